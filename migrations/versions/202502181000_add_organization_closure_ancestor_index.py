@@ -0,0 +1,23 @@
+"""add ancestor/depth index to organization closure"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202502181000"
+down_revision = "202502170900"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_organization_closure_anc_tree_depth",
+        "organization_closure",
+        ["ancestor_id", "tree_type", "depth"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_closure_anc_tree_depth", table_name="organization_closure")
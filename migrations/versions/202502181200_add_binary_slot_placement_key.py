@@ -0,0 +1,21 @@
+"""add placement key to binary slots for ordered spillover lookup"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502181200"
+down_revision = "202502181000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("binary_slots", sa.Column("placement_key", sa.Text(), nullable=False, server_default=""))
+    # Keys for existing slots are backfilled set-based by 202502191100.
+
+
+def downgrade() -> None:
+    op.drop_column("binary_slots", "placement_key")
@@ -0,0 +1,32 @@
+"""add organization KPI rollup watermark and ledger tables"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502181400"
+down_revision = "202502181200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_rollup_state",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("last_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_order_id", sa.String(length=64), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now(), onupdate=sa.func.now()),
+    )
+    op.create_table(
+        "organization_rollup_orders",
+        sa.Column("order_id", sa.String(length=64), primary_key=True),
+        sa.Column("rolled_up_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("organization_rollup_orders")
+    op.drop_table("organization_rollup_state")
@@ -0,0 +1,20 @@
+"""add revoked_at to auth_sessions for signed token revocation"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502181600"
+down_revision = "202502181400"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("auth_sessions", sa.Column("revoked_at", sa.Numeric(18, 3), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("auth_sessions", "revoked_at")
@@ -0,0 +1,60 @@
+"""add signed deltas to point_wallet_ledger and per-wallet ledger checkpoints"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502181800"
+down_revision = "202502181600"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "point_wallet_ledger",
+        sa.Column("balance_delta", sa.Numeric(24, 8), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "point_wallet_ledger",
+        sa.Column("pending_delta", sa.Numeric(24, 8), nullable=False, server_default="0"),
+    )
+    # Existing rows only have running totals; recover each row's delta from the previous row of its wallet.
+    op.execute(
+        """
+        UPDATE point_wallet_ledger
+        SET balance_delta = deltas.balance_delta, pending_delta = deltas.pending_delta
+        FROM (
+            SELECT
+                entry_id,
+                balance_after - COALESCE(LAG(balance_after) OVER w, 0) AS balance_delta,
+                pending_after - COALESCE(LAG(pending_after) OVER w, 0) AS pending_delta
+            FROM point_wallet_ledger
+            WINDOW w AS (PARTITION BY wallet_id ORDER BY created_at, entry_id)
+        ) AS deltas
+        WHERE point_wallet_ledger.entry_id = deltas.entry_id
+        """,
+    )
+    op.create_index(
+        "ix_point_wallet_ledger_wallet_created",
+        "point_wallet_ledger",
+        ["wallet_id", "created_at", "entry_id"],
+    )
+    op.create_table(
+        "point_wallet_ledger_checkpoints",
+        sa.Column("wallet_id", sa.String(length=64), primary_key=True),
+        sa.Column("checkpoint_at", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("balance", sa.Numeric(24, 8), nullable=False),
+        sa.Column("pending_withdrawal", sa.Numeric(24, 8), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("point_wallet_ledger_checkpoints")
+    op.drop_index("ix_point_wallet_ledger_wallet_created", table_name="point_wallet_ledger")
+    op.drop_column("point_wallet_ledger", "pending_delta")
+    op.drop_column("point_wallet_ledger", "balance_delta")
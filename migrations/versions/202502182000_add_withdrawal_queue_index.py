@@ -0,0 +1,23 @@
+"""add (status, created_at, request_id) index for the withdrawal approval queue"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202502182000"
+down_revision = "202502181800"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_point_wallet_withdrawals_status_created",
+        "point_wallet_withdrawals",
+        ["status", "created_at", "request_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_point_wallet_withdrawals_status_created", table_name="point_wallet_withdrawals")
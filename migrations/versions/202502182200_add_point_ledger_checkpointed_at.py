@@ -0,0 +1,41 @@
+"""mark which checkpoint covers each point_wallet_ledger row"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502182200"
+down_revision = "202502182000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "point_wallet_ledger",
+        sa.Column("checkpointed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing checkpoints covered every row created at or before them; attribute each row to the first one.
+    op.execute(
+        """
+        UPDATE point_wallet_ledger
+        SET checkpointed_at = (
+            SELECT MIN(checkpoints.checkpoint_at)
+            FROM point_wallet_ledger_checkpoints AS checkpoints
+            WHERE checkpoints.wallet_id = point_wallet_ledger.wallet_id
+              AND checkpoints.checkpoint_at >= point_wallet_ledger.created_at
+        )
+        """,
+    )
+    op.create_index(
+        "ix_point_wallet_ledger_wallet_checkpointed",
+        "point_wallet_ledger",
+        ["wallet_id", "checkpointed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_point_wallet_ledger_wallet_checkpointed", table_name="point_wallet_ledger")
+    op.drop_column("point_wallet_ledger", "checkpointed_at")
@@ -0,0 +1,40 @@
+"""mark commerce_orders consumed by the organization rollup"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502190900"
+down_revision = "202502182200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "commerce_orders",
+        sa.Column("rolled_up_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Orders already claimed by the rollup keep their claim time so they are not listed again.
+    op.execute(
+        """
+        UPDATE commerce_orders
+        SET rolled_up_at = (
+            SELECT claims.rolled_up_at
+            FROM organization_rollup_orders AS claims
+            WHERE claims.order_id = commerce_orders.order_id
+        )
+        """,
+    )
+    op.create_index(
+        "ix_commerce_orders_rollup_pending",
+        "commerce_orders",
+        ["status", "rolled_up_at", "created_at", "order_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_commerce_orders_rollup_pending", table_name="commerce_orders")
+    op.drop_column("commerce_orders", "rolled_up_at")
@@ -0,0 +1,48 @@
+"""index open binary slots by placement key and backfill keys in one statement"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202502191100"
+down_revision = "202502190900"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A slot's key is the key of the slot its owner fills plus "L"/"R"; derive every node's prefix at once.
+    op.execute(
+        """
+        WITH RECURSIVE slot_prefixes (node_id, prefix) AS (
+            SELECT node_id, ''
+            FROM organization_nodes
+            WHERE tree_type = 'binary' AND (parent_node_id IS NULL OR position IS NULL)
+            UNION ALL
+            SELECT child.node_id, parent.prefix || UPPER(child.position)
+            FROM organization_nodes AS child
+            JOIN slot_prefixes AS parent ON child.parent_node_id = parent.node_id
+            WHERE child.tree_type = 'binary' AND child.position IS NOT NULL
+        )
+        UPDATE binary_slots
+        SET placement_key = (
+            SELECT slot_prefixes.prefix
+            FROM slot_prefixes
+            WHERE slot_prefixes.node_id = binary_slots.node_id
+        ) || slot
+        WHERE node_id IN (SELECT node_id FROM slot_prefixes)
+        """,
+    )
+    op.create_index(
+        "ix_binary_slots_open_placement",
+        "binary_slots",
+        ["status", "placement_key"],
+        sqlite_where=sa.text("status = 'OPEN'"),
+        postgresql_where=sa.text("status = 'OPEN'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_binary_slots_open_placement", table_name="binary_slots")
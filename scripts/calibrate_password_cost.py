@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark password hashing on this host and suggest a cost profile."""
+
+from __future__ import annotations
+
+import argparse
+
+from aeghash.security.passwords import (
+    SCHEME_PBKDF2,
+    SCHEME_SCRYPT,
+    PasswordCostProfile,
+    calibrate_profile,
+    measure_profile,
+)
+
+
+def calibrate(
+    schemes: tuple[str, ...],
+    *,
+    target_ms: float,
+    samples: int = 3,
+) -> list[tuple[PasswordCostProfile, float]]:
+    """Return ``(profile, measured_seconds)`` for each scheme, tuned to ``target_ms``."""
+    results = []
+    for scheme in schemes:
+        profile = calibrate_profile(scheme, target_seconds=target_ms / 1000, samples=samples)
+        results.append((profile, measure_profile(profile, samples=samples)))
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Pick a password hashing cost that hits a target latency.")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=100.0,
+        help="Desired time to hash one password, in milliseconds (default: 100).",
+    )
+    parser.add_argument(
+        "--scheme",
+        action="append",
+        choices=(SCHEME_PBKDF2, SCHEME_SCRYPT),
+        help="Scheme to calibrate; repeat for several (default: pbkdf2_sha256).",
+    )
+    parser.add_argument("--samples", type=int, default=3, help="Timings per measurement (default: 3).")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.target_ms <= 0:
+        parser.error("--target-ms must be positive.")
+
+    for profile, elapsed in calibrate(tuple(args.scheme or (SCHEME_PBKDF2,)), target_ms=args.target_ms, samples=args.samples):
+        print(f"# {profile.scheme}: {elapsed * 1000:.1f} ms per hash")
+        print(f"PASSWORD_HASH_SCHEME={profile.scheme}")
+        print(f"PASSWORD_HASH_COST={profile.iterations}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
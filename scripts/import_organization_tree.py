@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Bulk import a legacy organization tree from a CSV or JSONL edge list."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL
+from aeghash.core.organization_import import OrganizationImportResult, OrganizationImportService, read_edges
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import SqlAlchemyOrganizationRepository
+from aeghash.infrastructure.session import SessionManager
+
+
+def detect_format(source: Path) -> str:
+    suffix = source.suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in {".jsonl", ".ndjson"}:
+        return "jsonl"
+    raise ValueError(f"Cannot infer edge list format from '{source.name}'; pass --format.")
+
+
+def import_organization_tree(
+    *,
+    database_url: str,
+    source: Path,
+    tree_type: str,
+    fmt: str | None = None,
+) -> OrganizationImportResult:
+    """Import every edge in ``source`` in a single transaction."""
+    manager = SessionManager(database_url)
+    Base.metadata.create_all(manager.engine)
+    try:
+        with source.open(newline="", encoding="utf-8") as stream, manager.session_scope() as session:
+            service = OrganizationImportService(SqlAlchemyOrganizationRepository(session))
+            return service.import_edges(read_edges(stream, fmt=fmt or detect_format(source)), tree_type=tree_type)
+    finally:
+        manager.dispose()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Bulk import an organization tree from an edge list.")
+    parser.add_argument("source", type=Path, help="CSV (with header) or JSONL edge list.")
+    parser.add_argument(
+        "--tree-type",
+        required=True,
+        choices=(TREE_UNILEVEL, TREE_BINARY),
+        help="Organization tree to populate.",
+    )
+    parser.add_argument(
+        "--format",
+        dest="fmt",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="Edge list format (default: inferred from the file extension).",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="Database URL (default: DATABASE_URL environment variable).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("DATABASE_URL must be provided either via --database-url or environment variable.")
+
+    try:
+        fmt = args.fmt or detect_format(args.source)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    result = import_organization_tree(
+        database_url=args.database_url,
+        source=args.source,
+        tree_type=args.tree_type,
+        fmt=fmt,
+    )
+    print(
+        f"Imported {result.nodes} nodes, {result.closure_rows} closure rows "
+        f"and {result.binary_slots} binary slots.",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Place members waiting in binary_waiting_queue once their slots are no longer contended."""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from aeghash.core.organization import PLACEMENT_CLAIM, OrganizationService, WaitingQueueResult
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import SqlAlchemyOrganizationRepository
+from aeghash.infrastructure.session import SessionManager
+
+
+def process_binary_waiting_queue(
+    *,
+    database_url: str,
+    batch_size: int = 100,
+    max_batches: int | None = None,
+    max_queue_retries: int = 5,
+) -> WaitingQueueResult:
+    """Drain pending placements in claim mode, committing once per batch.
+
+    A batch that defers anything ends the run, so still-contended entries wait for the
+    next scheduled run instead of burning their retry budget back to back.
+    """
+    manager = SessionManager(database_url)
+    Base.metadata.create_all(manager.engine)
+    total = WaitingQueueResult()
+    batches = 0
+    try:
+        while max_batches is None or batches < max_batches:
+            with manager.session_scope() as session:
+                service = OrganizationService(
+                    SqlAlchemyOrganizationRepository(session),
+                    placement_mode=PLACEMENT_CLAIM,
+                    max_queue_retries=max_queue_retries,
+                )
+                result = service.process_waiting_queue(limit=batch_size)
+            batches += 1
+            total.processed += result.processed
+            total.placed += result.placed
+            total.deferred += result.deferred
+            total.failed += result.failed
+            total.errors.extend(result.errors)
+            if result.processed < batch_size or result.deferred:
+                break
+    finally:
+        manager.dispose()
+    return total
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Drain the binary placement waiting queue.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Entries per batch/transaction (default: 100).")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches.")
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Attempts before a contended entry is marked FAILED (default: 5).",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="Database URL (default: DATABASE_URL environment variable).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("DATABASE_URL must be provided either via --database-url or environment variable.")
+
+    result = process_binary_waiting_queue(
+        database_url=args.database_url,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+        max_queue_retries=args.max_retries,
+    )
+    print(
+        f"Processed {result.processed} queued placements: "
+        f"{result.placed} placed, {result.deferred} deferred, {result.failed} failed.",
+    )
+    for error in result.errors:
+        print(f"ERROR {error}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Checkpoint the point ledger and reconcile wallet balances against it."""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from aeghash.core.point_ledger import CheckpointResult, PointLedgerService, ReconciliationReport
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import SqlAlchemyPointLedgerRepository
+from aeghash.infrastructure.session import SessionManager
+
+
+def reconcile_point_ledger(
+    *,
+    database_url: str,
+    checkpoint: bool = False,
+    use_checkpoints: bool = True,
+    min_entries: int = 1,
+    batch_size: int = 500,
+) -> tuple[CheckpointResult | None, ReconciliationReport]:
+    """Optionally write fresh checkpoints (committed first), then reconcile every wallet."""
+    manager = SessionManager(database_url)
+    Base.metadata.create_all(manager.engine)
+    checkpoints: CheckpointResult | None = None
+    try:
+        if checkpoint:
+            with manager.session_scope() as session:
+                service = PointLedgerService(SqlAlchemyPointLedgerRepository(session), batch_size=batch_size)
+                checkpoints = service.checkpoint(min_entries=min_entries)
+        with manager.session_scope() as session:
+            service = PointLedgerService(SqlAlchemyPointLedgerRepository(session), batch_size=batch_size)
+            report = service.reconcile(use_checkpoints=use_checkpoints)
+    finally:
+        manager.dispose()
+    return checkpoints, report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Reconcile point wallet balances against the ledger.")
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Write a new checkpoint for wallets with ledger activity before reconciling.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore checkpoints and sum each wallet's whole ledger.",
+    )
+    parser.add_argument(
+        "--min-entries",
+        type=int,
+        default=1,
+        help="Only checkpoint wallets with at least this many new entries (default: 1).",
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Wallets per query batch (default: 500).")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="Database URL (default: DATABASE_URL environment variable).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("DATABASE_URL must be provided either via --database-url or environment variable.")
+
+    checkpoints, report = reconcile_point_ledger(
+        database_url=args.database_url,
+        checkpoint=args.checkpoint,
+        use_checkpoints=not args.full,
+        min_entries=args.min_entries,
+        batch_size=args.batch_size,
+    )
+    if checkpoints is not None:
+        print(f"Wrote {checkpoints.checkpoints} checkpoints covering {checkpoints.entries} new ledger entries.")
+    print(f"Reconciled {report.wallets} wallets ({report.entries_scanned} ledger entries scanned).")
+    for mismatch in report.mismatches:
+        print(
+            f"MISMATCH {mismatch.wallet_id}: balance {mismatch.wallet_balance} != ledger {mismatch.ledger_balance}, "
+            f"pending {mismatch.wallet_pending} != ledger {mismatch.ledger_pending}",
+        )
+    return 1 if report.mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
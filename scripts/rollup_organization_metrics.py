@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Roll newly paid orders up into organization_metrics_daily."""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from aeghash.core.organization_kpi import KpiSummaryCache
+from aeghash.core.organization_rollup import OrganizationRollupService, RollupResult
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import (
+    SqlAlchemyOrderRepository,
+    SqlAlchemyOrganizationMetricsRepository,
+    SqlAlchemyOrganizationRepository,
+)
+from aeghash.infrastructure.session import SessionManager
+
+
+def rollup_organization_metrics(
+    *,
+    database_url: str,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    cache: KpiSummaryCache | None = None,
+) -> RollupResult:
+    """Consume orders not yet marked as rolled up, committing once per batch.
+
+    When ``cache`` is given, the KPI summaries of touched nodes are invalidated after
+    each batch commits, so readers never cache pre-commit metrics under a fresh token.
+    """
+    manager = SessionManager(database_url)
+    Base.metadata.create_all(manager.engine)
+    total = RollupResult()
+    try:
+        while max_batches is None or total.batches < max_batches:
+            with manager.session_scope() as session:
+                service = OrganizationRollupService(
+                    SqlAlchemyOrderRepository(session),
+                    SqlAlchemyOrganizationRepository(session),
+                    SqlAlchemyOrganizationMetricsRepository(session),
+                    batch_size=batch_size,
+                )
+                result = service.run(max_batches=1)
+            if cache is not None:
+                cache.invalidate_many(result.touched_nodes)
+            total.orders += result.orders
+            total.skipped += result.skipped
+            total.rows_updated += result.rows_updated
+            total.batches += result.batches
+            total.watermark = result.watermark
+            total.touched_nodes.update(result.touched_nodes)
+            if result.orders + result.skipped < batch_size:
+                break
+    finally:
+        manager.dispose()
+    return total
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Roll paid orders up into daily organization KPI metrics.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Orders per batch/transaction (default: 1000).")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches.")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="Database URL (default: DATABASE_URL environment variable).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("DATABASE_URL must be provided either via --database-url or environment variable.")
+
+    result = rollup_organization_metrics(
+        database_url=args.database_url,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+    )
+    print(f"Rolled up {result.orders} orders into {result.rows_updated} metric rows ({result.skipped} skipped).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
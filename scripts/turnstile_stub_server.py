@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Local stand-in for Cloudflare's Turnstile siteverify endpoint, for load tests.
+
+Point the app at it with ``TURNSTILE_VERIFY_URL=http://127.0.0.1:8787/turnstile/v0/siteverify``.
+Tokens starting with ``fail`` are rejected; everything else passes.
+"""
+
+from __future__ import annotations
+
+import argparse
+from urllib.parse import parse_qs
+
+import anyio
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+VERIFY_PATH = "/turnstile/v0/siteverify"
+
+
+def build_app(*, latency_ms: float = 0.0, fail_prefix: str = "fail") -> FastAPI:
+    """Create the stub app; ``latency_ms`` simulates Cloudflare's round trip."""
+    app = FastAPI()
+
+    @app.post(VERIFY_PATH)
+    async def siteverify(request: Request) -> JSONResponse:
+        # Parsed by hand so the stub does not need python-multipart.
+        form = {key: values[0] for key, values in parse_qs((await request.body()).decode("utf-8")).items()}
+        if latency_ms > 0:
+            await anyio.sleep(latency_ms / 1000)
+        token = form.get("response", "")
+        if not form.get("secret"):
+            return JSONResponse({"success": False, "error-codes": ["missing-input-secret"]})
+        if not token or token.startswith(fail_prefix):
+            return JSONResponse({"success": False, "error-codes": ["invalid-input-response"]})
+        return JSONResponse({"success": True, "hostname": "localhost", "action": "stub"})
+
+    return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve a stub Turnstile siteverify endpoint.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8787, help="Port (default: 8787).")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Artificial delay added to every verification (default: 0).",
+    )
+    parser.add_argument(
+        "--fail-prefix",
+        default="fail",
+        help="Tokens starting with this prefix fail verification (default: fail).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    import uvicorn
+
+    print(f"TURNSTILE_VERIFY_URL=http://{args.host}:{args.port}{VERIFY_PATH}")
+    uvicorn.run(build_app(latency_ms=args.latency_ms, fail_prefix=args.fail_prefix), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -84,8 +84,14 @@ class HashDamHTTPTransport:
         api_key: str | None = None,
         client: httpx.Client | None = None,
         timeout: float = 10.0,
+        max_connections: int = 10,
     ) -> None:
-        self._client = client or httpx.Client(base_url=base_url, timeout=timeout)
+        # Batch approvals share one client across worker threads; keep enough keep-alive slots for all of them.
+        self._client = client or httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
         self._api_key = api_key
 
     def post(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import binascii
+import importlib.util
 import json
+import logging
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Protocol
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Mapping, Protocol
+from urllib.parse import urlsplit
 
+import anyio
 import httpx
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from aeghash.config import OAuthProviderSettings
 
@@ -30,6 +40,19 @@ class OAuthTransport(Protocol):
         ...
 
 
+class AsyncOAuthTransport(Protocol):
+    """Async counterpart of :class:`OAuthTransport`, awaited directly on the event loop."""
+
+    async def post(self, url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        ...
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        ...
+
+    async def aclose(self) -> None:  # pragma: no cover - interface only
+        ...
+
+
 @dataclass(slots=True)
 class OAuthToken:
     """Token exchange result."""
@@ -82,16 +105,152 @@ class OAuthHTTPTransport:
         self._client.close()
 
 
+class AsyncOAuthHTTPTransport:
+    """Pooled ``httpx.AsyncClient`` shared by every provider.
+
+    Connections are kept alive between callbacks, HTTP/2 is used when ``h2`` is
+    installed, and each provider host gets its own concurrency cap so one slow
+    provider cannot hold the whole pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        per_host_limit: int = 20,
+        http2: bool | None = None,
+    ) -> None:
+        if per_host_limit <= 0:
+            raise ValueError("per_host_limit must be positive")
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self._per_host_limit = per_host_limit
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def post(self, url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        async with self._limit_for(url):
+            response = await self._client.post(url, data=data, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        async with self._limit_for(url):
+            response = await self._client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _limit_for(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits.setdefault(host, asyncio.Semaphore(self._per_host_limit))
+        return limit
+
+
+class JwksCache:
+    """Provider signing keys kept in memory and refreshed before they expire.
+
+    Lookups inside the last ``refresh_ahead_seconds`` of the TTL return the cached key
+    and refresh in the background; an unknown ``kid`` forces a refresh (at most once
+    per ``min_refresh_interval_seconds``) so provider key rotation is picked up.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncOAuthTransport,
+        url: str,
+        *,
+        ttl_seconds: float = 3600.0,
+        refresh_ahead_seconds: float = 300.0,
+        min_refresh_interval_seconds: float = 30.0,
+        clock: Callable[[], float] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._transport = transport
+        self.url = url
+        self._ttl = ttl_seconds
+        self._refresh_ahead = min(refresh_ahead_seconds, ttl_seconds)
+        self._min_interval = min_refresh_interval_seconds
+        self._clock = clock or time.monotonic
+        self._logger = logger or logging.getLogger(__name__)
+        self._keys: Dict[str, rsa.RSAPublicKey] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._background: asyncio.Task[None] | None = None
+
+    async def get_key(self, kid: str) -> rsa.RSAPublicKey:
+        now = self._clock()
+        if self._fetched_at is None or now - self._fetched_at >= self._ttl:
+            await self.refresh()
+        elif kid not in self._keys and now - self._fetched_at >= self._min_interval:
+            await self.refresh()
+        elif now - self._fetched_at >= self._ttl - self._refresh_ahead:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise OAuthError(f"Unknown id_token signing key: {kid}")
+        return key
+
+    async def refresh(self) -> None:
+        fetched_at = self._fetched_at
+        async with self._lock:
+            # Another caller refreshed while we waited for the lock.
+            if self._fetched_at != fetched_at:
+                return
+            document = await self._transport.get(self.url, headers={"Accept": "application/json"})
+            self._keys = dict(_parse_jwks(document.get("keys") or ()))
+            self._fetched_at = self._clock()
+
+    def _schedule_refresh(self) -> None:
+        if self._background is not None and not self._background.done():
+            return
+        self._background = asyncio.get_running_loop().create_task(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as exc:  # pragma: no cover - network failures keep the old keys
+            self._logger.warning("JWKS background refresh failed", exc_info=exc, extra={"url": self.url})
+
+
 class BaseOAuthClient:
     """Shared logic for provider-specific OAuth clients."""
 
     provider_name: str
     token_endpoint: str
     profile_endpoint: str | None = None
-
-    def __init__(self, *, transport: OAuthTransport, settings: OAuthProviderSettings) -> None:
+    jwks_url: str | None = None
+    issuers: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        *,
+        transport: OAuthTransport,
+        settings: OAuthProviderSettings,
+        async_transport: AsyncOAuthTransport | None = None,
+        jwks: JwksCache | None = None,
+    ) -> None:
         self._transport = transport
         self._settings = settings
+        self._async_transport = async_transport
+        self._jwks = jwks
 
     def authenticate(self, *, code: str) -> OAuthResult:
         """Exchange an authorization code and resolve the user profile."""
@@ -99,11 +258,36 @@ class BaseOAuthClient:
         profile = self._fetch_profile(token=token)
         return OAuthResult(token=token, profile=profile)
 
+    async def authenticate_async(self, *, code: str) -> OAuthResult:
+        """Async variant of :meth:`authenticate`.
+
+        With a JWKS cache the profile comes from the verified id_token, saving the
+        userinfo round trip. Without an async transport the sync flow runs in a thread.
+        """
+        if self._async_transport is None:
+            return await anyio.to_thread.run_sync(partial(self.authenticate, code=code))
+        data = await self._async_transport.post(
+            self.token_endpoint,
+            data=self._token_request(code=code),
+            headers=self._token_headers(),
+        )
+        token = self._parse_token_response(data)
+        profile = await self._fetch_profile_async(token=token)
+        return OAuthResult(token=token, profile=profile)
+
     def close(self) -> None:
         """Close the underlying transport."""
         self._transport.close()
 
     def _exchange_code(self, *, code: str) -> OAuthToken:
+        data = self._transport.post(
+            self.token_endpoint,
+            data=self._token_request(code=code),
+            headers=self._token_headers(),
+        )
+        return self._parse_token_response(data)
+
+    def _token_request(self, *, code: str) -> Dict[str, Any]:
         payload = {
             "code": code,
             "client_id": self._settings.client_id,
@@ -112,13 +296,7 @@ class BaseOAuthClient:
             "grant_type": "authorization_code",
         }
         payload.update(self._token_payload(code=code))
-
-        data = self._transport.post(
-            self.token_endpoint,
-            data=payload,
-            headers=self._token_headers(),
-        )
-        return self._parse_token_response(data)
+        return payload
 
     def _token_payload(self, *, code: str) -> Dict[str, Any]:
         return {}
@@ -158,6 +336,25 @@ class BaseOAuthClient:
         )
         return self._parse_profile(data=data, token=token)
 
+    async def _fetch_profile_async(self, *, token: OAuthToken) -> OAuthProfile:
+        if self._jwks is not None and token.id_token:
+            claims = await verify_id_token(
+                token.id_token,
+                jwks=self._jwks,
+                audience=self._settings.client_id,
+                issuers=self.issuers,
+                provider=self.provider_name,
+            )
+            return self._parse_profile(data=claims, token=token)
+        if not self.profile_endpoint:
+            raise OAuthError(f"{self.provider_name} does not expose a profile endpoint.")
+
+        data = await self._async_transport.get(  # type: ignore[union-attr]
+            self.profile_endpoint,
+            headers={"Authorization": f"Bearer {token.access_token}"},
+        )
+        return self._parse_profile(data=data, token=token)
+
     def _parse_profile(self, *, data: Dict[str, Any], token: OAuthToken) -> OAuthProfile:
         raise NotImplementedError
 
@@ -168,6 +365,8 @@ class GoogleOAuthClient(BaseOAuthClient):
     provider_name = "google"
     token_endpoint = "https://oauth2.googleapis.com/token"
     profile_endpoint = "https://www.googleapis.com/oauth2/v3/userinfo"
+    jwks_url = "https://www.googleapis.com/oauth2/v3/certs"
+    issuers = ("https://accounts.google.com", "accounts.google.com")
 
     def _parse_profile(self, *, data: Dict[str, Any], token: OAuthToken) -> OAuthProfile:
         subject = _require_str(data, "sub", provider=self.provider_name)
@@ -214,22 +413,33 @@ class AppleOAuthClient(BaseOAuthClient):
     provider_name = "apple"
     token_endpoint = "https://appleid.apple.com/auth/token"
     profile_endpoint = None
+    jwks_url = "https://appleid.apple.com/auth/keys"
+    issuers = ("https://appleid.apple.com",)
 
     def _fetch_profile(self, *, token: OAuthToken) -> OAuthProfile:
         if not token.id_token:
             raise OAuthError("apple response missing id_token.")
         payload = _decode_jwt_payload(token.id_token, provider=self.provider_name)
+        return self._parse_profile(data=payload, token=token)
 
-        subject = _require_str(payload, "sub", provider=self.provider_name)
-        email_value = payload.get("email")
-        name_value = payload.get("name")
+    async def _fetch_profile_async(self, *, token: OAuthToken) -> OAuthProfile:
+        if self._jwks is None:
+            return self._fetch_profile(token=token)
+        if not token.id_token:
+            raise OAuthError("apple response missing id_token.")
+        return await super()._fetch_profile_async(token=token)
+
+    def _parse_profile(self, *, data: Dict[str, Any], token: OAuthToken) -> OAuthProfile:
+        subject = _require_str(data, "sub", provider=self.provider_name)
+        email_value = data.get("email")
+        name_value = data.get("name")
 
         return OAuthProfile(
             provider=self.provider_name,
             subject=subject,
             email=email_value if isinstance(email_value, str) else None,
             name=name_value if isinstance(name_value, str) else None,
-            raw=payload,
+            raw=data,
         )
 
 
@@ -253,3 +463,76 @@ def _decode_jwt_payload(token: str, *, provider: str) -> Dict[str, Any]:
         return json.loads(decoded.decode("utf-8"))
     except (binascii.Error, json.JSONDecodeError) as exc:
         raise OAuthError(f"{provider} id_token payload could not be decoded.") from exc
+
+
+async def verify_id_token(
+    token: str,
+    *,
+    jwks: JwksCache,
+    audience: str,
+    issuers: Iterable[str],
+    provider: str,
+    leeway_seconds: int = 60,
+    clock: Callable[[], float] | None = None,
+) -> Dict[str, Any]:
+    """Verify an RS256 id_token against the cached JWKS and return its claims."""
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+    except ValueError as exc:
+        raise OAuthError(f"{provider} id_token is not a valid JWT.") from exc
+
+    header = _decode_segment(header_segment, provider=provider)
+    if header.get("alg") != "RS256" or not isinstance(header.get("kid"), str):
+        raise OAuthError(f"{provider} id_token uses an unsupported signing algorithm.")
+
+    key = await jwks.get_key(header["kid"])
+    try:
+        key.verify(
+            _b64decode(signature_segment),
+            f"{header_segment}.{payload_segment}".encode("ascii"),
+            padding.PKCS1v15(),
+            hashes.SHA256(),
+        )
+    except (InvalidSignature, binascii.Error, ValueError) as exc:
+        raise OAuthError(f"{provider} id_token signature is invalid.") from exc
+
+    claims = _decode_segment(payload_segment, provider=provider)
+    now = (clock or time.time)()
+    expires_at = claims.get("exp")
+    if not isinstance(expires_at, (int, float)) or expires_at + leeway_seconds < now:
+        raise OAuthError(f"{provider} id_token has expired.")
+    if claims.get("iss") not in tuple(issuers):
+        raise OAuthError(f"{provider} id_token issuer is not trusted.")
+    token_audience = claims.get("aud")
+    audiences = token_audience if isinstance(token_audience, list) else [token_audience]
+    if audience not in audiences:
+        raise OAuthError(f"{provider} id_token audience does not match.")
+    return claims
+
+
+def _parse_jwks(keys: Iterable[Mapping[str, Any]]) -> Iterable[tuple[str, rsa.RSAPublicKey]]:
+    for jwk in keys:
+        if jwk.get("kty") != "RSA" or not isinstance(jwk.get("kid"), str):
+            continue
+        try:
+            numbers = rsa.RSAPublicNumbers(
+                e=int.from_bytes(_b64decode(jwk["e"]), "big"),
+                n=int.from_bytes(_b64decode(jwk["n"]), "big"),
+            )
+            yield jwk["kid"], numbers.public_key()
+        except (KeyError, TypeError, ValueError, binascii.Error):
+            continue
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_segment(segment: str, *, provider: str) -> Dict[str, Any]:
+    try:
+        value = json.loads(_b64decode(segment).decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise OAuthError(f"{provider} id_token could not be decoded.") from exc
+    if not isinstance(value, dict):
+        raise OAuthError(f"{provider} id_token could not be decoded.")
+    return value
@@ -7,6 +7,11 @@ from typing import Any, Dict, Protocol
 import httpx
 
 
+VERIFY_ENDPOINT = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
+# Turnstile sits on the login path, so fail fast rather than queue behind a slow upstream.
+DEFAULT_ASYNC_TIMEOUT = httpx.Timeout(3.0, connect=1.0)
+
+
 class TurnstileTransport(Protocol):
     """Protocol describing the minimal transport required by TurnstileClient."""
 
@@ -21,7 +26,7 @@ class TurnstileError(RuntimeError):
 class TurnstileClient:
     """Client for verifying Cloudflare Turnstile tokens."""
 
-    VERIFY_ENDPOINT = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
+    VERIFY_ENDPOINT = VERIFY_ENDPOINT
 
     def __init__(
         self,
@@ -29,40 +34,79 @@ class TurnstileClient:
         secret_key: str,
         transport: TurnstileTransport | None = None,
         timeout: float = 5.0,
+        verify_url: str | None = None,
     ) -> None:
         if not secret_key:
             raise ValueError("Turnstile secret key must be provided.")
         self._secret_key = secret_key
         self._timeout = timeout
+        self._verify_url = verify_url or self.VERIFY_ENDPOINT
         self._client = transport or httpx.Client()
 
     def verify(self, token: str, *, remote_ip: str | None = None) -> bool:
-        if not token:
-            raise ValueError("Turnstile token cannot be empty.")
-
-        payload: Dict[str, Any] = {"secret": self._secret_key, "response": token}
-        if remote_ip:
-            payload["remoteip"] = remote_ip
-
-        response = self._client.post(self.VERIFY_ENDPOINT, data=payload, timeout=self._timeout)
-        response.raise_for_status()
-        try:
-            data = response.json()
-        except ValueError as exc:
-            raise TurnstileError("Turnstile response is not valid JSON.") from exc
-
-        if not isinstance(data, dict):
-            raise TurnstileError("Invalid Turnstile response payload.")
-
-        success = data.get("success")
-        if success is True:
-            return True
-
-        error_codes = data.get("error-codes")
-        if isinstance(error_codes, list) and error_codes:
-            raise TurnstileError(f"Turnstile verification failed: {', '.join(map(str, error_codes))}")
-        raise TurnstileError("Turnstile verification failed without specific error codes.")
+        payload = _verify_payload(self._secret_key, token, remote_ip)
+        response = self._client.post(self._verify_url, data=payload, timeout=self._timeout)
+        return _parse_verify_response(response)
 
     def close(self) -> None:
         if isinstance(self._client, httpx.Client):
             self._client.close()
+
+
+class AsyncTurnstileClient:
+    """Turnstile client awaited on the event loop over a shared keep-alive pool."""
+
+    def __init__(
+        self,
+        *,
+        secret_key: str,
+        client: httpx.AsyncClient | None = None,
+        timeout: httpx.Timeout | float = DEFAULT_ASYNC_TIMEOUT,
+        verify_url: str | None = None,
+        max_connections: int = 50,
+    ) -> None:
+        if not secret_key:
+            raise ValueError("Turnstile secret key must be provided.")
+        self._secret_key = secret_key
+        self._verify_url = verify_url or VERIFY_ENDPOINT
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def verify(self, token: str, *, remote_ip: str | None = None) -> bool:
+        payload = _verify_payload(self._secret_key, token, remote_ip)
+        response = await self._client.post(self._verify_url, data=payload)
+        return _parse_verify_response(response)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _verify_payload(secret_key: str, token: str, remote_ip: str | None) -> Dict[str, Any]:
+    if not token:
+        raise ValueError("Turnstile token cannot be empty.")
+    payload: Dict[str, Any] = {"secret": secret_key, "response": token}
+    if remote_ip:
+        payload["remoteip"] = remote_ip
+    return payload
+
+
+def _parse_verify_response(response: httpx.Response) -> bool:
+    response.raise_for_status()
+    try:
+        data = response.json()
+    except ValueError as exc:
+        raise TurnstileError("Turnstile response is not valid JSON.") from exc
+
+    if not isinstance(data, dict):
+        raise TurnstileError("Invalid Turnstile response payload.")
+
+    success = data.get("success")
+    if success is True:
+        return True
+
+    error_codes = data.get("error-codes")
+    if isinstance(error_codes, list) and error_codes:
+        raise TurnstileError(f"Turnstile verification failed: {', '.join(map(str, error_codes))}")
+    raise TurnstileError("Turnstile verification failed without specific error codes.")
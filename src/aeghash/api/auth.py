@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterator, Optional
 
+import anyio
 from sqlalchemy.orm import Session
 
+from aeghash.adapters.oauth import OAuthResult
 from aeghash.core.auth_flow import AuthenticationResult, OAuthFlowService, OAuthRequest
 from aeghash.core.repositories import SessionRepository, TwoFactorRepository, UserRepository
 from aeghash.core.two_factor import TwoFactorService
@@ -53,36 +57,75 @@ class AuthenticationAPI:
         remote_ip: Optional[str] = None,
     ) -> AuthenticationResult:
         """Process an OAuth callback and return the resulting authentication status."""
+        with self._flow_scope() as flow:
+            return flow.authenticate(self._build_request(payload, remote_ip))
 
-        with self._container.session_manager.session_scope() as session:
-            user_repository = self._user_repository_factory(session)
-            session_repository = self._session_repository_factory(session)
-            two_factor_manager = self._build_two_factor_manager(session)
+    async def authenticate_async(
+        self,
+        payload: OAuthCallbackPayload,
+        *,
+        remote_ip: Optional[str] = None,
+        offload: Callable[..., Awaitable[Any]] | None = None,
+    ) -> AuthenticationResult:
+        """Process an OAuth callback, awaiting the provider exchange on the event loop.
+
+        ``offload`` runs the blocking parts (Turnstile, database) on a worker thread.
+        Without an async OAuth transport the whole flow is offloaded instead.
+        """
+        run = offload or _run_in_thread
+        if self._container.oauth_transport is None:
+            return await run(self.authenticate, payload, remote_ip=remote_ip)
+
+        request = self._build_request(payload, remote_ip)
+        await run(self._validate, request)
+        oauth_result = await self._container.auth_service.authenticate_async(
+            provider=payload.provider,
+            code=payload.code,
+        )
+        return await run(self._complete, request, oauth_result)
+
+    def _validate(self, request: OAuthRequest) -> None:
+        with self._flow_scope() as flow:
+            flow.validate(request)
 
-            flow = OAuthFlowService(
+    def _complete(self, request: OAuthRequest, oauth_result: OAuthResult) -> AuthenticationResult:
+        with self._flow_scope() as flow:
+            return flow.complete(request, oauth_result)
+
+    @contextmanager
+    def _flow_scope(self) -> Iterator[OAuthFlowService]:
+        with self._container.session_manager.session_scope() as session:
+            yield OAuthFlowService(
                 self._container.auth_service,
-                user_repository,
-                session_repository,
-                two_factor_manager=two_factor_manager,
+                self._user_repository_factory(session),
+                self._session_repository_factory(session),
+                two_factor_manager=self._build_two_factor_manager(session),
                 turnstile_verifier=self._container.turnstile_verifier,
+                token_signer=self._container.session_signer,
             )
 
-            request = OAuthRequest(
-                provider=payload.provider,
-                code=payload.code,
-                state=payload.state,
-                expected_state=payload.expected_state,
-                two_factor_code=payload.two_factor_code,
-                turnstile_token=payload.turnstile_token,
-                turnstile_remote_ip=remote_ip,
-            )
-            return flow.authenticate(request)
+    @staticmethod
+    def _build_request(payload: OAuthCallbackPayload, remote_ip: Optional[str]) -> OAuthRequest:
+        return OAuthRequest(
+            provider=payload.provider,
+            code=payload.code,
+            state=payload.state,
+            expected_state=payload.expected_state,
+            two_factor_code=payload.two_factor_code,
+            turnstile_token=payload.turnstile_token,
+            turnstile_remote_ip=remote_ip,
+        )
 
     def _build_two_factor_manager(self, session: Session):
         if not self._two_factor_repository_factory:
             return None
         repository = self._two_factor_repository_factory(session)
-        return TwoFactorService(repository, event_hook=self._container.event_hook)
+        return TwoFactorService(
+            repository,
+            event_hook=self._container.event_hook,
+            keyring=self._container.keyring,
+            rate_limiter=self._container.rate_limiter,
+        )
 
     @classmethod
     def from_container(
@@ -114,3 +157,7 @@ class AuthenticationAPI:
             session_repository_factory=session_repo_factory,
             two_factor_repository_factory=two_factor_factory,
         )
+
+
+async def _run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
@@ -9,6 +9,7 @@ from typing import Any, Mapping, Sequence
 from aeghash.core.commerce_service import (
     AegmallOrderPayload,
     AegmallOrderService,
+    BatchOrderOutcome,
     IdempotencyConflictError,
     IdempotencyInProgressError,
     OrderProcessingResult,
@@ -51,9 +52,24 @@ class AegmallOrderResponse:
     bonus_ids: Sequence[str]
 
 
+@dataclass(slots=True)
+class AegmallBatchOrderResult:
+    """Per-order entry of a batch ingestion response."""
+
+    order_id: str
+    idempotency_key: str
+    status: str
+    bonuses_created: int
+    bonus_ids: Sequence[str]
+    error: str | None = None
+
+
 class AegmallInboundAPI:
     """Facade for handling inbound AEGMALL order events."""
 
+    MAX_BATCH_SIZE = 5000
+    BATCH_CHUNK_SIZE = 500
+
     def __init__(self, container: ServiceContainer) -> None:
         self._container = container
 
@@ -63,15 +79,7 @@ class AegmallInboundAPI:
 
     def process_order(self, request: AegmallOrderRequest) -> AegmallOrderResponse:
         """Persist the order, trigger bonuses, and enforce idempotency."""
-        payload = AegmallOrderPayload(
-            order_id=request.order_id,
-            user_id=request.user_id,
-            total_amount=request.total_amount,
-            pv_amount=request.pv_amount,
-            channel=request.channel,
-            metadata=dict(request.metadata),
-            idempotency_key=request.idempotency_key,
-        )
+        payload = self._to_payload(request)
         with aegmall_order_service_scope(self._container.session_manager) as service:
             try:
                 result = service.process_order(payload)
@@ -82,6 +90,46 @@ class AegmallInboundAPI:
 
         return self._to_response(result)
 
+    def process_orders(
+        self,
+        requests: Sequence[AegmallOrderRequest],
+        *,
+        chunk_size: int | None = None,
+    ) -> list[AegmallBatchOrderResult]:
+        """Ingest a batch of orders, committing one transaction per chunk."""
+        if len(requests) > self.MAX_BATCH_SIZE:
+            raise AegmallOrderError(f"Batch exceeds maximum of {self.MAX_BATCH_SIZE} orders.")
+        size = chunk_size or self.BATCH_CHUNK_SIZE
+        results: list[AegmallBatchOrderResult] = []
+        for start in range(0, len(requests), size):
+            payloads = [self._to_payload(request) for request in requests[start : start + size]]
+            with aegmall_order_service_scope(self._container.session_manager) as service:
+                outcomes = service.process_orders(payloads)
+            results.extend(self._to_batch_result(outcome) for outcome in outcomes)
+        return results
+
+    def _to_payload(self, request: AegmallOrderRequest) -> AegmallOrderPayload:
+        return AegmallOrderPayload(
+            order_id=request.order_id,
+            user_id=request.user_id,
+            total_amount=request.total_amount,
+            pv_amount=request.pv_amount,
+            channel=request.channel,
+            metadata=dict(request.metadata),
+            idempotency_key=request.idempotency_key,
+        )
+
+    def _to_batch_result(self, outcome: BatchOrderOutcome) -> AegmallBatchOrderResult:
+        bonus_ids = [entry.bonus_id for entry in outcome.bonuses]
+        return AegmallBatchOrderResult(
+            order_id=outcome.order_id,
+            idempotency_key=outcome.idempotency_key,
+            status=outcome.status,
+            bonuses_created=len(bonus_ids),
+            bonus_ids=bonus_ids,
+            error=outcome.error,
+        )
+
     def _to_response(self, result: OrderProcessingResult) -> AegmallOrderResponse:
         bonus_ids = [entry.bonus_id for entry in result.bonuses]
         return AegmallOrderResponse(
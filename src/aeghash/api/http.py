@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import asdict
+from functools import partial
 from datetime import datetime, UTC
 from decimal import Decimal
 import time
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional, TypeVar
 
-from fastapi import Depends, FastAPI, HTTPException, Request, Response
+import anyio
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import BaseModel
 
 from aeghash.adapters.turnstile import TurnstileError
+from aeghash.core.turnstile import TurnstileVerifier
 from aeghash.api.auth import AuthenticationAPI, OAuthCallbackPayload
 from aeghash.api.signup import SignupAPI, SignupPayload, SignupError, SignupResult
 from aeghash.api.login import LoginError, PasswordLoginAPI, PasswordLoginPayload
 from aeghash.api.audit import LoginAuditAPI
-from aeghash.api.kpi import OrganizationKpiAPI, serialize_summary
+from aeghash.api.kpi import OrganizationKpiAPI, serialize_compact_summary
+from aeghash.api.organization import OrganizationTreeAPI, serialize_node
 from aeghash.api.commerce import (
     AegmallInboundAPI,
     AegmallOrderError,
@@ -28,13 +33,25 @@ from aeghash.api.commerce import (
 from aeghash.api.withdrawals import WithdrawalApprovalAPI
 from aeghash.application import Application, create_application, shutdown_application
 from aeghash.core.auth_flow import AuthenticationResult
+from aeghash.core.repositories import SessionRecord, TwoFactorRecord
 from aeghash.core.mining_workflow import WithdrawalExecutionError
-from aeghash.core.point_wallet import InvalidWithdrawalState, WithdrawalNotFound, WITHDRAWAL_STATUS_APPROVED_STAGE1
+from aeghash.core.point_wallet import (
+    InvalidWithdrawalState,
+    PointWalletError,
+    WithdrawalNotFound,
+    WithdrawalSnapshot,
+    WITHDRAWAL_STATUS_APPROVED_STAGE1,
+    WITHDRAWAL_STATUS_PENDING,
+)
+from aeghash.infrastructure.bootstrap import ServiceContainer
 from aeghash.infrastructure.database import Base
 from aeghash.core.two_factor import TwoFactorService
 from aeghash.infrastructure.repositories import SqlAlchemySessionRepository, SqlAlchemyTwoFactorRepository
 from aeghash.security.access import AccessContext, AccessPolicy
 from aeghash.security.masking import mask_email, mask_identifier, mask_wallet_address
+from aeghash.security.passwords import PasswordHasherBusy
+from aeghash.security.rate_limit import LOGIN_EMAIL, LOGIN_IP, OAUTH_IP, RateLimitExceeded, retry_after_header
+from aeghash.security.session_tokens import SessionTokenSigner
 from aeghash.ui.qa_checklist import (
     get_accessibility_checklist,
     render_checklist_page_html,
@@ -42,6 +59,13 @@ from aeghash.ui.qa_checklist import (
 )
 
 
+T = TypeVar("T")
+
+# Upper bound on concurrent blocking calls (DB round trips, password hashing, outbound HTTP).
+# Matches the default SQLAlchemy pool (5 connections + 10 overflow) plus one spare thread.
+DEFAULT_BLOCKING_WORKERS = 16
+
+
 class OAuthCallbackBody(BaseModel):
     provider: str
     code: str
@@ -73,6 +97,11 @@ class LoginAuditResponse(BaseModel):
     reason: Optional[str]
 
 
+class KpiBatchBody(BaseModel):
+    node_ids: list[str]
+    days: int = 7
+
+
 class AegmallOrderBody(BaseModel):
     order_id: str
     user_id: str
@@ -90,6 +119,19 @@ class AegmallOrderResponseBody(BaseModel):
     bonus_ids: list[str]
 
 
+class AegmallOrderBatchBody(BaseModel):
+    orders: list[AegmallOrderBody]
+
+
+class AegmallBatchOrderResultBody(BaseModel):
+    order_id: str
+    idempotency_key: str
+    status: str
+    bonuses_created: int
+    bonus_ids: list[str]
+    error: Optional[str] = None
+
+
 class WithdrawalApproveBody(BaseModel):
     approved_by: str
     finalize: bool = True
@@ -97,6 +139,10 @@ class WithdrawalApproveBody(BaseModel):
     coin: Optional[str] = None
 
 
+class WithdrawalBatchApproveBody(WithdrawalApproveBody):
+    request_ids: list[str]
+
+
 class WithdrawalResponseBody(BaseModel):
     request_id: str
     wallet_id: str
@@ -107,6 +153,7 @@ class WithdrawalResponseBody(BaseModel):
     approved_at: Optional[datetime] = None
     notes: Optional[str] = None
     metadata: Optional[dict[str, Any]] = None
+    created_at: Optional[datetime] = None
 
 
 class TwoFactorStatusResponse(BaseModel):
@@ -121,8 +168,16 @@ def create_http_app(
     *,
     include_two_factor: bool = True,
     shutdown_on_exit: bool | None = None,
+    blocking_workers: int = DEFAULT_BLOCKING_WORKERS,
 ) -> FastAPI:
-    """Create a FastAPI application serving the OAuth authentication endpoint."""
+    """Create a FastAPI application serving the OAuth authentication endpoint.
+
+    The facades are synchronous, so every handler hands them to a worker thread
+    bounded by ``blocking_workers`` instead of running them on the event loop.
+    """
+
+    if blocking_workers <= 0:
+        raise ValueError("blocking_workers must be positive")
 
     created_application = application or create_application()
     Base.metadata.create_all(created_application.container.session_manager.engine)
@@ -133,10 +188,12 @@ def create_http_app(
 
     app = FastAPI()
     app.state.application = created_application
+    app.state.blocking_limiter = anyio.CapacityLimiter(blocking_workers)
     signup_api = SignupAPI.from_container(created_application.container)
     password_login_api = PasswordLoginAPI.from_container(created_application.container)
     login_audit_api = LoginAuditAPI.from_container(created_application.container)
     kpi_api = OrganizationKpiAPI.from_container(created_application.container)
+    organization_api = OrganizationTreeAPI.from_container(created_application.container)
     aegmall_api = AegmallInboundAPI.from_container(created_application.container)
     withdrawal_api = WithdrawalApprovalAPI.from_container(created_application.container)
 
@@ -145,6 +202,7 @@ def create_http_app(
     app.state.password_login_api = password_login_api
     app.state.login_audit_api = login_audit_api
     app.state.kpi_api = kpi_api
+    app.state.organization_api = organization_api
     app.state.aegmall_api = aegmall_api
     app.state.withdrawal_api = withdrawal_api
 
@@ -154,6 +212,11 @@ def create_http_app(
     if shutdown_on_exit:
         @app.on_event("shutdown")
         async def _shutdown() -> None:
+            container = created_application.container
+            if container.oauth_transport is not None:
+                await container.oauth_transport.aclose()
+            if container.turnstile_async_client is not None:
+                await container.turnstile_async_client.aclose()
             shutdown_application(created_application)
 
     @app.post("/oauth/callback")
@@ -171,8 +234,16 @@ def create_http_app(
             two_factor_code=body.two_factor_code,
         )
         remote_ip = request.client.host if request.client else None
+        _enforce_rate_limits(created_application.container, (OAUTH_IP, remote_ip))
+        await _prefetch_turnstile(created_application.container, body.turnstile_token, remote_ip)
         try:
-            result = api.authenticate(payload, remote_ip=remote_ip)
+            result = await api.authenticate_async(
+                payload,
+                remote_ip=remote_ip,
+                offload=partial(_run_blocking, request),
+            )
+        except RateLimitExceeded as exc:
+            raise _rate_limited(exc) from exc
         except TurnstileError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         except ValueError as exc:
@@ -197,10 +268,13 @@ def create_http_app(
             turnstile_token=body.turnstile_token,
             remote_ip=request.client.host if request.client else None,
         )
+        await _prefetch_turnstile(created_application.container, payload.turnstile_token, payload.remote_ip)
         try:
-            result = api.register(payload)
+            result = await api.register_async(payload, offload=partial(_run_blocking, request))
         except SignupError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except PasswordHasherBusy as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
         return JSONResponse(_signup_result_to_dict(result), status_code=201)
 
     @app.post("/login/password")
@@ -216,22 +290,50 @@ def create_http_app(
             two_factor_code=body.two_factor_code,
             remote_ip=request.client.host if request.client else None,
         )
+        _enforce_rate_limits(
+            created_application.container,
+            (LOGIN_IP, payload.remote_ip),
+            (LOGIN_EMAIL, payload.email.strip().lower()),
+        )
+        await _prefetch_turnstile(created_application.container, payload.turnstile_token, payload.remote_ip)
         try:
-            result = api.login(payload)
+            result = await api.login_async(payload, offload=partial(_run_blocking, request))
+        except RateLimitExceeded as exc:
+            raise _rate_limited(exc) from exc
         except LoginError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except PasswordHasherBusy as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
         return JSONResponse(_result_to_dict(result))
 
+    @app.post("/logout", status_code=204)
+    async def logout(request: Request) -> Response:
+        token = _bearer_token(request)
+        container = created_application.container
+        session_id = token
+        signer = container.session_signer
+        if signer is not None and signer.is_signed(token):
+            record = signer.verify(token)
+            if record is None:
+                raise HTTPException(status_code=401, detail="unauthorized")
+            session_id = record.token
+        await _run_blocking(request, _revoke_session, container, session_id)
+        if container.access_cache:
+            container.access_cache.revoke(token)
+        if container.session_revocations:
+            container.session_revocations.add(session_id)
+        return Response(status_code=204)
+
     @app.get("/audit/logins")
     async def list_login_audits(
         request: Request,
         limit: int = 100,
         api: LoginAuditAPI = Depends(_get_login_audit_api),
     ) -> list[LoginAuditResponse]:
-        access = _require_access(request, ("audits:view",))
+        access = await _require_access(request, ("audits:view",))
         policy = AccessPolicy(access)
         mask_subjects = not policy.can_view_full_audit_subjects()
-        records = api.list_recent(limit=limit)
+        records = await _run_blocking(request, api.list_recent, limit=limit)
         return [
             LoginAuditResponse(
                 provider=record.provider,
@@ -250,13 +352,72 @@ def create_http_app(
         days: int = 7,
         api: OrganizationKpiAPI = Depends(_get_kpi_api),
     ) -> JSONResponse:
-        access = _require_access(request, ("kpi:read",))
-        summary = api.get_summary(node_id=node_id, tree_type=tree_type, days=days, access=access)
-        return JSONResponse(serialize_summary(summary))
+        access = await _require_access(request, ("kpi:read",))
+        payload = await _run_blocking(
+            request,
+            api.get_summary_payload,
+            node_id=node_id,
+            tree_type=tree_type,
+            days=days,
+            access=access,
+        )
+        return JSONResponse(payload)
+
+    @app.post("/admin/organizations/{tree_type}/kpi:batch")
+    async def get_organization_kpi_batch(
+        tree_type: str,
+        body: KpiBatchBody,
+        request: Request,
+        api: OrganizationKpiAPI = Depends(_get_kpi_api),
+    ) -> JSONResponse:
+        access = await _require_access(request, ("kpi:read",))
+        summaries = await _run_blocking(request, api.get_summaries, body.node_ids, tree_type, days=body.days, access=access)
+        return JSONResponse({"items": [serialize_compact_summary(summary) for summary in summaries]})
+
+    @app.get("/admin/organizations/{tree_type}/{node_id}/ancestors")
+    async def list_organization_ancestors(
+        tree_type: str,
+        node_id: str,
+        request: Request,
+        depth: Optional[int] = None,
+        api: OrganizationTreeAPI = Depends(_get_organization_api),
+    ) -> JSONResponse:
+        access = await _require_access(request, ("organizations:view",))
+        ancestors = await _run_blocking(request, api.list_ancestors, node_id, tree_type, max_depth=depth, access=access)
+        return JSONResponse({"items": [serialize_node(node) for node in ancestors]})
+
+    @app.get("/admin/organizations/{tree_type}/{node_id}/descendants")
+    async def list_organization_descendants(
+        tree_type: str,
+        node_id: str,
+        request: Request,
+        depth: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        api: OrganizationTreeAPI = Depends(_get_organization_api),
+    ) -> JSONResponse:
+        access = await _require_access(request, ("organizations:view",))
+        page = await _run_blocking(
+            request,
+            api.list_descendants,
+            node_id,
+            tree_type,
+            max_depth=depth,
+            limit=limit,
+            cursor=cursor,
+            access=access,
+        )
+        return JSONResponse(
+            {
+                "items": [serialize_node(node) for node in page.items],
+                "next_cursor": page.next_cursor,
+            },
+        )
 
     @app.post("/aegmall/orders", status_code=201)
     async def ingest_aegmall_order(
         body: AegmallOrderBody,
+        request: Request,
         api: AegmallInboundAPI = Depends(_get_aegmall_api),
     ) -> JSONResponse:
         request_payload = AegmallOrderRequest(
@@ -269,7 +430,7 @@ def create_http_app(
             idempotency_key=body.idempotency_key,
         )
         try:
-            result = api.process_order(request_payload)
+            result = await _run_blocking(request, api.process_order, request_payload)
         except IdempotencyConflict as exc:
             raise HTTPException(status_code=409, detail=str(exc)) from exc
         except IdempotencyPending as exc:
@@ -289,6 +450,115 @@ def create_http_app(
             status_code=status_code,
         )
 
+    @app.post("/aegmall/orders:batch")
+    async def ingest_aegmall_orders_batch(
+        body: AegmallOrderBatchBody,
+        request: Request,
+        api: AegmallInboundAPI = Depends(_get_aegmall_api),
+    ) -> JSONResponse:
+        order_requests = [
+            AegmallOrderRequest(
+                order_id=order.order_id,
+                user_id=order.user_id,
+                total_amount=order.total_amount,
+                pv_amount=order.pv_amount,
+                channel=order.channel,
+                metadata=order.metadata or {},
+                idempotency_key=order.idempotency_key,
+            )
+            for order in body.orders
+        ]
+        try:
+            results = await _run_blocking(request, api.process_orders, order_requests)
+        except AegmallOrderError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+        return JSONResponse(
+            {
+                "results": [
+                    AegmallBatchOrderResultBody(
+                        order_id=result.order_id,
+                        idempotency_key=result.idempotency_key,
+                        status=result.status,
+                        bonuses_created=result.bonuses_created,
+                        bonus_ids=list(result.bonus_ids),
+                        error=result.error,
+                    ).model_dump()
+                    for result in results
+                ],
+            },
+        )
+
+    @app.get("/admin/withdrawals")
+    async def list_withdrawals(
+        request: Request,
+        status: list[str] = Query(default=[WITHDRAWAL_STATUS_PENDING]),
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        api: WithdrawalApprovalAPI = Depends(_get_withdrawal_api),
+    ) -> JSONResponse:
+        access = await _require_access(request, ("wallets:approve_withdrawal",))
+        if limit <= 0 or limit > WithdrawalApprovalAPI.MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail="invalid_limit")
+        try:
+            page = await _run_blocking(
+                request,
+                api.list_requests,
+                statuses=status,
+                created_before=created_before,
+                cursor=cursor,
+                limit=limit,
+            )
+        except PointWalletError as exc:
+            raise HTTPException(status_code=400, detail="invalid_cursor") from exc
+        policy = AccessPolicy(access)
+        return JSONResponse(
+            {
+                "items": [
+                    _mask_withdrawal_payload(_withdrawal_response(snapshot).model_dump(mode="json"), policy)
+                    for snapshot in page.items
+                ],
+                "next_cursor": page.next_cursor,
+            },
+        )
+
+    @app.post("/admin/withdrawals/approve")
+    async def approve_withdrawals(
+        body: WithdrawalBatchApproveBody,
+        request: Request,
+        api: WithdrawalApprovalAPI = Depends(_get_withdrawal_api),
+    ) -> JSONResponse:
+        access = await _require_access(request, ("wallets:approve_withdrawal",))
+        if not body.request_ids or len(body.request_ids) > WithdrawalApprovalAPI.MAX_BATCH_SIZE:
+            raise HTTPException(status_code=400, detail="invalid_batch_size")
+        results = await _run_blocking(
+            request,
+            api.approve_many,
+            body.request_ids,
+            approved_by=body.approved_by,
+            notes=body.notes,
+            coin=body.coin,
+            finalize=body.finalize,
+        )
+        policy = AccessPolicy(access)
+        return JSONResponse(
+            {
+                "results": [
+                    {
+                        "request_id": result.request_id,
+                        "withdrawal": (
+                            _mask_withdrawal_payload(_withdrawal_response(result.snapshot).model_dump(mode="json"), policy)
+                            if result.snapshot
+                            else None
+                        ),
+                        "error": result.error,
+                    }
+                    for result in results
+                ],
+            },
+        )
+
     @app.post("/admin/withdrawals/{request_id}/approve")
     async def approve_withdrawal(
         request_id: str,
@@ -296,9 +566,11 @@ def create_http_app(
         request: Request,
         api: WithdrawalApprovalAPI = Depends(_get_withdrawal_api),
     ) -> WithdrawalResponseBody:
-        access = _require_access(request, ("wallets:approve_withdrawal",))
+        access = await _require_access(request, ("wallets:approve_withdrawal",))
         try:
-            snapshot = api.approve(
+            snapshot = await _run_blocking(
+                request,
+                api.approve,
                 request_id,
                 approved_by=body.approved_by,
                 notes=body.notes,
@@ -312,31 +584,16 @@ def create_http_app(
         except WithdrawalExecutionError as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-        metadata = dict(snapshot.metadata) if snapshot.metadata else None
-        response = WithdrawalResponseBody(
-            request_id=snapshot.request_id,
-            wallet_id=snapshot.wallet_id,
-            amount=snapshot.amount,
-            status=snapshot.status,
-            requested_by=snapshot.requested_by,
-            approved_by=snapshot.approved_by,
-            approved_at=snapshot.approved_at,
-            notes=snapshot.notes,
-            metadata=metadata,
-        )
         status_code = 202 if snapshot.status == WITHDRAWAL_STATUS_APPROVED_STAGE1 else 200
-        payload = response.model_dump(mode="json")
+        payload = _withdrawal_response(snapshot).model_dump(mode="json")
         masked_payload = _mask_withdrawal_payload(payload, AccessPolicy(access))
         return JSONResponse(masked_payload, status_code=status_code)
 
     @app.get("/admin/users/{user_id}/two_factor", response_model=TwoFactorStatusResponse)
     async def get_two_factor_status(user_id: str, request: Request) -> TwoFactorStatusResponse:
-        _require_access(request, ("users:two_factor:view",))
+        await _require_access(request, ("users:two_factor:view",))
         application: Application = request.app.state.application
-        container = application.container
-        with container.session_manager.session_scope() as session:
-            repo = SqlAlchemyTwoFactorRepository(session)
-            record = repo.get(user_id)
+        record = await _run_blocking(request, _load_two_factor, application.container, user_id)
         if not record:
             return TwoFactorStatusResponse(
                 user_id=user_id,
@@ -356,14 +613,17 @@ def create_http_app(
 
     @app.post("/admin/users/{user_id}/two_factor/disable", status_code=204)
     async def disable_two_factor(user_id: str, request: Request) -> Response:
-        access = _require_access(request, ("users:two_factor:disable",))
+        access = await _require_access(request, ("users:two_factor:disable",))
         application: Application = request.app.state.application
-        container = application.container
-        with container.session_manager.session_scope() as session:
-            repo = SqlAlchemyTwoFactorRepository(session)
-            service = TwoFactorService(repo, event_hook=container.event_hook)
-            if not service.disable(user_id, actor_id=access.user_id):
-                raise HTTPException(status_code=404, detail="two_factor_not_enabled")
+        disabled = await _run_blocking(
+            request,
+            _disable_two_factor,
+            application.container,
+            user_id,
+            actor_id=access.user_id,
+        )
+        if not disabled:
+            raise HTTPException(status_code=404, detail="two_factor_not_enabled")
         return Response(status_code=204)
 
     @app.get("/qa/checklist", response_class=HTMLResponse)
@@ -414,6 +674,13 @@ def _get_kpi_api(request: Request) -> OrganizationKpiAPI:
     return api
 
 
+def _get_organization_api(request: Request) -> OrganizationTreeAPI:
+    api = getattr(request.app.state, "organization_api", None)
+    if api is None:  # pragma: no cover - defensive guard
+        raise RuntimeError("OrganizationTreeAPI is not configured.")
+    return api
+
+
 def _get_aegmall_api(request: Request) -> AegmallInboundAPI:
     api = getattr(request.app.state, "aegmall_api", None)
     if api is None:  # pragma: no cover - defensive guard
@@ -444,19 +711,122 @@ def _signup_result_to_dict(result: SignupResult) -> dict[str, object]:
     }
 
 
-def _require_access(request: Request, required_permissions: tuple[str, ...]) -> AccessContext:
+async def _run_blocking(request: Request, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous call on a worker thread bounded by the app's blocking limiter."""
+    limiter: anyio.CapacityLimiter = request.app.state.blocking_limiter
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=limiter)
+
+
+def _enforce_rate_limits(container: ServiceContainer, *checks: tuple[str, str | None]) -> None:
+    """Apply rate-limit rules before any hashing, provider or database work."""
+    limiter = container.rate_limiter
+    if limiter is None:
+        return
+    try:
+        for rule_name, subject in checks:
+            limiter.check(rule_name, subject)
+    except RateLimitExceeded as exc:
+        raise _rate_limited(exc) from exc
+
+
+def _rate_limited(exc: RateLimitExceeded) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": retry_after_header(exc)})
+
+
+async def _prefetch_turnstile(container: ServiceContainer, token: str | None, remote_ip: str | None) -> None:
+    """Verify the Turnstile token on the event loop so the facade's own check is a cache hit.
+
+    Rejections are cached too and re-raised by the facade, which keeps the per-route
+    error mapping in one place. Transport errors are not cached, so they end the request
+    here rather than letting the facade call Cloudflare a second time.
+    """
+    verifier = container.turnstile_verifier
+    if not token or not isinstance(verifier, TurnstileVerifier) or not verifier.is_async:
+        return
+    try:
+        await verifier.verify_async(token, remote_ip)
+    except TurnstileError:
+        return
+    except httpx.HTTPError as exc:
+        raise HTTPException(status_code=503, detail="turnstile_unavailable", headers={"Retry-After": "1"}) from exc
+
+
+def _load_two_factor(container: ServiceContainer, user_id: str) -> TwoFactorRecord | None:
+    with container.session_manager.session_scope() as session:
+        return SqlAlchemyTwoFactorRepository(session).get(user_id)
+
+
+def _disable_two_factor(container: ServiceContainer, user_id: str, *, actor_id: str) -> bool:
+    with container.session_manager.session_scope() as session:
+        repo = SqlAlchemyTwoFactorRepository(session)
+        service = TwoFactorService(repo, event_hook=container.event_hook, keyring=container.keyring)
+        return service.disable(user_id, actor_id=actor_id)
+
+
+def _load_session(container: ServiceContainer, token: str) -> SessionRecord | None:
+    with container.session_manager.session_scope() as session:
+        return SqlAlchemySessionRepository(session).get_session(token)
+
+
+def _revoke_session(container: ServiceContainer, token: str) -> bool:
+    with container.session_manager.session_scope() as session:
+        return SqlAlchemySessionRepository(session).revoke_session(token)
+
+
+def _bearer_token(request: Request) -> str:
     auth_header = request.headers.get("authorization")
     if not auth_header or not auth_header.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="unauthorized")
     token = auth_header.split(" ", 1)[1].strip()
     if not token:
         raise HTTPException(status_code=401, detail="unauthorized")
+    return token
+
 
+async def _require_access(request: Request, required_permissions: tuple[str, ...]) -> AccessContext:
+    token = _bearer_token(request)
     application: Application = request.app.state.application
     container = application.container
-    with container.session_manager.session_scope() as session:
-        repo = SqlAlchemySessionRepository(session)
-        record = repo.get_session(token)
+    signer = container.session_signer
+    if signer is not None and signer.is_signed(token):
+        access = await _resolve_signed_access(request, container, signer, token)
+    else:
+        access = await _resolve_session_access(request, container, token)
+
+    policy = AccessPolicy(access)
+    if required_permissions and not policy.has_all(required_permissions):
+        raise HTTPException(status_code=403, detail="forbidden")
+    return access
+
+
+async def _resolve_signed_access(
+    request: Request,
+    container: ServiceContainer,
+    signer: SessionTokenSigner,
+    token: str,
+) -> AccessContext:
+    record = signer.verify(token)
+    if record is None:
+        raise HTTPException(status_code=401, detail="unauthorized")
+    if record.expires_at <= time.time():
+        raise HTTPException(status_code=401, detail="session_expired")
+
+    revocations = container.session_revocations
+    if revocations is not None:
+        if revocations.is_stale():
+            await _run_blocking(request, revocations.refresh)
+        if record.token in revocations:
+            raise HTTPException(status_code=401, detail="unauthorized")
+    return AccessContext.from_session(record)
+
+
+async def _resolve_session_access(request: Request, container: ServiceContainer, token: str) -> AccessContext:
+    cache = container.access_cache
+    access = cache.get(token) if cache else None
+    if access is not None:
+        return access
+
+    record = await _run_blocking(request, _load_session, container, token)
 
     if record is None:
         raise HTTPException(status_code=401, detail="unauthorized")
@@ -465,12 +835,26 @@ def _require_access(request: Request, required_permissions: tuple[str, ...]) ->
         raise HTTPException(status_code=401, detail="session_expired")
 
     access = AccessContext.from_session(record)
-    policy = AccessPolicy(access)
-    if required_permissions and not policy.has_all(required_permissions):
-        raise HTTPException(status_code=403, detail="forbidden")
+    if cache:
+        cache.put(record, access)
     return access
 
 
+def _withdrawal_response(snapshot: WithdrawalSnapshot) -> WithdrawalResponseBody:
+    return WithdrawalResponseBody(
+        request_id=snapshot.request_id,
+        wallet_id=snapshot.wallet_id,
+        amount=snapshot.amount,
+        status=snapshot.status,
+        requested_by=snapshot.requested_by,
+        approved_by=snapshot.approved_by,
+        approved_at=snapshot.approved_at,
+        notes=snapshot.notes,
+        metadata=dict(snapshot.metadata) if snapshot.metadata else None,
+        created_at=snapshot.created_at,
+    )
+
+
 def _mask_withdrawal_payload(payload: dict[str, Any], policy: AccessPolicy) -> dict[str, Any]:
     if policy.can_view_full_personal_data():
         return payload
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
-from typing import Callable, Mapping, Set
+from typing import Callable, Mapping, Sequence, Set
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from aeghash.core.organization_kpi import KpiSummary, OrganizationKpiService
+from aeghash.core.organization_kpi import (
+    CachedKpiSummary,
+    CompactKpiSummary,
+    KpiSummary,
+    KpiSummaryCache,
+    OrganizationKpiService,
+)
 from aeghash.core.repositories import OrganizationMetricsRepository, OrganizationRepository
 from aeghash.infrastructure.bootstrap import ServiceContainer
 from aeghash.infrastructure.repositories import (
@@ -58,19 +65,150 @@ def serialize_summary(summary: KpiSummary) -> dict[str, object]:
     }
 
 
+def serialize_compact_summary(summary: CompactKpiSummary) -> dict[str, object]:
+    return {
+        "node_id": summary.node_id,
+        "tree_type": summary.tree_type,
+        "period": {
+            "start": summary.period_start.isoformat(),
+            "end": summary.period_end.isoformat(),
+        },
+        "totals": {
+            "personal_volume": _decimal_to_str(summary.total_personal_volume),
+            "group_volume": _decimal_to_str(summary.total_group_volume),
+            "orders": summary.total_orders,
+        },
+        "latest": {
+            "personal_volume": _decimal_to_str(summary.latest_personal_volume),
+            "group_volume": _decimal_to_str(summary.latest_group_volume),
+            "volume_left": _decimal_to_str(summary.latest_volume_left),
+            "volume_right": _decimal_to_str(summary.latest_volume_right),
+        },
+    }
+
+
+def enforce_node_access(
+    organization_repo: OrganizationRepository,
+    access: AccessContext,
+    *,
+    node_id: str,
+    tree_type: str,
+) -> None:
+    """Raise ``HTTPException`` unless ``access`` may view ``node_id`` (global, scoped, or own downline)."""
+    policy = AccessPolicy(access)
+    if policy.has_global_kpi_access():
+        return
+
+    node = organization_repo.get_node(node_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail="organization_node_not_found")
+    if node.tree_type != tree_type:
+        raise HTTPException(status_code=400, detail="invalid_tree_type")
+
+    scoped_nodes = policy.allowed_kpi_nodes()
+    if scoped_nodes:
+        if _is_node_in_scope(organization_repo, node_id, tree_type, scoped_nodes):
+            return
+        raise HTTPException(status_code=403, detail="forbidden")
+
+    owner_node = organization_repo.get_node_by_user(tree_type, access.user_id)
+    if owner_node is None:
+        raise HTTPException(status_code=403, detail="forbidden")
+    if owner_node.node_id == node_id:
+        return
+    if owner_node.node_id in _ancestor_ids(organization_repo, node_id, tree_type):
+        return
+    raise HTTPException(status_code=403, detail="forbidden")
+
+
+def enforce_nodes_access(
+    organization_repo: OrganizationRepository,
+    access: AccessContext,
+    *,
+    node_ids: Sequence[str],
+    tree_type: str,
+) -> None:
+    """Batch form of :func:`enforce_node_access`; ancestry comes from each node's materialized path."""
+    policy = AccessPolicy(access)
+    if policy.has_global_kpi_access():
+        return
+
+    nodes = {node.node_id: node for node in organization_repo.get_nodes_by_ids(list(node_ids))}
+    missing = [node_id for node_id in node_ids if node_id not in nodes]
+    if missing:
+        raise HTTPException(status_code=404, detail="organization_node_not_found")
+    if any(node.tree_type != tree_type for node in nodes.values()):
+        raise HTTPException(status_code=400, detail="invalid_tree_type")
+
+    allowed = visible_root_nodes(organization_repo, access, tree_type=tree_type) or set()
+    for node in nodes.values():
+        lineage = {segment for segment in node.path.split("/") if segment}
+        lineage.add(node.node_id)
+        if allowed.isdisjoint(lineage):
+            raise HTTPException(status_code=403, detail="forbidden")
+
+
+def visible_root_nodes(
+    organization_repo: OrganizationRepository,
+    access: AccessContext,
+    *,
+    tree_type: str,
+) -> set[str] | None:
+    """Return the nodes whose downlines ``access`` may view, or None for global access."""
+    policy = AccessPolicy(access)
+    if policy.has_global_kpi_access():
+        return None
+    scoped_nodes = policy.allowed_kpi_nodes()
+    if scoped_nodes:
+        return set(scoped_nodes.get(None, set()) | scoped_nodes.get(tree_type, set()))
+    owner_node = organization_repo.get_node_by_user(tree_type, access.user_id)
+    return {owner_node.node_id} if owner_node is not None else set()
+
+
+def _is_node_in_scope(
+    organization_repo: OrganizationRepository,
+    node_id: str,
+    tree_type: str,
+    scoped_nodes: Mapping[str | None, Set[str]],
+) -> bool:
+    direct_matches = scoped_nodes.get(None, set())
+    if node_id in direct_matches:
+        return True
+
+    scoped_for_tree = scoped_nodes.get(tree_type, set())
+    if node_id in scoped_for_tree:
+        return True
+
+    all_candidates = direct_matches | scoped_for_tree
+    if not all_candidates:
+        return False
+    return not all_candidates.isdisjoint(_ancestor_ids(organization_repo, node_id, tree_type))
+
+
+def _ancestor_ids(organization_repo: OrganizationRepository, node_id: str, tree_type: str) -> Set[str]:
+    # One closure-table read answers every "is X above this node?" question.
+    return {ancestor.node_id for ancestor in organization_repo.list_ancestors(node_id, tree_type=tree_type)}
+
+
 class OrganizationKpiAPI:
     """Facade for retrieving organization KPI summaries."""
 
+    MAX_BATCH_NODES = 500
+
     def __init__(
         self,
         container: ServiceContainer,
         *,
         repository_factory: Callable[[Session], OrganizationMetricsRepository] | None = None,
         organization_repo_factory: Callable[[Session], OrganizationRepository] | None = None,
+        cache: KpiSummaryCache | None = None,
+        today_factory: Callable[[], date] | None = None,
     ) -> None:
         self._container = container
         self._repository_factory = repository_factory or SqlAlchemyOrganizationMetricsRepository
         self._organization_repo_factory = organization_repo_factory or SqlAlchemyOrganizationRepository
+        self._cache = cache
+        self._today = today_factory or date.today
 
     @classmethod
     def from_container(
@@ -84,6 +222,7 @@ class OrganizationKpiAPI:
             container,
             repository_factory=repository_factory,
             organization_repo_factory=organization_repo_factory,
+            cache=getattr(container, "kpi_cache", None),
         )
 
     def get_summary(
@@ -94,84 +233,90 @@ class OrganizationKpiAPI:
         days: int = 7,
         access: AccessContext | None = None,
     ) -> KpiSummary:
+        return self._get_cached(node_id, tree_type, days=days, access=access).summary
+
+    def get_summary_payload(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        days: int = 7,
+        access: AccessContext | None = None,
+    ) -> Mapping[str, object]:
+        """Return the serialized summary, rendering it at most once per cache entry."""
+        entry = self._get_cached(node_id, tree_type, days=days, access=access)
+        if entry.payload is None:
+            entry.payload = serialize_summary(entry.summary)
+        return entry.payload
+
+    def _get_cached(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        days: int,
+        access: AccessContext | None,
+    ) -> CachedKpiSummary:
         if days <= 0 or days > 90:
             raise HTTPException(status_code=400, detail="invalid_days")
 
-        with self._container.session_manager.session_scope() as session:
-            repository = self._repository_factory(session)
-            organization_repo = None
-            if access is not None:
+        # Global viewers skip the session entirely; scoped viewers still need the tree for RLS.
+        if access is not None and not AccessPolicy(access).has_global_kpi_access():
+            with self._container.session_manager.session_scope() as session:
                 organization_repo = self._organization_repo_factory(session)
                 self._enforce_access(organization_repo, access, node_id=node_id, tree_type=tree_type)
 
-            service = OrganizationKpiService(repository)
+        today = self._today()
+        generation: str | None = None
+        if self._cache is not None:
+            generation = self._cache.generation(node_id, tree_type)
+            cached = self._cache.get(node_id, tree_type, days=days, today=today, generation=generation)
+            if cached is not None:
+                return cached
+
+        with self._container.session_manager.session_scope() as session:
+            service = OrganizationKpiService(self._repository_factory(session), today_factory=lambda: today)
             summary = service.get_summary(node_id=node_id, tree_type=tree_type, days=days)
-            self._dispatch_alerts(summary)
-            return summary
+        self._dispatch_alerts(summary)
 
-    # ------------------------------------------------------------------ internal helpers
+        entry = CachedKpiSummary(summary=summary)
+        if self._cache is not None and generation is not None:
+            self._cache.put(node_id, tree_type, days=days, today=today, generation=generation, entry=entry)
+        return entry
 
-    def _enforce_access(
+    def get_summaries(
         self,
-        organization_repo: OrganizationRepository,
-        access: AccessContext,
-        *,
-        node_id: str,
+        node_ids: Sequence[str],
         tree_type: str,
-    ) -> None:
-        policy = AccessPolicy(access)
-        if policy.has_global_kpi_access():
-            return
+        *,
+        days: int = 7,
+        access: AccessContext | None = None,
+    ) -> list[CompactKpiSummary]:
+        if days <= 0 or days > 90:
+            raise HTTPException(status_code=400, detail="invalid_days")
+        unique_ids = list(dict.fromkeys(node_ids))
+        if not unique_ids or len(unique_ids) > self.MAX_BATCH_NODES:
+            raise HTTPException(status_code=400, detail="invalid_node_ids")
 
-        node = organization_repo.get_node(node_id)
-        if node is None:
-            raise HTTPException(status_code=404, detail="organization_node_not_found")
-        if node.tree_type != tree_type:
-            raise HTTPException(status_code=400, detail="invalid_tree_type")
+        with self._container.session_manager.session_scope() as session:
+            if access is not None:
+                organization_repo = self._organization_repo_factory(session)
+                enforce_nodes_access(organization_repo, access, node_ids=unique_ids, tree_type=tree_type)
 
-        scoped_nodes = policy.allowed_kpi_nodes()
-        if scoped_nodes:
-            if self._is_node_in_scope(organization_repo, node_id, tree_type, scoped_nodes):
-                return
-            raise HTTPException(status_code=403, detail="forbidden")
+            service = OrganizationKpiService(self._repository_factory(session))
+            return service.get_summaries(unique_ids, tree_type, days=days)
 
-        owner_node = organization_repo.get_node_by_user(tree_type, access.user_id)
-        if owner_node is None:
-            raise HTTPException(status_code=403, detail="forbidden")
-        if owner_node.node_id == node_id:
-            return
-        if organization_repo.is_descendant(
-            ancestor_node_id=owner_node.node_id,
-            descendant_node_id=node_id,
-            tree_type=tree_type,
-        ):
-            return
-        raise HTTPException(status_code=403, detail="forbidden")
+    # ------------------------------------------------------------------ internal helpers
 
-    def _is_node_in_scope(
+    def _enforce_access(
         self,
         organization_repo: OrganizationRepository,
+        access: AccessContext,
+        *,
         node_id: str,
         tree_type: str,
-        scoped_nodes: Mapping[str | None, Set[str]],
-    ) -> bool:
-        direct_matches = scoped_nodes.get(None, set())
-        if node_id in direct_matches:
-            return True
-
-        scoped_for_tree = scoped_nodes.get(tree_type, set())
-        if node_id in scoped_for_tree:
-            return True
-
-        all_candidates = direct_matches | scoped_for_tree
-        for candidate in all_candidates:
-            if organization_repo.is_descendant(
-                ancestor_node_id=candidate,
-                descendant_node_id=node_id,
-                tree_type=tree_type,
-            ):
-                return True
-        return False
+    ) -> None:
+        enforce_node_access(organization_repo, access, node_id=node_id, tree_type=tree_type)
 
     def _dispatch_alerts(self, summary: KpiSummary) -> None:
         notifier = self._container.notifier
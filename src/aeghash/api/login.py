@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterator, Optional
 
+import anyio
 from sqlalchemy.orm import Session
 
 from aeghash.core.login_service import LoginError, LoginRequest, PasswordLoginService
+from aeghash.core.auth_flow import AuthenticationResult
 from aeghash.core.repositories import (
     LoginAuditRepository,
     SessionRepository,
     TwoFactorRepository,
+    UserAccountRecord,
     UserAccountRepository,
     UserRepository,
 )
@@ -24,6 +29,7 @@ from aeghash.infrastructure.repositories import (
     SqlAlchemyUserAccountRepository,
     SqlAlchemyUserRepository,
 )
+from aeghash.security.passwords import PasswordHasherBusy, hash_password_async, verify_password_async
 
 
 @dataclass(slots=True)
@@ -57,30 +63,89 @@ class PasswordLoginAPI:
         self._turnstile_verifier = container.turnstile_verifier
 
     def login(self, payload: PasswordLoginPayload):
+        with self._service_scope() as service:
+            return service.login(self._build_request(payload))
+
+    async def login_async(
+        self,
+        payload: PasswordLoginPayload,
+        *,
+        offload: Callable[..., Awaitable[Any]] | None = None,
+    ) -> AuthenticationResult:
+        """Log in, verifying and upgrading the password hash on the hasher's own pool.
+
+        ``offload`` runs the blocking parts (Turnstile, database) on a worker thread.
+        """
+        run = offload or _run_in_thread
+        hasher = self._container.password_hasher
+        request = self._build_request(payload)
+        account = await run(self._begin, request)
+        verified = account is not None and await verify_password_async(
+            request.password,
+            account.password_hash,
+            hasher=hasher,
+        )
+        result, upgrade = await run(self._complete, request, account, verified)
+        if account is not None and upgrade:
+            try:
+                upgraded = await hash_password_async(request.password, hasher=hasher)
+            except PasswordHasherBusy:
+                # The upgrade is opportunistic; the next login will retry it.
+                return result
+            await run(self._store_password_hash, account, upgraded)
+        return result
+
+    def _begin(self, request: LoginRequest) -> Optional[UserAccountRecord]:
+        with self._service_scope() as service:
+            return service.begin(request)
+
+    def _complete(
+        self,
+        request: LoginRequest,
+        account: Optional[UserAccountRecord],
+        verified: bool,
+    ) -> tuple[AuthenticationResult, bool]:
+        with self._service_scope() as service:
+            result = service.complete(request, account, verified=verified)
+            upgrade = account is not None and result.success and service.needs_password_upgrade(account)
+            return result, upgrade
+
+    def _store_password_hash(self, account: UserAccountRecord, password_hash: str) -> None:
+        with self._service_scope() as service:
+            service.store_password_hash(account, password_hash)
+
+    @contextmanager
+    def _service_scope(self) -> Iterator[PasswordLoginService]:
         with self._container.session_manager.session_scope() as session:
             two_factor_service: TwoFactorService | None = None
             if self._two_factor_repo_factory:
                 two_factor_service = TwoFactorService(
                     self._two_factor_repo_factory(session),
                     event_hook=self._container.event_hook,
+                    keyring=self._container.keyring,
+                    rate_limiter=self._container.rate_limiter,
                 )
 
-            service = PasswordLoginService(
+            yield PasswordLoginService(
                 account_repository=self._account_repo_factory(session),
                 identity_repository=self._identity_repo_factory(session),
                 session_repository=self._session_repo_factory(session),
                 audit_repository=self._audit_repo_factory(session),
                 two_factor_service=two_factor_service,
                 turnstile_verifier=self._turnstile_verifier,
+                password_hasher=self._container.password_hasher,
+                token_signer=self._container.session_signer,
             )
-            request = LoginRequest(
-                email=payload.email,
-                password=payload.password,
-                turnstile_token=payload.turnstile_token,
-                remote_ip=payload.remote_ip,
-                two_factor_code=payload.two_factor_code,
-            )
-            return service.login(request)
+
+    @staticmethod
+    def _build_request(payload: PasswordLoginPayload) -> LoginRequest:
+        return LoginRequest(
+            email=payload.email,
+            password=payload.password,
+            turnstile_token=payload.turnstile_token,
+            remote_ip=payload.remote_ip,
+            two_factor_code=payload.two_factor_code,
+        )
 
     @classmethod
     def from_container(cls, container: ServiceContainer) -> "PasswordLoginAPI":
@@ -89,9 +154,21 @@ class PasswordLoginAPI:
             account_repo_factory=lambda session: SqlAlchemyUserAccountRepository(session),
             identity_repo_factory=lambda session: SqlAlchemyUserRepository(session),
             session_repo_factory=lambda session: SqlAlchemySessionRepository(session),
-            audit_repo_factory=lambda session: SqlAlchemyLoginAuditRepository(session),
+            audit_repo_factory=_audit_repo_factory(container),
             two_factor_repo_factory=lambda session: SqlAlchemyTwoFactorRepository(session),
         )
 
 
+def _audit_repo_factory(container: ServiceContainer) -> Callable[[Session], LoginAuditRepository]:
+    # The buffered writer commits on its own, so audit rows survive a failed (rolled back) login.
+    writer = container.audit_writer
+    if writer is not None:
+        return lambda _session: writer
+    return lambda session: SqlAlchemyLoginAuditRepository(session)
+
+
+async def _run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
 __all__ = ["PasswordLoginAPI", "PasswordLoginPayload", "LoginError"]
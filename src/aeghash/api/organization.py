@@ -0,0 +1,120 @@
+"""API layer for browsing organization trees."""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from aeghash.api.kpi import enforce_node_access, visible_root_nodes
+from aeghash.core.organization import OrganizationError
+from aeghash.core.repositories import OrganizationNodePage, OrganizationNodeRecord, OrganizationRepository
+from aeghash.infrastructure.bootstrap import ServiceContainer
+from aeghash.infrastructure.repositories import SqlAlchemyOrganizationRepository
+from aeghash.security.access import AccessContext
+
+
+def serialize_node(node: OrganizationNodeRecord) -> dict[str, object]:
+    return {
+        "node_id": node.node_id,
+        "user_id": node.user_id,
+        "tree_type": node.tree_type,
+        "parent_node_id": node.parent_node_id,
+        "sponsor_user_id": node.sponsor_user_id,
+        "position": node.position,
+        "depth": node.depth,
+        "rank": node.rank,
+        "center_id": node.center_id,
+    }
+
+
+class OrganizationTreeAPI:
+    """Facade serving ancestor paths and paginated downlines for the org-tree view."""
+
+    MAX_PAGE_SIZE = 500
+
+    def __init__(
+        self,
+        container: ServiceContainer,
+        *,
+        organization_repo_factory: Callable[[Session], OrganizationRepository] | None = None,
+    ) -> None:
+        self._container = container
+        self._organization_repo_factory = organization_repo_factory or SqlAlchemyOrganizationRepository
+
+    @classmethod
+    def from_container(
+        cls,
+        container: ServiceContainer,
+        *,
+        organization_repo_factory: Callable[[Session], OrganizationRepository] | None = None,
+    ) -> "OrganizationTreeAPI":
+        return cls(container, organization_repo_factory=organization_repo_factory)
+
+    def list_ancestors(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        max_depth: Optional[int] = None,
+        access: AccessContext | None = None,
+    ) -> list[OrganizationNodeRecord]:
+        if max_depth is not None and max_depth <= 0:
+            raise HTTPException(status_code=400, detail="invalid_depth")
+
+        with self._container.session_manager.session_scope() as session:
+            repository = self._organization_repo_factory(session)
+            if access is not None:
+                enforce_node_access(repository, access, node_id=node_id, tree_type=tree_type)
+            ancestors = list(repository.list_ancestors(node_id, tree_type=tree_type, max_depth=max_depth))
+            roots = visible_root_nodes(repository, access, tree_type=tree_type) if access is not None else None
+            if roots is None:
+                return ancestors
+            # Non-global callers see the upline only as far as their own scope or owner node.
+            node = repository.get_node(node_id)
+            return _within_visible_lineage(ancestors, node, roots) if node is not None else []
+
+    def list_descendants(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        max_depth: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        access: AccessContext | None = None,
+    ) -> OrganizationNodePage:
+        if limit <= 0 or limit > self.MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail="invalid_limit")
+        if max_depth is not None and max_depth <= 0:
+            raise HTTPException(status_code=400, detail="invalid_depth")
+
+        with self._container.session_manager.session_scope() as session:
+            repository = self._organization_repo_factory(session)
+            if access is not None:
+                enforce_node_access(repository, access, node_id=node_id, tree_type=tree_type)
+            try:
+                return repository.list_descendants(
+                    node_id,
+                    tree_type=tree_type,
+                    max_depth=max_depth,
+                    limit=limit,
+                    cursor=cursor,
+                )
+            except OrganizationError as exc:
+                raise HTTPException(status_code=400, detail="invalid_cursor") from exc
+
+
+def _within_visible_lineage(
+    ancestors: list[OrganizationNodeRecord],
+    node: OrganizationNodeRecord,
+    roots: set[str],
+) -> list[OrganizationNodeRecord]:
+    """Drop ancestors above the highest scope root on ``node``'s materialized path."""
+    lineage = [segment for segment in node.path.split("/") if segment]
+    for index, segment in enumerate(lineage):
+        if segment in roots:
+            visible = set(lineage[index:])
+            return [ancestor for ancestor in ancestors if ancestor.node_id in visible]
+    return []
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Optional, Sequence
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterator, Optional, Sequence
 
+import anyio
 from sqlalchemy.orm import Session
 
 from aeghash.adapters.turnstile import TurnstileError
@@ -12,6 +15,7 @@ from aeghash.core.repositories import UserAccountRepository, UserRepository
 from aeghash.core.signup_service import SignupError, SignupResult, SignupService
 from aeghash.infrastructure.bootstrap import ServiceContainer
 from aeghash.infrastructure.repositories import SqlAlchemyUserAccountRepository, SqlAlchemyUserRepository
+from aeghash.security.passwords import hash_password_async
 
 
 @dataclass(slots=True)
@@ -39,6 +43,35 @@ class SignupAPI:
         self._turnstile_verifier = container.turnstile_verifier
 
     def register(self, payload: SignupPayload) -> SignupResult:
+        self._verify_turnstile(payload)
+        with self._service_scope() as service:
+            return service.register(payload.email, payload.password, roles=payload.roles)
+
+    async def register_async(
+        self,
+        payload: SignupPayload,
+        *,
+        offload: Callable[..., Awaitable[Any]] | None = None,
+    ) -> SignupResult:
+        """Register a user, hashing the password on the hasher's own pool.
+
+        ``offload`` runs the blocking parts (Turnstile, database) on a worker thread.
+        """
+        run = offload or _run_in_thread
+        normalized_email = await run(self._prepare, payload)
+        password_hash = await hash_password_async(payload.password, hasher=self._container.password_hasher)
+        return await run(self._create, normalized_email, password_hash, payload.roles)
+
+    def _prepare(self, payload: SignupPayload) -> str:
+        self._verify_turnstile(payload)
+        with self._service_scope() as service:
+            return service.prepare(payload.email, payload.password)
+
+    def _create(self, normalized_email: str, password_hash: str, roles: Sequence[str] | None) -> SignupResult:
+        with self._service_scope() as service:
+            return service.create(normalized_email, password_hash, roles=roles)
+
+    def _verify_turnstile(self, payload: SignupPayload) -> None:
         if self._turnstile_verifier:
             token = payload.turnstile_token
             if not token:
@@ -48,11 +81,12 @@ class SignupAPI:
             except TurnstileError as exc:
                 raise SignupError("turnstile_failed") from exc
 
+    @contextmanager
+    def _service_scope(self) -> Iterator[SignupService]:
         with self._container.session_manager.session_scope() as session:
             accounts = self._account_repo_factory(session)
             identities = self._identity_repo_factory(session)
-            service = SignupService(accounts, identities)
-            return service.register(payload.email, payload.password, roles=payload.roles)
+            yield SignupService(accounts, identities, password_hasher=self._container.password_hasher)
 
     @classmethod
     def from_container(cls, container: ServiceContainer) -> "SignupAPI":
@@ -63,4 +97,8 @@ class SignupAPI:
         )
 
 
+async def _run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
 __all__ = ["SignupAPI", "SignupPayload", "SignupError", "SignupResult"]
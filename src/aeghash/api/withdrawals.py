@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Any, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Mapping, Optional, Sequence
 
 from aeghash.core.mining_workflow import WithdrawalExecutionError
-from aeghash.core.point_wallet import InvalidWithdrawalState, WithdrawalNotFound, WithdrawalSnapshot
-from aeghash.core.withdrawal_workflow import WithdrawalWorkflowService
+from aeghash.core.point_wallet import (
+    InvalidWithdrawalState,
+    PointWalletService,
+    WithdrawalNotFound,
+    WithdrawalPage,
+    WithdrawalSnapshot,
+)
+from aeghash.core.withdrawal_workflow import BatchApprovalResult, WithdrawalWorkflowService
 from aeghash.infrastructure.bootstrap import ServiceContainer, withdrawal_workflow_scope
+from aeghash.infrastructure.repositories import SqlAlchemyPointWalletRepository
 
 
 class WithdrawalApprovalAPI:
     """Facade wrapping WithdrawalWorkflowService for admin operations."""
 
+    MAX_PAGE_SIZE = 200
+    MAX_BATCH_SIZE = 100
+    BATCH_WORKERS = 8
+
     def __init__(self, container: ServiceContainer) -> None:
         self._container = container
 
@@ -52,6 +64,50 @@ class WithdrawalApprovalAPI:
             except WithdrawalExecutionError:
                 raise
 
+    def approve_many(
+        self,
+        request_ids: Sequence[str],
+        *,
+        approved_by: str,
+        notes: str | None = None,
+        coin: str | None = None,
+        finalize: bool = True,
+    ) -> list[BatchApprovalResult]:
+        """Approve a batch in one transaction, sharing one HashDam client across the transfers."""
+        if not self._container.hashdam_client_factory:
+            raise RuntimeError("HashDam client factory is not configured.")
+        with withdrawal_workflow_scope(
+            self._container.session_manager,
+            mining_client_factory=self._container.hashdam_client_factory,
+            notifier=self._container.notifier,
+        ) as workflow:
+            return workflow.approve_many(
+                request_ids,
+                approved_by=approved_by,
+                notes=notes,
+                coin=coin,
+                finalize=finalize,
+                max_workers=self.BATCH_WORKERS,
+            )
+
+    def list_requests(
+        self,
+        *,
+        statuses: Sequence[str] | None = None,
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> WithdrawalPage:
+        """Page through requests across all wallets, oldest first (the approval queue)."""
+        with self._container.session_manager.session_scope() as session:
+            service = PointWalletService(SqlAlchemyPointWalletRepository(session))
+            return service.list_withdrawal_page(
+                statuses=statuses,
+                created_before=created_before,
+                cursor=cursor,
+                limit=limit,
+            )
+
     def list_audit_events(self, request_id: str) -> Sequence[Mapping[str, Any]]:
         if not self._container.hashdam_client_factory:
             raise RuntimeError("HashDam client factory is not configured.")
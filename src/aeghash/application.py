@@ -62,7 +62,7 @@ def create_application(
         logger=logger,
         transport_factory=transport_factory,
     )
-    audit_logger = LoginAuditLogger(container.session_manager)
+    audit_logger = LoginAuditLogger(container.session_manager, writer=container.audit_writer)
     dispatcher.register(audit_logger.handle_event)
     container.audit_logger = audit_logger
     return Application(container=container, metrics=metrics)
@@ -7,7 +7,11 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
+from aeghash.security.passwords import DEFAULT_PROFILE, DEFAULT_SCHEME, PasswordCostProfile
+
 DEFAULT_HASHDAM_BASE_URL = "https://api.pool.hashdam.com/v1"
+SESSION_TOKEN_OPAQUE = "opaque"
+SESSION_TOKEN_SIGNED = "signed"
 DEV_MODE_ENV = "AEGHASH_DEV_MODE"
 
 DEV_DEFAULTS = {
@@ -61,6 +65,7 @@ class OAuthSettings:
 @dataclass
 class TurnstileSettings:
     secret_key: str
+    verify_url: Optional[str] = None
 
 
 @dataclass
@@ -72,6 +77,8 @@ class AppSettings:
     database_url: str
     secret_key: str
     kpi_alerts: Optional["KpiAlertSettings"] = None
+    password_profile: PasswordCostProfile = DEFAULT_PROFILE
+    session_token_format: str = SESSION_TOKEN_OPAQUE
 
 
 @dataclass
@@ -114,6 +121,8 @@ def load_settings() -> AppSettings:
         database_url=database_url,
         secret_key=secret_key,
         kpi_alerts=_load_kpi_alert_settings(),
+        password_profile=_load_password_profile(),
+        session_token_format=_load_session_token_format(),
     )
 
 
@@ -165,7 +174,10 @@ def _require_env(var_name: str) -> str:
 
 
 def _load_turnstile_settings() -> TurnstileSettings:
-    return TurnstileSettings(secret_key=_require_env("TURNSTILE_SECRET_KEY"))
+    return TurnstileSettings(
+        secret_key=_require_env("TURNSTILE_SECRET_KEY"),
+        verify_url=os.getenv("TURNSTILE_VERIFY_URL") or None,
+    )
 
 
 def _optional_decimal(var_name: str) -> Optional[Decimal]:
@@ -186,6 +198,22 @@ def _load_kpi_alert_settings() -> Optional[KpiAlertSettings]:
     return KpiAlertSettings(personal_volume_floor=personal, group_volume_floor=group)
 
 
+def _load_password_profile() -> PasswordCostProfile:
+    scheme = os.environ.get("PASSWORD_HASH_SCHEME") or DEFAULT_SCHEME
+    cost = os.environ.get("PASSWORD_HASH_COST")
+    try:
+        return PasswordCostProfile.for_scheme(scheme, int(cost) if cost else None)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid password hash profile: {exc}") from exc
+
+
+def _load_session_token_format() -> str:
+    value = (os.environ.get("SESSION_TOKEN_FORMAT") or SESSION_TOKEN_OPAQUE).lower()
+    if value not in (SESSION_TOKEN_OPAQUE, SESSION_TOKEN_SIGNED):
+        raise RuntimeError("SESSION_TOKEN_FORMAT must be 'opaque' or 'signed'.")
+    return value
+
+
 def is_dev_mode() -> bool:
     """Return True when development mode is enabled via environment."""
     value = os.environ.get(DEV_MODE_ENV, "")
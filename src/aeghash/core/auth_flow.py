@@ -7,10 +7,18 @@ import time
 from dataclasses import dataclass
 from typing import Optional, Protocol
 
+from aeghash.adapters.oauth import OAuthResult
 from aeghash.core.auth_service import AuthService
 from aeghash.core.repositories import SessionRecord, SessionRepository, UserRecord, UserRepository
 
 
+class SessionTokenIssuer(Protocol):
+    """Protocol for turning a persisted session into the token handed to clients."""
+
+    def sign(self, record: SessionRecord) -> str:
+        ...
+
+
 class TwoFactorManager(Protocol):
     """Protocol for managing second-factor challenges."""
 
@@ -67,6 +75,7 @@ class OAuthFlowService:
         two_factor_manager: TwoFactorManager | None = None,
         turnstile_verifier: TurnstileManager | None = None,
         session_ttl_seconds: int = 3600,
+        token_signer: SessionTokenIssuer | None = None,
     ) -> None:
         self._auth_service = auth_service
         self._user_repository = user_repository
@@ -74,16 +83,24 @@ class OAuthFlowService:
         self._two_factor_manager = two_factor_manager
         self._turnstile_verifier = turnstile_verifier
         self._session_ttl_seconds = session_ttl_seconds
+        self._token_signer = token_signer
 
     def authenticate(self, request: OAuthRequest) -> AuthenticationResult:
         """Execute the OAuth authentication flow."""
+        self.validate(request)
+        auth_result = self._auth_service.authenticate(provider=request.provider, code=request.code)
+        return self.complete(request, auth_result)
+
+    def validate(self, request: OAuthRequest) -> None:
+        """Check state and Turnstile; must pass before the provider code exchange."""
         self._validate_state(request.state, request.expected_state)
         if self._turnstile_verifier:
             if not request.turnstile_token:
                 raise ValueError("Turnstile token is required for authentication.")
             self._turnstile_verifier.verify(request.turnstile_token, request.turnstile_remote_ip)
-        auth_result = self._auth_service.authenticate(provider=request.provider, code=request.code)
 
+    def complete(self, request: OAuthRequest, auth_result: OAuthResult) -> AuthenticationResult:
+        """Resolve the user for an exchanged code, run 2FA and issue the session."""
         user = self._user_repository.find_by_oauth_identity(request.provider, auth_result.profile.subject)
         if user is None:
             raise ValueError("User not registered for OAuth provider.")
@@ -107,7 +124,7 @@ class OAuthFlowService:
             success=True,
             user_id=user.user_id,
             roles=user.roles,
-            session_token=persisted.token,
+            session_token=self._token_signer.sign(persisted) if self._token_signer else persisted.token,
             requires_two_factor=False,
         )
 
@@ -18,6 +18,9 @@ class OAuthClient(Protocol):
     def authenticate(self, *, code: str) -> OAuthResult:
         ...
 
+    async def authenticate_async(self, *, code: str) -> OAuthResult:
+        ...
+
     def close(self) -> None:
         ...
 
@@ -40,26 +43,52 @@ class AuthService:
 
     def authenticate(self, *, provider: str, code: str) -> OAuthResult:
         """Authenticate via the requested provider."""
+        client = self._start(provider)
+        try:
+            result = client.authenticate(code=code)
+        except Exception as exc:
+            self._fail(provider, exc)
+            raise
+        return self._succeed(provider, result)
+
+    async def authenticate_async(self, *, provider: str, code: str) -> OAuthResult:
+        """Authenticate via the requested provider without blocking the event loop."""
+        client = self._start(provider)
+        try:
+            result = await client.authenticate_async(code=code)
+        except Exception as exc:
+            self._fail(provider, exc)
+            raise
+        return self._succeed(provider, result)
+
+    def close(self) -> None:
+        """Close all provider clients."""
+        for client in self._providers.values():
+            client.close()
+
+    def providers(self) -> Mapping[str, OAuthClient]:
+        """Expose the registered providers (read-only)."""
+        return dict(self._providers)
+
+    def _start(self, provider: str) -> OAuthClient:
         self._emit_event("auth.start", {"provider": provider})
         self._logger.info("OAuth authentication started", extra={"provider": provider})
         try:
-            client = self._providers[provider]
+            return self._providers[provider]
         except KeyError as exc:
             self._logger.warning("OAuth provider not registered", extra={"provider": provider})
             self._emit_event("auth.error", {"provider": provider, "reason": "unknown_provider"})
             raise ValueError(f"Unknown OAuth provider: {provider}") from exc
 
-        try:
-            result = client.authenticate(code=code)
-        except Exception as exc:
-            self._logger.error(
-                "OAuth authentication failed",
-                exc_info=exc,
-                extra={"provider": provider},
-            )
-            self._emit_event("auth.error", {"provider": provider, "reason": "exception"})
-            raise
+    def _fail(self, provider: str, exc: Exception) -> None:
+        self._logger.error(
+            "OAuth authentication failed",
+            exc_info=exc,
+            extra={"provider": provider},
+        )
+        self._emit_event("auth.error", {"provider": provider, "reason": "exception"})
 
+    def _succeed(self, provider: str, result: OAuthResult) -> OAuthResult:
         self._emit_event(
             "auth.success",
             {"provider": provider, "subject": result.profile.subject},
@@ -70,15 +99,6 @@ class AuthService:
         )
         return result
 
-    def close(self) -> None:
-        """Close all provider clients."""
-        for client in self._providers.values():
-            client.close()
-
-    def providers(self) -> Mapping[str, OAuthClient]:
-        """Expose the registered providers (read-only)."""
-        return dict(self._providers)
-
     def _emit_event(self, name: str, payload: Mapping[str, object]) -> None:
         if self._event_hook:
             self._event_hook(name, payload)
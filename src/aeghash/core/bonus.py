@@ -5,9 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Iterable, Mapping, Sequence
+from typing import Mapping, Sequence
 
-from aeghash.core.repositories import BonusEntryRecord, BonusRepository, OrganizationRepository
+from aeghash.core.repositories import (
+    BonusEntryRecord,
+    BonusRepository,
+    OrganizationNodeRecord,
+    OrganizationRepository,
+)
 
 
 @dataclass(slots=True)
@@ -28,7 +33,40 @@ class BonusContext:
 
 
 class BonusService:
-    """Distribute bonuses according to configured percentage rules."""
+    """Distribute bonuses according to configured percentage rules.
+
+    Entries are built and recorded by :class:`BatchBonusEngine`; this class keeps the
+    single-service entry point used by callers that only distribute rule bonuses.
+    """
+
+    def __init__(
+        self,
+        organization_repository: OrganizationRepository,
+        bonus_repository: BonusRepository,
+        rules: Sequence[BonusRule],
+        *,
+        id_factory: callable | None = None,
+        clock: callable | None = None,
+    ) -> None:
+        self._engine = BatchBonusEngine(
+            organization_repository,
+            bonus_repository,
+            rules,
+            id_factory=id_factory,
+            clock=clock,
+        )
+
+    def distribute(self, context: BonusContext) -> list[BonusEntryRecord]:
+        return self._engine.distribute(context)
+
+
+class BatchBonusEngine:
+    """Compute bonuses for rules spanning several trees and persist them in one write.
+
+    Ancestor chains for every tree referenced by the rules are resolved with a
+    single repository lookup and entries are built in memory, so callers can
+    combine them with other bonus types before one ``record_bonuses`` call.
+    """
 
     def __init__(
         self,
@@ -39,77 +77,74 @@ class BonusService:
         id_factory: callable | None = None,
         clock: callable | None = None,
     ) -> None:
+        if not rules:
+            raise ValueError("At least one bonus rule is required.")
         self._organizations = organization_repository
         self._bonuses = bonus_repository
         self._rules = list(rules)
+        self._tree_types = list(dict.fromkeys(rule.tree_type for rule in self._rules))
+        self._max_depth = max(len(rule.percentages) for rule in self._rules)
         self._id_factory = id_factory or (lambda: datetime.now(UTC).strftime("%Y%m%d%H%M%S%f"))
         self._clock = clock or (lambda: datetime.now(UTC))
 
-    def distribute(self, context: BonusContext) -> list[BonusEntryRecord]:
-        node = self._organizations.get_node_by_user(self._rules[0].tree_type, context.user_id)
-        if node is None:
-            raise ValueError(f"User '{context.user_id}' is not registered in organization tree '{self._rules[0].tree_type}'.")
+    def calculate(self, context: BonusContext) -> list[BonusEntryRecord]:
+        """Build bonus entries for every rule without touching the bonus repository."""
+        chains = self._organizations.get_ancestor_chains(
+            context.user_id,
+            tree_types=self._tree_types,
+            max_depth=self._max_depth,
+        )
+        for tree_type in self._tree_types:
+            if not chains.get(tree_type):
+                raise ValueError(f"User '{context.user_id}' is not registered in organization tree '{tree_type}'.")
 
         results: list[BonusEntryRecord] = []
         for rule in self._rules:
-            results.extend(self._distribute_for_rule(rule, node, context))
+            chain = chains[rule.tree_type]
+            results.extend(self._entries_for_rule(rule, chain[0], chain[1:], context))
         return results
 
+    def distribute(self, context: BonusContext) -> list[BonusEntryRecord]:
+        """Calculate rule-based entries and record them with a single bulk write."""
+        records = self.calculate(context)
+        if records:
+            self._bonuses.record_bonuses(records)
+        return records
+
     # ------------------------------------------------------------------ helpers
 
-    def _distribute_for_rule(
+    def _entries_for_rule(
         self,
         rule: BonusRule,
-        node,
+        node: OrganizationNodeRecord,
+        ancestors: Sequence[OrganizationNodeRecord],
         context: BonusContext,
     ) -> list[BonusEntryRecord]:
-        ancestors = self._collect_ancestors(node, max_levels=len(rule.percentages))
         created: list[BonusEntryRecord] = []
-        for level, (ancestor_id, ancestor_node) in enumerate(ancestors, start=1):
+        for level, ancestor in enumerate(ancestors[: len(rule.percentages)], start=1):
             percentage = rule.percentages[level - 1]
             if percentage <= 0:
                 continue
             amount = (context.amount * percentage).quantize(Decimal("0.0001"))
-            record = BonusEntryRecord(
-                bonus_id=self._new_id(),
-                user_id=ancestor_node.user_id,
-                source_user_id=context.user_id,
-                bonus_type=rule.bonus_type,
-                order_id=context.order_id,
-                level=level,
-                pv_amount=context.amount,
-                bonus_amount=amount,
-                status="PENDING",
-                metadata={
-                    "order_id": context.order_id,
-                    "tree_type": rule.tree_type,
-                    "source_node_id": node.node_id,
-                    "ancestor_node_id": ancestor_id,
-                    "pv_amount": str(context.amount),
-                } | dict(context.metadata),
-                created_at=self._now(),
+            created.append(
+                BonusEntryRecord(
+                    bonus_id=str(self._id_factory()),
+                    user_id=ancestor.user_id,
+                    source_user_id=context.user_id,
+                    bonus_type=rule.bonus_type,
+                    order_id=context.order_id,
+                    level=level,
+                    pv_amount=context.amount,
+                    bonus_amount=amount,
+                    status="PENDING",
+                    metadata={
+                        "order_id": context.order_id,
+                        "tree_type": rule.tree_type,
+                        "source_node_id": node.node_id,
+                        "ancestor_node_id": ancestor.node_id,
+                        "pv_amount": str(context.amount),
+                    } | dict(context.metadata),
+                    created_at=self._clock(),
+                ),
             )
-            self._bonuses.record_bonus(record)
-            created.append(record)
         return created
-
-    def _collect_ancestors(
-        self,
-        node,
-        *,
-        max_levels: int,
-    ) -> Iterable[tuple[str, object]]:
-        path_ids = [segment for segment in node.path.split("/") if segment]
-        ancestor_ids = list(reversed(path_ids[:-1]))  # exclude current node
-        ancestor_ids = ancestor_ids[:max_levels]
-        if not ancestor_ids:
-            return []
-        nodes = self._organizations.get_nodes_by_ids(ancestor_ids)
-        lookup = {record.node_id: record for record in nodes}
-        return [(ancestor_id, lookup[ancestor_id]) for ancestor_id in ancestor_ids if ancestor_id in lookup]
-
-    def _new_id(self) -> str:
-        return str(self._id_factory())
-
-    def _now(self) -> datetime:
-        return self._clock()
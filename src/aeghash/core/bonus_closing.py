@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Mapping, Optional, Sequence
+from typing import Callable, Mapping, Optional, Sequence
 
-from aeghash.core.repositories import BonusEntryRecord, BonusRepository
+from aeghash.core.point_wallet import CreditInstruction, CreditOutcome
+from aeghash.core.repositories import BonusEntryRecord, BonusRepository, BonusRetrySchedule
 
 
 @dataclass(slots=True)
@@ -34,6 +35,7 @@ class BonusClosingService:
         repository: BonusRepository,
         *,
         wallet_creditor,
+        batch_creditor: Callable[[Sequence[CreditInstruction]], Sequence[CreditOutcome]] | None = None,
         now_factory: callable | None = None,
         id_factory: callable | None = None,
         retry_backoff_minutes: int = 10,
@@ -41,6 +43,7 @@ class BonusClosingService:
     ) -> None:
         self._repository = repository
         self._wallet_creditor = wallet_creditor
+        self._batch_creditor = batch_creditor
         self._now = now_factory or (lambda: datetime.now(UTC))
         self._id_factory = id_factory or (lambda: self._now().strftime("closing-%Y%m%d%H%M%S"))
         self._retry_delay = timedelta(minutes=retry_backoff_minutes)
@@ -57,14 +60,17 @@ class BonusClosingService:
         entries = self._repository.list_pending(limit=500)
         job.total_entries = len(entries)
 
-        for entry in entries:
-            try:
-                self._credit_wallet(entry)
-            except Exception as exc:  # pragma: no cover - failure path
-                self._schedule_retry(entry, reason=str(exc))
-                job.retry_entries += 1
-            else:
-                job.confirmed_entries += 1
+        if self._batch_creditor is not None:
+            self._credit_batch(entries, job)
+        else:
+            for entry in entries:
+                try:
+                    self._credit_wallet(entry)
+                except Exception as exc:  # pragma: no cover - failure path
+                    self._schedule_retry(entry, reason=str(exc))
+                    job.retry_entries += 1
+                else:
+                    job.confirmed_entries += 1
 
         job.completed_at = self._now()
         job.summary = {
@@ -89,7 +95,33 @@ class BonusClosingService:
         self._wallet_creditor(payload)
         self._repository.mark_confirmed(entry.bonus_id)
 
+    def _credit_batch(self, entries: Sequence[BonusEntryRecord], job: BonusClosingJob) -> None:
+        # A raising creditor may already have applied part of the batch, so the error
+        # propagates and the caller's transaction rolls everything back; scheduling
+        # retries here would credit those wallets twice.
+        instructions = [to_credit_instruction(entry) for entry in entries]
+        outcomes = self._batch_creditor(instructions)  # type: ignore[misc]
+        confirmed: list[str] = []
+        retries: list[BonusRetrySchedule] = []
+        for entry, outcome in zip(entries, outcomes):
+            if outcome.succeeded:
+                confirmed.append(entry.bonus_id)
+                continue
+            retry = self._next_retry(entry, reason=outcome.error or "credit_failed")
+            if retry is not None:
+                retries.append(retry)
+            job.retry_entries += 1
+        self._repository.mark_confirmed_many(confirmed)
+        self._repository.schedule_retries(retries)
+        job.confirmed_entries += len(confirmed)
+
     def _schedule_retry(self, entry: BonusEntryRecord, *, reason: str) -> None:
+        retry = self._next_retry(entry, reason=reason)
+        if retry is not None:
+            self._repository.schedule_retries([retry])
+
+    def _next_retry(self, entry: BonusEntryRecord, *, reason: str) -> Optional[BonusRetrySchedule]:
+        """Return the retry to queue for ``entry``, or mark it failed once retries run out."""
         metadata = dict(entry.metadata)
         retry_count = int(metadata.get("retry_count", 0)) + 1
         metadata["retry_count"] = retry_count
@@ -97,7 +129,17 @@ class BonusClosingService:
         if retry_count >= self._max_retries:
             metadata["status"] = "failed"
             self._repository.mark_failed(entry.bonus_id, metadata)
-        else:
-            retry_after = self._now() + self._retry_delay
-            metadata["retry_after"] = retry_after.isoformat()
-            self._repository.schedule_retry(entry.bonus_id, retry_after, metadata)
+            return None
+        retry_after = self._now() + self._retry_delay
+        metadata["retry_after"] = retry_after.isoformat()
+        return BonusRetrySchedule(bonus_id=entry.bonus_id, retry_after=retry_after, metadata=metadata)
+
+
+def to_credit_instruction(entry: BonusEntryRecord) -> CreditInstruction:
+    """Build the wallet credit for a bonus entry, referencing the bonus id."""
+    return CreditInstruction(
+        user_id=entry.user_id,
+        amount=entry.bonus_amount,
+        reference_id=entry.bonus_id,
+        metadata=dict(entry.metadata),
+    )
@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from decimal import Decimal, ROUND_DOWN
 from typing import Mapping, Optional, Sequence
 
-from aeghash.core.bonus import BonusContext, BonusRule, BonusService
+from aeghash.core.bonus import BatchBonusEngine, BonusContext, BonusRule
 from aeghash.core.repositories import BonusEntryRecord, BonusRepository, OrganizationRepository
 
 
@@ -52,7 +52,7 @@ class BonusPipeline:
             center_ref_percent if center_ref_percent is not None else self.CENTER_REF_PERCENT
         )
 
-        self._recommend_service = BonusService(
+        self._engine = BatchBonusEngine(
             organization_repository,
             bonus_repository,
             [
@@ -61,14 +61,6 @@ class BonusPipeline:
                     tree_type="unilevel",
                     percentages=self._recommend_percentages(),
                 ),
-            ],
-            id_factory=self._next_bonus_id,
-            clock=self._clock,
-        )
-        self._binary_service = BonusService(
-            organization_repository,
-            bonus_repository,
-            [
                 BonusRule(
                     bonus_type="sponsor",
                     tree_type="binary",
@@ -89,12 +81,11 @@ class BonusPipeline:
             metadata=metadata,
         )
 
-        records: list[BonusEntryRecord] = []
-        records.extend(self._recommend_service.distribute(context))
-        records.extend(self._binary_service.distribute(context))
-
+        records = self._engine.calculate(context)
         records.extend(self._apply_share_bonus(event, metadata))
         records.extend(self._apply_center_bonuses(event, metadata))
+        if records:
+            self._bonuses.record_bonuses(records)
         return records
 
     # ---------------------------------------------------------------- Direct bonuses
@@ -121,7 +112,6 @@ class BonusPipeline:
             status="PENDING",
             metadata=meta,
         )
-        self._bonuses.record_bonus(record)
         return [record]
 
     def _apply_center_bonuses(
@@ -152,7 +142,6 @@ class BonusPipeline:
                     status="PENDING",
                     metadata=meta,
                 )
-                self._bonuses.record_bonus(record)
                 records.append(record)
 
         if ref_user_id and self._center_ref_percent > 0:
@@ -174,7 +163,6 @@ class BonusPipeline:
                     status="PENDING",
                     metadata=meta,
                 )
-                self._bonuses.record_bonus(record)
                 records.append(record)
         return records
 
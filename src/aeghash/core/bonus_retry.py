@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Callable, Mapping
+from typing import Callable, Mapping, Sequence
 
-from aeghash.core.repositories import BonusEntryRecord, BonusRepository, BonusRetryRecord
+from aeghash.core.bonus_closing import to_credit_instruction
+from aeghash.core.point_wallet import CreditInstruction, CreditOutcome
+from aeghash.core.repositories import BonusEntryRecord, BonusRepository, BonusRetryRecord, BonusRetrySchedule
 
 
 @dataclass(slots=True)
@@ -28,6 +30,7 @@ class BonusRetryService:
         repository: BonusRepository,
         *,
         wallet_creditor: Callable[[Mapping[str, object]], None],
+        batch_creditor: Callable[[Sequence[CreditInstruction]], Sequence[CreditOutcome]] | None = None,
         now_factory: Callable[[], datetime] | None = None,
         base_delay_minutes: int = 15,
         backoff_factor: int = 2,
@@ -35,6 +38,7 @@ class BonusRetryService:
     ) -> None:
         self._repository = repository
         self._wallet_creditor = wallet_creditor
+        self._batch_creditor = batch_creditor
         self._now = now_factory or (lambda: datetime.now(UTC))
         self._base_delay = base_delay_minutes
         self._backoff_factor = max(backoff_factor, 1)
@@ -45,6 +49,7 @@ class BonusRetryService:
         now = self._now()
         candidates = self._repository.list_retry_candidates(now=now, limit=limit)
         result = BonusRetryResult(processed=len(candidates))
+        ready: list[tuple[BonusRetryRecord, BonusEntryRecord]] = []
 
         for candidate in candidates:
             started_at = self._now()
@@ -59,16 +64,19 @@ class BonusRetryService:
                 result.failed += 1
                 result.errors.append(f"bonus entry '{candidate.bonus_id}' missing")
                 continue
+            if self._batch_creditor is not None:
+                ready.append((candidate, entry))
+                continue
 
             try:
                 self._credit_wallet(entry)
             except Exception as exc:  # pragma: no cover - defensive
                 self._handle_failure(entry, candidate, str(exc), result)
             else:
-                completed_at = self._now()
-                self._repository.mark_confirmed(entry.bonus_id)
-                self._repository.mark_retry_completed(candidate.queue_id, completed_at=completed_at)
-                result.succeeded += 1
+                self._complete(entry, candidate, result)
+
+        if ready:
+            self._credit_batch(ready, result)
         return result
 
     # ------------------------------------------------------------------ helpers
@@ -81,6 +89,35 @@ class BonusRetryService:
         }
         self._wallet_creditor(payload)
 
+    def _credit_batch(
+        self,
+        ready: Sequence[tuple[BonusRetryRecord, BonusEntryRecord]],
+        result: BonusRetryResult,
+    ) -> None:
+        # Unlike per-entry failures, a raising creditor propagates: it may have applied
+        # part of the batch, which only a rollback of the whole run can undo.
+        instructions = [to_credit_instruction(entry) for _, entry in ready]
+        outcomes = self._batch_creditor(instructions)  # type: ignore[misc]
+        confirmed: list[str] = []
+        retries: list[BonusRetrySchedule] = []
+        for (candidate, entry), outcome in zip(ready, outcomes):
+            if outcome.succeeded:
+                confirmed.append(entry.bonus_id)
+                continue
+            retry = self._next_retry(entry, candidate, outcome.error or "credit_failed", result)
+            if retry is not None:
+                retries.append(retry)
+        # Confirming an entry also completes its retry queue row.
+        self._repository.mark_confirmed_many(confirmed)
+        self._repository.schedule_retries(retries)
+        result.succeeded += len(confirmed)
+
+    def _complete(self, entry: BonusEntryRecord, candidate: BonusRetryRecord, result: BonusRetryResult) -> None:
+        completed_at = self._now()
+        self._repository.mark_confirmed(entry.bonus_id)
+        self._repository.mark_retry_completed(candidate.queue_id, completed_at=completed_at)
+        result.succeeded += 1
+
     def _handle_failure(
         self,
         entry: BonusEntryRecord,
@@ -88,6 +125,18 @@ class BonusRetryService:
         reason: str,
         result: BonusRetryResult,
     ) -> None:
+        retry = self._next_retry(entry, candidate, reason, result)
+        if retry is not None:
+            self._repository.schedule_retries([retry])
+
+    def _next_retry(
+        self,
+        entry: BonusEntryRecord,
+        candidate: BonusRetryRecord,
+        reason: str,
+        result: BonusRetryResult,
+    ) -> BonusRetrySchedule | None:
+        """Return the retry to queue for ``entry``, or mark it failed once retries run out."""
         next_retry_count = max(candidate.retry_count, int(entry.metadata.get("retry_count", 0))) + 1
         metadata = dict(entry.metadata)
         metadata["retry_count"] = next_retry_count
@@ -99,13 +148,13 @@ class BonusRetryService:
             self._repository.mark_retry_failed(candidate.queue_id, failed_at=self._now(), metadata=metadata)
             result.failed += 1
             result.errors.append(reason)
-            return
+            return None
 
         retry_after = self._now() + self._compute_delay(next_retry_count)
         metadata["retry_after"] = retry_after.isoformat()
-        self._repository.schedule_retry(entry.bonus_id, retry_after, metadata)
         result.rescheduled += 1
         result.errors.append(reason)
+        return BonusRetrySchedule(bonus_id=entry.bonus_id, retry_after=retry_after, metadata=metadata)
 
     def _compute_delay(self, retry_count: int) -> timedelta:
         exponent = max(retry_count - 1, 0)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from hashlib import sha256
-from typing import Any, Callable, Mapping, Sequence
+from typing import Any, Callable, ContextManager, Iterable, Mapping, Sequence
 
 from aeghash.core.bonus_pipeline import BonusPipeline, OrderEvent
 from aeghash.core.repositories import (
@@ -16,6 +17,7 @@ from aeghash.core.repositories import (
     IdempotencyRepository,
     OrderRecord,
     OrderRepository,
+    TransactionScope,
 )
 from aeghash.utils import RetryConfig, retry
 
@@ -50,6 +52,17 @@ class OrderProcessingResult:
     status: str  # "created" or "duplicate"
 
 
+@dataclass(slots=True)
+class BatchOrderOutcome:
+    """Per-order result of a bulk ingestion run."""
+
+    order_id: str
+    idempotency_key: str
+    status: str  # "created", "duplicate", "conflict" or "failed"
+    bonuses: Sequence[BonusEntryRecord] = ()
+    error: str | None = None
+
+
 class AegmallOrderService:
     """Coordinates PV persistence and bonus triggering with idempotency guarantees."""
 
@@ -63,6 +76,7 @@ class AegmallOrderService:
         clock: Callable[[], datetime] | None = None,
         idempotency_scope: str = "aegmall",
         idempotency_ttl: timedelta | None = timedelta(days=1),
+        transaction: TransactionScope | None = None,
     ) -> None:
         self._orders = order_repository
         self._idempotency = idempotency_repository
@@ -71,6 +85,7 @@ class AegmallOrderService:
         self._clock = clock or (lambda: datetime.now(UTC))
         self._idempotency_scope = idempotency_scope
         self._idempotency_ttl = idempotency_ttl
+        self._transaction = transaction
 
     def process_order(self, payload: AegmallOrderPayload) -> OrderProcessingResult:
         """Persist order, compute PV bonuses, and uphold idempotency semantics."""
@@ -116,23 +131,7 @@ class AegmallOrderService:
                 ),
             )
 
-            bonuses: list[BonusEntryRecord] = []
-            if self._pipeline:
-                @retry(self._retry_config)
-                def _run_pipeline() -> Sequence[BonusEntryRecord]:
-                    order_event = OrderEvent(
-                        order_id=payload.order_id,
-                        user_id=payload.user_id,
-                        pv_amount=payload.pv_amount,
-                        total_amount=payload.total_amount,
-                        metadata=dict(payload.metadata),
-                    )
-                    return self._pipeline.process_order(order_event)
-
-                try:
-                    bonuses = list(_run_pipeline())
-                except ValueError:
-                    bonuses = []
+            bonuses = self._run_pipeline(payload)
 
             self._idempotency.mark_status(
                 key=payload.idempotency_key,
@@ -149,6 +148,143 @@ class AegmallOrderService:
             )
             raise
 
+    def process_orders(self, payloads: Iterable[AegmallOrderPayload]) -> list[BatchOrderOutcome]:
+        """Ingest many orders with bulk idempotency checks and order upserts.
+
+        Idempotency keys are resolved with one ``get_many`` lookup and the bonus
+        pipeline runs per order, each attempt inside its own savepoint, so a failing
+        order leaves no partial bonuses behind. Only orders whose bonuses succeeded
+        are then upserted as PAID, in bulk. Outcomes preserve the input order.
+        Transaction boundaries belong to the caller.
+        """
+        items = list(payloads)
+        if not items:
+            return []
+
+        now = self._clock()
+        expires_at = self._compute_expiry(now)
+        hashes = [self._hash_payload(payload) for payload in items]
+        scopes = [f"{self._idempotency_scope}:{payload.user_id}" for payload in items]
+        stored = self._idempotency.get_many(
+            [(scope, payload.idempotency_key) for scope, payload in zip(scopes, items)],
+        )
+
+        outcomes: list[BatchOrderOutcome | None] = [None] * len(items)
+        tokens: dict[tuple[str, str], IdempotencyKeyRecord] = {}
+        to_create: list[IdempotencyKeyRecord] = []
+        to_reopen: list[IdempotencyKeyRecord] = []
+        accepted: list[int] = []
+
+        for index, payload in enumerate(items):
+            token = (scopes[index], payload.idempotency_key)
+            existing = tokens.get(token) or stored.get(token)
+            if existing is not None and existing.payload_hash != hashes[index]:
+                outcomes[index] = self._batch_outcome(
+                    payload,
+                    "conflict",
+                    error="Idempotency key reused with different payload.",
+                )
+                continue
+            if token in tokens or (existing is not None and existing.status == "SUCCEEDED" and existing.resource_id):
+                outcomes[index] = self._batch_outcome(payload, "duplicate")
+                continue
+
+            if existing is None:
+                record = IdempotencyKeyRecord(
+                    key=payload.idempotency_key,
+                    scope=scopes[index],
+                    payload_hash=hashes[index],
+                    status="PENDING",
+                    created_at=now,
+                    expires_at=expires_at,
+                )
+                to_create.append(record)
+            else:
+                # Allow retry for failed or pending entries with identical payload.
+                record = existing
+                record.status = "PENDING"
+                to_reopen.append(record)
+            tokens[token] = record
+            accepted.append(index)
+
+        self._idempotency.create_many(to_create)
+        self._idempotency.mark_statuses(to_reopen)
+
+        settled: list[IdempotencyKeyRecord] = []
+        paid: list[OrderRecord] = []
+        for index in accepted:
+            payload = items[index]
+            record = tokens[(scopes[index], payload.idempotency_key)]
+            try:
+                bonuses = self._run_pipeline(payload)
+            except Exception as exc:
+                record.status = "FAILED"
+                outcomes[index] = self._batch_outcome(payload, "failed", error=str(exc))
+            else:
+                record.status = "SUCCEEDED"
+                record.resource_id = payload.order_id
+                outcomes[index] = self._batch_outcome(payload, "created", bonuses=bonuses)
+                paid.append(
+                    OrderRecord(
+                        order_id=payload.order_id,
+                        user_id=payload.user_id,
+                        total_amount=payload.total_amount,
+                        pv_amount=payload.pv_amount,
+                        status="PAID",
+                        channel=payload.channel,
+                        metadata=dict(payload.metadata),
+                        created_at=now,
+                    ),
+                )
+            settled.append(record)
+        self._orders.upsert_orders(paid)
+        self._idempotency.mark_statuses(settled)
+
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    def _run_pipeline(self, payload: AegmallOrderPayload) -> list[BonusEntryRecord]:
+        if not self._pipeline:
+            return []
+
+        order_event = OrderEvent(
+            order_id=payload.order_id,
+            user_id=payload.user_id,
+            pv_amount=payload.pv_amount,
+            total_amount=payload.total_amount,
+            metadata=dict(payload.metadata),
+        )
+
+        @retry(self._retry_config)
+        def _execute() -> list[BonusEntryRecord]:
+            # A fresh savepoint per attempt: a failed attempt's writes are undone and the retry runs on a clean state.
+            try:
+                with self._savepoint():
+                    return list(self._pipeline.process_order(order_event))
+            except ValueError:
+                # Users missing from the organization trees earn no bonuses; retrying cannot help.
+                return []
+
+        return _execute()
+
+    def _savepoint(self) -> ContextManager[None]:
+        return self._transaction.savepoint() if self._transaction else nullcontext()
+
+    def _batch_outcome(
+        self,
+        payload: AegmallOrderPayload,
+        status: str,
+        *,
+        bonuses: Sequence[BonusEntryRecord] = (),
+        error: str | None = None,
+    ) -> BatchOrderOutcome:
+        return BatchOrderOutcome(
+            order_id=payload.order_id,
+            idempotency_key=payload.idempotency_key,
+            status=status,
+            bonuses=bonuses,
+            error=error,
+        )
+
     def _hash_payload(self, payload: AegmallOrderPayload) -> str:
         canonical = {
             "order_id": payload.order_id,
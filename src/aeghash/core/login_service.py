@@ -4,22 +4,30 @@ from __future__ import annotations
 
 import secrets
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Callable, Optional, Sequence
 
 from aeghash.adapters.turnstile import TurnstileError
 from aeghash.core.auth_flow import AuthenticationResult
-from aeghash.core.auth_flow import TurnstileManager
+from aeghash.core.auth_flow import SessionTokenIssuer, TurnstileManager
 from aeghash.core.repositories import (
     LoginAuditRecord,
     LoginAuditRepository,
     SessionRecord,
+    UserAccountRecord,
     SessionRepository,
     UserAccountRepository,
     UserRepository,
 )
 from aeghash.core.two_factor import TwoFactorService
-from aeghash.security.passwords import verify_password
+from aeghash.security.passwords import (
+    DEFAULT_PROFILE,
+    PasswordHasher,
+    PasswordHasherBusy,
+    hash_password,
+    verify_password,
+)
+from aeghash.security.rate_limit import RateLimitExceeded
 
 
 class LoginError(ValueError):
@@ -49,6 +57,8 @@ class PasswordLoginService:
         email_normalizer: Callable[[str], str] | None = None,
         two_factor_service: TwoFactorService | None = None,
         turnstile_verifier: TurnstileManager | None = None,
+        password_hasher: PasswordHasher | None = None,
+        token_signer: SessionTokenIssuer | None = None,
     ) -> None:
         self._accounts = account_repository
         self._identities = identity_repository
@@ -58,8 +68,20 @@ class PasswordLoginService:
         self._normalize = email_normalizer or (lambda value: value.strip().lower())
         self._two_factor_service = two_factor_service
         self._turnstile_verifier = turnstile_verifier
+        self._password_hasher = password_hasher
+        self._token_signer = token_signer
+        self._verify_password = password_hasher.verify if password_hasher else verify_password
 
     def login(self, request: LoginRequest) -> AuthenticationResult:
+        account = self.begin(request)
+        verified = account is not None and self._verify_password(request.password, account.password_hash)
+        result = self.complete(request, account, verified=verified)
+        if account is not None and result.success:
+            self._upgrade_password_hash(account, request.password)
+        return result
+
+    def begin(self, request: LoginRequest) -> Optional[UserAccountRecord]:
+        """Check Turnstile, audit the attempt and load the account whose password must be verified."""
         normalized = self._normalize(request.email)
         if not normalized:
             raise LoginError("invalid_email")
@@ -79,11 +101,19 @@ class PasswordLoginService:
                 )
                 raise LoginError("turnstile_failed") from exc
 
-        password_value = request.password
         self._audits.log(LoginAuditRecord(provider="local", status="STARTED", subject=normalized))
+        return self._accounts.find_by_email(normalized)
 
-        account = self._accounts.find_by_email(normalized)
-        if account is None or not verify_password(password_value, account.password_hash):
+    def complete(
+        self,
+        request: LoginRequest,
+        account: Optional[UserAccountRecord],
+        *,
+        verified: bool,
+    ) -> AuthenticationResult:
+        """Finish a login whose password check (``verified``) ran outside this service."""
+        normalized = self._normalize(request.email)
+        if account is None or not verified:
             self._audits.log(
                 LoginAuditRecord(provider="local", status="FAILED", subject=None, reason="invalid_credentials"),
             )
@@ -132,7 +162,19 @@ class PasswordLoginService:
                     requires_two_factor=True,
                 )
 
-            if not self._two_factor_service.verify_code(account.user_id, request.two_factor_code):
+            try:
+                verified = self._two_factor_service.verify_code(account.user_id, request.two_factor_code)
+            except RateLimitExceeded:
+                self._audits.log(
+                    LoginAuditRecord(
+                        provider="local",
+                        status="FAILED",
+                        subject=account.user_id,
+                        reason="two_factor_rate_limited",
+                    ),
+                )
+                raise
+            if not verified:
                 self._audits.log(
                     LoginAuditRecord(
                         provider="local",
@@ -154,10 +196,31 @@ class PasswordLoginService:
             success=True,
             user_id=account.user_id,
             roles=identity.roles,
-            session_token=session.token,
+            session_token=self._token_signer.sign(session) if self._token_signer else session.token,
             requires_two_factor=False,
         )
 
+    def needs_password_upgrade(self, account: UserAccountRecord) -> bool:
+        """Return True when the stored hash uses parameters older than the active cost profile."""
+        hasher = self._password_hasher
+        profile = hasher.profile if hasher else DEFAULT_PROFILE
+        return profile.needs_rehash(account.password_hash)
+
+    def store_password_hash(self, account: UserAccountRecord, password_hash: str) -> None:
+        self._accounts.save(replace(account, password_hash=password_hash))
+
+    def _upgrade_password_hash(self, account: UserAccountRecord, password: str) -> None:
+        """Rehash with the active cost profile when the stored hash uses older parameters."""
+        if not self.needs_password_upgrade(account):
+            return
+        hasher = self._password_hasher
+        try:
+            upgraded = hasher.hash(password) if hasher else hash_password(password, profile=DEFAULT_PROFILE)
+        except PasswordHasherBusy:
+            # The upgrade is opportunistic; the next login will retry it.
+            return
+        self.store_password_hash(account, upgraded)
+
     def _issue_session(self, user_id: str, roles: Sequence[str]) -> SessionRecord:
         token = secrets.token_urlsafe(32)
         expires_at = time.time() + self._session_ttl
@@ -48,23 +48,23 @@ class MiningService:
 
     def request_withdrawal(self, *, user_id: str, coin: str, amount: Decimal) -> WithdrawalRequest:
         """Request mining asset withdrawal."""
+        try:
+            result = self.submit_withdrawal(coin=coin, amount=amount)
+        except Exception:
+            self.record_withdrawal_failure(user_id=user_id, coin=coin, amount=amount)
+            raise
+        return self.record_withdrawal(user_id=user_id, result=result)
+
+    def submit_withdrawal(self, *, coin: str, amount: Decimal) -> AssetWithdrawal:
+        """Call HashDam (with retries) without touching the repository, so it can run off the session thread."""
         @retry(self._retry_config, on_failure=lambda exc, attempt: self._notify_failure(f"Withdrawal attempt {attempt} failed: {exc}"))
         def _withdraw() -> AssetWithdrawal:
             return self._client.request_asset_withdrawal(coin=coin, amount=amount)
 
-        try:
-            result = _withdraw()
-        except Exception:
-            self._repository.log_withdrawal(
-                WithdrawalRecord(
-                    user_id=user_id,
-                    withdraw_id=None,
-                    coin=coin,
-                    amount=amount,
-                    status="failed",
-                ),
-            )
-            raise
+        return _withdraw()
+
+    def record_withdrawal(self, *, user_id: str, result: AssetWithdrawal) -> WithdrawalRequest:
+        """Log a submitted HashDam withdrawal."""
         self._repository.log_withdrawal(
             WithdrawalRecord(
                 user_id=user_id,
@@ -79,3 +79,15 @@ class MiningService:
             coin=result.coin,
             amount=result.amount,
         )
+
+    def record_withdrawal_failure(self, *, user_id: str, coin: str, amount: Decimal) -> None:
+        """Log a HashDam withdrawal that failed after all retries."""
+        self._repository.log_withdrawal(
+            WithdrawalRecord(
+                user_id=user_id,
+                withdraw_id=None,
+                coin=coin,
+                amount=amount,
+                status="failed",
+            ),
+        )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
+from aeghash.adapters.hashdam import AssetWithdrawal
 from aeghash.core.mining_service import MiningService, WithdrawalRequest as MiningWithdrawalRequest
 from aeghash.core.point_wallet import (
     PointWalletService,
@@ -27,6 +29,15 @@ class WithdrawalExecutionOutcome:
     mining_request: MiningWithdrawalRequest
 
 
+@dataclass(slots=True)
+class PreparedWithdrawal:
+    """A locally approved withdrawal waiting for its HashDam transfer."""
+
+    withdrawal: WithdrawalSnapshot
+    user_id: str
+    coin: str
+
+
 class MiningWithdrawalOrchestrator:
     """Coordinates platform withdrawal approval with HashDam execution."""
 
@@ -49,6 +60,27 @@ class MiningWithdrawalOrchestrator:
         coin: Optional[str] = None,
     ) -> WithdrawalExecutionOutcome:
         """Approve the platform withdrawal and trigger the HashDam transfer."""
+        prepared = self.prepare(request_id, approved_by=approved_by, notes=notes, coin=coin)
+        try:
+            mining_result = self._mining.request_withdrawal(
+                user_id=prepared.user_id,
+                coin=prepared.coin,
+                amount=prepared.withdrawal.amount,
+            )
+        except Exception as exc:  # pragma: no cover - network/HashDam failure
+            raise self._fail(prepared, approved_by, exc) from exc
+
+        return WithdrawalExecutionOutcome(withdrawal=prepared.withdrawal, mining_request=mining_result)
+
+    def prepare(
+        self,
+        request_id: str,
+        *,
+        approved_by: str,
+        notes: Optional[str] = None,
+        coin: Optional[str] = None,
+    ) -> PreparedWithdrawal:
+        """Approve the platform withdrawal locally and resolve what HashDam should transfer."""
         pending = self._wallets.get_withdrawal(request_id)
         if pending.status not in {"pending", WITHDRAWAL_STATUS_APPROVED_STAGE1, WITHDRAWAL_STATUS_APPROVED}:
             raise WithdrawalExecutionError(f"Withdrawal '{request_id}' is not eligible for execution.")
@@ -62,22 +94,61 @@ class MiningWithdrawalOrchestrator:
             approved = pending
         else:
             approved = self._wallets.approve_withdrawal(request_id, approved_by=approved_by, notes=notes)
+        return PreparedWithdrawal(withdrawal=approved, user_id=wallet.user_id, coin=str(coin_symbol))
 
-        try:
-            mining_result = self._mining.request_withdrawal(
-                user_id=wallet.user_id,
-                coin=str(coin_symbol),
-                amount=pending.amount,
+    def submit_many(
+        self,
+        prepared: Sequence[PreparedWithdrawal],
+        *,
+        max_workers: int = 8,
+    ) -> list[AssetWithdrawal | Exception]:
+        """Submit prepared withdrawals to HashDam concurrently; one result or error per item, in order.
+
+        Nothing is written here, so the worker threads never touch the session; pass each
+        result to :meth:`settle` from the thread that owns it.
+        """
+        if not prepared:
+            return []
+        results: list[AssetWithdrawal | Exception] = []
+        workers = max(1, min(max_workers, len(prepared)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hashdam-withdrawal") as executor:
+            futures = [
+                executor.submit(self._mining.submit_withdrawal, coin=item.coin, amount=item.withdrawal.amount)
+                for item in prepared
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    results.append(exc)
+        return results
+
+    def settle(
+        self,
+        prepared: PreparedWithdrawal,
+        submitted: AssetWithdrawal | Exception,
+        *,
+        approved_by: str,
+    ) -> WithdrawalExecutionOutcome:
+        """Record a ``submit_many`` result; a failed transfer is refunded and raised as ``WithdrawalExecutionError``."""
+        if isinstance(submitted, Exception):
+            self._mining.record_withdrawal_failure(
+                user_id=prepared.user_id,
+                coin=prepared.coin,
+                amount=prepared.withdrawal.amount,
             )
-        except Exception as exc:  # pragma: no cover - network/HashDam failure
-            self._wallets.fail_withdrawal(request_id, failed_by=approved_by, reason=str(exc))
-            if self._notifier:
-                self._notifier.send(
-                    NotificationMessage(
-                        subject="HashDam withdrawal failure",
-                        body=f"Request {request_id} for user {wallet.user_id} failed: {exc}",
-                    ),
-                )
-            raise WithdrawalExecutionError(str(exc)) from exc
-
-        return WithdrawalExecutionOutcome(withdrawal=approved, mining_request=mining_result)
+            raise self._fail(prepared, approved_by, submitted) from submitted
+        mining_result = self._mining.record_withdrawal(user_id=prepared.user_id, result=submitted)
+        return WithdrawalExecutionOutcome(withdrawal=prepared.withdrawal, mining_request=mining_result)
+
+    def _fail(self, prepared: PreparedWithdrawal, failed_by: str, exc: Exception) -> WithdrawalExecutionError:
+        request_id = prepared.withdrawal.request_id
+        self._wallets.fail_withdrawal(request_id, failed_by=failed_by, reason=str(exc))
+        if self._notifier:
+            self._notifier.send(
+                NotificationMessage(
+                    subject="HashDam withdrawal failure",
+                    body=f"Request {request_id} for user {prepared.user_id} failed: {exc}",
+                ),
+            )
+        return WithdrawalExecutionError(str(exc))
@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Optional
 
-from aeghash.core.repositories import OrganizationNodeRecord, OrganizationRepository, SpilloverLogRecord
+from aeghash.core.repositories import (
+    BinaryPlacementQueueRecord,
+    OrganizationNodeRecord,
+    OrganizationRepository,
+    SpilloverLogRecord,
+)
 
 
 TREE_UNILEVEL = "unilevel"
 TREE_BINARY = "binary"
 
+PLACEMENT_SCAN = "scan"
+PLACEMENT_CLAIM = "claim"
+
+QUEUE_PENDING = "PENDING"
+QUEUE_COMPLETED = "COMPLETED"
+QUEUE_FAILED = "FAILED"
+
+
+def encode_node_cursor(relative_depth: int, node_id: str) -> str:
+    """Build the opaque keyset cursor used by ``list_descendants``."""
+    return f"{relative_depth}:{node_id}"
+
+
+def decode_node_cursor(cursor: str) -> tuple[int, str]:
+    """Parse a cursor produced by :func:`encode_node_cursor`."""
+    depth, separator, node_id = cursor.partition(":")
+    if not separator or not node_id or not depth.isdigit():
+        raise OrganizationError(f"Invalid organization cursor: {cursor!r}")
+    return int(depth), node_id
+
 
 class OrganizationError(ValueError):
     """Base error for organization operations."""
@@ -26,6 +50,33 @@ class SponsorNotAssigned(OrganizationError):
     """Raised when attempting to add a member without a valid sponsor."""
 
 
+class SlotContention(OrganizationError):
+    """Raised when a binary slot could not be claimed within the attempt budget."""
+
+
+@dataclass(slots=True)
+class BinaryPlacementResult:
+    """Outcome of a binary placement request: placed immediately or queued."""
+
+    node: Optional[OrganizationNodeRecord] = None
+    queue_id: Optional[str] = None
+
+    @property
+    def queued(self) -> bool:
+        return self.node is None
+
+
+@dataclass(slots=True)
+class WaitingQueueResult:
+    """Summary of a waiting-queue drain run."""
+
+    processed: int = 0
+    placed: int = 0
+    deferred: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
 class OrganizationService:
     """Manage organization nodes with spillover for binary trees."""
 
@@ -35,10 +86,18 @@ class OrganizationService:
         *,
         id_factory: callable | None = None,
         clock: callable | None = None,
+        placement_mode: str = PLACEMENT_SCAN,
+        max_claim_attempts: int = 3,
+        max_queue_retries: int = 5,
     ) -> None:
+        if placement_mode not in (PLACEMENT_SCAN, PLACEMENT_CLAIM):
+            raise OrganizationError(f"Unknown placement mode: {placement_mode}")
         self._repository = repository
         self._id_factory = id_factory or (lambda: datetime.now(UTC).strftime("%Y%m%d%H%M%S%f"))
         self._clock = clock or (lambda: datetime.now(UTC))
+        self._placement_mode = placement_mode
+        self._max_claim_attempts = max(max_claim_attempts, 1)
+        self._max_queue_retries = max_queue_retries
 
     def create_root(self, *, tree_type: str, user_id: str) -> OrganizationNodeRecord:
         node_id = self._new_id()
@@ -64,9 +123,7 @@ class OrganizationService:
         user_id: str,
         sponsor_user_id: str,
     ) -> OrganizationNodeRecord:
-        sponsor_node = self._repository.get_node_by_user(tree_type, sponsor_user_id)
-        if sponsor_node is None:
-            raise SponsorNotAssigned(f"Sponsor '{sponsor_user_id}' not found for {tree_type} tree.")
+        sponsor_node = self._require_sponsor(tree_type, sponsor_user_id)
 
         if tree_type == TREE_UNILEVEL:
             parent_node = sponsor_node
@@ -76,6 +133,103 @@ class OrganizationService:
         else:
             raise OrganizationError(f"Unknown tree type: {tree_type}")
 
+        return self._attach(sponsor_node, parent_node, position, tree_type=tree_type, user_id=user_id)
+
+    def request_binary_placement(self, *, user_id: str, sponsor_user_id: str) -> BinaryPlacementResult:
+        """Place a binary member, deferring to the waiting queue when slots stay contended.
+
+        Unlike :meth:`add_member` this never raises on contention, so the enqueue is
+        committed together with the caller's transaction.
+        """
+        sponsor_node = self._require_sponsor(TREE_BINARY, sponsor_user_id)
+        try:
+            parent_node, position = self._locate_binary_slot(sponsor_node)
+        except SlotContention:
+            queue_id = self._new_id()
+            self._repository.enqueue_binary_placement(
+                BinaryPlacementQueueRecord(
+                    queue_id=queue_id,
+                    sponsor_node_id=sponsor_node.node_id,
+                    candidate_user_id=user_id,
+                    status=QUEUE_PENDING,
+                    enqueued_at=self._now(),
+                ),
+            )
+            return BinaryPlacementResult(queue_id=queue_id)
+        node = self._attach(sponsor_node, parent_node, position, tree_type=TREE_BINARY, user_id=user_id)
+        return BinaryPlacementResult(node=node)
+
+    def process_waiting_queue(self, *, limit: int = 100) -> WaitingQueueResult:
+        """Drain pending placements from ``binary_waiting_queue`` in enqueue order."""
+        candidates = self._repository.list_pending_binary_placements(limit=limit)
+        result = WaitingQueueResult(processed=len(candidates))
+
+        for candidate in candidates:
+            attempted_at = self._now()
+            retry_count = candidate.retry_count + 1
+            if self._repository.get_node_by_user(TREE_BINARY, candidate.candidate_user_id) is not None:
+                self._repository.mark_binary_placement(
+                    candidate.queue_id,
+                    status=QUEUE_COMPLETED,
+                    attempted_at=attempted_at,
+                    retry_count=retry_count,
+                )
+                result.placed += 1
+                continue
+
+            sponsor_node = self._repository.get_node(candidate.sponsor_node_id)
+            try:
+                if sponsor_node is None:
+                    raise NodeNotFound(f"Node '{candidate.sponsor_node_id}' not found.")
+                parent_node, position = self._locate_binary_slot(sponsor_node)
+            except OrganizationError as exc:
+                # Only contention is transient; a missing sponsor or slot fails the entry at once.
+                exhausted = not isinstance(exc, SlotContention) or retry_count >= self._max_queue_retries
+                self._repository.mark_binary_placement(
+                    candidate.queue_id,
+                    status=QUEUE_FAILED if exhausted else QUEUE_PENDING,
+                    attempted_at=attempted_at,
+                    retry_count=retry_count,
+                )
+                if exhausted:
+                    result.failed += 1
+                else:
+                    result.deferred += 1
+                result.errors.append(str(exc))
+                continue
+
+            self._attach(
+                sponsor_node,
+                parent_node,
+                position,
+                tree_type=TREE_BINARY,
+                user_id=candidate.candidate_user_id,
+            )
+            self._repository.mark_binary_placement(
+                candidate.queue_id,
+                status=QUEUE_COMPLETED,
+                attempted_at=attempted_at,
+                retry_count=retry_count,
+            )
+            result.placed += 1
+        return result
+
+    def _require_sponsor(self, tree_type: str, sponsor_user_id: str) -> OrganizationNodeRecord:
+        sponsor_node = self._repository.get_node_by_user(tree_type, sponsor_user_id)
+        if sponsor_node is None:
+            raise SponsorNotAssigned(f"Sponsor '{sponsor_user_id}' not found for {tree_type} tree.")
+        return sponsor_node
+
+    def _attach(
+        self,
+        sponsor_node: OrganizationNodeRecord,
+        parent_node: OrganizationNodeRecord,
+        position: Optional[str],
+        *,
+        tree_type: str,
+        user_id: str,
+    ) -> OrganizationNodeRecord:
+        sponsor_user_id = sponsor_node.user_id
         node_id = self._new_id()
         now = self._now()
         record = OrganizationNodeRecord(
@@ -112,17 +266,30 @@ class OrganizationService:
         return node
 
     def _locate_binary_slot(self, sponsor_node: OrganizationNodeRecord) -> tuple[OrganizationNodeRecord, str]:
-        queue = deque([sponsor_node])
-        while queue:
-            candidate = queue.popleft()
-            children = {child.position: child for child in self._repository.list_children(candidate.node_id)}
-            if "L" not in children:
-                return candidate, "L"
-            if "R" not in children:
-                return candidate, "R"
-            queue.append(children["L"])
-            queue.append(children["R"])
-        raise OrganizationError("Unable to find spillover slot in binary tree.")
+        if self._placement_mode == PLACEMENT_CLAIM:
+            slot = None
+            for _ in range(self._max_claim_attempts):
+                claim = self._repository.claim_binary_slot(sponsor_node.node_id)
+                if claim.slot is not None:
+                    slot = claim.slot
+                    break
+                if not claim.contended:
+                    # Retrying or queueing cannot help when the subtree has no open slot.
+                    raise OrganizationError("Unable to find spillover slot in binary tree.")
+            if slot is None:
+                raise SlotContention(
+                    f"No binary slot claimed under '{sponsor_node.node_id}' after {self._max_claim_attempts} attempts.",
+                )
+        else:
+            slot = self._repository.find_open_binary_slot(sponsor_node.node_id)
+            if slot is None:
+                raise OrganizationError("Unable to find spillover slot in binary tree.")
+        if slot.node_id == sponsor_node.node_id:
+            return sponsor_node, slot.slot
+        parent = self._repository.get_node(slot.node_id)
+        if parent is None:
+            raise NodeNotFound(f"Node '{slot.node_id}' not found.")
+        return parent, slot.slot
 
     def _new_id(self) -> str:
         return str(self._id_factory())
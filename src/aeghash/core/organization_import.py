@@ -0,0 +1,240 @@
+"""Bulk import of legacy organization trees from edge lists."""
+
+from __future__ import annotations
+
+import csv
+import json
+import uuid
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL, OrganizationError
+from aeghash.core.repositories import OrganizationRepository
+
+
+# (user_id, parent_user_id, sponsor_user_id, position)
+ImportEdge = tuple[str, Optional[str], Optional[str], Optional[str]]
+
+_POSITION_CODES = {None: 0, "L": 1, "R": 2}
+_POSITION_NAMES = (None, "L", "R")
+
+
+class OrganizationImportError(OrganizationError):
+    """Raised when an edge list cannot be turned into a valid tree."""
+
+
+@dataclass(slots=True)
+class OrganizationImportResult:
+    """Row counts written by an import run."""
+
+    nodes: int = 0
+    closure_rows: int = 0
+    binary_slots: int = 0
+
+
+def read_edges(stream: TextIO, *, fmt: str) -> Iterator[ImportEdge]:
+    """Yield edges from a CSV (with header) or JSONL stream.
+
+    Each record carries ``user_id`` and optionally ``parent_user_id``, ``sponsor_user_id``
+    and ``position``. Rows without a parent are roots.
+    """
+    if fmt == "csv":
+        rows: Iterable[dict] = csv.DictReader(stream)
+    elif fmt == "jsonl":
+        rows = (json.loads(line) for line in stream if line.strip())
+    else:
+        raise OrganizationImportError(f"Unsupported edge list format: {fmt}")
+
+    for row in rows:
+        user_id = (row.get("user_id") or "").strip()
+        if not user_id:
+            raise OrganizationImportError("Edge is missing user_id.")
+        parent = (row.get("parent_user_id") or "").strip() or None
+        sponsor = (row.get("sponsor_user_id") or "").strip() or parent
+        position = (row.get("position") or "").strip().upper() or None
+        yield user_id, parent, sponsor, position
+
+
+class OrganizationImportPlan:
+    """Array-backed tree in topological (breadth-first) order.
+
+    Nodes are addressed by integer index; parents, depths and positions live in flat
+    arrays so a multi-million member tree does not allocate one object per node.
+    Paths, closure rows and slots are derived on the fly while streaming.
+    """
+
+    __slots__ = ("tree_type", "node_ids", "user_ids", "sponsor_ids", "parents", "depths", "positions", "order")
+
+    def __init__(self, tree_type: str) -> None:
+        self.tree_type = tree_type
+        self.node_ids: list[str] = []
+        self.user_ids: list[str] = []
+        self.sponsor_ids: list[Optional[str]] = []
+        self.parents = array("q")
+        self.depths = array("l")
+        self.positions = bytearray()
+        self.order = array("q")
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def iter_nodes(self) -> Iterator[tuple[str, str, Optional[str], Optional[str], Optional[str], int, str]]:
+        """Yield ``(node_id, user_id, parent_node_id, sponsor_user_id, position, depth, path)``."""
+        for index in self.order:
+            parent = self.parents[index]
+            yield (
+                self.node_ids[index],
+                self.user_ids[index],
+                self.node_ids[parent] if parent >= 0 else None,
+                self.sponsor_ids[index],
+                _POSITION_NAMES[self.positions[index]],
+                self.depths[index],
+                "/" + "/".join(self.node_ids[ancestor] for ancestor in reversed(self._chain(index))),
+            )
+
+    def iter_closure(self) -> Iterator[tuple[str, str, int]]:
+        """Yield ``(ancestor_id, descendant_id, depth)`` including the self row."""
+        for index in self.order:
+            node_id = self.node_ids[index]
+            for distance, ancestor in enumerate(self._chain(index)):
+                yield self.node_ids[ancestor], node_id, distance
+
+    def iter_binary_slots(self) -> Iterator[tuple[str, str, str, Optional[str], str]]:
+        """Yield ``(node_id, slot, status, child_node_id, placement_key)`` for binary trees."""
+        if self.tree_type != TREE_BINARY:
+            return
+        size = len(self.node_ids)
+        # children[code - 1][parent] holds the index of the L (code 1) / R (code 2) child, or -1.
+        children = (array("q", [-1]) * size, array("q", [-1]) * size)
+        for index in self.order:
+            parent = self.parents[index]
+            if parent >= 0:
+                children[self.positions[index] - 1][parent] = index
+        for index in self.order:
+            prefix = "".join(_POSITION_NAMES[self.positions[ancestor]] for ancestor in reversed(self._chain(index)[:-1]))
+            node_id = self.node_ids[index]
+            for code in (1, 2):
+                child = children[code - 1][index]
+                slot = _POSITION_NAMES[code]
+                yield (
+                    node_id,
+                    slot,
+                    "FILLED" if child >= 0 else "OPEN",
+                    self.node_ids[child] if child >= 0 else None,
+                    f"{prefix}{slot}",
+                )
+
+    def _chain(self, index: int) -> list[int]:
+        """Indices from ``index`` up to its root, nearest first."""
+        chain = [index]
+        parent = self.parents[index]
+        while parent >= 0:
+            chain.append(parent)
+            parent = self.parents[parent]
+        return chain
+
+
+def build_import_plan(
+    edges: Iterable[ImportEdge],
+    *,
+    tree_type: str,
+    id_factory: Callable[[], str],
+) -> OrganizationImportPlan:
+    """Validate an edge list and order it so every parent precedes its children."""
+    if tree_type not in (TREE_UNILEVEL, TREE_BINARY):
+        raise OrganizationImportError(f"Unknown tree type: {tree_type}")
+
+    plan = OrganizationImportPlan(tree_type)
+    index_by_user: dict[str, int] = {}
+    parent_users: list[Optional[str]] = []
+    for user_id, parent_user_id, sponsor_user_id, position in edges:
+        if user_id in index_by_user:
+            raise OrganizationImportError(f"Duplicate user '{user_id}' in edge list.")
+        if tree_type == TREE_BINARY and parent_user_id is not None and position not in ("L", "R"):
+            raise OrganizationImportError(f"Binary member '{user_id}' needs position L or R.")
+        index_by_user[user_id] = len(plan.node_ids)
+        plan.node_ids.append(str(id_factory()))
+        plan.user_ids.append(user_id)
+        plan.sponsor_ids.append(sponsor_user_id)
+        plan.positions.append(_POSITION_CODES[position] if tree_type == TREE_BINARY and parent_user_id else 0)
+        parent_users.append(parent_user_id)
+
+    size = len(plan.node_ids)
+    plan.parents = array("q", [-1]) * size
+    plan.depths = array("l", [0]) * size
+    # Children are kept as a CSR-style adjacency (offsets + flat list) instead of per-node lists.
+    child_counts = array("q", [0]) * (size + 1)
+    taken_slots: set[tuple[int, int]] = set()
+    roots = array("q")
+    for index, parent_user_id in enumerate(parent_users):
+        if parent_user_id is None:
+            roots.append(index)
+            continue
+        parent = index_by_user.get(parent_user_id)
+        if parent is None:
+            raise OrganizationImportError(f"Parent '{parent_user_id}' of '{plan.user_ids[index]}' is not in the edge list.")
+        if tree_type == TREE_BINARY:
+            slot_key = (parent, plan.positions[index])
+            if slot_key in taken_slots:
+                raise OrganizationImportError(
+                    f"Slot {_POSITION_NAMES[plan.positions[index]]} under '{parent_user_id}' is assigned twice.",
+                )
+            taken_slots.add(slot_key)
+        plan.parents[index] = parent
+        child_counts[parent + 1] += 1
+    del parent_users, taken_slots
+
+    offsets = child_counts
+    for position in range(1, size + 1):
+        offsets[position] += offsets[position - 1]
+    cursor = array("q", offsets)
+    children = array("q", [0]) * size
+    for index in range(size):
+        parent = plan.parents[index]
+        if parent >= 0:
+            children[cursor[parent]] = index
+            cursor[parent] += 1
+
+    queue = deque(roots)
+    while queue:
+        index = queue.popleft()
+        plan.order.append(index)
+        start, end = offsets[index], offsets[index + 1]
+        members = children[start:end]
+        if tree_type == TREE_BINARY:
+            members = sorted(members, key=lambda child: plan.positions[child])
+        for child in members:
+            plan.depths[child] = plan.depths[index] + 1
+            queue.append(child)
+
+    if len(plan.order) != size:
+        raise OrganizationImportError("Edge list contains a cycle; some members are unreachable from a root.")
+    return plan
+
+
+class OrganizationImportService:
+    """Load a whole organization tree with chunked bulk inserts."""
+
+    def __init__(
+        self,
+        repository: OrganizationRepository,
+        *,
+        id_factory: Callable[[], str] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._id_factory = id_factory or (lambda: uuid.uuid4().hex)
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    def import_edges(self, edges: Iterable[ImportEdge], *, tree_type: str) -> OrganizationImportResult:
+        plan = build_import_plan(edges, tree_type=tree_type, id_factory=self._id_factory)
+        now = self._clock()
+        result = OrganizationImportResult()
+        result.nodes = self._repository.bulk_insert_nodes(tree_type, plan.iter_nodes(), created_at=now)
+        result.closure_rows = self._repository.bulk_insert_closure(tree_type, plan.iter_closure())
+        if tree_type == TREE_BINARY:
+            result.binary_slots = self._repository.bulk_insert_binary_slots(plan.iter_binary_slots(), assigned_at=now)
+        return result
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Callable, Sequence
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 from aeghash.core.repositories import OrganizationKpiRecord, OrganizationMetricsRepository
+from aeghash.utils.cache import CacheBackend, TTLCache
 
 
 ZERO = Decimal("0")
@@ -43,6 +45,97 @@ class KpiSummary:
     daily: Sequence[DailyKpiSnapshot]
 
 
+@dataclass(slots=True)
+class CompactKpiSummary:
+    """Totals-only KPI summary used for multi-node dashboard tables."""
+
+    node_id: str
+    tree_type: str
+    period_start: date
+    period_end: date
+    total_personal_volume: Decimal
+    total_group_volume: Decimal
+    total_orders: int
+    latest_personal_volume: Decimal
+    latest_group_volume: Decimal
+    latest_volume_left: Decimal | None
+    latest_volume_right: Decimal | None
+
+
+@dataclass(slots=True)
+class CachedKpiSummary:
+    """Cache entry holding a summary and, once rendered, its serialized payload."""
+
+    summary: KpiSummary
+    payload: Optional[Mapping[str, Any]] = None
+
+
+class KpiSummaryCache:
+    """Cache KPI summaries per ``(node_id, tree_type, days, today)``.
+
+    Each node carries a generation token in the backend; invalidating a node swaps the
+    token, which orphans every cached window for that node without scanning keys. This
+    works unchanged on shared backends, so a rollup in another process can invalidate.
+    Callers read the generation before loading a summary and store it under that same
+    token, so a load that races an invalidation is orphaned instead of revived.
+
+    Every window ends today, so the default TTL is short: with an in-process backend the
+    rollup job cannot reach this cache and the TTL is the only bound on staleness.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, *, ttl_seconds: float = 30) -> None:
+        self._backend = backend or TTLCache(maxsize=4096)
+        self._ttl = ttl_seconds
+
+    def generation(self, node_id: str, tree_type: str) -> str:
+        generation_key = self._generation_key(node_id, tree_type)
+        generation = self._backend.get(generation_key)
+        if generation is None:
+            # A missing (or evicted) token must not revive entries written under an older one.
+            generation = uuid.uuid4().hex
+            self._backend.set(generation_key, generation)
+        return generation
+
+    def get(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        days: int,
+        today: date,
+        generation: str | None = None,
+    ) -> Optional[CachedKpiSummary]:
+        token = generation or self.generation(node_id, tree_type)
+        return self._backend.get(self._entry_key(node_id, tree_type, days, today, token))
+
+    def put(
+        self,
+        node_id: str,
+        tree_type: str,
+        *,
+        days: int,
+        today: date,
+        generation: str,
+        entry: CachedKpiSummary,
+    ) -> None:
+        self._backend.set(self._entry_key(node_id, tree_type, days, today, generation), entry, ttl_seconds=self._ttl)
+
+    def invalidate(self, node_id: str, tree_type: str) -> None:
+        self._backend.set(self._generation_key(node_id, tree_type), uuid.uuid4().hex)
+
+    def invalidate_many(self, nodes: Iterable[tuple[str, str]]) -> None:
+        for node_id, tree_type in set(nodes):
+            self.invalidate(node_id, tree_type)
+
+    @staticmethod
+    def _entry_key(node_id: str, tree_type: str, days: int, today: date, generation: str) -> str:
+        return f"kpi:{tree_type}:{node_id}:{days}:{today.isoformat()}:{generation}"
+
+    @staticmethod
+    def _generation_key(node_id: str, tree_type: str) -> str:
+        return f"kpi-gen:{tree_type}:{node_id}"
+
+
 class OrganizationKpiService:
     """Compute KPI summaries using stored organization metrics."""
 
@@ -97,6 +190,50 @@ class OrganizationKpiService:
             daily=daily,
         )
 
+    def get_summaries(
+        self,
+        node_ids: Sequence[str],
+        tree_type: str,
+        *,
+        days: int = 7,
+    ) -> list[CompactKpiSummary]:
+        """Summarize many nodes with a single aggregate query, preserving the requested order."""
+        if days <= 0:
+            raise ValueError("days must be positive")
+
+        period_end = self._today()
+        period_start = period_end - timedelta(days=days - 1)
+        unique_ids = list(dict.fromkeys(node_ids))
+        totals = {
+            item.node_id: item
+            for item in self._repository.summarize_metrics(
+                unique_ids,
+                tree_type=tree_type,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        }
+
+        summaries: list[CompactKpiSummary] = []
+        for node_id in unique_ids:
+            item = totals.get(node_id)
+            summaries.append(
+                CompactKpiSummary(
+                    node_id=node_id,
+                    tree_type=tree_type,
+                    period_start=period_start,
+                    period_end=period_end,
+                    total_personal_volume=item.personal_volume if item else ZERO,
+                    total_group_volume=item.group_volume if item else ZERO,
+                    total_orders=item.orders_count if item else 0,
+                    latest_personal_volume=item.latest_personal_volume if item else ZERO,
+                    latest_group_volume=item.latest_group_volume if item else ZERO,
+                    latest_volume_left=item.latest_volume_left if item else None,
+                    latest_volume_right=item.latest_volume_right if item else None,
+                ),
+            )
+        return summaries
+
     # ------------------------------------------------------------------ helpers
 
     def _normalize(
@@ -0,0 +1,133 @@
+"""Incremental rollup of paid orders into daily organization KPI metrics."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Callable, Optional, Sequence
+
+from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL
+from aeghash.core.repositories import (
+    OrderRecord,
+    OrderRepository,
+    OrganizationMetricDelta,
+    OrganizationMetricsRepository,
+    OrganizationRepository,
+    RollupWatermark,
+)
+
+
+ZERO = Decimal("0")
+ROLLUP_NAME = "organization_metrics_daily"
+
+
+@dataclass(slots=True)
+class RollupResult:
+    """Summary of a rollup run."""
+
+    orders: int = 0
+    skipped: int = 0
+    rows_updated: int = 0
+    batches: int = 0
+    watermark: Optional[RollupWatermark] = None
+    # (node_id, tree_type) pairs whose metrics changed; invalidate cached KPIs once committed.
+    touched_nodes: set[tuple[str, str]] = field(default_factory=set)
+
+
+class OrganizationRollupService:
+    """Propagate order PV up both organization trees, one batch of new orders at a time.
+
+    Each run reads the PAID orders that are not yet marked as rolled up and marks them
+    afterwards, so an order is picked up whenever it commits, however old its
+    ``created_at``. Orders are also claimed in a ledger, which keeps them from being
+    counted twice. The stored watermark only records the last order consumed.
+    """
+
+    def __init__(
+        self,
+        orders: OrderRepository,
+        organizations: OrganizationRepository,
+        metrics: OrganizationMetricsRepository,
+        *,
+        clock: Callable[[], datetime] | None = None,
+        tree_types: Sequence[str] = (TREE_UNILEVEL, TREE_BINARY),
+        batch_size: int = 1000,
+    ) -> None:
+        self._orders = orders
+        self._organizations = organizations
+        self._metrics = metrics
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._tree_types = tuple(tree_types)
+        self._batch_size = max(batch_size, 1)
+
+    def run(self, *, max_batches: Optional[int] = None) -> RollupResult:
+        rolled_up_at = self._clock()
+        result = RollupResult(watermark=self._metrics.get_rollup_watermark(ROLLUP_NAME))
+
+        while max_batches is None or result.batches < max_batches:
+            orders = self._orders.list_unrolled_paid_orders(limit=self._batch_size)
+            if not orders:
+                break
+            result.batches += 1
+
+            claimed = self._metrics.claim_rollup_orders([order.order_id for order in orders])
+            fresh = [order for order in orders if order.order_id in claimed]
+            result.orders += len(fresh)
+            result.skipped += len(orders) - len(fresh)
+
+            deltas = self._build_deltas(fresh)
+            if deltas:
+                self._metrics.apply_metric_deltas(deltas)
+                result.rows_updated += len(deltas)
+                result.touched_nodes.update((delta.node_id, delta.tree_type) for delta in deltas)
+
+            self._orders.mark_orders_rolled_up([order.order_id for order in orders], rolled_up_at=rolled_up_at)
+            watermark = RollupWatermark(
+                name=ROLLUP_NAME,
+                last_created_at=orders[-1].created_at,
+                last_order_id=orders[-1].order_id,
+            )
+            self._metrics.save_rollup_watermark(watermark)
+            result.watermark = watermark
+            if len(orders) < self._batch_size:
+                break
+        return result
+
+    # ------------------------------------------------------------------ helpers
+
+    def _build_deltas(self, orders: Sequence[OrderRecord]) -> list[OrganizationMetricDelta]:
+        if not orders:
+            return []
+        by_user: dict[str, list[OrderRecord]] = defaultdict(list)
+        for order in orders:
+            by_user[order.user_id].append(order)
+
+        deltas: dict[tuple, OrganizationMetricDelta] = {}
+        for tree_type in self._tree_types:
+            binary = tree_type == TREE_BINARY
+            for entry in self._organizations.list_uplines(list(by_user), tree_type=tree_type):
+                for order in by_user[entry.user_id]:
+                    metric_date = order.created_at.date()
+                    key = (entry.node_id, tree_type, metric_date)
+                    delta = deltas.get(key)
+                    if delta is None:
+                        delta = OrganizationMetricDelta(
+                            node_id=entry.node_id,
+                            tree_type=tree_type,
+                            metric_date=metric_date,
+                            volume_left=ZERO if binary else None,
+                            volume_right=ZERO if binary else None,
+                        )
+                        deltas[key] = delta
+                    pv = Decimal(order.pv_amount)
+                    delta.group_volume += pv
+                    if entry.distance == 0:
+                        delta.personal_volume += pv
+                        delta.orders_count += 1
+                    elif binary and entry.leg == "L":
+                        delta.volume_left += pv
+                    elif binary and entry.leg == "R":
+                        delta.volume_right += pv
+        return list(deltas.values())
@@ -0,0 +1,215 @@
+"""Balance-at-time queries, history and reconciliation over the point ledger."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Callable, Iterator, Optional, Sequence
+
+from aeghash.core.repositories import (
+    PointLedgerCheckpointRecord,
+    PointLedgerPage,
+    PointLedgerRepository,
+    PointLedgerTotals,
+    PointWalletRecord,
+)
+
+
+class PointLedgerError(ValueError):
+    """Base error for point ledger queries."""
+
+
+def encode_ledger_cursor(created_at: datetime, entry_id: str) -> str:
+    """Build the opaque keyset cursor used by ``list_entries``."""
+    return f"{created_at.isoformat()}|{entry_id}"
+
+
+def decode_ledger_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a cursor produced by :func:`encode_ledger_cursor`."""
+    created_at, separator, entry_id = cursor.rpartition("|")
+    if not separator or not entry_id:
+        raise PointLedgerError(f"Invalid ledger cursor: {cursor!r}")
+    try:
+        return datetime.fromisoformat(created_at), entry_id
+    except ValueError as exc:
+        raise PointLedgerError(f"Invalid ledger cursor: {cursor!r}") from exc
+
+
+@dataclass(slots=True)
+class LedgerBalance:
+    """Wallet balance derived from the ledger at a point in time."""
+
+    wallet_id: str
+    as_of: datetime
+    balance: Decimal
+    pending_withdrawal: Decimal
+
+    @property
+    def available_balance(self) -> Decimal:
+        return self.balance - self.pending_withdrawal
+
+
+@dataclass(slots=True)
+class ReconciliationMismatch:
+    """A wallet whose stored balance disagrees with its ledger."""
+
+    wallet_id: str
+    wallet_balance: Decimal
+    ledger_balance: Decimal
+    wallet_pending: Decimal
+    ledger_pending: Decimal
+
+
+@dataclass(slots=True)
+class ReconciliationReport:
+    """Summary of a reconciliation run."""
+
+    wallets: int = 0
+    entries_scanned: int = 0
+    mismatches: list[ReconciliationMismatch] = field(default_factory=list)
+
+    @property
+    def balanced(self) -> bool:
+        return not self.mismatches
+
+
+@dataclass(slots=True)
+class CheckpointResult:
+    """Summary of a checkpoint run."""
+
+    wallets: int = 0
+    checkpoints: int = 0
+    entries: int = 0
+    checkpoint_at: Optional[datetime] = None
+
+
+class PointLedgerService:
+    """Answer balance questions from the ledger rather than ``point_wallets.balance``.
+
+    Every ledger row carries its signed balance/pending deltas, so a balance is the sum of
+    a wallet's rows. A checkpoint stores the sum of the rows it covers, and each covered row
+    records which checkpoint that was. Coverage is decided by what has committed when the
+    checkpoint runs, not by ``created_at``: a row written earlier but committed later stays
+    uncovered and lands in the next tail. Queries start from the newest usable checkpoint
+    and add the rows it does not cover.
+    """
+
+    def __init__(
+        self,
+        repository: PointLedgerRepository,
+        *,
+        clock: Callable[[], datetime] | None = None,
+        batch_size: int = 500,
+    ) -> None:
+        self._repository = repository
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._batch_size = max(batch_size, 1)
+
+    def balance_as_of(self, wallet_id: str, at: datetime) -> LedgerBalance:
+        checkpoint = self._repository.latest_checkpoints([wallet_id], at_or_before=at).get(wallet_id)
+        after = {wallet_id: checkpoint.checkpoint_at} if checkpoint else {}
+        tail = self._repository.sum_entries([wallet_id], after=after, until=at).get(wallet_id, PointLedgerTotals())
+        totals = self._combine(checkpoint, tail)
+        return LedgerBalance(
+            wallet_id=wallet_id,
+            as_of=at,
+            balance=totals.balance,
+            pending_withdrawal=totals.pending_withdrawal,
+        )
+
+    def history(self, wallet_id: str, *, limit: int = 50, cursor: Optional[str] = None) -> PointLedgerPage:
+        return self._repository.list_entries(wallet_id, limit=max(1, min(limit, 500)), cursor=cursor)
+
+    def checkpoint(self, *, min_entries: int = 1) -> CheckpointResult:
+        """Roll each wallet's newest checkpoint forward when at least ``min_entries`` uncovered rows have accrued.
+
+        Run one checkpoint at a time; concurrent runs would each build on the same previous checkpoint.
+        """
+        cutoff = self._clock()
+        result = CheckpointResult(checkpoint_at=cutoff)
+        for wallets in self._wallet_batches():
+            wallet_ids = [wallet.wallet_id for wallet in wallets]
+            result.wallets += len(wallet_ids)
+            previous = self._repository.latest_checkpoints(wallet_ids)
+            after = {wallet_id: record.checkpoint_at for wallet_id, record in previous.items()}
+            tails = self._repository.sum_entries(wallet_ids, after=after, until=cutoff)
+            due = [
+                wallet_id
+                for wallet_id, tail in tails.items()
+                if tail.entry_count >= max(min_entries, 1)
+                and not (wallet_id in previous and previous[wallet_id].checkpoint_at >= cutoff)
+            ]
+            if not due:
+                continue
+            covered = self._repository.cover_entries(due, checkpoint_at=cutoff)
+            records: list[PointLedgerCheckpointRecord] = []
+            for wallet_id, totals in covered.items():
+                combined = self._combine(previous.get(wallet_id), totals)
+                records.append(
+                    PointLedgerCheckpointRecord(
+                        wallet_id=wallet_id,
+                        checkpoint_at=cutoff,
+                        balance=combined.balance,
+                        pending_withdrawal=combined.pending_withdrawal,
+                        entry_count=combined.entry_count,
+                        created_at=cutoff,
+                    ),
+                )
+                result.entries += totals.entry_count
+            if records:
+                self._repository.add_checkpoints(records)
+                result.checkpoints += len(records)
+        return result
+
+    def reconcile(self, *, use_checkpoints: bool = True) -> ReconciliationReport:
+        """Check ``balance == sum(ledger)`` (and the same for pending) for every wallet.
+
+        Run it against a quiet database or re-check reported wallets: writes landing between
+        the wallet read and the ledger sum show up as transient mismatches.
+        """
+        report = ReconciliationReport()
+        for wallets in self._wallet_batches():
+            wallet_ids = [wallet.wallet_id for wallet in wallets]
+            checkpoints = self._repository.latest_checkpoints(wallet_ids) if use_checkpoints else {}
+            after = {wallet_id: record.checkpoint_at for wallet_id, record in checkpoints.items()}
+            tails = self._repository.sum_entries(wallet_ids, after=after)
+            report.wallets += len(wallets)
+            for wallet in wallets:
+                tail = tails.get(wallet.wallet_id, PointLedgerTotals())
+                report.entries_scanned += tail.entry_count
+                totals = self._combine(checkpoints.get(wallet.wallet_id), tail)
+                if totals.balance != wallet.balance or totals.pending_withdrawal != wallet.pending_withdrawal:
+                    report.mismatches.append(
+                        ReconciliationMismatch(
+                            wallet_id=wallet.wallet_id,
+                            wallet_balance=wallet.balance,
+                            ledger_balance=totals.balance,
+                            wallet_pending=wallet.pending_withdrawal,
+                            ledger_pending=totals.pending_withdrawal,
+                        ),
+                    )
+        return report
+
+    # ------------------------------------------------------------------ helpers
+
+    def _wallet_batches(self) -> Iterator[Sequence[PointWalletRecord]]:
+        after_wallet_id: Optional[str] = None
+        while True:
+            wallets = self._repository.list_wallets(after_wallet_id=after_wallet_id, limit=self._batch_size)
+            if not wallets:
+                return
+            yield wallets
+            if len(wallets) < self._batch_size:
+                return
+            after_wallet_id = wallets[-1].wallet_id
+
+    @staticmethod
+    def _combine(checkpoint: Optional[PointLedgerCheckpointRecord], tail: PointLedgerTotals) -> PointLedgerTotals:
+        if checkpoint is None:
+            return tail
+        return PointLedgerTotals(
+            balance=checkpoint.balance + tail.balance,
+            pending_withdrawal=checkpoint.pending_withdrawal + tail.pending_withdrawal,
+            entry_count=checkpoint.entry_count + tail.entry_count,
+        )
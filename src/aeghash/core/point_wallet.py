@@ -9,9 +9,11 @@ import uuid
 from typing import Callable, Mapping, MutableMapping, Optional, Sequence
 
 from aeghash.core.repositories import (
+    BalanceGuard,
     PointLedgerRecord,
     PointWalletRecord,
     PointWalletRepository,
+    WithdrawalRequestPage,
     WithdrawalRequestRecord,
 )
 
@@ -19,6 +21,8 @@ from aeghash.core.repositories import (
 WALLET_STATUS_ACTIVE = "active"
 WALLET_STATUS_SUSPENDED = "suspended"
 
+ZERO = Decimal("0")
+
 LEDGER_TYPE_CREDIT = "credit"
 LEDGER_TYPE_DEBIT = "debit"
 LEDGER_TYPE_HOLD = "hold"
@@ -57,6 +61,22 @@ class InvalidWithdrawalState(PointWalletError):
     """Raised when a withdrawal request transition is not allowed."""
 
 
+def encode_withdrawal_cursor(created_at: datetime, request_id: str) -> str:
+    """Build the opaque keyset cursor used by ``list_withdrawal_requests``."""
+    return f"{created_at.isoformat()}|{request_id}"
+
+
+def decode_withdrawal_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a cursor produced by :func:`encode_withdrawal_cursor`."""
+    created_at, separator, request_id = cursor.rpartition("|")
+    if not separator or not request_id:
+        raise PointWalletError(f"Invalid withdrawal cursor: {cursor!r}")
+    try:
+        return datetime.fromisoformat(created_at), request_id
+    except ValueError as exc:
+        raise PointWalletError(f"Invalid withdrawal cursor: {cursor!r}") from exc
+
+
 @dataclass(slots=True)
 class PointWalletSnapshot:
     """Immutable snapshot of a wallet state returned by the service."""
@@ -91,6 +111,38 @@ class WithdrawalSnapshot:
     metadata: Optional[Mapping[str, object]] = None
 
 
+@dataclass(slots=True)
+class WithdrawalPage:
+    """Cursor-paginated slice of withdrawal snapshots, oldest first."""
+
+    items: list[WithdrawalSnapshot]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CreditInstruction:
+    """One credit to apply as part of ``PointWalletService.credit_many``."""
+
+    user_id: str
+    amount: Decimal
+    reference_id: Optional[str] = None
+    metadata: Optional[Mapping[str, object]] = None
+
+
+@dataclass(slots=True)
+class CreditOutcome:
+    """Result of a single ``CreditInstruction``; ``error`` is set when it was not applied."""
+
+    instruction: CreditInstruction
+    wallet_id: Optional[str] = None
+    balance_after: Optional[Decimal] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
 class PointWalletService:
     """Service encapsulating point balance adjustments and withdrawal flow."""
 
@@ -148,18 +200,106 @@ class PointWalletService:
         wallet_record = self._get_or_create_record(user_id)
         self._assert_active(wallet_record)
         value = self._ensure_positive(amount)
-        wallet_record.balance += value
-        wallet_record.updated_at = self._now()
-        updated = self._repository.update_wallet(wallet_record)
+        updated = self._apply_delta(
+            wallet_record.wallet_id,
+            balance_delta=value,
+            guard=BalanceGuard(require_status=WALLET_STATUS_ACTIVE),
+        )
         self._append_ledger(
             updated,
             entry_type=LEDGER_TYPE_CREDIT,
             amount=value,
             reference_id=reference_id,
             metadata=metadata,
+            balance_delta=value,
         )
         return self._to_snapshot(updated)
 
+    def credit_many(self, instructions: Sequence[CreditInstruction]) -> list[CreditOutcome]:
+        """Apply many credits with a bounded number of statements.
+
+        Instructions are grouped by user: missing wallets are created in one bulk insert,
+        each wallet gets a single aggregated balance update, and all ledger rows go out in
+        one multi-row insert. Outcomes are returned in instruction order; a bad amount or a
+        suspended wallet fails only the affected instructions. Any other error propagates
+        with earlier updates still pending, so the caller must roll back its transaction.
+        """
+        outcomes = [CreditOutcome(instruction=instruction) for instruction in instructions]
+        amounts: dict[int, Decimal] = {}
+        by_user: dict[str, list[int]] = {}
+        for index, instruction in enumerate(instructions):
+            try:
+                amounts[index] = self._ensure_positive(instruction.amount)
+            except (PointWalletError, ArithmeticError) as exc:
+                outcomes[index].error = str(exc) or "Amount must be positive."
+                continue
+            by_user.setdefault(instruction.user_id, []).append(index)
+        if not by_user:
+            return outcomes
+
+        wallets = dict(self._repository.get_wallets_by_users(list(by_user)))
+        missing = [user_id for user_id in by_user if user_id not in wallets]
+        if missing:
+            now = self._now()
+            created = [
+                PointWalletRecord(
+                    wallet_id=self._new_id(),
+                    user_id=user_id,
+                    balance=ZERO,
+                    pending_withdrawal=ZERO,
+                    status=WALLET_STATUS_ACTIVE,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for user_id in missing
+            ]
+            self._repository.create_wallets(created)
+            wallets.update((record.user_id, record) for record in created)
+
+        now = self._now()
+        guard = BalanceGuard(require_status=WALLET_STATUS_ACTIVE)
+        ledger: list[PointLedgerRecord] = []
+        for user_id, indexes in by_user.items():
+            wallet = wallets[user_id]
+            total = sum((amounts[index] for index in indexes), ZERO)
+            updated = None
+            if wallet.status == WALLET_STATUS_ACTIVE:
+                updated = self._repository.apply_balance_delta(
+                    wallet.wallet_id,
+                    balance_delta=total,
+                    guard=guard,
+                    updated_at=now,
+                )
+            if updated is None:
+                for index in indexes:
+                    outcomes[index].wallet_id = wallet.wallet_id
+                    outcomes[index].error = f"Wallet '{wallet.wallet_id}' is suspended."
+                continue
+            # Replay the group on top of the pre-update balance so each ledger row has its own running total.
+            running = updated.balance - total
+            for index in indexes:
+                instruction = instructions[index]
+                running += amounts[index]
+                ledger.append(
+                    PointLedgerRecord(
+                        entry_id=self._new_id(),
+                        wallet_id=updated.wallet_id,
+                        entry_type=LEDGER_TYPE_CREDIT,
+                        amount=amounts[index],
+                        balance_after=running,
+                        pending_after=updated.pending_withdrawal,
+                        reference_id=instruction.reference_id,
+                        metadata=dict(instruction.metadata) if instruction.metadata is not None else None,
+                        created_at=now,
+                        balance_delta=amounts[index],
+                    ),
+                )
+                outcomes[index].wallet_id = updated.wallet_id
+                outcomes[index].balance_after = running
+        if ledger:
+            self._repository.add_ledger_entries(ledger)
+        return outcomes
+
     def debit(
         self,
         *,
@@ -168,19 +308,19 @@ class PointWalletService:
         reference_id: Optional[str] = None,
         metadata: Optional[Mapping[str, object]] = None,
     ) -> PointWalletSnapshot:
-        wallet = self._require_wallet(wallet_id)
-        self._assert_active(wallet)
         value = self._ensure_positive(amount)
-        self._ensure_sufficient(wallet, value)
-        wallet.balance -= value
-        wallet.updated_at = self._now()
-        updated = self._repository.update_wallet(wallet)
+        updated = self._apply_delta(
+            wallet_id,
+            balance_delta=-value,
+            guard=BalanceGuard(min_available=value, require_status=WALLET_STATUS_ACTIVE),
+        )
         self._append_ledger(
             updated,
             entry_type=LEDGER_TYPE_DEBIT,
             amount=value,
             reference_id=reference_id,
             metadata=metadata,
+            balance_delta=-value,
         )
         return self._to_snapshot(updated)
 
@@ -198,11 +338,11 @@ class PointWalletService:
         wallet = self._require_wallet(wallet_id, expected_user_id=requested_by)
         self._assert_active(wallet)
         value = self._ensure_positive(amount)
-        self._ensure_sufficient(wallet, value)
-
-        wallet.pending_withdrawal += value
-        wallet.updated_at = self._now()
-        updated_wallet = self._repository.update_wallet(wallet)
+        updated_wallet = self._apply_delta(
+            wallet_id,
+            pending_delta=value,
+            guard=BalanceGuard(min_available=value, require_status=WALLET_STATUS_ACTIVE),
+        )
 
         request = WithdrawalRequestRecord(
             request_id=self._new_id(),
@@ -222,6 +362,7 @@ class PointWalletService:
             amount=value,
             reference_id=request.request_id,
             metadata={"reference_id": reference_id, "requested_by": requested_by},
+            pending_delta=value,
         )
         return self._to_withdrawal_snapshot(persisted)
 
@@ -232,19 +373,11 @@ class PointWalletService:
         approved_by: str,
         notes: Optional[str] = None,
     ) -> WithdrawalSnapshot:
+        approvable = (WITHDRAWAL_STATUS_PENDING, WITHDRAWAL_STATUS_APPROVED_STAGE1)
         request = self._require_withdrawal(request_id)
-        if request.status not in {WITHDRAWAL_STATUS_PENDING, WITHDRAWAL_STATUS_APPROVED_STAGE1}:
+        if request.status not in approvable:
             raise InvalidWithdrawalState(f"Withdrawal '{request_id}' is not pending.")
 
-        wallet = self._require_wallet(request.wallet_id)
-        self._assert_active(wallet)
-        self._ensure_sufficient(wallet, request.amount, include_pending=True)
-
-        wallet.balance -= request.amount
-        wallet.pending_withdrawal -= request.amount
-        wallet.updated_at = self._now()
-        updated_wallet = self._repository.update_wallet(wallet)
-
         request = replace(
             request,
             status=WITHDRAWAL_STATUS_APPROVED,
@@ -252,7 +385,18 @@ class PointWalletService:
             approved_at=self._now(),
             notes=notes,
         )
-        persisted = self._repository.update_withdrawal_request(request)
+        persisted = self._transition(request, approvable, "is not pending")
+
+        updated_wallet = self._apply_delta(
+            request.wallet_id,
+            balance_delta=-request.amount,
+            pending_delta=-request.amount,
+            guard=BalanceGuard(
+                min_balance=request.amount,
+                min_pending=request.amount,
+                require_status=WALLET_STATUS_ACTIVE,
+            ),
+        )
 
         self._append_ledger(
             updated_wallet,
@@ -260,6 +404,8 @@ class PointWalletService:
             amount=request.amount,
             reference_id=request.request_id,
             metadata={"approved_by": approved_by, "notes": notes},
+            balance_delta=-request.amount,
+            pending_delta=-request.amount,
         )
         return self._to_withdrawal_snapshot(persisted)
 
@@ -287,7 +433,7 @@ class PointWalletService:
             status=WITHDRAWAL_STATUS_APPROVED_STAGE1,
             metadata=merged_metadata,
         )
-        persisted = self._repository.update_withdrawal_request(updated_request)
+        persisted = self._transition(updated_request, (WITHDRAWAL_STATUS_PENDING,), "is not pending")
         return self._to_withdrawal_snapshot(persisted)
 
     def fail_withdrawal(
@@ -301,13 +447,7 @@ class PointWalletService:
         if request.status not in {WITHDRAWAL_STATUS_APPROVED, WITHDRAWAL_STATUS_APPROVED_STAGE1}:
             raise InvalidWithdrawalState(f"Withdrawal '{request_id}' is not approved.")
 
-        wallet = self._require_wallet(request.wallet_id)
-        if request.status == WITHDRAWAL_STATUS_APPROVED:
-            wallet.balance += request.amount
-        wallet.pending_withdrawal = max(Decimal("0"), wallet.pending_withdrawal - request.amount)
-        wallet.updated_at = self._now()
-        updated_wallet = self._repository.update_wallet(wallet)
-
+        previous_status = request.status
         request = replace(
             request,
             status=WITHDRAWAL_STATUS_FAILED,
@@ -315,7 +455,20 @@ class PointWalletService:
             rejected_at=self._now(),
             notes=reason,
         )
-        persisted = self._repository.update_withdrawal_request(request)
+        persisted = self._transition(request, (previous_status,), "is not approved")
+
+        # A fully approved request already left the hold and the balance, so it is refunded;
+        # a stage-1 request still holds its amount, which is released instead.
+        if previous_status == WITHDRAWAL_STATUS_APPROVED:
+            refunded, released = request.amount, ZERO
+        else:
+            refunded, released = ZERO, request.amount
+        updated_wallet = self._apply_delta(
+            request.wallet_id,
+            balance_delta=refunded,
+            pending_delta=-released,
+            guard=BalanceGuard(min_pending=released),
+        )
 
         self._append_ledger(
             updated_wallet,
@@ -323,6 +476,8 @@ class PointWalletService:
             amount=request.amount,
             reference_id=request.request_id,
             metadata={"failed_by": failed_by, "reason": reason},
+            balance_delta=refunded,
+            pending_delta=-released,
         )
         return self._to_withdrawal_snapshot(persisted)
 
@@ -338,12 +493,6 @@ class PointWalletService:
         if request.status != WITHDRAWAL_STATUS_PENDING:
             raise InvalidWithdrawalState(f"Withdrawal '{request_id}' is not pending.")
 
-        wallet = self._require_wallet(request.wallet_id)
-        self._ensure_pending_amount(wallet, request.amount)
-        wallet.pending_withdrawal -= request.amount
-        wallet.updated_at = self._now()
-        updated_wallet = self._repository.update_wallet(wallet)
-
         request = replace(
             request,
             status=WITHDRAWAL_STATUS_REJECTED,
@@ -351,7 +500,13 @@ class PointWalletService:
             rejected_at=self._now(),
             notes=notes,
         )
-        persisted = self._repository.update_withdrawal_request(request)
+        persisted = self._transition(request, (WITHDRAWAL_STATUS_PENDING,), "is not pending")
+
+        updated_wallet = self._apply_delta(
+            request.wallet_id,
+            pending_delta=-request.amount,
+            guard=BalanceGuard(min_pending=request.amount),
+        )
 
         self._append_ledger(
             updated_wallet,
@@ -359,6 +514,7 @@ class PointWalletService:
             amount=request.amount,
             reference_id=request.request_id,
             metadata={"rejected_by": rejected_by, "notes": notes},
+            pending_delta=-request.amount,
         )
         return self._to_withdrawal_snapshot(persisted)
 
@@ -367,19 +523,19 @@ class PointWalletService:
         if request.status != WITHDRAWAL_STATUS_PENDING:
             raise InvalidWithdrawalState(f"Withdrawal '{request_id}' is not pending.")
 
-        wallet = self._require_wallet(request.wallet_id)
-        self._ensure_pending_amount(wallet, request.amount)
-        wallet.pending_withdrawal -= request.amount
-        wallet.updated_at = self._now()
-        updated_wallet = self._repository.update_wallet(wallet)
-
         request = replace(
             request,
             status=WITHDRAWAL_STATUS_CANCELLED,
             rejected_by=cancelled_by,
             rejected_at=self._now(),
         )
-        persisted = self._repository.update_withdrawal_request(request)
+        persisted = self._transition(request, (WITHDRAWAL_STATUS_PENDING,), "is not pending")
+
+        updated_wallet = self._apply_delta(
+            request.wallet_id,
+            pending_delta=-request.amount,
+            guard=BalanceGuard(min_pending=request.amount),
+        )
 
         self._append_ledger(
             updated_wallet,
@@ -387,6 +543,7 @@ class PointWalletService:
             amount=request.amount,
             reference_id=request.request_id,
             metadata={"cancelled_by": cancelled_by},
+            pending_delta=-request.amount,
         )
         return self._to_withdrawal_snapshot(persisted)
 
@@ -409,9 +566,31 @@ class PointWalletService:
         *,
         wallet_id: str,
         statuses: Sequence[str] | None = None,
+        limit: int = 100,
     ) -> list[WithdrawalSnapshot]:
-        records = self._repository.list_withdrawal_requests(wallet_id=wallet_id, statuses=statuses)
-        return [self._to_withdrawal_snapshot(record) for record in records]
+        """Return the oldest ``limit`` requests of a wallet; use ``list_withdrawal_page`` to page further."""
+        return self.list_withdrawal_page(wallet_id=wallet_id, statuses=statuses, limit=limit).items
+
+    def list_withdrawal_page(
+        self,
+        *,
+        wallet_id: Optional[str] = None,
+        statuses: Sequence[str] | None = None,
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> WithdrawalPage:
+        page: WithdrawalRequestPage = self._repository.list_withdrawal_requests(
+            wallet_id=wallet_id,
+            statuses=statuses,
+            created_before=created_before,
+            cursor=cursor,
+            limit=max(limit, 1),
+        )
+        return WithdrawalPage(
+            items=[self._to_withdrawal_snapshot(record) for record in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     # ----------------------------------------------------------------- helpers
 
@@ -439,6 +618,43 @@ class PointWalletService:
             raise WalletNotFound(f"Wallet '{wallet_id}' was not found.")
         return record
 
+    def _apply_delta(
+        self,
+        wallet_id: str,
+        *,
+        balance_delta: Decimal = ZERO,
+        pending_delta: Decimal = ZERO,
+        guard: BalanceGuard,
+    ) -> PointWalletRecord:
+        updated = self._repository.apply_balance_delta(
+            wallet_id,
+            balance_delta=balance_delta,
+            pending_delta=pending_delta,
+            guard=guard,
+            updated_at=self._now(),
+        )
+        if updated is not None:
+            return updated
+        # The write was refused; re-read only to report why.
+        wallet = self._require_wallet(wallet_id)
+        if guard.require_status is not None:
+            self._assert_active(wallet)
+        if guard.min_pending is not None:
+            self._ensure_pending_amount(wallet, guard.min_pending)
+        raise InsufficientBalance("Insufficient wallet balance.")
+
+    def _transition(
+        self,
+        request: WithdrawalRequestRecord,
+        expected_statuses: Sequence[str],
+        problem: str,
+    ) -> WithdrawalRequestRecord:
+        # Claim the status change before any balance moves, so a racing transition loses here.
+        persisted = self._repository.transition_withdrawal_request(request, expected_statuses=expected_statuses)
+        if persisted is None:
+            raise InvalidWithdrawalState(f"Withdrawal '{request.request_id}' {problem}.")
+        return persisted
+
     def _require_withdrawal(self, request_id: str) -> WithdrawalRequestRecord:
         record = self._repository.get_withdrawal_request(request_id)
         if not record:
@@ -474,6 +690,8 @@ class PointWalletService:
         amount: Decimal,
         reference_id: Optional[str],
         metadata: Optional[Mapping[str, object]],
+        balance_delta: Decimal = ZERO,
+        pending_delta: Decimal = ZERO,
     ) -> None:
         payload: Optional[MutableMapping[str, object]]
         if metadata is None:
@@ -490,6 +708,8 @@ class PointWalletService:
             reference_id=reference_id,
             metadata=payload,
             created_at=self._now(),
+            balance_delta=balance_delta,
+            pending_delta=pending_delta,
         )
         self._repository.add_ledger_entry(entry)
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import date, datetime
-from typing import Any, Mapping, Optional, Protocol, Sequence
+from typing import Any, ContextManager, Iterable, Mapping, Optional, Protocol, Sequence
 
 from aeghash.adapters.hashdam import HashBalance
 
@@ -54,6 +54,16 @@ class PointWalletRecord:
     updated_at: datetime
 
 
+@dataclass(slots=True)
+class BalanceGuard:
+    """Preconditions evaluated inside an atomic wallet update; every set bound must hold."""
+
+    min_available: Optional[Decimal] = None
+    min_balance: Optional[Decimal] = None
+    min_pending: Optional[Decimal] = None
+    require_status: Optional[str] = None
+
+
 @dataclass(slots=True)
 class PointLedgerRecord:
     """Immutable ledger entry capturing wallet balance transitions."""
@@ -67,6 +77,37 @@ class PointLedgerRecord:
     reference_id: Optional[str]
     metadata: Optional[Mapping[str, Any]]
     created_at: datetime
+    balance_delta: Decimal = Decimal("0")
+    pending_delta: Decimal = Decimal("0")
+
+
+@dataclass(slots=True)
+class PointLedgerPage:
+    """Cursor-paginated slice of ledger entries, newest first."""
+
+    items: Sequence[PointLedgerRecord]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PointLedgerTotals:
+    """Sum of the signed deltas over a run of ledger entries."""
+
+    balance: Decimal = Decimal("0")
+    pending_withdrawal: Decimal = Decimal("0")
+    entry_count: int = 0
+
+
+@dataclass(slots=True)
+class PointLedgerCheckpointRecord:
+    """Ledger totals of a wallet over every entry created at or before ``checkpoint_at``."""
+
+    wallet_id: str
+    checkpoint_at: datetime
+    balance: Decimal
+    pending_withdrawal: Decimal
+    entry_count: int
+    created_at: datetime
 
 
 @dataclass(slots=True)
@@ -88,6 +129,14 @@ class WithdrawalRequestRecord:
     notes: Optional[str] = None
 
 
+@dataclass(slots=True)
+class WithdrawalRequestPage:
+    """Cursor-paginated slice of withdrawal requests, oldest first."""
+
+    items: Sequence[WithdrawalRequestRecord]
+    next_cursor: Optional[str] = None
+
+
 @dataclass(slots=True)
 class WithdrawalAuditRecord:
     """Audit trail entry for withdrawal workflow actions."""
@@ -144,6 +193,14 @@ class OrganizationNodeRecord:
     center_id: Optional[str] = None
 
 
+@dataclass(slots=True)
+class OrganizationNodePage:
+    """Cursor-paginated slice of organization nodes."""
+
+    items: Sequence[OrganizationNodeRecord]
+    next_cursor: Optional[str] = None
+
+
 @dataclass(slots=True)
 class SpilloverLogRecord:
     """Record of a spillover event for auditing."""
@@ -157,6 +214,39 @@ class SpilloverLogRecord:
     created_at: datetime
 
 
+@dataclass(slots=True)
+class BinarySlotRecord:
+    """Open or filled L/R slot beneath a binary tree node."""
+
+    node_id: str
+    slot: str  # "L" or "R"
+    status: str
+    placement_key: str
+    child_node_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BinarySlotClaim:
+    """Outcome of ``claim_binary_slot``: a reserved slot, a lost race, or no open slot at all."""
+
+    slot: Optional[BinarySlotRecord] = None
+    contended: bool = False
+
+
+@dataclass(slots=True)
+class BinaryPlacementQueueRecord:
+    """Binary placement deferred to the waiting queue after slot contention."""
+
+    queue_id: str
+    sponsor_node_id: str
+    candidate_user_id: str
+    status: str  # PENDING, COMPLETED, FAILED
+    enqueued_at: datetime
+    retry_count: int = 0
+    preferred_slot: Optional[str] = None
+    last_attempt_at: Optional[datetime] = None
+
+
 @dataclass(slots=True)
 class BonusEntryRecord:
     """Bonus ledger entry created by the bonus distribution engine."""
@@ -221,6 +311,15 @@ class BonusRetryRecord:
     updated_at: Optional[datetime]
 
 
+@dataclass(slots=True)
+class BonusRetrySchedule:
+    """Retry to queue for a bonus entry whose wallet credit failed."""
+
+    bonus_id: str
+    retry_after: datetime
+    metadata: Mapping[str, Any]
+
+
 @dataclass(slots=True)
 class OrganizationKpiRecord:
     """Daily KPI snapshot for an organization node."""
@@ -235,6 +334,54 @@ class OrganizationKpiRecord:
     orders_count: int
 
 
+@dataclass(slots=True)
+class OrganizationKpiTotals:
+    """Per-node KPI aggregates over a date range, computed by the database."""
+
+    node_id: str
+    tree_type: str
+    personal_volume: Decimal
+    group_volume: Decimal
+    orders_count: int
+    latest_personal_volume: Decimal
+    latest_group_volume: Decimal
+    latest_volume_left: Optional[Decimal]
+    latest_volume_right: Optional[Decimal]
+
+
+@dataclass(slots=True)
+class OrganizationMetricDelta:
+    """Increment applied to one ``organization_metrics_daily`` row by the KPI rollup."""
+
+    node_id: str
+    tree_type: str
+    metric_date: date
+    personal_volume: Decimal = Decimal("0")
+    group_volume: Decimal = Decimal("0")
+    volume_left: Optional[Decimal] = None
+    volume_right: Optional[Decimal] = None
+    orders_count: int = 0
+
+
+@dataclass(slots=True)
+class RollupWatermark:
+    """Position of the last order consumed by an incremental rollup."""
+
+    name: str
+    last_created_at: Optional[datetime] = None
+    last_order_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UplineEntry:
+    """Node on a member's upline (distance 0 is the member) and the leg the member sits in."""
+
+    user_id: str
+    node_id: str
+    distance: int
+    leg: Optional[str] = None  # "L"/"R" below binary ancestors
+
+
 @dataclass(slots=True)
 class OrderRecord:
     """Commerce order persisted for PV/bonus processing."""
@@ -334,6 +481,9 @@ class LoginAuditRepository(Protocol):
     def log(self, record: LoginAuditRecord) -> None:
         ...
 
+    def log_many(self, records: Sequence[LoginAuditRecord]) -> None:
+        ...
+
     def list_recent(self, *, limit: int = 100) -> Sequence[LoginAuditRecord]:
         ...
 
@@ -370,6 +520,14 @@ class SessionRepository(Protocol):
     def get_session(self, token: str) -> Optional[SessionRecord]:
         ...
 
+    def revoke_session(self, token: str) -> bool:
+        """Mark a session revoked; returns False when it is unknown or already revoked."""
+        ...
+
+    def list_revoked_tokens(self, *, now: float) -> list[str]:
+        """Tokens of revoked sessions that would otherwise still be valid at ``now``."""
+        ...
+
 
 class TwoFactorRepository(Protocol):
     """Persistence operations for two-factor secrets."""
@@ -403,15 +561,40 @@ class PointWalletRepository(Protocol):
     def get_wallet_by_user(self, user_id: str) -> Optional[PointWalletRecord]:
         ...
 
+    def get_wallets_by_users(self, user_ids: Sequence[str]) -> Mapping[str, PointWalletRecord]:
+        """Return existing wallets for ``user_ids``, keyed by user id."""
+        ...
+
     def create_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         ...
 
+    def create_wallets(self, records: Sequence[PointWalletRecord]) -> None:
+        ...
+
     def update_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         ...
 
+    def apply_balance_delta(
+        self,
+        wallet_id: str,
+        *,
+        balance_delta: Decimal = Decimal("0"),
+        pending_delta: Decimal = Decimal("0"),
+        guard: Optional[BalanceGuard] = None,
+        updated_at: datetime,
+    ) -> Optional[PointWalletRecord]:
+        """Add the deltas in one conditional write and return the new state.
+
+        Returns None, leaving the wallet untouched, when it does not exist or the guard fails.
+        """
+        ...
+
     def add_ledger_entry(self, entry: PointLedgerRecord) -> None:
         ...
 
+    def add_ledger_entries(self, entries: Sequence[PointLedgerRecord]) -> None:
+        ...
+
     def get_withdrawal_request(self, request_id: str) -> Optional[WithdrawalRequestRecord]:
         ...
 
@@ -421,12 +604,76 @@ class PointWalletRepository(Protocol):
     def update_withdrawal_request(self, record: WithdrawalRequestRecord) -> WithdrawalRequestRecord:
         ...
 
+    def transition_withdrawal_request(
+        self,
+        record: WithdrawalRequestRecord,
+        *,
+        expected_statuses: Sequence[str],
+    ) -> Optional[WithdrawalRequestRecord]:
+        """Write ``record`` in one conditional update while the stored status is still expected.
+
+        Returns None, leaving the request untouched, when it does not exist or another
+        writer already moved it out of ``expected_statuses``.
+        """
+        ...
+
     def list_withdrawal_requests(
         self,
         *,
-        wallet_id: str,
+        wallet_id: Optional[str] = None,
         statuses: Sequence[str] | None = None,
-    ) -> Sequence[WithdrawalRequestRecord]:
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> WithdrawalRequestPage:
+        """Return requests oldest first, keyset-paginated on ``(created_at, request_id)``.
+
+        Without ``wallet_id`` the listing spans all wallets (the admin approval queue).
+        """
+        ...
+
+
+class PointLedgerRepository(Protocol):
+    """Read side of the point ledger and its per-wallet balance checkpoints."""
+
+    def list_entries(self, wallet_id: str, *, limit: int = 50, cursor: Optional[str] = None) -> PointLedgerPage:
+        ...
+
+    def list_wallets(self, *, after_wallet_id: Optional[str] = None, limit: int = 500) -> Sequence[PointWalletRecord]:
+        """Return wallets ordered by id, starting after ``after_wallet_id``."""
+        ...
+
+    def latest_checkpoints(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        at_or_before: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerCheckpointRecord]:
+        """Return the newest checkpoint of each wallet (not later than ``at_or_before``), keyed by wallet id."""
+        ...
+
+    def sum_entries(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        after: Mapping[str, datetime],
+        until: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerTotals]:
+        """Totals per wallet of entries created at or before ``until`` that the checkpoint at ``after[wallet_id]``
+        (or an earlier one) does not cover; all entries when the wallet has no ``after``.
+
+        Wallets without matching entries are left out.
+        """
+        ...
+
+    def cover_entries(self, wallet_ids: Sequence[str], *, checkpoint_at: datetime) -> Mapping[str, PointLedgerTotals]:
+        """Mark every uncovered entry created at or before ``checkpoint_at`` as covered by that checkpoint.
+
+        Returns the totals of exactly the entries marked here, keyed by wallet id.
+        """
+        ...
+
+    def add_checkpoints(self, records: Sequence[PointLedgerCheckpointRecord]) -> None:
         ...
 
 
@@ -477,12 +724,99 @@ class OrganizationRepository(Protocol):
     def list_spillovers(self, sponsor_user_id: str, *, limit: int = 100) -> Sequence[SpilloverLogRecord]:
         ...
 
+    def find_open_binary_slot(self, sponsor_node_id: str) -> Optional[BinarySlotRecord]:
+        """Return the shallowest, leftmost open slot under the sponsor (breadth-first order)."""
+        ...
+
+    def claim_binary_slot(self, sponsor_node_id: str) -> BinarySlotClaim:
+        """Atomically reserve the next open slot.
+
+        ``contended`` is set when open slots exist but another placement holds or won them;
+        a claim with neither a slot nor contention means the subtree has no open slot.
+        """
+        ...
+
+    def enqueue_binary_placement(self, record: BinaryPlacementQueueRecord) -> None:
+        ...
+
+    def list_pending_binary_placements(self, *, limit: int = 100) -> Sequence[BinaryPlacementQueueRecord]:
+        ...
+
+    def mark_binary_placement(
+        self,
+        queue_id: str,
+        *,
+        status: str,
+        attempted_at: datetime,
+        retry_count: int,
+    ) -> None:
+        ...
+
+    def bulk_insert_nodes(
+        self,
+        tree_type: str,
+        rows: Iterable[tuple[str, str, Optional[str], Optional[str], Optional[str], int, str]],
+        *,
+        created_at: datetime,
+    ) -> int:
+        """Stream ``(node_id, user_id, parent_node_id, sponsor_user_id, position, depth, path)`` rows."""
+        ...
+
+    def bulk_insert_closure(self, tree_type: str, rows: Iterable[tuple[str, str, int]]) -> int:
+        """Stream ``(ancestor_id, descendant_id, depth)`` rows."""
+        ...
+
+    def bulk_insert_binary_slots(
+        self,
+        rows: Iterable[tuple[str, str, str, Optional[str], str]],
+        *,
+        assigned_at: datetime,
+    ) -> int:
+        """Stream ``(node_id, slot, status, child_node_id, placement_key)`` rows."""
+        ...
+
     def get_nodes_by_ids(self, node_ids: Sequence[str]) -> Sequence[OrganizationNodeRecord]:
         ...
 
     def is_descendant(self, *, ancestor_node_id: str, descendant_node_id: str, tree_type: str) -> bool:
         ...
 
+    def get_ancestor_chains(
+        self,
+        user_id: str,
+        *,
+        tree_types: Sequence[str],
+        max_depth: int,
+    ) -> Mapping[str, Sequence[OrganizationNodeRecord]]:
+        """Return ``{tree_type: [node, parent, grandparent, ...]}`` for a user in one lookup."""
+        ...
+
+    def list_ancestors(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+    ) -> Sequence[OrganizationNodeRecord]:
+        """Return ancestors (excluding the node itself) nearest first."""
+        ...
+
+    def list_descendants(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> OrganizationNodePage:
+        """Return descendants (excluding the node itself) ordered by depth, then node id."""
+        ...
+
+    def list_uplines(self, user_ids: Sequence[str], *, tree_type: str) -> Sequence[UplineEntry]:
+        """Return every member's node and ancestors with one closure query."""
+        ...
+
 
 class OrganizationMetricsRepository(Protocol):
     """Persistence operations for organization KPI metrics."""
@@ -497,6 +831,31 @@ class OrganizationMetricsRepository(Protocol):
     ) -> Sequence[OrganizationKpiRecord]:
         ...
 
+    def summarize_metrics(
+        self,
+        node_ids: Sequence[str],
+        *,
+        tree_type: str,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[OrganizationKpiTotals]:
+        """Aggregate totals for many nodes at once; "latest" values are those of ``end_date``."""
+        ...
+
+    def apply_metric_deltas(self, deltas: Sequence[OrganizationMetricDelta]) -> None:
+        """Add each delta onto its daily row, creating rows that do not exist yet."""
+        ...
+
+    def get_rollup_watermark(self, name: str) -> Optional[RollupWatermark]:
+        ...
+
+    def save_rollup_watermark(self, watermark: RollupWatermark) -> None:
+        ...
+
+    def claim_rollup_orders(self, order_ids: Sequence[str]) -> set[str]:
+        """Record orders as rolled up and return the ids that had not been claimed before."""
+        ...
+
 
 class BonusRepository(Protocol):
     """Persistence operations for bonus entries."""
@@ -504,6 +863,9 @@ class BonusRepository(Protocol):
     def record_bonus(self, record: BonusEntryRecord) -> None:
         ...
 
+    def record_bonuses(self, records: Sequence[BonusEntryRecord]) -> None:
+        ...
+
     def list_pending(self, *, limit: int = 100) -> Sequence[BonusEntryRecord]:
         ...
 
@@ -513,9 +875,16 @@ class BonusRepository(Protocol):
     def mark_confirmed(self, bonus_id: str) -> None:
         ...
 
+    def mark_confirmed_many(self, bonus_ids: Sequence[str]) -> None:
+        """Confirm ``bonus_ids`` and complete their retry queue rows in bulk."""
+        ...
+
     def schedule_retry(self, bonus_id: str, retry_after: datetime, metadata: Mapping[str, Any]) -> None:
         ...
 
+    def schedule_retries(self, retries: Sequence[BonusRetrySchedule]) -> None:
+        ...
+
     def mark_failed(self, bonus_id: str, metadata: Mapping[str, Any]) -> None:
         ...
 
@@ -541,6 +910,16 @@ class OrderRepository(Protocol):
     def upsert_order(self, record: OrderRecord) -> OrderRecord:
         ...
 
+    def upsert_orders(self, records: Sequence[OrderRecord]) -> Sequence[OrderRecord]:
+        ...
+
+    def list_unrolled_paid_orders(self, *, limit: int = 1000) -> Sequence[OrderRecord]:
+        """Return PAID orders not yet marked as rolled up, oldest first."""
+        ...
+
+    def mark_orders_rolled_up(self, order_ids: Sequence[str], *, rolled_up_at: datetime) -> None:
+        ...
+
 
 class IdempotencyRepository(Protocol):
     """Persistence layer for idempotency key tracking."""
@@ -554,6 +933,17 @@ class IdempotencyRepository(Protocol):
     def mark_status(self, *, key: str, scope: str, status: str, resource_id: Optional[str] = None) -> None:
         ...
 
+    def get_many(self, keys: Sequence[tuple[str, str]]) -> Mapping[tuple[str, str], IdempotencyKeyRecord]:
+        """Return stored records for ``(scope, key)`` pairs, keyed by the same pair."""
+        ...
+
+    def create_many(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        ...
+
+    def mark_statuses(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        """Persist ``status``/``resource_id`` of each record (a ``None`` resource keeps the stored value)."""
+        ...
+
 
 class ProductRepository(Protocol):
     """Product catalog access for commerce services."""
@@ -573,3 +963,15 @@ class MiningRepository(Protocol):
 
     def log_withdrawal(self, record: WithdrawalRecord) -> None:
         ...
+
+
+class TransactionScope(Protocol):
+    """Transaction control for services that isolate items or must persist work early."""
+
+    def savepoint(self) -> ContextManager[None]:
+        """Roll back only the writes made inside the block when it raises."""
+        ...
+
+    def commit(self) -> None:
+        """Make everything written so far durable."""
+        ...
@@ -9,7 +9,7 @@ from datetime import UTC, datetime
 from typing import Callable, Sequence
 
 from aeghash.core.repositories import UserAccountRecord, UserAccountRepository, UserRecord, UserRepository
-from aeghash.security.passwords import hash_password
+from aeghash.security.passwords import PasswordHasher, hash_password
 
 
 DEFAULT_ROLES: tuple[str, ...] = ("member",)
@@ -37,13 +37,20 @@ class SignupService:
         *,
         id_factory: Callable[[], str] | None = None,
         default_roles: Sequence[str] = DEFAULT_ROLES,
+        password_hasher: PasswordHasher | None = None,
     ) -> None:
         self._accounts = account_repository
         self._identities = identity_repository
         self._id_factory = id_factory or (lambda: uuid.uuid4().hex)
         self._default_roles = tuple(default_roles)
+        self._hash_password = password_hasher.hash if password_hasher else hash_password
 
     def register(self, email: str, password: str, *, roles: Sequence[str] | None = None) -> SignupResult:
+        normalized_email = self.prepare(email, password)
+        return self.create(normalized_email, self._hash_password(password), roles=roles)
+
+    def prepare(self, email: str, password: str) -> str:
+        """Validate the signup input and return the normalized email to register."""
         normalized_email = self._normalize_email(email)
         if not normalized_email:
             raise SignupError("invalid_email")
@@ -52,9 +59,20 @@ class SignupService:
 
         if self._accounts.find_by_email(normalized_email) is not None:
             raise SignupError("email_already_exists")
+        return normalized_email
 
+    def create(
+        self,
+        normalized_email: str,
+        password_hash: str,
+        *,
+        roles: Sequence[str] | None = None,
+    ) -> SignupResult:
+        """Store the account and identity for an email already checked by :meth:`prepare`."""
+        # Hashing may run between prepare and create, so a concurrent signup can claim the email first.
+        if self._accounts.find_by_email(normalized_email) is not None:
+            raise SignupError("email_already_exists")
         user_id = self._id_factory()
-        password_hash = hash_password(password)
         timestamp = datetime.now(UTC)
         account_record = UserAccountRecord(
             user_id=user_id,
@@ -2,17 +2,88 @@
 
 from __future__ import annotations
 
+import hashlib
+from functools import partial
 from typing import Optional
 
-from aeghash.adapters.turnstile import TurnstileClient, TurnstileError
+import anyio
+
+from aeghash.adapters.turnstile import AsyncTurnstileClient, TurnstileClient, TurnstileError
+from aeghash.utils.cache import CacheBackend
 
 
 class TurnstileVerifier:
-    """Adapter that validates Turnstile tokens using the HTTP client."""
+    """Adapter that validates Turnstile tokens using the HTTP client.
+
+    With a ``cache`` the outcome for a ``(token, remote_ip)`` pair is remembered for
+    ``cache_ttl_seconds``, so a client retrying the same token (or a sync service
+    re-checking one the route already verified) does not hit Cloudflare again.
+    Cloudflare itself rejects a token the second time it is verified.
+    """
 
-    def __init__(self, client: TurnstileClient) -> None:
+    def __init__(
+        self,
+        client: TurnstileClient,
+        *,
+        async_client: AsyncTurnstileClient | None = None,
+        cache: CacheBackend | None = None,
+        cache_ttl_seconds: float = 60.0,
+    ) -> None:
         self._client = client
+        self._async_client = async_client
+        self._cache = cache
+        self._cache_ttl = cache_ttl_seconds
+
+    @property
+    def is_async(self) -> bool:
+        return self._async_client is not None
 
     def verify(self, token: str, remote_ip: Optional[str]) -> None:
         """Verify the supplied token, raising TurnstileError on failure."""
-        self._client.verify(token, remote_ip=remote_ip)
+        if self._replay_cached(token, remote_ip):
+            return
+        try:
+            self._client.verify(token, remote_ip=remote_ip)
+        except TurnstileError as exc:
+            self._remember(token, remote_ip, str(exc))
+            raise
+        self._remember(token, remote_ip, None)
+
+    async def verify_async(self, token: str, remote_ip: Optional[str]) -> None:
+        """Async :meth:`verify`; falls back to a worker thread without an async client."""
+        if self._async_client is None:
+            await anyio.to_thread.run_sync(partial(self.verify, token, remote_ip))
+            return
+        if self._replay_cached(token, remote_ip):
+            return
+        try:
+            await self._async_client.verify(token, remote_ip=remote_ip)
+        except TurnstileError as exc:
+            self._remember(token, remote_ip, str(exc))
+            raise
+        self._remember(token, remote_ip, None)
+
+    def _replay_cached(self, token: str, remote_ip: Optional[str]) -> bool:
+        if self._cache is None or not token:
+            return False
+        outcome = self._cache.get(_cache_key(token, remote_ip))
+        if outcome is None:
+            return False
+        passed, message = outcome
+        if not passed:
+            raise TurnstileError(message)
+        return True
+
+    def _remember(self, token: str, remote_ip: Optional[str], failure: Optional[str]) -> None:
+        if self._cache is None:
+            return
+        self._cache.set(
+            _cache_key(token, remote_ip),
+            (failure is None, failure),
+            ttl_seconds=self._cache_ttl,
+        )
+
+
+def _cache_key(token: str, remote_ip: Optional[str]) -> str:
+    digest = hashlib.sha256(f"{token}\0{remote_ip or ''}".encode("utf-8")).hexdigest()
+    return f"turnstile:{digest}"
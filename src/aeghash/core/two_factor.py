@@ -10,8 +10,9 @@ from dataclasses import dataclass
 from typing import Callable, Mapping, Tuple
 
 from aeghash.core.repositories import TwoFactorRecord, TwoFactorRepository
+from aeghash.security.rate_limit import TWO_FACTOR_USER, RateLimiter
 from aeghash.utils import totp
-from aeghash.utils.crypto import EncryptionError, decrypt_secret, encrypt_secret
+from aeghash.utils.crypto import EncryptionError, Keyring, decrypt_secret, encrypt_secret
 
 
 @dataclass(slots=True)
@@ -32,10 +33,13 @@ class TwoFactorService:
         encryptor: Callable[[str], str] = encrypt_secret,
         decryptor: Callable[[str], str] = decrypt_secret,
         event_hook: Callable[[str, Mapping[str, object]], None] | None = None,
+        keyring: Keyring | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         self._repository = repository
-        self._encrypt = encryptor
-        self._decrypt = decryptor
+        self._rate_limiter = rate_limiter
+        self._encrypt = keyring.encrypt if keyring is not None else encryptor
+        self._decrypt = keyring.decrypt if keyring is not None else decryptor
         self._event_hook = event_hook
 
     def enable(self, user_id: str) -> TwoFactorStatus:
@@ -91,11 +95,17 @@ class TwoFactorService:
             raise ValueError("Two-factor authentication is not enabled for this user.")
 
     def verify(self, user_id: str, code: str) -> bool:
+        # Throttle before the lookup and decrypt so guessing bursts cost almost nothing.
+        if self._rate_limiter:
+            self._rate_limiter.check(TWO_FACTOR_USER, user_id)
         record = self._repository.get(user_id)
         if not record or not record.enabled:
             raise ValueError("Two-factor authentication is not enabled for this user.")
-        secret = self._reveal_secret(record.secret)
-        return totp.verify_totp(secret, code)
+        key = totp.decode_secret(self._reveal_secret(record.secret))
+        verified = totp.verify_totp_key(key, code)
+        if verified and self._rate_limiter:
+            self._rate_limiter.reset(TWO_FACTOR_USER, user_id)
+        return verified
 
     # Adapter for OAuthFlowService interface
     def verify_code(self, user_id: str, code: str) -> bool:
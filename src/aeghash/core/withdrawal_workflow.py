@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Mapping, Optional, Sequence
+from typing import ContextManager, Mapping, Optional, Sequence
 
+from aeghash.adapters.hashdam import AssetWithdrawal
 from aeghash.core.point_wallet import (
     PointWalletService,
     WithdrawalSnapshot,
     WITHDRAWAL_STATUS_APPROVED_STAGE1,
     WITHDRAWAL_STATUS_PENDING,
 )
-from aeghash.core.mining_workflow import MiningWithdrawalOrchestrator, WithdrawalExecutionError
+from aeghash.core.mining_workflow import (
+    MiningWithdrawalOrchestrator,
+    PreparedWithdrawal,
+    WithdrawalExecutionError,
+)
 from aeghash.security.risk import RiskRejected, RiskService, WithdrawalRiskContext
-from aeghash.core.repositories import WithdrawalAuditRecord, WithdrawalAuditRepository
+from aeghash.core.repositories import TransactionScope, WithdrawalAuditRecord, WithdrawalAuditRepository
 
 
 @dataclass(slots=True)
@@ -32,6 +38,19 @@ class WithdrawalEvent:
     created_at: datetime
 
 
+@dataclass(slots=True)
+class BatchApprovalResult:
+    """Outcome of one request in ``approve_many``; ``error`` is set when it was not approved."""
+
+    request_id: str
+    snapshot: Optional[WithdrawalSnapshot] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
 class WithdrawalWorkflowService:
     """High-level workflow service coordinating withdrawals and audit logging."""
 
@@ -46,6 +65,7 @@ class WithdrawalWorkflowService:
         mining_orchestrator: MiningWithdrawalOrchestrator | None = None,
         two_step_required: bool = False,
         distinct_approvers: bool = True,
+        transaction: TransactionScope | None = None,
     ) -> None:
         self._wallet_service = wallet_service
         self._audit_repository = audit_repository
@@ -55,6 +75,7 @@ class WithdrawalWorkflowService:
         self._mining_orchestrator = mining_orchestrator
         self._two_step_required = two_step_required
         self._distinct_approvers = distinct_approvers
+        self._transaction = transaction
 
     def request_withdrawal(
         self,
@@ -125,33 +146,9 @@ class WithdrawalWorkflowService:
         coin: Optional[str] = None,
         finalize: bool = True,
     ) -> WithdrawalSnapshot:
-        pending = self._wallet_service.get_withdrawal(request_id)
-        if not self._two_step_required:
-            finalize = True
-
-        if self._two_step_required and pending.status == WITHDRAWAL_STATUS_PENDING:
-            if not finalize:
-                metadata = {"stage": "stage1"}
-                snapshot = self._wallet_service.mark_stage1_approval(
-                    request_id,
-                    approver_id=approved_by,
-                    notes=notes,
-                    metadata=metadata,
-                )
-                self._log(snapshot, actor_id=approved_by, action="approved_stage1", notes=notes, metadata=metadata)
-                return snapshot
-            raise WithdrawalExecutionError("Second approval required; finalize flag must be False on first approval.")
-
-        if self._two_step_required and pending.status == WITHDRAWAL_STATUS_APPROVED_STAGE1:
-            stage1_approver = (pending.metadata or {}).get("stage1_approver")
-            if self._distinct_approvers and stage1_approver == approved_by:
-                raise WithdrawalExecutionError("Second approval must be performed by a different reviewer.")
-            finalize = True
-
-        if not finalize:
-            raise WithdrawalExecutionError("Finalize flag must be True when completing the approval.")
-
-        snapshot = self._wallet_service.approve_withdrawal(request_id, approved_by=approved_by, notes=notes)
+        snapshot = self._approve_locally(request_id, approved_by=approved_by, notes=notes, finalize=finalize)
+        if snapshot.status == WITHDRAWAL_STATUS_APPROVED_STAGE1:
+            return snapshot
         metadata = None
 
         if self._should_execute_mining(snapshot, coin):
@@ -165,14 +162,7 @@ class WithdrawalWorkflowService:
                     coin=coin,
                 )
             except WithdrawalExecutionError as exc:
-                failure_snapshot = self._wallet_service.get_withdrawal(request_id)
-                self._log(
-                    failure_snapshot,
-                    actor_id=approved_by,
-                    action="failed",
-                    notes=str(exc),
-                    metadata={"error": str(exc)},
-                )
+                self._log_failure(request_id, actor_id=approved_by, error=exc)
                 raise
             else:
                 metadata = {
@@ -181,12 +171,66 @@ class WithdrawalWorkflowService:
                 }
                 snapshot = self._wallet_service.annotate_withdrawal(request_id, metadata)
 
-        if self._two_step_required:
-            metadata = dict(snapshot.metadata or {})
-            metadata.setdefault("stage", "final")
-        self._log(snapshot, actor_id=approved_by, action="approved", notes=notes, metadata=metadata)
+        self._log_approved(snapshot, actor_id=approved_by, notes=notes, metadata=metadata)
         return snapshot
 
+    def approve_many(
+        self,
+        request_ids: Sequence[str],
+        *,
+        approved_by: str,
+        notes: Optional[str] = None,
+        coin: Optional[str] = None,
+        finalize: bool = True,
+        max_workers: int = 8,
+    ) -> list[BatchApprovalResult]:
+        """Approve several requests, submitting their HashDam transfers concurrently.
+
+        Each request succeeds or fails on its own. Local approvals run one by one, each in
+        its own savepoint, and are committed before HashDam is called; the transfers then go
+        through ``submit_many`` together and their results are recorded in order, again one
+        savepoint per request. Once a transfer has been submitted nothing can move its
+        request back to pending, so a bookkeeping error is reported on that item instead of
+        undoing the batch. Duplicate ids are approved once.
+        """
+        results = {request_id: BatchApprovalResult(request_id=request_id) for request_id in dict.fromkeys(request_ids)}
+        prepared: list[PreparedWithdrawal] = []
+        for request_id, result in results.items():
+            try:
+                with self._savepoint():
+                    snapshot = self._approve_locally(
+                        request_id,
+                        approved_by=approved_by,
+                        notes=notes,
+                        finalize=finalize,
+                    )
+                    if snapshot.status != WITHDRAWAL_STATUS_APPROVED_STAGE1:
+                        if self._should_execute_mining(snapshot, coin):
+                            prepared.append(
+                                self._mining_orchestrator.prepare(
+                                    request_id,
+                                    approved_by=approved_by,
+                                    notes=notes,
+                                    coin=coin,
+                                ),
+                            )
+                        else:
+                            self._log_approved(snapshot, actor_id=approved_by, notes=notes)
+            except Exception as exc:
+                result.error = str(exc)
+                continue
+            result.snapshot = snapshot
+
+        if not prepared:
+            return list(results.values())
+
+        if self._transaction:
+            self._transaction.commit()
+        submitted = self._mining_orchestrator.submit_many(prepared, max_workers=max_workers)
+        for item, outcome in zip(prepared, submitted):
+            self._settle(item, outcome, result=results[item.withdrawal.request_id], approved_by=approved_by, notes=notes)
+        return list(results.values())
+
     def reject(
         self,
         request_id: str,
@@ -217,6 +261,99 @@ class WithdrawalWorkflowService:
 
     # ------------------------------------------------------------------ helpers
 
+    def _approve_locally(
+        self,
+        request_id: str,
+        *,
+        approved_by: str,
+        notes: Optional[str],
+        finalize: bool,
+    ) -> WithdrawalSnapshot:
+        """Record the stage-1 sign-off, or the final platform approval, without touching HashDam."""
+        pending = self._wallet_service.get_withdrawal(request_id)
+        if not self._two_step_required:
+            finalize = True
+
+        if self._two_step_required and pending.status == WITHDRAWAL_STATUS_PENDING:
+            if not finalize:
+                metadata = {"stage": "stage1"}
+                snapshot = self._wallet_service.mark_stage1_approval(
+                    request_id,
+                    approver_id=approved_by,
+                    notes=notes,
+                    metadata=metadata,
+                )
+                self._log(snapshot, actor_id=approved_by, action="approved_stage1", notes=notes, metadata=metadata)
+                return snapshot
+            raise WithdrawalExecutionError("Second approval required; finalize flag must be False on first approval.")
+
+        if self._two_step_required and pending.status == WITHDRAWAL_STATUS_APPROVED_STAGE1:
+            stage1_approver = (pending.metadata or {}).get("stage1_approver")
+            if self._distinct_approvers and stage1_approver == approved_by:
+                raise WithdrawalExecutionError("Second approval must be performed by a different reviewer.")
+            finalize = True
+
+        if not finalize:
+            raise WithdrawalExecutionError("Finalize flag must be True when completing the approval.")
+
+        return self._wallet_service.approve_withdrawal(request_id, approved_by=approved_by, notes=notes)
+
+    def _settle(
+        self,
+        prepared: PreparedWithdrawal,
+        submitted: AssetWithdrawal | Exception,
+        *,
+        result: BatchApprovalResult,
+        approved_by: str,
+        notes: Optional[str],
+    ) -> None:
+        request_id = prepared.withdrawal.request_id
+        try:
+            with self._savepoint():
+                try:
+                    outcome = self._mining_orchestrator.settle(prepared, submitted, approved_by=approved_by)
+                except WithdrawalExecutionError as exc:
+                    result.snapshot = self._log_failure(request_id, actor_id=approved_by, error=exc)
+                    result.error = str(exc)
+                    return
+                metadata = {
+                    "hashdam_withdraw_id": outcome.mining_request.withdraw_id,
+                    "coin": outcome.mining_request.coin,
+                }
+                snapshot = self._wallet_service.annotate_withdrawal(request_id, metadata)
+                self._log_approved(snapshot, actor_id=approved_by, notes=notes, metadata=metadata)
+                result.snapshot = snapshot
+        except Exception as exc:
+            # The approval was committed before submission, so the request stays approved and cannot be re-paid.
+            withdraw_id = getattr(submitted, "withdraw_id", None)
+            result.snapshot = prepared.withdrawal
+            result.error = (
+                f"HashDam withdrawal {withdraw_id} was submitted but recording it failed: {exc}"
+                if withdraw_id
+                else f"Recording the HashDam result failed: {exc}"
+            )
+
+    def _savepoint(self) -> ContextManager[None]:
+        return self._transaction.savepoint() if self._transaction else nullcontext()
+
+    def _log_approved(
+        self,
+        snapshot: WithdrawalSnapshot,
+        *,
+        actor_id: str,
+        notes: Optional[str],
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        if self._two_step_required:
+            metadata = dict(snapshot.metadata or {})
+            metadata.setdefault("stage", "final")
+        self._log(snapshot, actor_id=actor_id, action="approved", notes=notes, metadata=metadata)
+
+    def _log_failure(self, request_id: str, *, actor_id: str, error: Exception) -> WithdrawalSnapshot:
+        snapshot = self._wallet_service.get_withdrawal(request_id)
+        self._log(snapshot, actor_id=actor_id, action="failed", notes=str(error), metadata={"error": str(error)})
+        return snapshot
+
     def _log(
         self,
         snapshot: WithdrawalSnapshot,
@@ -1,6 +1,6 @@
 """Infrastructure utilities including database repositories and service wiring."""
 
-from .audit import LoginAuditLogger
+from .audit import BufferedLoginAuditWriter, LoginAuditLogger
 from .bootstrap import (
     ServiceContainer,
     bootstrap_services,
@@ -14,6 +14,7 @@ from .database import Base, create_engine_and_session
 from .repositories import (
     SqlAlchemyLoginAuditRepository,
     SqlAlchemyMiningRepository,
+    SqlAlchemyPointLedgerRepository,
     SqlAlchemyPointWalletRepository,
     SqlAlchemyRiskRepository,
     SqlAlchemyOrganizationRepository,
@@ -22,6 +23,7 @@ from .repositories import (
     SqlAlchemyOrderRepository,
     SqlAlchemyIdempotencyRepository,
     SqlAlchemySessionRepository,
+    SqlAlchemyTransactionScope,
     SqlAlchemyTwoFactorRepository,
     SqlAlchemyUserAccountRepository,
     SqlAlchemyUserRepository,
@@ -36,6 +38,7 @@ __all__ = [
     "SqlAlchemyWalletRepository",
     "SqlAlchemyMiningRepository",
     "SqlAlchemyPointWalletRepository",
+    "SqlAlchemyPointLedgerRepository",
     "SqlAlchemyRiskRepository",
     "SqlAlchemyOrganizationRepository",
     "SqlAlchemyBonusRepository",
@@ -45,6 +48,7 @@ __all__ = [
     "SqlAlchemyLoginAuditRepository",
     "SqlAlchemyTwoFactorRepository",
     "SqlAlchemySessionRepository",
+    "SqlAlchemyTransactionScope",
     "SqlAlchemyUserAccountRepository",
     "SqlAlchemyUserRepository",
     "wallet_service_scope",
@@ -53,6 +57,7 @@ __all__ = [
     "bootstrap_services",
     "shutdown_services",
     "ServiceContainer",
+    "BufferedLoginAuditWriter",
     "LoginAuditLogger",
     "withdrawal_workflow_scope",
 ]
@@ -2,18 +2,136 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional
+import logging
+import queue
+import threading
+import time
+from typing import Mapping, Optional, Sequence
 
 from aeghash.core.repositories import LoginAuditRecord
 from aeghash.infrastructure.repositories import SqlAlchemyLoginAuditRepository
 from aeghash.infrastructure.session import SessionManager
 
+OVERFLOW_SYNC = "sync"
+OVERFLOW_DROP = "drop"
+
+_FLUSH = object()
+_STOP = object()
+
+
+class BufferedLoginAuditWriter:
+    """Write login audit records in multi-row batches from a background thread.
+
+    Records wait on a bounded queue and are flushed once ``batch_size`` have
+    accumulated or ``flush_interval_seconds`` after the first one arrived. When the
+    queue is full, ``overflow`` decides what happens: ``"sync"`` writes the record
+    inline, which slows the caller but loses nothing, and ``"drop"`` discards it and
+    counts it in ``dropped``. Closing the writer flushes whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        *,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.2,
+        max_queue: int = 10_000,
+        overflow: str = OVERFLOW_SYNC,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if batch_size <= 0 or max_queue <= 0 or flush_interval_seconds < 0:
+            raise ValueError("batch_size and max_queue must be positive and flush_interval_seconds non-negative")
+        if overflow not in (OVERFLOW_SYNC, OVERFLOW_DROP):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self._session_manager = session_manager
+        self._batch_size = batch_size
+        self._interval = flush_interval_seconds
+        self._overflow = overflow
+        self._logger = logger or logging.getLogger(__name__)
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="login-audit-writer", daemon=True)
+        self._thread.start()
+
+    def log(self, record: LoginAuditRecord) -> None:
+        if self._closed:
+            self._write([record])
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if self._overflow == OVERFLOW_DROP:
+                with self._lock:
+                    self.dropped += 1
+                self._logger.warning("Login audit queue is full; dropping record.")
+            else:
+                self._write([record])
+
+    def log_many(self, records: Sequence[LoginAuditRecord]) -> None:
+        for record in records:
+            self.log(record)
+
+    def list_recent(self, *, limit: int = 100) -> list[LoginAuditRecord]:
+        self.flush()
+        with self._session_manager.session_scope() as session:
+            return SqlAlchemyLoginAuditRepository(session).list_recent(limit=limit)
+
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        if self._closed:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self, *, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch: list[LoginAuditRecord] = []
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, LoginAuditRecord):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._interval
+                if len(batch) < self._batch_size:
+                    continue
+            if batch:
+                self._write(batch)
+                for _ in batch:
+                    self._queue.task_done()
+                batch = []
+            deadline = None
+            if item is _FLUSH or item is _STOP:
+                self._queue.task_done()
+            if item is _STOP:
+                return
+
+    def _write(self, records: Sequence[LoginAuditRecord]) -> None:
+        try:
+            with self._session_manager.session_scope() as session:
+                SqlAlchemyLoginAuditRepository(session).log_many(records)
+        except Exception:  # pragma: no cover - keep the writer alive on database errors
+            self._logger.exception("Failed to write %d login audit records.", len(records))
+
 
 class LoginAuditLogger:
     """Persist authentication events for audit purposes."""
 
-    def __init__(self, session_manager: SessionManager) -> None:
+    def __init__(self, session_manager: SessionManager, *, writer: BufferedLoginAuditWriter | None = None) -> None:
         self._session_manager = session_manager
+        self._writer = writer
 
     def handle_event(self, name: str, payload: Mapping[str, object]) -> None:
         status = self._map_status(name)
@@ -26,6 +144,10 @@ class LoginAuditLogger:
 
         record = LoginAuditRecord(provider=provider, status=status, subject=subject, reason=reason)
 
+        if self._writer is not None:
+            self._writer.log(record)
+            return
+
         with self._session_manager.session_scope() as session:
             repository = SqlAlchemyLoginAuditRepository(session)
             repository.log(record)
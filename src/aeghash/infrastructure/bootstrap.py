@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
@@ -10,25 +11,29 @@ from typing import Callable, Iterator, Optional
 
 from aeghash.adapters.hashdam import HashDamClient, HashDamHTTPTransport
 from aeghash.adapters.mblock import MBlockClient, MBlockHTTPTransport
-from aeghash.adapters.turnstile import TurnstileClient
+from aeghash.adapters.turnstile import AsyncTurnstileClient, TurnstileClient
 from aeghash.adapters.oauth import (
     AppleOAuthClient,
+    AsyncOAuthHTTPTransport,
+    AsyncOAuthTransport,
     GoogleOAuthClient,
+    JwksCache,
     KakaoOAuthClient,
     OAuthHTTPTransport,
     OAuthTransport,
 )
-from aeghash.config import AppSettings, is_dev_mode
+from aeghash.config import SESSION_TOKEN_SIGNED, AppSettings, is_dev_mode
 from aeghash.core.auth_service import AuthEventHook, AuthService
 from aeghash.core.bonus_pipeline import BonusPipeline
 from aeghash.core.commerce_service import AegmallOrderService
 from aeghash.core.mining_service import MiningService
+from aeghash.core.organization_kpi import KpiSummaryCache
 from aeghash.core.mining_workflow import MiningWithdrawalOrchestrator, WithdrawalExecutionError
 from aeghash.core.wallet_service import WalletService
 from aeghash.core.point_wallet import PointWalletService
 from aeghash.core.withdrawal_workflow import WithdrawalWorkflowService
 from aeghash.core.turnstile import TurnstileVerifier
-from aeghash.infrastructure.audit import LoginAuditLogger
+from aeghash.infrastructure.audit import BufferedLoginAuditWriter, LoginAuditLogger
 from aeghash.infrastructure.repositories import (
     SqlAlchemyBonusRepository,
     SqlAlchemyIdempotencyRepository,
@@ -37,10 +42,17 @@ from aeghash.infrastructure.repositories import (
     SqlAlchemyOrganizationRepository,
     SqlAlchemyWalletRepository,
     SqlAlchemyPointWalletRepository,
+    SqlAlchemySessionRepository,
+    SqlAlchemyTransactionScope,
     SqlAlchemyWithdrawalAuditRepository,
 )
 from aeghash.infrastructure.session import SessionManager
-from aeghash.utils import Notifier
+from aeghash.security.access import AccessContextCache
+from aeghash.security.passwords import PasswordHasher
+from aeghash.security.rate_limit import RateLimiter
+from aeghash.security.session_tokens import SessionRevocationList, SessionTokenSigner
+from aeghash.utils import Notifier, TTLCache
+from aeghash.utils.crypto import ENCRYPTION_KEY_ENV, Keyring, load_keyring
 from aeghash.utils.webhook_notifier import WebhookNotifier
 
 
@@ -58,6 +70,16 @@ class ServiceContainer:
     mblock_client_factory: Callable[[], MBlockClient] | None = None
     hashdam_client_factory: Callable[[], HashDamClient] | None = None
     event_hook: AuthEventHook | None = None
+    kpi_cache: KpiSummaryCache | None = None
+    password_hasher: PasswordHasher | None = None
+    access_cache: AccessContextCache | None = None
+    session_signer: SessionTokenSigner | None = None
+    session_revocations: SessionRevocationList | None = None
+    audit_writer: BufferedLoginAuditWriter | None = None
+    keyring: Keyring | None = None
+    oauth_transport: AsyncOAuthHTTPTransport | None = None
+    turnstile_async_client: AsyncTurnstileClient | None = None
+    rate_limiter: RateLimiter | None = None
 
 
 @contextmanager
@@ -114,6 +136,7 @@ def aegmall_order_service_scope(
             order_repository=order_repo,
             idempotency_repository=idempotency_repo,
             bonus_pipeline=pipeline,
+            transaction=SqlAlchemyTransactionScope(session),
         )
 
 
@@ -145,6 +168,7 @@ def withdrawal_workflow_scope(
                 audit_repository=audit_repo,
                 mining_orchestrator=orchestrator,
                 two_step_required=True,
+                transaction=SqlAlchemyTransactionScope(session),
             )
             try:
                 yield workflow
@@ -155,19 +179,48 @@ def withdrawal_workflow_scope(
             mining_client.close()
 
 
+def load_revoked_session_tokens(session_manager: SessionManager) -> list[str]:
+    """Return ids of revoked sessions that have not expired yet."""
+    with session_manager.session_scope() as session:
+        return SqlAlchemySessionRepository(session).list_revoked_tokens(now=time.time())
+
+
 def create_auth_service(
     settings: AppSettings,
     *,
     event_hook: AuthEventHook | None = None,
     logger: logging.Logger | None = None,
     transport_factory: Callable[[str], OAuthTransport] | None = None,
+    async_transport: AsyncOAuthTransport | None = None,
 ) -> AuthService:
-    """Instantiate AuthService with HTTP transports for each provider."""
+    """Instantiate AuthService with HTTP transports for each provider.
+
+    With ``async_transport`` the Google and Apple clients verify id_tokens against a
+    cached JWKS instead of calling the userinfo endpoint.
+    """
     factory = transport_factory or (lambda _provider: OAuthHTTPTransport())
+
+    def jwks_for(url: str) -> JwksCache | None:
+        return JwksCache(async_transport, url, logger=logger) if async_transport is not None else None
+
     clients = [
-        GoogleOAuthClient(transport=factory("google"), settings=settings.oauth.google),
-        KakaoOAuthClient(transport=factory("kakao"), settings=settings.oauth.kakao),
-        AppleOAuthClient(transport=factory("apple"), settings=settings.oauth.apple),
+        GoogleOAuthClient(
+            transport=factory("google"),
+            settings=settings.oauth.google,
+            async_transport=async_transport,
+            jwks=jwks_for(GoogleOAuthClient.jwks_url),
+        ),
+        KakaoOAuthClient(
+            transport=factory("kakao"),
+            settings=settings.oauth.kakao,
+            async_transport=async_transport,
+        ),
+        AppleOAuthClient(
+            transport=factory("apple"),
+            settings=settings.oauth.apple,
+            async_transport=async_transport,
+            jwks=jwks_for(AppleOAuthClient.jwks_url),
+        ),
     ]
     return AuthService(
         {client.provider_name: client for client in clients},
@@ -186,18 +239,32 @@ def bootstrap_services(
 ) -> ServiceContainer:
     """Create core service container for application startup."""
     session_manager = SessionManager(settings.database_url)
+    # Custom transports (dev stubs, tests) keep the sync-only path.
+    oauth_transport = AsyncOAuthHTTPTransport() if transport_factory is None else None
     auth_service = create_auth_service(
         settings,
         event_hook=event_hook,
         logger=logger,
         transport_factory=transport_factory,
+        async_transport=oauth_transport,
     )
-    if is_dev_mode():
-        turnstile_client: Optional[TurnstileClient] = None
-        turnstile_verifier: Optional[TurnstileVerifier] = None
-    else:
-        turnstile_client = TurnstileClient(secret_key=settings.turnstile.secret_key)
-        turnstile_verifier = TurnstileVerifier(turnstile_client)
+    turnstile_client: Optional[TurnstileClient] = None
+    turnstile_async_client: Optional[AsyncTurnstileClient] = None
+    turnstile_verifier: Optional[TurnstileVerifier] = None
+    if not is_dev_mode():
+        turnstile_client = TurnstileClient(
+            secret_key=settings.turnstile.secret_key,
+            verify_url=settings.turnstile.verify_url,
+        )
+        turnstile_async_client = AsyncTurnstileClient(
+            secret_key=settings.turnstile.secret_key,
+            verify_url=settings.turnstile.verify_url,
+        )
+        turnstile_verifier = TurnstileVerifier(
+            turnstile_client,
+            async_client=turnstile_async_client,
+            cache=TTLCache(maxsize=10_000),
+        )
     resolved_notifier = notifier
     if resolved_notifier is None:
         webhook_url = os.getenv("ALERT_WEBHOOK_URL")
@@ -216,6 +283,11 @@ def bootstrap_services(
             api_key=settings.hashdam.api_key,
         )
         return HashDamClient(transport)
+    session_signer: Optional[SessionTokenSigner] = None
+    session_revocations: Optional[SessionRevocationList] = None
+    if settings.session_token_format == SESSION_TOKEN_SIGNED:
+        session_signer = SessionTokenSigner(settings.secret_key)
+        session_revocations = SessionRevocationList(lambda: load_revoked_session_tokens(session_manager))
     return ServiceContainer(
         settings=settings,
         session_manager=session_manager,
@@ -226,12 +298,26 @@ def bootstrap_services(
         mblock_client_factory=make_mblock_client,
         hashdam_client_factory=make_hashdam_client,
         event_hook=event_hook,
+        kpi_cache=KpiSummaryCache(),
+        password_hasher=PasswordHasher(profile=settings.password_profile),
+        access_cache=AccessContextCache(),
+        session_signer=session_signer,
+        session_revocations=session_revocations,
+        audit_writer=BufferedLoginAuditWriter(session_manager, logger=logger),
+        keyring=load_keyring() if os.getenv(ENCRYPTION_KEY_ENV) else None,
+        oauth_transport=oauth_transport,
+        turnstile_async_client=turnstile_async_client,
+        rate_limiter=RateLimiter(),
     )
 
 
 def shutdown_services(container: ServiceContainer) -> None:
     """Gracefully dispose service container resources."""
     container.auth_service.close()
+    if container.audit_writer:
+        container.audit_writer.close()
     container.session_manager.dispose()
     if container.turnstile_client:
         container.turnstile_client.close()
+    if container.password_hasher:
+        container.password_hasher.shutdown(wait=False)
@@ -2,28 +2,49 @@
 
 from __future__ import annotations
 
+import time
+from contextlib import contextmanager
 from decimal import Decimal
 from datetime import UTC, datetime, date
-from typing import Any, Mapping, Optional, Sequence
-
-from sqlalchemy import Boolean, Date, DateTime, JSON, Numeric, String, UniqueConstraint, func, ForeignKey
-from sqlalchemy import Integer
-from sqlalchemy.orm import Mapped, Session, mapped_column
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Index, JSON, Numeric, String, UniqueConstraint, func, ForeignKey, tuple_
+from sqlalchemy import Integer, Text, and_, bindparam, case, insert, or_, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, aliased, mapped_column
+from aeghash.core.organization import decode_node_cursor, encode_node_cursor
+from aeghash.core.point_ledger import decode_ledger_cursor, encode_ledger_cursor
+from aeghash.core.point_wallet import decode_withdrawal_cursor, encode_withdrawal_cursor
 from aeghash.core.repositories import (
+    BalanceGuard,
+    BonusRetrySchedule,
     LoginAuditRecord,
     LoginAuditRepository,
     MiningBalanceRecord,
     MiningRepository,
+    PointLedgerCheckpointRecord,
+    PointLedgerPage,
     PointLedgerRecord,
+    PointLedgerRepository,
+    PointLedgerTotals,
     PointWalletRecord,
     PointWalletRepository,
     KnownDeviceRecord,
     RiskEventRecord,
+    BinaryPlacementQueueRecord,
+    BinarySlotClaim,
+    BinarySlotRecord,
+    OrganizationMetricDelta,
+    OrganizationNodePage,
     OrganizationNodeRecord,
     OrganizationRepository,
     OrganizationMetricsRepository,
     OrganizationKpiRecord,
+    OrganizationKpiTotals,
+    RollupWatermark,
     SpilloverLogRecord,
+    UplineEntry,
     RiskRepository,
     BonusEntryRecord,
     BonusRepository,
@@ -35,6 +56,7 @@ from aeghash.core.repositories import (
     SessionRecord,
     SessionRepository,
     TransactionRecord,
+    TransactionScope,
     TwoFactorRecord,
     TwoFactorRepository,
     UserAccountRecord,
@@ -46,11 +68,19 @@ from aeghash.core.repositories import (
     WithdrawalAuditRecord,
     WithdrawalAuditRepository,
     WithdrawalRecord,
+    WithdrawalRequestPage,
     WithdrawalRequestRecord,
 )
 from aeghash.infrastructure.database import Base
 
 
+# Rows per multi-row INSERT; keeps bind parameters well under SQLite's limit.
+BULK_INSERT_CHUNK = 500
+
+# Dialects that understand SELECT ... FOR UPDATE SKIP LOCKED.
+SKIP_LOCKED_DIALECTS = frozenset({"postgresql", "mysql", "mariadb", "oracle"})
+
+
 class WalletModel(Base):
     __tablename__ = "wallets"
 
@@ -74,6 +104,7 @@ class TransactionModel(Base):
 
 class OrderModel(Base):
     __tablename__ = "commerce_orders"
+    __table_args__ = (Index("ix_commerce_orders_rollup_pending", "status", "rolled_up_at", "created_at", "order_id"),)
 
     order_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     user_id: Mapped[str] = mapped_column(String(64), index=True)
@@ -84,6 +115,8 @@ class OrderModel(Base):
     metadata_json: Mapped[Optional[dict[str, object]]] = mapped_column("metadata", JSON, nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Set once the organization rollup has consumed the order; upserts never reset it.
+    rolled_up_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class IdempotencyKeyModel(Base):
@@ -114,6 +147,10 @@ class PointWalletModel(Base):
 
 class PointLedgerModel(Base):
     __tablename__ = "point_wallet_ledger"
+    __table_args__ = (
+        Index("ix_point_wallet_ledger_wallet_created", "wallet_id", "created_at", "entry_id"),
+        Index("ix_point_wallet_ledger_wallet_checkpointed", "wallet_id", "checkpointed_at"),
+    )
 
     entry_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     wallet_id: Mapped[str] = mapped_column(String(64), index=True)
@@ -124,10 +161,26 @@ class PointLedgerModel(Base):
     reference_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     metadata_json: Mapped[Optional[dict[str, object]]] = mapped_column("metadata", JSON, nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    balance_delta: Mapped[Decimal] = mapped_column(Numeric(24, 8), default=Decimal("0"), server_default="0")
+    pending_delta: Mapped[Decimal] = mapped_column(Numeric(24, 8), default=Decimal("0"), server_default="0")
+    # Set by the checkpoint that includes this row; NULL until one does, however late the row committed.
+    checkpointed_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class PointLedgerCheckpointModel(Base):
+    __tablename__ = "point_wallet_ledger_checkpoints"
+
+    wallet_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    checkpoint_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    balance: Mapped[Decimal] = mapped_column(Numeric(24, 8))
+    pending_withdrawal: Mapped[Decimal] = mapped_column(Numeric(24, 8))
+    entry_count: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class PointWithdrawalModel(Base):
     __tablename__ = "point_wallet_withdrawals"
+    __table_args__ = (Index("ix_point_wallet_withdrawals_status_created", "status", "created_at", "request_id"),)
 
     request_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     wallet_id: Mapped[str] = mapped_column(String(64), index=True)
@@ -203,6 +256,10 @@ class OrganizationNodeModel(Base):
 
 class OrganizationClosureModel(Base):
     __tablename__ = "organization_closure"
+    __table_args__ = (
+        Index("ix_organization_closure_desc_tree", "descendant_id", "tree_type"),
+        Index("ix_organization_closure_anc_tree_depth", "ancestor_id", "tree_type", "depth"),
+    )
 
     ancestor_id: Mapped[str] = mapped_column(String(64), ForeignKey("organization_nodes.node_id", ondelete="CASCADE"), primary_key=True)
     descendant_id: Mapped[str] = mapped_column(String(64), ForeignKey("organization_nodes.node_id", ondelete="CASCADE"), primary_key=True)
@@ -224,6 +281,22 @@ class OrganizationMetricsDailyModel(Base):
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
+class OrganizationRollupStateModel(Base):
+    __tablename__ = "organization_rollup_state"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    last_created_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_order_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class OrganizationRollupOrderModel(Base):
+    __tablename__ = "organization_rollup_orders"
+
+    order_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    rolled_up_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class OrganizationRankHistoryModel(Base):
     __tablename__ = "organization_rank_history"
 
@@ -255,6 +328,18 @@ class BinarySlotModel(Base):
     status: Mapped[str] = mapped_column(String(16), server_default="OPEN")
     child_node_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     last_assigned_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # L/R path from the tree root down to this slot; sorts in breadth-first order within a depth.
+    placement_key: Mapped[str] = mapped_column(Text, server_default="")
+
+    __table_args__ = (
+        Index(
+            "ix_binary_slots_open_placement",
+            "status",
+            "placement_key",
+            sqlite_where=text("status = 'OPEN'"),
+            postgresql_where=text("status = 'OPEN'"),
+        ),
+    )
 
 
 class BinaryWaitingQueueModel(Base):
@@ -372,6 +457,7 @@ class AuthSessionModel(Base):
     user_id: Mapped[str] = mapped_column(String(64), index=True)
     roles: Mapped[str] = mapped_column(String(256))
     expires_at: Mapped[Numeric] = mapped_column(Numeric(18, 3))
+    revoked_at: Mapped[Numeric | None] = mapped_column(Numeric(18, 3), nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -398,6 +484,62 @@ class UserAccountModel(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+def _as_utc(value: datetime) -> datetime:
+    """SQLite drops the offset of timezone-aware columns; read those values back as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _bulk_insert(session: Session, model: type[Base], rows: Sequence[Mapping[str, Any]]) -> None:
+    """Insert ``rows`` with multi-row ``INSERT ... VALUES`` statements of bounded size."""
+    for start in range(0, len(rows), BULK_INSERT_CHUNK):
+        session.execute(insert(model).values(list(rows[start : start + BULK_INSERT_CHUNK])))
+
+
+def _merge_metric_delta(
+    current: Optional[OrganizationMetricDelta],
+    delta: OrganizationMetricDelta,
+) -> OrganizationMetricDelta:
+    if current is None:
+        return delta
+
+    def leg(left: Optional[Decimal], right: Optional[Decimal]) -> Optional[Decimal]:
+        return left if right is None else right if left is None else left + right
+
+    return OrganizationMetricDelta(
+        node_id=delta.node_id,
+        tree_type=delta.tree_type,
+        metric_date=delta.metric_date,
+        personal_volume=current.personal_volume + delta.personal_volume,
+        group_volume=current.group_volume + delta.group_volume,
+        volume_left=leg(current.volume_left, delta.volume_left),
+        volume_right=leg(current.volume_right, delta.volume_right),
+        orders_count=current.orders_count + delta.orders_count,
+    )
+
+
+def _metric_row(delta: OrganizationMetricDelta) -> dict[str, Any]:
+    return {
+        "metric_date": delta.metric_date,
+        "node_id": delta.node_id,
+        "tree_type": delta.tree_type,
+        "personal_volume": delta.personal_volume,
+        "group_volume": delta.group_volume,
+        "volume_left": delta.volume_left,
+        "volume_right": delta.volume_right,
+        "orders_count": delta.orders_count,
+    }
+
+
+def _stream_insert(session: Session, model: type[Base], rows: Iterable[Mapping[str, Any]]) -> int:
+    """Consume ``rows`` lazily, inserting one bounded chunk at a time; returns the row count."""
+    iterator = iter(rows)
+    total = 0
+    while chunk := list(islice(iterator, BULK_INSERT_CHUNK)):
+        session.execute(insert(model).values(chunk))
+        total += len(chunk)
+    return total
+
+
 class SqlAlchemyOrderRepository(OrderRepository):
     """SQLAlchemy-backed repository for commerce orders."""
 
@@ -434,6 +576,65 @@ class SqlAlchemyOrderRepository(OrderRepository):
             model.created_at = record.created_at
         return self._map_order(model)
 
+    def upsert_orders(self, records: Sequence[OrderRecord]) -> Sequence[OrderRecord]:
+        if not records:
+            return []
+        latest = {record.order_id: record for record in records}
+        existing = {
+            model.order_id: model
+            for model in self._session.query(OrderModel).filter(OrderModel.order_id.in_(list(latest)))
+        }
+        new_rows: list[dict[str, Any]] = []
+        for order_id, record in latest.items():
+            model = existing.get(order_id)
+            if model is None:
+                new_rows.append(
+                    {
+                        "order_id": record.order_id,
+                        "user_id": record.user_id,
+                        "total_amount": record.total_amount,
+                        "pv_amount": record.pv_amount,
+                        "status": record.status,
+                        "channel": record.channel,
+                        "metadata_json": dict(record.metadata),
+                        "created_at": record.created_at,
+                    },
+                )
+                continue
+            model.user_id = record.user_id
+            model.total_amount = record.total_amount
+            model.pv_amount = record.pv_amount
+            model.status = record.status
+            model.channel = record.channel
+            model.metadata_json = dict(record.metadata)
+            model.created_at = record.created_at
+        _bulk_insert(self._session, OrderModel, new_rows)
+        self._session.flush()
+        return list(records)
+
+    def list_unrolled_paid_orders(self, *, limit: int = 1000) -> Sequence[OrderRecord]:
+        models = (
+            self._session.query(OrderModel)
+            .filter(OrderModel.status == "PAID", OrderModel.rolled_up_at.is_(None))
+            .order_by(OrderModel.created_at.asc(), OrderModel.order_id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [self._map_order(model) for model in models]
+
+    def mark_orders_rolled_up(self, order_ids: Sequence[str], *, rolled_up_at: datetime) -> None:
+        unique_ids = list(dict.fromkeys(order_ids))
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            self._session.execute(
+                update(OrderModel)
+                .where(
+                    OrderModel.order_id.in_(unique_ids[start : start + BULK_INSERT_CHUNK]),
+                    OrderModel.rolled_up_at.is_(None),
+                )
+                .values(rolled_up_at=rolled_up_at)
+                .execution_options(synchronize_session=False),
+            )
+
     def _map_order(self, model: OrderModel) -> OrderRecord:
         return OrderRecord(
             order_id=model.order_id,
@@ -502,6 +703,64 @@ class SqlAlchemyIdempotencyRepository(IdempotencyRepository):
             updates["resource_id"] = resource_id
         query.update(updates)
 
+    def get_many(self, keys: Sequence[tuple[str, str]]) -> Mapping[tuple[str, str], IdempotencyKeyRecord]:
+        wanted = set(keys)
+        if not wanted:
+            return {}
+        models = (
+            self._session.query(IdempotencyKeyModel)
+            .filter(
+                IdempotencyKeyModel.scope.in_({scope for scope, _ in wanted}),
+                IdempotencyKeyModel.key.in_({key for _, key in wanted}),
+            )
+            .all()
+        )
+        return {
+            (model.scope, model.key): self._map_idempotency(model)
+            for model in models
+            if (model.scope, model.key) in wanted
+        }
+
+    def create_many(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        rows = [
+            {
+                "key": record.key,
+                "scope": record.scope,
+                "payload_hash": record.payload_hash,
+                "status": record.status,
+                "resource_id": record.resource_id,
+                "created_at": record.created_at,
+                "expires_at": record.expires_at,
+            }
+            for record in records
+        ]
+        _bulk_insert(self._session, IdempotencyKeyModel, rows)
+
+    def mark_statuses(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        if not records:
+            return
+        table = IdempotencyKeyModel.__table__
+        statement = (
+            update(table)
+            .where(table.c.scope == bindparam("b_scope"), table.c.key == bindparam("b_key"))
+            .values(
+                status=bindparam("b_status"),
+                resource_id=func.coalesce(bindparam("b_resource_id"), table.c.resource_id),
+            )
+        )
+        self._session.execute(
+            statement,
+            [
+                {
+                    "b_scope": record.scope,
+                    "b_key": record.key,
+                    "b_status": record.status,
+                    "b_resource_id": record.resource_id,
+                }
+                for record in records
+            ],
+        )
+
     def _map_idempotency(self, model: IdempotencyKeyModel) -> IdempotencyKeyRecord:
         return IdempotencyKeyRecord(
             key=model.key,
@@ -550,6 +809,15 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
         model = self._session.query(PointWalletModel).filter(PointWalletModel.user_id == user_id).one_or_none()
         return self._map_wallet(model)
 
+    def get_wallets_by_users(self, user_ids: Sequence[str]) -> Mapping[str, PointWalletRecord]:
+        unique_ids = list(dict.fromkeys(user_ids))
+        wallets: dict[str, PointWalletRecord] = {}
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            chunk = unique_ids[start : start + BULK_INSERT_CHUNK]
+            for model in self._session.query(PointWalletModel).filter(PointWalletModel.user_id.in_(chunk)):
+                wallets[model.user_id] = self._map_wallet(model)  # type: ignore[assignment]
+        return wallets
+
     def create_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         model = PointWalletModel(
             wallet_id=record.wallet_id,
@@ -564,6 +832,21 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
         self._session.flush()
         return self._map_wallet(model)  # type: ignore[arg-type]
 
+    def create_wallets(self, records: Sequence[PointWalletRecord]) -> None:
+        rows = [
+            {
+                "wallet_id": record.wallet_id,
+                "user_id": record.user_id,
+                "balance": record.balance,
+                "pending_withdrawal": record.pending_withdrawal,
+                "status": record.status,
+                "created_at": record.created_at,
+                "updated_at": record.updated_at,
+            }
+            for record in records
+        ]
+        _bulk_insert(self._session, PointWalletModel, rows)
+
     def update_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         model = self._session.query(PointWalletModel).filter(PointWalletModel.wallet_id == record.wallet_id).one()
         model.user_id = record.user_id
@@ -574,6 +857,39 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
         self._session.flush()
         return self._map_wallet(model)
 
+    def apply_balance_delta(
+        self,
+        wallet_id: str,
+        *,
+        balance_delta: Decimal = Decimal("0"),
+        pending_delta: Decimal = Decimal("0"),
+        guard: Optional[BalanceGuard] = None,
+        updated_at: datetime,
+    ) -> Optional[PointWalletRecord]:
+        conditions = [PointWalletModel.wallet_id == wallet_id]
+        if guard is not None:
+            if guard.require_status is not None:
+                conditions.append(PointWalletModel.status == guard.require_status)
+            if guard.min_available is not None:
+                conditions.append(PointWalletModel.balance - PointWalletModel.pending_withdrawal >= guard.min_available)
+            if guard.min_balance is not None:
+                conditions.append(PointWalletModel.balance >= guard.min_balance)
+            if guard.min_pending is not None:
+                conditions.append(PointWalletModel.pending_withdrawal >= guard.min_pending)
+        statement = (
+            update(PointWalletModel)
+            .where(*conditions)
+            .values(
+                balance=PointWalletModel.balance + balance_delta,
+                pending_withdrawal=PointWalletModel.pending_withdrawal + pending_delta,
+                updated_at=updated_at,
+            )
+            .returning(PointWalletModel)
+        )
+        # One UPDATE ... RETURNING: no prior read, and the guard is checked against the row as written.
+        model = self._session.execute(statement).scalars().one_or_none()
+        return self._map_wallet(model)
+
     def add_ledger_entry(self, entry: PointLedgerRecord) -> None:
         model = PointLedgerModel(
             entry_id=entry.entry_id,
@@ -585,9 +901,30 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
             reference_id=entry.reference_id,
             metadata_json=dict(entry.metadata) if entry.metadata is not None else None,
             created_at=entry.created_at,
+            balance_delta=entry.balance_delta,
+            pending_delta=entry.pending_delta,
         )
         self._session.add(model)
 
+    def add_ledger_entries(self, entries: Sequence[PointLedgerRecord]) -> None:
+        rows = [
+            {
+                "entry_id": entry.entry_id,
+                "wallet_id": entry.wallet_id,
+                "entry_type": entry.entry_type,
+                "amount": entry.amount,
+                "balance_after": entry.balance_after,
+                "pending_after": entry.pending_after,
+                "reference_id": entry.reference_id,
+                "metadata_json": dict(entry.metadata) if entry.metadata is not None else None,
+                "created_at": entry.created_at,
+                "balance_delta": entry.balance_delta,
+                "pending_delta": entry.pending_delta,
+            }
+            for entry in entries
+        ]
+        _bulk_insert(self._session, PointLedgerModel, rows)
+
     def get_withdrawal_request(self, request_id: str) -> Optional[WithdrawalRequestRecord]:
         model = (
             self._session.query(PointWithdrawalModel)
@@ -632,17 +969,65 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
         self._session.flush()
         return self._map_withdrawal(model)
 
+    def transition_withdrawal_request(
+        self,
+        record: WithdrawalRequestRecord,
+        *,
+        expected_statuses: Sequence[str],
+    ) -> Optional[WithdrawalRequestRecord]:
+        statement = (
+            update(PointWithdrawalModel)
+            .where(
+                PointWithdrawalModel.request_id == record.request_id,
+                PointWithdrawalModel.status.in_(list(expected_statuses)),
+            )
+            .values(
+                status=record.status,
+                approved_by=record.approved_by,
+                approved_at=record.approved_at,
+                rejected_by=record.rejected_by,
+                rejected_at=record.rejected_at,
+                notes=record.notes,
+                metadata_json=dict(record.metadata) if record.metadata is not None else None,
+            )
+            .returning(PointWithdrawalModel)
+            .execution_options(synchronize_session="fetch")
+        )
+        model = self._session.execute(statement).scalars().one_or_none()
+        return self._map_withdrawal(model)
+
     def list_withdrawal_requests(
         self,
         *,
-        wallet_id: str,
+        wallet_id: Optional[str] = None,
         statuses: Sequence[str] | None = None,
-    ) -> Sequence[WithdrawalRequestRecord]:
-        query = self._session.query(PointWithdrawalModel).filter(PointWithdrawalModel.wallet_id == wallet_id)
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> WithdrawalRequestPage:
+        query = self._session.query(PointWithdrawalModel)
+        if wallet_id is not None:
+            query = query.filter(PointWithdrawalModel.wallet_id == wallet_id)
         if statuses:
             query = query.filter(PointWithdrawalModel.status.in_(list(statuses)))
-        models = query.order_by(PointWithdrawalModel.created_at.asc()).all()
-        return [self._map_withdrawal(model) for model in models]
+        if created_before is not None:
+            query = query.filter(PointWithdrawalModel.created_at < created_before)
+        if cursor:
+            after_created_at, after_request_id = decode_withdrawal_cursor(cursor)
+            query = query.filter(
+                tuple_(PointWithdrawalModel.created_at, PointWithdrawalModel.request_id)
+                > tuple_(after_created_at, after_request_id),
+            )
+        models = (
+            query.order_by(PointWithdrawalModel.created_at.asc(), PointWithdrawalModel.request_id.asc())
+            .limit(limit + 1)
+            .all()
+        )
+        page = models[:limit]
+        next_cursor = None
+        if len(models) > limit and page:
+            next_cursor = encode_withdrawal_cursor(page[-1].created_at, page[-1].request_id)
+        return WithdrawalRequestPage(items=[self._map_withdrawal(model) for model in page], next_cursor=next_cursor)
 
     def _map_wallet(self, model: PointWalletModel | None) -> Optional[PointWalletRecord]:
         if not model:
@@ -680,6 +1065,184 @@ class SqlAlchemyPointWalletRepository(PointWalletRepository):
         )
 
 
+class SqlAlchemyPointLedgerRepository(PointLedgerRepository):
+    """SQLAlchemy-backed ledger queries and balance checkpoints."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def list_entries(self, wallet_id: str, *, limit: int = 50, cursor: Optional[str] = None) -> PointLedgerPage:
+        query = self._session.query(PointLedgerModel).filter(PointLedgerModel.wallet_id == wallet_id)
+        if cursor:
+            before_created_at, before_entry_id = decode_ledger_cursor(cursor)
+            query = query.filter(
+                tuple_(PointLedgerModel.created_at, PointLedgerModel.entry_id) < tuple_(before_created_at, before_entry_id),
+            )
+        models = (
+            query.order_by(PointLedgerModel.created_at.desc(), PointLedgerModel.entry_id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        page = models[:limit]
+        next_cursor = None
+        if len(models) > limit and page:
+            next_cursor = encode_ledger_cursor(page[-1].created_at, page[-1].entry_id)
+        return PointLedgerPage(items=[self._map_entry(model) for model in page], next_cursor=next_cursor)
+
+    def list_wallets(self, *, after_wallet_id: Optional[str] = None, limit: int = 500) -> Sequence[PointWalletRecord]:
+        query = self._session.query(PointWalletModel)
+        if after_wallet_id is not None:
+            query = query.filter(PointWalletModel.wallet_id > after_wallet_id)
+        models = query.order_by(PointWalletModel.wallet_id.asc()).limit(limit).all()
+        return [
+            PointWalletRecord(
+                wallet_id=model.wallet_id,
+                user_id=model.user_id,
+                balance=Decimal(model.balance),
+                pending_withdrawal=Decimal(model.pending_withdrawal),
+                status=model.status,
+                created_at=model.created_at,
+                updated_at=model.updated_at or model.created_at,
+            )
+            for model in models
+        ]
+
+    def latest_checkpoints(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        at_or_before: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerCheckpointRecord]:
+        unique_ids = list(dict.fromkeys(wallet_ids))
+        checkpoints: dict[str, PointLedgerCheckpointRecord] = {}
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            chunk = unique_ids[start : start + BULK_INSERT_CHUNK]
+            newest = self._session.query(
+                PointLedgerCheckpointModel.wallet_id.label("wallet_id"),
+                func.max(PointLedgerCheckpointModel.checkpoint_at).label("checkpoint_at"),
+            ).filter(PointLedgerCheckpointModel.wallet_id.in_(chunk))
+            if at_or_before is not None:
+                newest = newest.filter(PointLedgerCheckpointModel.checkpoint_at <= at_or_before)
+            newest = newest.group_by(PointLedgerCheckpointModel.wallet_id).subquery()
+            models = self._session.query(PointLedgerCheckpointModel).join(
+                newest,
+                and_(
+                    PointLedgerCheckpointModel.wallet_id == newest.c.wallet_id,
+                    PointLedgerCheckpointModel.checkpoint_at == newest.c.checkpoint_at,
+                ),
+            )
+            for model in models:
+                checkpoints[model.wallet_id] = PointLedgerCheckpointRecord(
+                    wallet_id=model.wallet_id,
+                    checkpoint_at=_as_utc(model.checkpoint_at),
+                    balance=Decimal(model.balance),
+                    pending_withdrawal=Decimal(model.pending_withdrawal),
+                    entry_count=model.entry_count,
+                    created_at=model.created_at,
+                )
+        return checkpoints
+
+    def sum_entries(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        after: Mapping[str, datetime],
+        until: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerTotals]:
+        unique_ids = list(dict.fromkeys(wallet_ids))
+        totals: dict[str, PointLedgerTotals] = {}
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            chunk = unique_ids[start : start + BULK_INSERT_CHUNK]
+            # Each wallet only scans the rows its checkpoint does not cover, via the (wallet_id, checkpointed_at) index.
+            unbounded = [wallet_id for wallet_id in chunk if wallet_id not in after]
+            ranges = [
+                and_(
+                    PointLedgerModel.wallet_id == wallet_id,
+                    or_(PointLedgerModel.checkpointed_at.is_(None), PointLedgerModel.checkpointed_at > after[wallet_id]),
+                )
+                for wallet_id in chunk
+                if wallet_id in after
+            ]
+            if unbounded:
+                ranges.append(PointLedgerModel.wallet_id.in_(unbounded))
+            query = self._totals_query().filter(or_(*ranges))
+            if until is not None:
+                query = query.filter(PointLedgerModel.created_at <= until)
+            totals.update(self._collect_totals(query))
+        return totals
+
+    def cover_entries(self, wallet_ids: Sequence[str], *, checkpoint_at: datetime) -> Mapping[str, PointLedgerTotals]:
+        unique_ids = list(dict.fromkeys(wallet_ids))
+        totals: dict[str, PointLedgerTotals] = {}
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            chunk = unique_ids[start : start + BULK_INSERT_CHUNK]
+            # Mark first, then sum what was marked: rows committing in between stay NULL for the next checkpoint.
+            self._session.execute(
+                update(PointLedgerModel)
+                .where(
+                    PointLedgerModel.wallet_id.in_(chunk),
+                    PointLedgerModel.checkpointed_at.is_(None),
+                    PointLedgerModel.created_at <= checkpoint_at,
+                )
+                .values(checkpointed_at=checkpoint_at)
+                .execution_options(synchronize_session=False),
+            )
+            query = self._totals_query().filter(
+                PointLedgerModel.wallet_id.in_(chunk),
+                PointLedgerModel.checkpointed_at == checkpoint_at,
+            )
+            totals.update(self._collect_totals(query))
+        return totals
+
+    def _totals_query(self):
+        return self._session.query(
+            PointLedgerModel.wallet_id,
+            func.coalesce(func.sum(PointLedgerModel.balance_delta), 0),
+            func.coalesce(func.sum(PointLedgerModel.pending_delta), 0),
+            func.count(),
+        )
+
+    @staticmethod
+    def _collect_totals(query) -> dict[str, PointLedgerTotals]:
+        return {
+            wallet_id: PointLedgerTotals(
+                balance=Decimal(balance),
+                pending_withdrawal=Decimal(pending),
+                entry_count=int(count),
+            )
+            for wallet_id, balance, pending, count in query.group_by(PointLedgerModel.wallet_id)
+        }
+
+    def add_checkpoints(self, records: Sequence[PointLedgerCheckpointRecord]) -> None:
+        rows = [
+            {
+                "wallet_id": record.wallet_id,
+                "checkpoint_at": record.checkpoint_at,
+                "balance": record.balance,
+                "pending_withdrawal": record.pending_withdrawal,
+                "entry_count": record.entry_count,
+                "created_at": record.created_at,
+            }
+            for record in records
+        ]
+        _bulk_insert(self._session, PointLedgerCheckpointModel, rows)
+
+    def _map_entry(self, model: PointLedgerModel) -> PointLedgerRecord:
+        return PointLedgerRecord(
+            entry_id=model.entry_id,
+            wallet_id=model.wallet_id,
+            entry_type=model.entry_type,
+            amount=Decimal(model.amount),
+            balance_after=Decimal(model.balance_after),
+            pending_after=Decimal(model.pending_after),
+            reference_id=model.reference_id,
+            metadata=dict(model.metadata_json) if model.metadata_json is not None else None,
+            created_at=model.created_at,
+            balance_delta=Decimal(model.balance_delta or 0),
+            pending_delta=Decimal(model.pending_delta or 0),
+        )
+
+
 class SqlAlchemyWithdrawalAuditRepository(WithdrawalAuditRepository):
     """SQLAlchemy-backed repository for withdrawal audit logs."""
 
@@ -834,9 +1397,10 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
         self._ensure_closure_entries(record)
 
         if record.tree_type == "binary":
-            self._ensure_binary_slots(record.node_id)
+            placement_key = ""
             if record.parent_node_id and record.position:
-                self._fill_binary_slot(record.parent_node_id, record.position, record.node_id)
+                placement_key = self._fill_binary_slot(record.parent_node_id, record.position, record.node_id)
+            self._ensure_binary_slots(record.node_id, placement_key)
 
         return self._map_node(model)
 
@@ -915,6 +1479,255 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
             center_id=model.center_id,
         )
 
+    def find_open_binary_slot(self, sponsor_node_id: str) -> Optional[BinarySlotRecord]:
+        model = self._open_slot_query(sponsor_node_id).one_or_none()
+        return self._map_slot(model)
+
+    def claim_binary_slot(self, sponsor_node_id: str) -> BinarySlotClaim:
+        query = self._open_slot_query(sponsor_node_id)
+        skip_locked = self._session.get_bind().dialect.name in SKIP_LOCKED_DIALECTS
+        if skip_locked:
+            # Concurrent placements skip rows another transaction is claiming instead of queueing on them.
+            query = query.with_for_update(skip_locked=True, of=BinarySlotModel)
+        model = query.one_or_none()
+        if model is None:
+            # Under SKIP LOCKED an empty result may only mean every open slot is being claimed.
+            contended = skip_locked and self._open_slot_query(sponsor_node_id).first() is not None
+            return BinarySlotClaim(contended=contended)
+        # Compare-and-swap on status keeps the claim safe on backends without row locks (SQLite).
+        result = self._session.execute(
+            update(BinarySlotModel)
+            .where(
+                BinarySlotModel.node_id == model.node_id,
+                BinarySlotModel.slot == model.slot,
+                BinarySlotModel.status == "OPEN",
+            )
+            .values(status="RESERVED", last_assigned_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount != 1:
+            return BinarySlotClaim(contended=True)
+        self._session.expire(model)
+        return BinarySlotClaim(slot=self._map_slot(model))
+
+    def enqueue_binary_placement(self, record: BinaryPlacementQueueRecord) -> None:
+        self._session.add(
+            BinaryWaitingQueueModel(
+                queue_id=record.queue_id,
+                sponsor_node_id=record.sponsor_node_id,
+                candidate_user_id=record.candidate_user_id,
+                preferred_slot=record.preferred_slot,
+                status=record.status,
+                retry_count=record.retry_count,
+                enqueued_at=record.enqueued_at,
+                last_attempt_at=record.last_attempt_at,
+            ),
+        )
+        self._session.flush()
+
+    def list_pending_binary_placements(self, *, limit: int = 100) -> Sequence[BinaryPlacementQueueRecord]:
+        models = (
+            self._session.query(BinaryWaitingQueueModel)
+            .filter(BinaryWaitingQueueModel.status == "PENDING")
+            .order_by(BinaryWaitingQueueModel.enqueued_at.asc(), BinaryWaitingQueueModel.queue_id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            BinaryPlacementQueueRecord(
+                queue_id=model.queue_id,
+                sponsor_node_id=model.sponsor_node_id,
+                candidate_user_id=model.candidate_user_id,
+                status=model.status,
+                enqueued_at=model.enqueued_at,
+                retry_count=model.retry_count or 0,
+                preferred_slot=model.preferred_slot,
+                last_attempt_at=model.last_attempt_at,
+            )
+            for model in models
+        ]
+
+    def mark_binary_placement(
+        self,
+        queue_id: str,
+        *,
+        status: str,
+        attempted_at: datetime,
+        retry_count: int,
+    ) -> None:
+        model = self._session.get(BinaryWaitingQueueModel, queue_id)
+        if model is None:
+            return
+        model.status = status
+        model.last_attempt_at = attempted_at
+        model.retry_count = retry_count
+        self._session.flush()
+
+    def list_uplines(self, user_ids: Sequence[str], *, tree_type: str) -> Sequence[UplineEntry]:
+        member = aliased(OrganizationNodeModel)
+        entries: list[UplineEntry] = []
+        unique_ids = list(dict.fromkeys(user_ids))
+        for start in range(0, len(unique_ids), BULK_INSERT_CHUNK):
+            chunk = unique_ids[start : start + BULK_INSERT_CHUNK]
+            if tree_type == "binary":
+                # The member's leg under an ancestor is the position of the path node one level below it.
+                step = aliased(OrganizationClosureModel)
+                child = aliased(OrganizationNodeModel)
+                query = (
+                    self._session.query(
+                        member.user_id,
+                        OrganizationClosureModel.ancestor_id,
+                        OrganizationClosureModel.depth,
+                        child.position,
+                    )
+                    .select_from(OrganizationClosureModel)
+                    .join(member, member.node_id == OrganizationClosureModel.descendant_id)
+                    .outerjoin(
+                        step,
+                        and_(
+                            step.descendant_id == OrganizationClosureModel.descendant_id,
+                            step.tree_type == OrganizationClosureModel.tree_type,
+                            step.depth == OrganizationClosureModel.depth - 1,
+                        ),
+                    )
+                    .outerjoin(
+                        child,
+                        and_(
+                            child.node_id == step.ancestor_id,
+                            child.parent_node_id == OrganizationClosureModel.ancestor_id,
+                        ),
+                    )
+                )
+            else:
+                query = (
+                    self._session.query(
+                        member.user_id,
+                        OrganizationClosureModel.ancestor_id,
+                        OrganizationClosureModel.depth,
+                    )
+                    .select_from(OrganizationClosureModel)
+                    .join(member, member.node_id == OrganizationClosureModel.descendant_id)
+                )
+            rows = query.filter(
+                member.user_id.in_(chunk),
+                member.tree_type == tree_type,
+                OrganizationClosureModel.tree_type == tree_type,
+            ).all()
+            for row in rows:
+                entries.append(
+                    UplineEntry(
+                        user_id=row[0],
+                        node_id=row[1],
+                        distance=row[2],
+                        leg=row[3] if len(row) > 3 else None,
+                    ),
+                )
+        return entries
+
+    def bulk_insert_nodes(
+        self,
+        tree_type: str,
+        rows: Iterable[tuple[str, str, Optional[str], Optional[str], Optional[str], int, str]],
+        *,
+        created_at: datetime,
+    ) -> int:
+        return _stream_insert(
+            self._session,
+            OrganizationNodeModel,
+            (
+                {
+                    "node_id": node_id,
+                    "user_id": user_id,
+                    "tree_type": tree_type,
+                    "parent_node_id": parent_node_id,
+                    "sponsor_user_id": sponsor_user_id,
+                    "position": position,
+                    "depth": depth,
+                    "path": path,
+                    "rank": None,
+                    "center_id": None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                for node_id, user_id, parent_node_id, sponsor_user_id, position, depth, path in rows
+            ),
+        )
+
+    def bulk_insert_closure(self, tree_type: str, rows: Iterable[tuple[str, str, int]]) -> int:
+        return _stream_insert(
+            self._session,
+            OrganizationClosureModel,
+            (
+                {"ancestor_id": ancestor_id, "descendant_id": descendant_id, "tree_type": tree_type, "depth": depth}
+                for ancestor_id, descendant_id, depth in rows
+            ),
+        )
+
+    def bulk_insert_binary_slots(
+        self,
+        rows: Iterable[tuple[str, str, str, Optional[str], str]],
+        *,
+        assigned_at: datetime,
+    ) -> int:
+        return _stream_insert(
+            self._session,
+            BinarySlotModel,
+            (
+                {
+                    "node_id": node_id,
+                    "slot": slot,
+                    "status": status,
+                    "child_node_id": child_node_id,
+                    "last_assigned_at": assigned_at if child_node_id else None,
+                    "placement_key": placement_key,
+                }
+                for node_id, slot, status, child_node_id, placement_key in rows
+            ),
+        )
+
+    def _open_slot_query(self, sponsor_node_id: str):
+        sponsor_key = (
+            self._session.query(BinarySlotModel.placement_key)
+            .filter(BinarySlotModel.node_id == sponsor_node_id)
+            .limit(1)
+            .scalar()
+        )
+        query = self._session.query(BinarySlotModel).filter(BinarySlotModel.status == "OPEN")
+        if sponsor_key:
+            # Every slot under the sponsor shares its key prefix; keys only use "L"/"R", so "Z" bounds the range.
+            prefix = sponsor_key[:-1]
+            query = query.filter(
+                BinarySlotModel.placement_key >= prefix,
+                BinarySlotModel.placement_key < f"{prefix}Z",
+            )
+        # Roots share the empty prefix, so the closure check keeps the seek inside the sponsor's own tree.
+        in_downline = (
+            self._session.query(OrganizationClosureModel.descendant_id)
+            .filter(
+                OrganizationClosureModel.ancestor_id == sponsor_node_id,
+                OrganizationClosureModel.descendant_id == BinarySlotModel.node_id,
+                OrganizationClosureModel.tree_type == "binary",
+            )
+            .exists()
+        )
+        return (
+            query.filter(in_downline)
+            .order_by(func.length(BinarySlotModel.placement_key).asc(), BinarySlotModel.placement_key.asc())
+            .limit(1)
+        )
+
+    @staticmethod
+    def _map_slot(model: BinarySlotModel | None) -> Optional[BinarySlotRecord]:
+        if model is None:
+            return None
+        return BinarySlotRecord(
+            node_id=model.node_id,
+            slot=model.slot,
+            status=model.status,
+            placement_key=model.placement_key,
+            child_node_id=model.child_node_id,
+        )
+
     def get_nodes_by_ids(self, node_ids: Sequence[str]) -> Sequence[OrganizationNodeRecord]:
         if not node_ids:
             return []
@@ -938,6 +1751,93 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
         )
         return count > 0
 
+    def get_ancestor_chains(
+        self,
+        user_id: str,
+        *,
+        tree_types: Sequence[str],
+        max_depth: int,
+    ) -> Mapping[str, Sequence[OrganizationNodeRecord]]:
+        if not tree_types:
+            return {}
+        descendant = aliased(OrganizationNodeModel)
+        rows = (
+            self._session.query(OrganizationClosureModel.tree_type, OrganizationNodeModel)
+            .join(OrganizationNodeModel, OrganizationNodeModel.node_id == OrganizationClosureModel.ancestor_id)
+            .join(descendant, descendant.node_id == OrganizationClosureModel.descendant_id)
+            .filter(
+                descendant.user_id == user_id,
+                descendant.tree_type.in_(list(tree_types)),
+                OrganizationClosureModel.tree_type == descendant.tree_type,
+                OrganizationClosureModel.depth <= max_depth,
+            )
+            .order_by(OrganizationClosureModel.tree_type.asc(), OrganizationClosureModel.depth.asc())
+            .all()
+        )
+        chains: dict[str, list[OrganizationNodeRecord]] = {}
+        for tree_type, model in rows:
+            chains.setdefault(tree_type, []).append(self._map_node(model))
+        return chains
+
+    def list_ancestors(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+    ) -> Sequence[OrganizationNodeRecord]:
+        query = (
+            self._session.query(OrganizationNodeModel)
+            .join(OrganizationClosureModel, OrganizationClosureModel.ancestor_id == OrganizationNodeModel.node_id)
+            .filter(
+                OrganizationClosureModel.descendant_id == node_id,
+                OrganizationClosureModel.tree_type == tree_type,
+                OrganizationClosureModel.depth > 0,
+            )
+        )
+        if max_depth is not None:
+            query = query.filter(OrganizationClosureModel.depth <= max_depth)
+        models = query.order_by(OrganizationClosureModel.depth.asc()).all()
+        return [self._map_node(model) for model in models]
+
+    def list_descendants(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> OrganizationNodePage:
+        query = (
+            self._session.query(OrganizationClosureModel.depth, OrganizationNodeModel)
+            .join(OrganizationNodeModel, OrganizationNodeModel.node_id == OrganizationClosureModel.descendant_id)
+            .filter(
+                OrganizationClosureModel.ancestor_id == node_id,
+                OrganizationClosureModel.tree_type == tree_type,
+                OrganizationClosureModel.depth > 0,
+            )
+        )
+        if max_depth is not None:
+            query = query.filter(OrganizationClosureModel.depth <= max_depth)
+        if cursor:
+            after_depth, after_node_id = decode_node_cursor(cursor)
+            query = query.filter(
+                tuple_(OrganizationClosureModel.depth, OrganizationClosureModel.descendant_id)
+                > tuple_(after_depth, after_node_id),
+            )
+        rows = (
+            query.order_by(OrganizationClosureModel.depth.asc(), OrganizationClosureModel.descendant_id.asc())
+            .limit(limit + 1)
+            .all()
+        )
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit and page:
+            last_depth, last_model = page[-1]
+            next_cursor = encode_node_cursor(last_depth, last_model.node_id)
+        return OrganizationNodePage(items=[self._map_node(model) for _, model in page], next_cursor=next_cursor)
+
     def _ensure_closure_entries(self, record: OrganizationNodeRecord) -> None:
         existing = (
             self._session.query(OrganizationClosureModel)
@@ -979,7 +1879,7 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
                     ),
                 )
 
-    def _ensure_binary_slots(self, node_id: str) -> None:
+    def _ensure_binary_slots(self, node_id: str, placement_key: str) -> None:
         existing = {
             slot.slot
             for slot in self._session.query(BinarySlotModel).filter(BinarySlotModel.node_id == node_id)
@@ -992,10 +1892,12 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
                         slot=slot_name,
                         status="OPEN",
                         last_assigned_at=None,
+                        placement_key=f"{placement_key}{slot_name}",
                     ),
                 )
 
-    def _fill_binary_slot(self, parent_node_id: str, slot: str, child_node_id: str) -> None:
+    def _fill_binary_slot(self, parent_node_id: str, slot: str, child_node_id: str) -> str:
+        """Mark the parent's slot as filled and return its placement key for the child."""
         slot = slot.upper()
         slot_model = (
             self._session.query(BinarySlotModel)
@@ -1010,16 +1912,25 @@ class SqlAlchemyOrganizationRepository(OrganizationRepository):
             slot_model.status = "FILLED"
             slot_model.child_node_id = child_node_id
             slot_model.last_assigned_at = now
-        else:
-            self._session.add(
-                BinarySlotModel(
-                    node_id=parent_node_id,
-                    slot=slot,
-                    status="FILLED",
-                    child_node_id=child_node_id,
-                    last_assigned_at=now,
-                ),
-            )
+            return slot_model.placement_key
+        sibling = (
+            self._session.query(BinarySlotModel.placement_key)
+            .filter(BinarySlotModel.node_id == parent_node_id)
+            .limit(1)
+            .scalar()
+        )
+        placement_key = f"{sibling[:-1]}{slot}" if sibling else slot
+        self._session.add(
+            BinarySlotModel(
+                node_id=parent_node_id,
+                slot=slot,
+                status="FILLED",
+                child_node_id=child_node_id,
+                last_assigned_at=now,
+                placement_key=placement_key,
+            ),
+        )
+        return placement_key
 
 
 class SqlAlchemyOrganizationMetricsRepository(OrganizationMetricsRepository):
@@ -1059,6 +1970,176 @@ class SqlAlchemyOrganizationMetricsRepository(OrganizationMetricsRepository):
         ]
 
 
+    def summarize_metrics(
+        self,
+        node_ids: Sequence[str],
+        *,
+        tree_type: str,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[OrganizationKpiTotals]:
+        if not node_ids:
+            return []
+        metrics = OrganizationMetricsDailyModel
+        is_latest = metrics.metric_date == end_date
+        rows = (
+            self._session.query(
+                metrics.node_id,
+                func.coalesce(func.sum(metrics.personal_volume), 0),
+                func.coalesce(func.sum(metrics.group_volume), 0),
+                func.coalesce(func.sum(metrics.orders_count), 0),
+                func.coalesce(func.sum(case((is_latest, metrics.personal_volume), else_=0)), 0),
+                func.coalesce(func.sum(case((is_latest, metrics.group_volume), else_=0)), 0),
+                func.sum(case((is_latest, metrics.volume_left))),
+                func.sum(case((is_latest, metrics.volume_right))),
+            )
+            .filter(
+                metrics.node_id.in_(list(dict.fromkeys(node_ids))),
+                metrics.tree_type == tree_type,
+                metrics.metric_date >= start_date,
+                metrics.metric_date <= end_date,
+            )
+            .group_by(metrics.node_id)
+            .all()
+        )
+        return [
+            OrganizationKpiTotals(
+                node_id=node_id,
+                tree_type=tree_type,
+                personal_volume=Decimal(personal),
+                group_volume=Decimal(group),
+                orders_count=int(orders),
+                latest_personal_volume=Decimal(latest_personal),
+                latest_group_volume=Decimal(latest_group),
+                latest_volume_left=Decimal(latest_left) if latest_left is not None else None,
+                latest_volume_right=Decimal(latest_right) if latest_right is not None else None,
+            )
+            for node_id, personal, group, orders, latest_personal, latest_group, latest_left, latest_right in rows
+        ]
+
+    def apply_metric_deltas(self, deltas: Sequence[OrganizationMetricDelta]) -> None:
+        if not deltas:
+            return
+        merged: dict[tuple, OrganizationMetricDelta] = {}
+        for delta in deltas:
+            key = (delta.node_id, delta.tree_type, delta.metric_date)
+            merged[key] = _merge_metric_delta(merged.get(key), delta)
+        for attempt in range(2):
+            existing = self._existing_metric_keys(merged)
+            missing = [delta for key, delta in merged.items() if key not in existing]
+            try:
+                # A concurrent rollup may create the same rows; retry those once as increments instead.
+                with self._session.begin_nested():
+                    _bulk_insert(self._session, OrganizationMetricsDailyModel, [_metric_row(delta) for delta in missing])
+                break
+            except IntegrityError:
+                if attempt:
+                    raise
+        self._increment_metrics([delta for key, delta in merged.items() if key in existing])
+        self._session.flush()
+
+    def _existing_metric_keys(self, deltas: Mapping[tuple, OrganizationMetricDelta]) -> set[tuple]:
+        node_ids = sorted({node_id for node_id, _tree_type, _metric_date in deltas})
+        metric_dates = sorted({metric_date for _node_id, _tree_type, metric_date in deltas})
+        table = OrganizationMetricsDailyModel
+        keys: set[tuple] = set()
+        for start in range(0, len(node_ids), BULK_INSERT_CHUNK):
+            keys.update(
+                (node_id, tree_type, metric_date)
+                for node_id, tree_type, metric_date in self._session.query(
+                    table.node_id,
+                    table.tree_type,
+                    table.metric_date,
+                ).filter(
+                    table.node_id.in_(node_ids[start : start + BULK_INSERT_CHUNK]),
+                    table.metric_date.in_(metric_dates),
+                )
+            )
+        return keys
+
+    def _increment_metrics(self, deltas: Sequence[OrganizationMetricDelta]) -> None:
+        """Add ``deltas`` in SQL (``col = col + :delta``) so concurrent runs never overwrite each other."""
+        if not deltas:
+            return
+        table = OrganizationMetricsDailyModel.__table__
+
+        def increment(column, parameter: str):
+            return func.coalesce(column, 0) + bindparam(parameter, type_=column.type)
+
+        def leg(column, parameter: str):
+            # A missing leg delta keeps the stored value, which may itself still be NULL.
+            value = bindparam(parameter, type_=column.type)
+            return case((value.is_(None), column), else_=func.coalesce(column, 0) + value)
+
+        statement = (
+            update(table)
+            .where(
+                table.c.node_id == bindparam("b_node_id"),
+                table.c.tree_type == bindparam("b_tree_type"),
+                table.c.metric_date == bindparam("b_metric_date"),
+            )
+            .values(
+                personal_volume=increment(table.c.personal_volume, "b_personal_volume"),
+                group_volume=increment(table.c.group_volume, "b_group_volume"),
+                volume_left=leg(table.c.volume_left, "b_volume_left"),
+                volume_right=leg(table.c.volume_right, "b_volume_right"),
+                orders_count=increment(table.c.orders_count, "b_orders_count"),
+            )
+        )
+        self._session.execute(
+            statement,
+            [
+                {
+                    "b_node_id": delta.node_id,
+                    "b_tree_type": delta.tree_type,
+                    "b_metric_date": delta.metric_date,
+                    "b_personal_volume": delta.personal_volume,
+                    "b_group_volume": delta.group_volume,
+                    "b_volume_left": delta.volume_left,
+                    "b_volume_right": delta.volume_right,
+                    "b_orders_count": delta.orders_count,
+                }
+                for delta in deltas
+            ],
+        )
+
+    def get_rollup_watermark(self, name: str) -> Optional[RollupWatermark]:
+        model = self._session.get(OrganizationRollupStateModel, name)
+        if model is None:
+            return None
+        return RollupWatermark(name=model.name, last_created_at=model.last_created_at, last_order_id=model.last_order_id)
+
+    def save_rollup_watermark(self, watermark: RollupWatermark) -> None:
+        model = self._session.get(OrganizationRollupStateModel, watermark.name)
+        if model is None:
+            model = OrganizationRollupStateModel(name=watermark.name)
+            self._session.add(model)
+        model.last_created_at = watermark.last_created_at
+        model.last_order_id = watermark.last_order_id
+        self._session.flush()
+
+    def claim_rollup_orders(self, order_ids: Sequence[str]) -> set[str]:
+        requested = set(order_ids)
+        if not requested:
+            return set()
+        ordered = sorted(requested)
+        seen: set[str] = set()
+        for start in range(0, len(ordered), BULK_INSERT_CHUNK):
+            seen.update(
+                order_id
+                for (order_id,) in self._session.query(OrganizationRollupOrderModel.order_id).filter(
+                    OrganizationRollupOrderModel.order_id.in_(ordered[start : start + BULK_INSERT_CHUNK]),
+                )
+            )
+        fresh = requested - seen
+        _bulk_insert(
+            self._session,
+            OrganizationRollupOrderModel,
+            [{"order_id": order_id} for order_id in sorted(fresh)],
+        )
+        return fresh
+
+
 class SqlAlchemyBonusRepository(BonusRepository):
     """SQLAlchemy-backed repository for bonus entries."""
 
@@ -1083,6 +2164,27 @@ class SqlAlchemyBonusRepository(BonusRepository):
         )
         self._session.add(model)
 
+    def record_bonuses(self, records: Sequence[BonusEntryRecord]) -> None:
+        rows = [
+            {
+                "bonus_id": record.bonus_id,
+                "user_id": record.user_id,
+                "source_user_id": record.source_user_id,
+                "bonus_type": record.bonus_type,
+                "order_id": record.order_id,
+                "level": record.level,
+                "pv_amount": record.pv_amount,
+                "bonus_amount": record.bonus_amount,
+                "status": record.status,
+                "hold_until": record.hold_until,
+                "metadata_json": dict(record.metadata),
+                "created_at": record.created_at,
+                "confirmed_at": record.confirmed_at,
+            }
+            for record in records
+        ]
+        _bulk_insert(self._session, BonusTransactionModel, rows)
+
     def list_pending(self, *, limit: int = 100) -> Sequence[BonusEntryRecord]:
         query = (
             self._session.query(BonusTransactionModel)
@@ -1096,62 +2198,78 @@ class SqlAlchemyBonusRepository(BonusRepository):
         ]
 
     def mark_confirmed(self, bonus_id: str) -> None:
+        self.mark_confirmed_many([bonus_id])
+
+    def mark_confirmed_many(self, bonus_ids: Sequence[str]) -> None:
+        ordered = sorted(set(bonus_ids))
         now = datetime.now(UTC)
-        self._session.query(BonusTransactionModel).filter(BonusTransactionModel.bonus_id == bonus_id).update({
-            "status": "CONFIRMED",
-            "confirmed_at": now,
-        })
-        self._session.query(BonusRetryQueueModel).filter(BonusRetryQueueModel.bonus_id == bonus_id).update({
-            "status": "COMPLETED",
-            "updated_at": now,
-        })
+        for start in range(0, len(ordered), BULK_INSERT_CHUNK):
+            chunk = ordered[start : start + BULK_INSERT_CHUNK]
+            self._session.query(BonusTransactionModel).filter(BonusTransactionModel.bonus_id.in_(chunk)).update({
+                "status": "CONFIRMED",
+                "confirmed_at": now,
+            })
+            self._session.query(BonusRetryQueueModel).filter(BonusRetryQueueModel.bonus_id.in_(chunk)).update({
+                "status": "COMPLETED",
+                "updated_at": now,
+            })
 
     def schedule_retry(self, bonus_id: str, retry_after: datetime, metadata: Mapping[str, Any]) -> None:
-        txn = (
-            self._session.query(BonusTransactionModel)
-            .filter(BonusTransactionModel.bonus_id == bonus_id)
-            .one_or_none()
-        )
-        if txn is None:
-            return
-
-        txn.status = "RETRY"
-        txn.metadata_json = dict(metadata)
-        txn.hold_until = retry_after
+        self.schedule_retries([BonusRetrySchedule(bonus_id=bonus_id, retry_after=retry_after, metadata=metadata)])
 
-        queue_id = f"retry-{bonus_id}"
-        failure_reason = metadata.get("last_error") or metadata.get("reason")
-        retry_count = int(metadata.get("retry_count", 0))
+    def schedule_retries(self, retries: Sequence[BonusRetrySchedule]) -> None:
+        by_bonus = {retry.bonus_id: retry for retry in retries}
+        ordered = sorted(by_bonus)
         now = datetime.now(UTC)
-        queue_model = (
-            self._session.query(BonusRetryQueueModel)
-            .filter(BonusRetryQueueModel.queue_id == queue_id)
-            .one_or_none()
-        )
-        if queue_model:
-            queue_model.order_id = txn.order_id
-            queue_model.bonus_type = txn.bonus_type
-            queue_model.failure_reason = failure_reason
-            queue_model.retry_after = retry_after
-            if retry_count:
-                queue_model.retry_count = retry_count
-            queue_model.status = "PENDING"
-            queue_model.updated_at = now
-        else:
-            self._session.add(
-                BonusRetryQueueModel(
-                    queue_id=queue_id,
-                    bonus_id=bonus_id,
-                    order_id=txn.order_id,
-                    bonus_type=txn.bonus_type,
-                    failure_reason=failure_reason,
-                    retry_after=retry_after,
-                    retry_count=retry_count,
-                    status="PENDING",
-                    created_at=now,
-                    updated_at=now,
-                ),
-            )
+        for start in range(0, len(ordered), BULK_INSERT_CHUNK):
+            chunk = ordered[start : start + BULK_INSERT_CHUNK]
+            txns = {
+                model.bonus_id: model
+                for model in self._session.query(BonusTransactionModel).filter(BonusTransactionModel.bonus_id.in_(chunk))
+            }
+            queued = {
+                model.queue_id: model
+                for model in self._session.query(BonusRetryQueueModel).filter(
+                    BonusRetryQueueModel.queue_id.in_([f"retry-{bonus_id}" for bonus_id in chunk]),
+                )
+            }
+            for bonus_id in chunk:
+                txn = txns.get(bonus_id)
+                if txn is None:
+                    continue
+                retry = by_bonus[bonus_id]
+                txn.status = "RETRY"
+                txn.metadata_json = dict(retry.metadata)
+                txn.hold_until = retry.retry_after
+
+                queue_id = f"retry-{bonus_id}"
+                failure_reason = retry.metadata.get("last_error") or retry.metadata.get("reason")
+                retry_count = int(retry.metadata.get("retry_count", 0))
+                queue_model = queued.get(queue_id)
+                if queue_model:
+                    queue_model.order_id = txn.order_id
+                    queue_model.bonus_type = txn.bonus_type
+                    queue_model.failure_reason = failure_reason
+                    queue_model.retry_after = retry.retry_after
+                    if retry_count:
+                        queue_model.retry_count = retry_count
+                    queue_model.status = "PENDING"
+                    queue_model.updated_at = now
+                else:
+                    self._session.add(
+                        BonusRetryQueueModel(
+                            queue_id=queue_id,
+                            bonus_id=bonus_id,
+                            order_id=txn.order_id,
+                            bonus_type=txn.bonus_type,
+                            failure_reason=failure_reason,
+                            retry_after=retry.retry_after,
+                            retry_count=retry_count,
+                            status="PENDING",
+                            created_at=now,
+                            updated_at=now,
+                        ),
+                    )
 
     def mark_failed(self, bonus_id: str, metadata: Mapping[str, Any]) -> None:
         failure_reason = metadata.get("last_error") or metadata.get("reason")
@@ -1292,6 +2410,16 @@ class SqlAlchemyLoginAuditRepository(LoginAuditRepository):
             ),
         )
 
+    def log_many(self, records: Sequence[LoginAuditRecord]) -> None:
+        _bulk_insert(
+            self._session,
+            LoginAuditModel,
+            [
+                {"provider": record.provider, "status": record.status, "subject": record.subject, "reason": record.reason}
+                for record in records
+            ],
+        )
+
     def list_recent(self, *, limit: int = 100) -> list[LoginAuditRecord]:
         models = (
             self._session.query(LoginAuditModel)
@@ -1370,7 +2498,7 @@ class SqlAlchemySessionRepository(SessionRepository):
 
     def get_session(self, token: str) -> Optional[SessionRecord]:
         model = self._session.query(AuthSessionModel).filter(AuthSessionModel.token == token).one_or_none()
-        if not model:
+        if not model or model.revoked_at is not None:
             return None
         roles = tuple(role for role in model.roles.split(",") if role)
         expires_at = float(model.expires_at) if model.expires_at is not None else 0.0
@@ -1381,6 +2509,21 @@ class SqlAlchemySessionRepository(SessionRepository):
             expires_at=expires_at,
         )
 
+    def revoke_session(self, token: str) -> bool:
+        result = self._session.execute(
+            update(AuthSessionModel)
+            .where(AuthSessionModel.token == token, AuthSessionModel.revoked_at.is_(None))
+            .values(revoked_at=time.time()),
+        )
+        return result.rowcount > 0
+
+    def list_revoked_tokens(self, *, now: float) -> list[str]:
+        rows = self._session.query(AuthSessionModel.token).filter(
+            AuthSessionModel.revoked_at.is_not(None),
+            AuthSessionModel.expires_at > now,
+        )
+        return [token for (token,) in rows]
+
 
 class SqlAlchemyUserRepository(UserRepository):
     """SQLAlchemy-backed user repository."""
@@ -1462,3 +2605,18 @@ class SqlAlchemyUserAccountRepository(UserAccountRepository):
             is_active=bool(model.is_active),
             created_at=created_at,
         )
+
+
+class SqlAlchemyTransactionScope(TransactionScope):
+    """Savepoints (``SAVEPOINT``) and early commits on the scope's session."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        with self._session.begin_nested():
+            yield
+
+    def commit(self) -> None:
+        self._session.commit()
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Mapping, Sequence, Set
+import time
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Iterable, Mapping, Optional, Sequence, Set
 
 from aeghash.core.repositories import SessionRecord
-from aeghash.security.permissions import PermissionService
+from aeghash.security.permissions import DEFAULT_PERMISSION_INDEX, PermissionIndex, PermissionService
+from aeghash.utils.cache import TTLCache
+
+_FULL_PERSONAL_DATA = ("personal_data:view_full", "wallets:view_sensitive")
+_FULL_AUDIT_SUBJECTS = ("audits:view_full", *_FULL_PERSONAL_DATA)
+_GLOBAL_KPI = ("kpi:read_all", "organizations:view_all")
 
 
 def _extract_base_roles(raw_roles: Sequence[str]) -> tuple[str, ...]:
@@ -27,15 +33,38 @@ def _extract_scopes(raw_roles: Sequence[str]) -> Mapping[str, Set[str]]:
     return scopes
 
 
+def _extract_kpi_nodes(scopes: Mapping[str, Set[str]]) -> Mapping[str | None, FrozenSet[str]]:
+    scoped: dict[str | None, set[str]] = {}
+    for entry in scopes.get("kpi", ()):
+        parts = entry.split(":")
+        if parts[0] != "node" or len(parts) < 2:
+            continue
+        if len(parts) == 2:
+            tree_type: str | None = None
+            node_id = parts[1]
+        else:
+            tree_type = parts[1] or None
+            node_id = ":".join(parts[2:])
+        scoped.setdefault(tree_type, set()).add(node_id)
+    return {tree_type: frozenset(nodes) for tree_type, nodes in scoped.items()}
+
+
 @dataclass(slots=True)
 class AccessContext:
-    """Normalized view of a session record for downstream access control."""
+    """Normalized view of a session record for downstream access control.
+
+    Permissions are also held as a bitmask over ``permission_index`` and KPI scopes
+    are parsed up front, so per-request checks never re-derive either.
+    """
 
     user_id: str
     raw_roles: tuple[str, ...]
     roles: tuple[str, ...]
     permissions: Set[str]
     scopes: Mapping[str, Set[str]]
+    permission_mask: int = 0
+    permission_index: PermissionIndex = DEFAULT_PERMISSION_INDEX
+    kpi_nodes: Mapping[str | None, FrozenSet[str]] = field(default_factory=dict)
 
     @classmethod
     def from_session(
@@ -46,14 +75,17 @@ class AccessContext:
     ) -> "AccessContext":
         service = permission_service or PermissionService()
         base_roles = _extract_base_roles(session.roles)
-        permissions = service.permissions_for(base_roles)
+        mask = service.mask_for(base_roles)
         scopes = _extract_scopes(session.roles)
         return cls(
             user_id=session.user_id,
             raw_roles=tuple(session.roles),
             roles=base_roles,
-            permissions=permissions,
+            permissions=service.index.names(mask),
             scopes=scopes,
+            permission_mask=mask,
+            permission_index=service.index,
+            kpi_nodes=_extract_kpi_nodes(scopes),
         )
 
 
@@ -64,38 +96,64 @@ class AccessPolicy:
     context: AccessContext
 
     def has(self, permission: str) -> bool:
-        return permission in self.context.permissions
+        bit = self.context.permission_index.bit(permission)
+        return bit != 0 and self.context.permission_mask & bit != 0
 
     def has_all(self, permissions: Iterable[str]) -> bool:
-        return all(self.has(permission) for permission in permissions)
+        index = self.context.permission_index
+        return index.allows(self.context.permission_mask, index.required_mask(permissions))
+
+    def has_any(self, permissions: Iterable[str]) -> bool:
+        return self.context.permission_mask & self.context.permission_index.any_mask(permissions) != 0
 
     # ------------------------------------------------------------------ masking helpers
 
     def can_view_full_personal_data(self) -> bool:
-        return self.has("personal_data:view_full") or self.has("wallets:view_sensitive")
+        return self.has_any(_FULL_PERSONAL_DATA)
 
     def can_view_full_audit_subjects(self) -> bool:
-        return self.has("audits:view_full") or self.can_view_full_personal_data()
+        return self.has_any(_FULL_AUDIT_SUBJECTS)
 
     # ------------------------------------------------------------------ KPI scope helpers
 
     def has_global_kpi_access(self) -> bool:
-        return self.has("kpi:read_all") or self.has("organizations:view_all")
+        return self.has_any(_GLOBAL_KPI)
 
     def allowed_kpi_nodes(self) -> Mapping[str | None, Set[str]]:
-        raw = self.context.scopes.get("kpi", set())
-        scoped: dict[str | None, Set[str]] = {}
-        for entry in raw:
-            parts = entry.split(":")
-            if not parts:
-                continue
-            if parts[0] != "node":
-                continue
-            if len(parts) == 2:
-                tree_type: str | None = None
-                node_id = parts[1]
-            else:
-                tree_type = parts[1] or None
-                node_id = ":".join(parts[2:])
-            scoped.setdefault(tree_type, set()).add(node_id)
-        return scoped
+        return self.context.kpi_nodes
+
+
+class AccessContextCache:
+    """Bounded token -> AccessContext cache for authenticated requests.
+
+    Entries live at most ``max_ttl_seconds`` and never past the session's ``expires_at``,
+    so out-of-process revocations and role changes are picked up within that window.
+    ``revoke`` drops an entry immediately when the session is revoked in this process.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 10_000,
+        max_ttl_seconds: float = 30.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if max_ttl_seconds <= 0:
+            raise ValueError("max_ttl_seconds must be positive")
+        # Session expiry is wall-clock time, so the cache must run on the same clock.
+        self._clock = clock or time.time
+        self._max_ttl = max_ttl_seconds
+        self._entries = TTLCache(maxsize=maxsize, clock=self._clock)
+
+    def get(self, token: str) -> Optional[AccessContext]:
+        return self._entries.get(token)
+
+    def put(self, session: SessionRecord, context: AccessContext) -> None:
+        now = self._clock()
+        ttl = min(session.expires_at - now, self._max_ttl)
+        if ttl <= 0:
+            return
+        self._entries.set(session.token, context, ttl_seconds=ttl)
+
+    def revoke(self, token: str) -> None:
+        self._entries.delete(token)
@@ -1,16 +1,33 @@
-"""Password hashing utilities using PBKDF2."""
+"""Password hashing utilities using PBKDF2 (or scrypt) with tunable cost profiles."""
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
 
-DEFAULT_SCHEME = "pbkdf2_sha256"
+SCHEME_PBKDF2 = "pbkdf2_sha256"
+SCHEME_SCRYPT = "scrypt"
+DEFAULT_SCHEME = SCHEME_PBKDF2
 DEFAULT_ITERATIONS = 150_000
+DEFAULT_SCRYPT_COST = 2**14
 DEFAULT_SALT_BYTES = 16
+DEFAULT_PENDING_PER_WORKER = 4
+# scrypt stores its CPU/memory cost N in the ``iterations`` field; r and p are fixed.
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELISM = 1
+DIGEST_BYTES = 32
+MIN_PBKDF2_ITERATIONS = 10_000
+MAX_SCRYPT_COST = 2**20
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,22 +58,80 @@ class PasswordHash:
         return cls(scheme=scheme, iterations=iterations, salt=salt, digest=digest)
 
 
-def _derive_digest(password: str, *, salt: bytes, iterations: int) -> bytes:
-    return hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations,
-    )
+@dataclass(frozen=True, slots=True)
+class PasswordCostProfile:
+    """Hashing scheme and work factor applied to newly stored passwords.
+
+    ``iterations`` is the PBKDF2 round count, or the scrypt cost ``N`` (a power of two).
+    """
+
+    scheme: str = DEFAULT_SCHEME
+    iterations: int = DEFAULT_ITERATIONS
+
+    def __post_init__(self) -> None:
+        if self.scheme == SCHEME_PBKDF2:
+            if self.iterations <= 0:
+                raise ValueError("PBKDF2 iterations must be positive.")
+        elif self.scheme == SCHEME_SCRYPT:
+            if self.iterations < 2 or self.iterations & (self.iterations - 1):
+                raise ValueError("scrypt cost must be a power of two greater than one.")
+        else:
+            raise ValueError(f"Unsupported password hash scheme: {self.scheme}")
+
+    @classmethod
+    def for_scheme(cls, scheme: str, iterations: Optional[int] = None) -> "PasswordCostProfile":
+        """Build a profile, falling back to the scheme's default cost."""
+        if iterations is None:
+            iterations = DEFAULT_SCRYPT_COST if scheme == SCHEME_SCRYPT else DEFAULT_ITERATIONS
+        return cls(scheme=scheme, iterations=iterations)
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """Return True when ``stored_hash`` was produced with different parameters."""
+        parsed = PasswordHash.deserialize(stored_hash)
+        return (
+            parsed.scheme != self.scheme
+            or parsed.iterations != self.iterations
+            or len(parsed.salt) != DEFAULT_SALT_BYTES
+        )
+
+
+DEFAULT_PROFILE = PasswordCostProfile()
 
 
-def hash_password(password: str, *, iterations: int = DEFAULT_ITERATIONS) -> str:
-    """Generate a salted hash for the supplied password."""
+def _derive_digest(password: str, *, salt: bytes, iterations: int, scheme: str = DEFAULT_SCHEME) -> bytes:
+    secret = password.encode("utf-8")
+    if scheme == SCHEME_PBKDF2:
+        return hashlib.pbkdf2_hmac("sha256", secret, salt, iterations)
+    if scheme == SCHEME_SCRYPT:
+        return hashlib.scrypt(
+            secret,
+            salt=salt,
+            n=iterations,
+            r=SCRYPT_BLOCK_SIZE,
+            p=SCRYPT_PARALLELISM,
+            maxmem=256 * iterations * SCRYPT_BLOCK_SIZE,
+            dklen=DIGEST_BYTES,
+        )
+    raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+
+def hash_password(
+    password: str,
+    *,
+    iterations: Optional[int] = None,
+    profile: Optional[PasswordCostProfile] = None,
+) -> str:
+    """Generate a salted hash for the supplied password.
+
+    ``profile`` selects the scheme and cost; ``iterations`` overrides the PBKDF2 default.
+    """
+    if profile is None:
+        profile = PasswordCostProfile(iterations=iterations) if iterations is not None else DEFAULT_PROFILE
     salt = os.urandom(DEFAULT_SALT_BYTES)
-    digest = _derive_digest(password, salt=salt, iterations=iterations)
+    digest = _derive_digest(password, salt=salt, iterations=profile.iterations, scheme=profile.scheme)
     return PasswordHash(
-        scheme=DEFAULT_SCHEME,
-        iterations=iterations,
+        scheme=profile.scheme,
+        iterations=profile.iterations,
         salt=salt,
         digest=digest,
     ).serialize()
@@ -65,7 +140,124 @@ def hash_password(password: str, *, iterations: int = DEFAULT_ITERATIONS) -> str
 def verify_password(password: str, stored_hash: str) -> bool:
     """Verify a password against the stored hash."""
     parsed = PasswordHash.deserialize(stored_hash)
-    if parsed.scheme != DEFAULT_SCHEME:
+    if parsed.scheme not in (SCHEME_PBKDF2, SCHEME_SCRYPT):
         raise ValueError(f"Unsupported password hash scheme: {parsed.scheme}")
-    candidate = _derive_digest(password, salt=parsed.salt, iterations=parsed.iterations)
+    candidate = _derive_digest(password, salt=parsed.salt, iterations=parsed.iterations, scheme=parsed.scheme)
     return hmac.compare_digest(candidate, parsed.digest)
+
+
+def measure_profile(
+    profile: PasswordCostProfile,
+    *,
+    samples: int = 3,
+    timer: Callable[[], float] = time.perf_counter,
+) -> float:
+    """Return the fastest of ``samples`` hash timings for ``profile``, in seconds."""
+    salt = os.urandom(DEFAULT_SALT_BYTES)
+    best = float("inf")
+    for _ in range(max(samples, 1)):
+        started = timer()
+        _derive_digest("calibration-password", salt=salt, iterations=profile.iterations, scheme=profile.scheme)
+        best = min(best, timer() - started)
+    return best
+
+
+def calibrate_profile(
+    scheme: str = DEFAULT_SCHEME,
+    *,
+    target_seconds: float = 0.1,
+    samples: int = 3,
+    timer: Callable[[], float] = time.perf_counter,
+) -> PasswordCostProfile:
+    """Pick the cost for ``scheme`` whose hash time on this host is closest to ``target_seconds``.
+
+    PBKDF2 scales linearly, so one probe is extrapolated and rounded to a thousand rounds.
+    scrypt's cost must be a power of two, so it is doubled until the target is reached.
+    """
+    if target_seconds <= 0:
+        raise ValueError("target_seconds must be positive.")
+    if scheme == SCHEME_PBKDF2:
+        probe = PasswordCostProfile(SCHEME_PBKDF2, MIN_PBKDF2_ITERATIONS)
+        elapsed = max(measure_profile(probe, samples=samples, timer=timer), 1e-9)
+        iterations = int(round(MIN_PBKDF2_ITERATIONS * target_seconds / elapsed, -3))
+        return PasswordCostProfile(SCHEME_PBKDF2, max(iterations, MIN_PBKDF2_ITERATIONS))
+    if scheme == SCHEME_SCRYPT:
+        cost = 2**10
+        while cost < MAX_SCRYPT_COST:
+            if measure_profile(PasswordCostProfile(SCHEME_SCRYPT, cost), samples=samples, timer=timer) >= target_seconds:
+                break
+            cost *= 2
+        return PasswordCostProfile(SCHEME_SCRYPT, cost)
+    raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing pool is saturated and a call is shed instead of queued."""
+
+
+class PasswordHasher:
+    """Run PBKDF2 on a dedicated, bounded worker pool.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL, so a thread pool sized to the CPU count
+    hashes in parallel without the pickling overhead of a process pool. At most
+    ``max_pending`` calls may wait for a worker; beyond that calls fail fast with
+    :class:`PasswordHasherBusy` so a login storm cannot pile up unbounded work.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        profile: PasswordCostProfile = DEFAULT_PROFILE,
+    ) -> None:
+        workers = max_workers or os.cpu_count() or 1
+        pending = max_pending if max_pending is not None else workers * DEFAULT_PENDING_PER_WORKER
+        if workers <= 0 or pending < 0:
+            raise ValueError("max_workers must be positive and max_pending non-negative")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + pending)
+        self.profile = profile
+
+    def hash(self, password: str) -> str:
+        return self._submit(hash_password, password, profile=self.profile).result()
+
+    def verify(self, password: str, stored_hash: str) -> bool:
+        return self._submit(verify_password, password, stored_hash).result()
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        return self.profile.needs_rehash(stored_hash)
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(hash_password, password, profile=self.profile))
+
+    async def verify_async(self, password: str, stored_hash: str) -> bool:
+        return await asyncio.wrap_future(self._submit(verify_password, password, stored_hash))
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("password_hashing_busy")
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+        return future
+
+
+async def hash_password_async(password: str, *, hasher: Optional[PasswordHasher] = None) -> str:
+    """Hash ``password`` on ``hasher``'s pool, or on a worker thread when none is configured."""
+    if hasher is None:
+        return await asyncio.to_thread(hash_password, password)
+    return await hasher.hash_async(password)
+
+
+async def verify_password_async(password: str, stored_hash: str, *, hasher: Optional[PasswordHasher] = None) -> bool:
+    """Verify ``password`` on ``hasher``'s pool, or on a worker thread when none is configured."""
+    if hasher is None:
+        return await asyncio.to_thread(verify_password, password, stored_hash)
+    return await hasher.verify_async(password, stored_hash)
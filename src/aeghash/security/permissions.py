@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, Set
+from typing import Dict, FrozenSet, Iterable, Mapping, Set
 
 
 ROLE_MATRIX: Mapping[str, Set[str]] = {
@@ -51,22 +51,90 @@ class AuthorizationDecision:
     missing_permissions: Set[str]
 
 
+class PermissionIndex:
+    """Role matrix compiled into one bit per permission and one mask per role.
+
+    Permission names are interned once, so authorization becomes integer OR/AND
+    instead of set unions. A permission no role grants maps to ``-1`` when required,
+    which no granted mask can satisfy.
+    """
+
+    __slots__ = ("_bits", "_names", "_role_masks", "_required", "_any")
+
+    def __init__(self, role_matrix: Mapping[str, Iterable[str]]) -> None:
+        names = sorted({permission for permissions in role_matrix.values() for permission in permissions})
+        self._names = tuple(names)
+        self._bits: Dict[str, int] = {name: 1 << position for position, name in enumerate(names)}
+        self._role_masks: Dict[str, int] = {
+            role: self._combine(permissions) for role, permissions in role_matrix.items()
+        }
+        self._required: Dict[tuple[str, ...], int] = {}
+        self._any: Dict[tuple[str, ...], int] = {}
+
+    def bit(self, permission: str) -> int:
+        """Bit for ``permission``; 0 when no role grants it."""
+        return self._bits.get(permission, 0)
+
+    def mask_for_roles(self, roles: Iterable[str]) -> int:
+        mask = 0
+        for role in roles:
+            mask |= self._role_masks.get(role, 0)
+        return mask
+
+    def required_mask(self, permissions: Iterable[str]) -> int:
+        """Mask that must be fully present in a granted mask; memoized per permission tuple."""
+        key = tuple(permissions)
+        mask = self._required.get(key)
+        if mask is None:
+            mask = -1 if any(permission not in self._bits for permission in key) else self._combine(key)
+            self._required[key] = mask
+        return mask
+
+    def any_mask(self, permissions: Iterable[str]) -> int:
+        """Mask of which at least one bit must be granted; unknown permissions contribute nothing."""
+        key = tuple(permissions)
+        mask = self._any.get(key)
+        if mask is None:
+            mask = self._combine(permission for permission in key if permission in self._bits)
+            self._any[key] = mask
+        return mask
+
+    def allows(self, granted: int, required: int) -> bool:
+        return required & ~granted == 0
+
+    def names(self, mask: int) -> FrozenSet[str]:
+        return frozenset(name for position, name in enumerate(self._names) if mask >> position & 1)
+
+    def _combine(self, permissions: Iterable[str]) -> int:
+        mask = 0
+        for permission in permissions:
+            mask |= self._bits[permission]
+        return mask
+
+
+DEFAULT_PERMISSION_INDEX = PermissionIndex(ROLE_MATRIX)
+
+
 class PermissionService:
     """Evaluate permissions for roles based on the predefined matrix."""
 
     def __init__(self, role_matrix: Mapping[str, Iterable[str]] | None = None) -> None:
-        self._matrix: Dict[str, Set[str]] = {
-            role: set(permissions) for role, permissions in (role_matrix or ROLE_MATRIX).items()
-        }
+        self._index = DEFAULT_PERMISSION_INDEX if role_matrix is None else PermissionIndex(role_matrix)
+
+    @property
+    def index(self) -> PermissionIndex:
+        return self._index
+
+    def mask_for(self, roles: Iterable[str]) -> int:
+        return self._index.mask_for_roles(roles)
 
     def permissions_for(self, roles: Iterable[str]) -> Set[str]:
-        permissions: Set[str] = set()
-        for role in roles:
-            permissions.update(self._matrix.get(role, set()))
-        return permissions
+        return set(self._index.names(self.mask_for(roles)))
 
     def authorize(self, roles: Iterable[str], required_permissions: Iterable[str]) -> AuthorizationDecision:
-        available = self.permissions_for(roles)
-        required = set(required_permissions)
-        missing = required - available
-        return AuthorizationDecision(allowed=not missing, missing_permissions=missing)
+        granted = self.mask_for(roles)
+        required = tuple(required_permissions)
+        if self._index.allows(granted, self._index.required_mask(required)):
+            return AuthorizationDecision(allowed=True, missing_permissions=set())
+        missing = {permission for permission in required if not self._index.bit(permission) & granted}
+        return AuthorizationDecision(allowed=False, missing_permissions=missing)
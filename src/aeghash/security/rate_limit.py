@@ -0,0 +1,142 @@
+"""Token-bucket rate limiting for authentication endpoints."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Protocol
+
+LOGIN_IP = "login:ip"
+LOGIN_EMAIL = "login:email"
+OAUTH_IP = "oauth:ip"
+TWO_FACTOR_USER = "two_factor:user"
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a caller has used up its allowance; ``retry_after`` is in seconds."""
+
+    def __init__(self, rule: str, retry_after: float) -> None:
+        super().__init__("rate_limited")
+        self.rule = rule
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitRule:
+    """Allow ``limit`` hits per ``window_seconds``, refilled continuously (token bucket)."""
+
+    limit: int
+    window_seconds: float
+
+    def __post_init__(self) -> None:
+        if self.limit <= 0 or self.window_seconds <= 0:
+            raise ValueError("limit and window_seconds must be positive")
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.limit / self.window_seconds
+
+
+DEFAULT_RULES: Mapping[str, RateLimitRule] = {
+    LOGIN_IP: RateLimitRule(limit=30, window_seconds=60),
+    LOGIN_EMAIL: RateLimitRule(limit=10, window_seconds=300),
+    OAUTH_IP: RateLimitRule(limit=30, window_seconds=60),
+    TWO_FACTOR_USER: RateLimitRule(limit=5, window_seconds=300),
+}
+
+
+class RateLimitBackend(Protocol):
+    """Bucket storage; in-process here, but e.g. a Redis script fits the same shape."""
+
+    def consume(self, key: str, *, capacity: int, refill_per_second: float) -> float:
+        """Take one token; return 0 if allowed, otherwise seconds until one is available."""
+        ...
+
+    def reset(self, key: str) -> None:
+        ...
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Token buckets spread over lock-striped shards so concurrent callers rarely contend.
+
+    Each shard keeps at most ``max_keys_per_shard`` buckets and evicts the least
+    recently used; an evicted bucket simply starts full again.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_keys_per_shard: int = 10_000,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if shards <= 0 or max_keys_per_shard <= 0:
+            raise ValueError("shards and max_keys_per_shard must be positive")
+        self._clock = clock or time.monotonic
+        self._max_keys = max_keys_per_shard
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._buckets: list[OrderedDict[str, tuple[float, float]]] = [OrderedDict() for _ in range(shards)]
+
+    def consume(self, key: str, *, capacity: int, refill_per_second: float) -> float:
+        shard = zlib.crc32(key.encode("utf-8")) % len(self._locks)
+        buckets = self._buckets[shard]
+        with self._locks[shard]:
+            now = self._clock()
+            tokens, updated_at = buckets.get(key, (float(capacity), now))
+            tokens = min(float(capacity), tokens + (now - updated_at) * refill_per_second)
+            if tokens >= 1:
+                buckets[key] = (tokens - 1, now)
+                wait = 0.0
+            else:
+                buckets[key] = (tokens, now)
+                wait = (1 - tokens) / refill_per_second
+            buckets.move_to_end(key)
+            while len(buckets) > self._max_keys:
+                buckets.popitem(last=False)
+            return wait
+
+    def reset(self, key: str) -> None:
+        shard = zlib.crc32(key.encode("utf-8")) % len(self._locks)
+        with self._locks[shard]:
+            self._buckets[shard].pop(key, None)
+
+
+class RateLimiter:
+    """Check named rules (see ``DEFAULT_RULES``) against a subject such as an IP or email."""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend | None = None,
+        *,
+        rules: Mapping[str, RateLimitRule] = DEFAULT_RULES,
+    ) -> None:
+        self._backend = backend or InMemoryRateLimitBackend()
+        self._rules = dict(rules)
+
+    def check(self, rule_name: str, subject: Optional[str]) -> None:
+        """Consume one hit for ``subject``; raise ``RateLimitExceeded`` when over the limit.
+
+        Unknown rules and empty subjects are not limited.
+        """
+        rule = self._rules.get(rule_name)
+        if rule is None or not subject:
+            return
+        wait = self._backend.consume(
+            f"{rule_name}:{subject}",
+            capacity=rule.limit,
+            refill_per_second=rule.refill_per_second,
+        )
+        if wait > 0:
+            raise RateLimitExceeded(rule_name, wait)
+
+    def reset(self, rule_name: str, subject: str) -> None:
+        self._backend.reset(f"{rule_name}:{subject}")
+
+
+def retry_after_header(exc: RateLimitExceeded) -> str:
+    """Whole seconds for a ``Retry-After`` header (at least 1)."""
+    return str(max(1, math.ceil(exc.retry_after)))
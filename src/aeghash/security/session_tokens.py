@@ -0,0 +1,141 @@
+"""Signed, self-contained session tokens and the revocation set that backs them."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from aeghash.core.repositories import SessionRecord
+
+SIGNED_TOKEN_PREFIX = "v1."
+_KEY_CONTEXT = b"aeghash-session-token:"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class SessionTokenSigner:
+    """Issue and verify HMAC-SHA256 signed session tokens.
+
+    A token carries the session id, user id, roles and expiry, so it can be checked
+    without reading ``auth_sessions``. The session row is still written at login and
+    only consulted for revocation.
+    """
+
+    def __init__(self, secret: str | bytes) -> None:
+        raw = secret.encode("utf-8") if isinstance(secret, str) else secret
+        if not raw:
+            raise ValueError("A non-empty signing secret is required.")
+        # Derive a dedicated key so SECRET_KEY is never used for two purposes directly.
+        self._key = hashlib.sha256(_KEY_CONTEXT + raw).digest()
+
+    @staticmethod
+    def is_signed(token: str) -> bool:
+        return token.startswith(SIGNED_TOKEN_PREFIX)
+
+    def sign(self, record: SessionRecord) -> str:
+        payload = json.dumps(
+            {"sid": record.token, "sub": record.user_id, "roles": list(record.roles), "exp": record.expires_at},
+            separators=(",", ":"),
+        )
+        body = SIGNED_TOKEN_PREFIX + _b64encode(payload.encode("utf-8"))
+        return f"{body}.{_b64encode(self._signature(body))}"
+
+    def verify(self, token: str) -> Optional[SessionRecord]:
+        """Return the embedded session, or None when the token is malformed or forged.
+
+        Expiry is left to the caller so it can report ``session_expired`` distinctly.
+        """
+        if not self.is_signed(token):
+            return None
+        body, _, signature = token.rpartition(".")
+        try:
+            if not hmac.compare_digest(_b64decode(signature), self._signature(body)):
+                return None
+            claims = json.loads(_b64decode(body[len(SIGNED_TOKEN_PREFIX):]))
+            return SessionRecord(
+                token=str(claims["sid"]),
+                user_id=str(claims["sub"]),
+                roles=tuple(str(role) for role in claims["roles"]),
+                expires_at=float(claims["exp"]),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _signature(self, body: str) -> bytes:
+        return hmac.new(self._key, body.encode("ascii"), hashlib.sha256).digest()
+
+
+class SessionRevocationList:
+    """In-memory set of revoked session ids, reloaded from the database periodically.
+
+    ``loader`` returns the ids of revoked sessions that have not expired yet, so the
+    set stays small. Revocations made in this process are applied immediately via
+    :meth:`add`; those made elsewhere become visible within ``refresh_seconds``.
+    Only one caller reloads at a time, and ids added while a load is in flight are
+    merged into its result rather than overwritten by it.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[str]],
+        *,
+        refresh_seconds: float = 5.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._loader = loader
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock or time.monotonic
+        self._revoked: frozenset[str] = frozenset()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        # Ids passed to add() since the in-flight load started; None when no load is running.
+        self._added_during_load: Optional[set[str]] = None
+
+    def is_stale(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or self._clock() - loaded_at >= self._refresh_seconds
+
+    def refresh(self) -> None:
+        # Before the first load there is nothing safe to serve, so wait for it; afterwards
+        # a concurrent caller keeps the current set rather than issuing a second load.
+        first_load = self._loaded_at is None
+        if not self._refresh_lock.acquire(blocking=first_load):
+            return
+        try:
+            if first_load and self._loaded_at is not None:
+                return
+            with self._lock:
+                self._added_during_load = set()
+            loaded = frozenset(self._loader())
+            with self._lock:
+                self._revoked = loaded | self._added_during_load
+                self._loaded_at = self._clock()
+        finally:
+            with self._lock:
+                self._added_during_load = None
+            self._refresh_lock.release()
+
+    def refresh_if_stale(self) -> None:
+        if self.is_stale():
+            self.refresh()
+
+    def add(self, session_id: str) -> None:
+        with self._lock:
+            self._revoked = self._revoked | {session_id}
+            if self._added_during_load is not None:
+                self._added_during_load.add(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._revoked
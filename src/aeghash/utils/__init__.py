@@ -3,10 +3,12 @@
 from .memory_repositories import (
     InMemoryMiningRepository,
     InMemoryWalletRepository,
+    InMemoryPointLedgerRepository,
     InMemoryPointWalletRepository,
     InMemoryWithdrawalAuditRepository,
     InMemoryRiskRepository,
     InMemoryOrganizationRepository,
+    InMemoryOrganizationMetricsRepository,
     InMemoryBonusRepository,
     InMemoryOrderRepository,
     InMemoryIdempotencyRepository,
@@ -14,15 +16,18 @@ from .memory_repositories import (
 )
 from .notifications import NotificationMessage, Notifier
 from .retry import RetryConfig, retry
-from .crypto import encrypt_secret, decrypt_secret, EncryptionError
+from .crypto import encrypt_secret, decrypt_secret, EncryptionError, Keyring, load_keyring
+from .cache import CacheBackend, TTLCache
 
 __all__ = [
     "InMemoryWalletRepository",
     "InMemoryMiningRepository",
     "InMemoryPointWalletRepository",
+    "InMemoryPointLedgerRepository",
     "InMemoryWithdrawalAuditRepository",
     "InMemoryRiskRepository",
     "InMemoryOrganizationRepository",
+    "InMemoryOrganizationMetricsRepository",
     "InMemoryBonusRepository",
     "InMemoryOrderRepository",
     "InMemoryIdempotencyRepository",
@@ -34,4 +39,8 @@ __all__ = [
     "encrypt_secret",
     "decrypt_secret",
     "EncryptionError",
+    "Keyring",
+    "load_keyring",
+    "CacheBackend",
+    "TTLCache",
 ]
@@ -3,41 +3,74 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from typing import Sequence
 
-from cryptography.fernet import Fernet, InvalidToken
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+ENCRYPTION_KEY_ENV = "AEGHASH_ENCRYPTION_KEY"
 
 
 class EncryptionError(RuntimeError):
     """Raised when encryption or decryption fails."""
 
 
-def _resolve_key() -> bytes:
-    key = os.environ.get("AEGHASH_ENCRYPTION_KEY")
-    if not key:
-        raise EncryptionError("AEGHASH_ENCRYPTION_KEY must be defined.")
-    try:
-        return key.encode("utf-8")
-    except Exception as exc:  # pragma: no cover - defensive
-        raise EncryptionError("Invalid encryption key encoding.") from exc
+class Keyring:
+    """Fernet keys built once and reused for every encrypt/decrypt call.
+
+    The first key encrypts; any key decrypts, so a new key can be prepended and old
+    ciphertexts re-encrypted with :meth:`rotate` before the old key is retired.
+    """
+
+    def __init__(self, keys: Sequence[str | bytes]) -> None:
+        if not keys:
+            raise EncryptionError(f"{ENCRYPTION_KEY_ENV} must be defined.")
+        try:
+            self._cipher = MultiFernet([Fernet(key) for key in keys])
+        except Exception as exc:
+            raise EncryptionError("Failed to initialize cipher.") from exc
+
+    @classmethod
+    def from_value(cls, value: str) -> "Keyring":
+        """Parse a comma-separated key list, primary key first."""
+        return cls([key.strip() for key in value.split(",") if key.strip()])
+
+    def encrypt(self, plaintext: str) -> str:
+        return self._cipher.encrypt(plaintext.encode("utf-8")).decode("utf-8")
+
+    def decrypt(self, token: str) -> str:
+        try:
+            plaintext = self._cipher.decrypt(token.encode("utf-8"))
+        except InvalidToken as exc:
+            raise EncryptionError("Invalid encryption token.") from exc
+        return plaintext.decode("utf-8")
+
+    def rotate(self, token: str) -> str:
+        """Re-encrypt ``token`` under the primary key."""
+        try:
+            return self._cipher.rotate(token.encode("utf-8")).decode("utf-8")
+        except InvalidToken as exc:
+            raise EncryptionError("Invalid encryption token.") from exc
+
+
+@lru_cache(maxsize=4)
+def _keyring_for(value: str) -> Keyring:
+    return Keyring.from_value(value)
+
+
+def load_keyring() -> Keyring:
+    """Return the keyring for the current ``AEGHASH_ENCRYPTION_KEY`` value."""
+    value = os.environ.get(ENCRYPTION_KEY_ENV)
+    if not value:
+        raise EncryptionError(f"{ENCRYPTION_KEY_ENV} must be defined.")
+    return _keyring_for(value)
 
 
 def encrypt_secret(plaintext: str) -> str:
     """Encrypt the given plaintext using Fernet symmetric key encryption."""
-    key = _resolve_key()
-    try:
-        cipher = Fernet(key)
-    except Exception as exc:  # pragma: no cover - defensive
-        raise EncryptionError("Failed to initialize cipher.") from exc
-    token = cipher.encrypt(plaintext.encode("utf-8"))
-    return token.decode("utf-8")
+    return load_keyring().encrypt(plaintext)
 
 
 def decrypt_secret(token: str) -> str:
     """Decrypt the given ciphertext using Fernet symmetric key encryption."""
-    key = _resolve_key()
-    try:
-        cipher = Fernet(key)
-        plaintext = cipher.decrypt(token.encode("utf-8"))
-    except InvalidToken as exc:
-        raise EncryptionError("Invalid encryption token.") from exc
-    return plaintext.decode("utf-8")
+    return load_keyring().decrypt(token)
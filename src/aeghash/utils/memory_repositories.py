@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Any, List, Mapping, Optional, Sequence
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
 
 from aeghash.adapters.hashdam import HashBalance
+from aeghash.core.organization import decode_node_cursor, encode_node_cursor
+from aeghash.core.point_ledger import decode_ledger_cursor, encode_ledger_cursor
+from aeghash.core.point_wallet import decode_withdrawal_cursor, encode_withdrawal_cursor
 from aeghash.core.repositories import (
+    BalanceGuard,
+    BonusRetrySchedule,
     MiningBalanceRecord,
     MiningRepository,
+    PointLedgerCheckpointRecord,
+    PointLedgerPage,
     PointLedgerRecord,
+    PointLedgerRepository,
+    PointLedgerTotals,
     PointWalletRecord,
     PointWalletRepository,
     KnownDeviceRecord,
     RiskEventRecord,
     RiskRepository,
+    BinaryPlacementQueueRecord,
+    BinarySlotClaim,
+    BinarySlotRecord,
+    OrganizationNodePage,
     OrganizationNodeRecord,
+    OrganizationKpiRecord,
+    OrganizationKpiTotals,
+    OrganizationMetricDelta,
+    OrganizationMetricsRepository,
     OrganizationRepository,
+    RollupWatermark,
+    UplineEntry,
     SpilloverLogRecord,
     BonusEntryRecord,
     BonusRepository,
@@ -32,6 +53,7 @@ from aeghash.core.repositories import (
     WalletRecord,
     WalletRepository,
     WithdrawalRecord,
+    WithdrawalRequestPage,
     WithdrawalRequestRecord,
     WithdrawalAuditRecord,
     WithdrawalAuditRepository,
@@ -58,6 +80,7 @@ class InMemoryWalletRepository(WalletRepository):
 class InMemoryOrderRepository(OrderRepository):
     def __init__(self) -> None:
         self.orders: dict[str, OrderRecord] = {}
+        self.rolled_up: dict[str, datetime] = {}
 
     def get_order(self, order_id: str) -> Optional[OrderRecord]:
         return self.orders.get(order_id)
@@ -66,6 +89,27 @@ class InMemoryOrderRepository(OrderRepository):
         self.orders[record.order_id] = record
         return record
 
+    def upsert_orders(self, records: Sequence[OrderRecord]) -> Sequence[OrderRecord]:
+        for record in records:
+            self.orders[record.order_id] = record
+        return list(records)
+
+    def list_unrolled_paid_orders(self, *, limit: int = 1000) -> Sequence[OrderRecord]:
+        matching = sorted(
+            (
+                record
+                for record in self.orders.values()
+                if record.status == "PAID" and record.order_id not in self.rolled_up
+            ),
+            key=lambda record: (record.created_at, record.order_id),
+        )
+        return matching[:limit]
+
+    def mark_orders_rolled_up(self, order_ids: Sequence[str], *, rolled_up_at: datetime) -> None:
+        for order_id in order_ids:
+            if order_id in self.orders:
+                self.rolled_up.setdefault(order_id, rolled_up_at)
+
 
 class InMemoryIdempotencyRepository(IdempotencyRepository):
     def __init__(self) -> None:
@@ -89,6 +133,17 @@ class InMemoryIdempotencyRepository(IdempotencyRepository):
         if resource_id is not None:
             record.resource_id = resource_id
 
+    def get_many(self, keys: Sequence[tuple[str, str]]) -> Mapping[tuple[str, str], IdempotencyKeyRecord]:
+        return {key: self.records[key] for key in keys if key in self.records}
+
+    def create_many(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        for record in records:
+            self.records[(record.scope, record.key)] = record
+
+    def mark_statuses(self, records: Sequence[IdempotencyKeyRecord]) -> None:
+        for record in records:
+            self.mark_status(key=record.key, scope=record.scope, status=record.status, resource_id=record.resource_id)
+
 
 class InMemoryProductRepository(ProductRepository):
     def __init__(self) -> None:
@@ -138,18 +193,53 @@ class InMemoryPointWalletRepository(PointWalletRepository):
             return None
         return self.wallets.get(wallet_id)
 
+    def get_wallets_by_users(self, user_ids: Sequence[str]) -> Mapping[str, PointWalletRecord]:
+        return {
+            user_id: self.wallets[self.wallets_by_user[user_id]]
+            for user_id in user_ids
+            if user_id in self.wallets_by_user
+        }
+
     def create_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         self.wallets[record.wallet_id] = record
         self.wallets_by_user[record.user_id] = record.wallet_id
         return record
 
+    def create_wallets(self, records: Sequence[PointWalletRecord]) -> None:
+        for record in records:
+            self.create_wallet(record)
+
     def update_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         self.wallets[record.wallet_id] = record
         return record
 
+    def apply_balance_delta(
+        self,
+        wallet_id: str,
+        *,
+        balance_delta: Decimal = Decimal("0"),
+        pending_delta: Decimal = Decimal("0"),
+        guard: Optional[BalanceGuard] = None,
+        updated_at: datetime,
+    ) -> Optional[PointWalletRecord]:
+        record = self.wallets.get(wallet_id)
+        if record is None or (guard is not None and not _guard_allows(record, guard)):
+            return None
+        updated = replace(
+            record,
+            balance=record.balance + balance_delta,
+            pending_withdrawal=record.pending_withdrawal + pending_delta,
+            updated_at=updated_at,
+        )
+        self.wallets[wallet_id] = updated
+        return updated
+
     def add_ledger_entry(self, entry: PointLedgerRecord) -> None:
         self.ledger.append(entry)
 
+    def add_ledger_entries(self, entries: Sequence[PointLedgerRecord]) -> None:
+        self.ledger.extend(entries)
+
     def get_withdrawal_request(self, request_id: str) -> Optional[WithdrawalRequestRecord]:
         return self.withdrawals.get(request_id)
 
@@ -161,18 +251,130 @@ class InMemoryPointWalletRepository(PointWalletRepository):
         self.withdrawals[record.request_id] = record
         return record
 
+    def transition_withdrawal_request(
+        self,
+        record: WithdrawalRequestRecord,
+        *,
+        expected_statuses: Sequence[str],
+    ) -> Optional[WithdrawalRequestRecord]:
+        current = self.withdrawals.get(record.request_id)
+        if current is None or current.status not in expected_statuses:
+            return None
+        self.withdrawals[record.request_id] = record
+        return record
+
     def list_withdrawal_requests(
         self,
         *,
-        wallet_id: str,
+        wallet_id: Optional[str] = None,
         statuses: Sequence[str] | None = None,
-    ) -> Sequence[WithdrawalRequestRecord]:
-        records = [
-            record
-            for record in self.withdrawals.values()
-            if record.wallet_id == wallet_id and (not statuses or record.status in statuses)
-        ]
-        return sorted(records, key=lambda item: item.created_at)
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> WithdrawalRequestPage:
+        records = sorted(
+            (
+                record
+                for record in self.withdrawals.values()
+                if (wallet_id is None or record.wallet_id == wallet_id)
+                and (not statuses or record.status in statuses)
+                and (created_before is None or record.created_at < created_before)
+            ),
+            key=lambda item: (item.created_at, item.request_id),
+        )
+        if cursor:
+            after = decode_withdrawal_cursor(cursor)
+            records = [record for record in records if (record.created_at, record.request_id) > after]
+        page = records[:limit]
+        next_cursor = None
+        if len(records) > limit and page:
+            next_cursor = encode_withdrawal_cursor(page[-1].created_at, page[-1].request_id)
+        return WithdrawalRequestPage(items=page, next_cursor=next_cursor)
+
+
+class InMemoryPointLedgerRepository(PointLedgerRepository):
+    """Ledger queries over the rows held by an ``InMemoryPointWalletRepository``."""
+
+    def __init__(self, wallets: InMemoryPointWalletRepository) -> None:
+        self._wallets = wallets
+        self.checkpoints: list[PointLedgerCheckpointRecord] = []
+        self.covered: dict[str, datetime] = {}
+
+    def list_entries(self, wallet_id: str, *, limit: int = 50, cursor: Optional[str] = None) -> PointLedgerPage:
+        entries = sorted(
+            (entry for entry in self._wallets.ledger if entry.wallet_id == wallet_id),
+            key=lambda entry: (entry.created_at, entry.entry_id),
+            reverse=True,
+        )
+        if cursor:
+            before = decode_ledger_cursor(cursor)
+            entries = [entry for entry in entries if (entry.created_at, entry.entry_id) < before]
+        page = entries[:limit]
+        next_cursor = None
+        if len(entries) > limit and page:
+            next_cursor = encode_ledger_cursor(page[-1].created_at, page[-1].entry_id)
+        return PointLedgerPage(items=page, next_cursor=next_cursor)
+
+    def list_wallets(self, *, after_wallet_id: Optional[str] = None, limit: int = 500) -> Sequence[PointWalletRecord]:
+        wallet_ids = sorted(
+            wallet_id for wallet_id in self._wallets.wallets if after_wallet_id is None or wallet_id > after_wallet_id
+        )
+        return [self._wallets.wallets[wallet_id] for wallet_id in wallet_ids[:limit]]
+
+    def latest_checkpoints(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        at_or_before: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerCheckpointRecord]:
+        wanted = set(wallet_ids)
+        latest: dict[str, PointLedgerCheckpointRecord] = {}
+        for record in self.checkpoints:
+            if record.wallet_id not in wanted or (at_or_before is not None and record.checkpoint_at > at_or_before):
+                continue
+            current = latest.get(record.wallet_id)
+            if current is None or record.checkpoint_at > current.checkpoint_at:
+                latest[record.wallet_id] = record
+        return latest
+
+    def sum_entries(
+        self,
+        wallet_ids: Sequence[str],
+        *,
+        after: Mapping[str, datetime],
+        until: Optional[datetime] = None,
+    ) -> Mapping[str, PointLedgerTotals]:
+        wanted = set(wallet_ids)
+        totals: dict[str, PointLedgerTotals] = {}
+        for entry in self._wallets.ledger:
+            if entry.wallet_id not in wanted or (until is not None and entry.created_at > until):
+                continue
+            since = after.get(entry.wallet_id)
+            covered_at = self.covered.get(entry.entry_id)
+            if since is not None and covered_at is not None and covered_at <= since:
+                continue
+            self._accumulate(totals, entry)
+        return totals
+
+    def cover_entries(self, wallet_ids: Sequence[str], *, checkpoint_at: datetime) -> Mapping[str, PointLedgerTotals]:
+        wanted = set(wallet_ids)
+        totals: dict[str, PointLedgerTotals] = {}
+        for entry in self._wallets.ledger:
+            if entry.wallet_id not in wanted or entry.entry_id in self.covered or entry.created_at > checkpoint_at:
+                continue
+            self.covered[entry.entry_id] = checkpoint_at
+            self._accumulate(totals, entry)
+        return totals
+
+    @staticmethod
+    def _accumulate(totals: dict[str, PointLedgerTotals], entry: PointLedgerRecord) -> None:
+        total = totals.setdefault(entry.wallet_id, PointLedgerTotals())
+        total.balance += entry.balance_delta
+        total.pending_withdrawal += entry.pending_delta
+        total.entry_count += 1
+
+    def add_checkpoints(self, records: Sequence[PointLedgerCheckpointRecord]) -> None:
+        self.checkpoints.extend(records)
 
 
 class InMemoryWithdrawalAuditRepository(WithdrawalAuditRepository):
@@ -212,6 +414,7 @@ class InMemoryOrganizationRepository(OrganizationRepository):
         self.nodes_by_user: dict[tuple[str, str], str] = {}
         self.children: dict[str, list[OrganizationNodeRecord]] = {}
         self.spillovers: list[SpilloverLogRecord] = []
+        self.waiting_queue: dict[str, BinaryPlacementQueueRecord] = {}
 
     def create_node(self, record: OrganizationNodeRecord) -> OrganizationNodeRecord:
         self.nodes[record.node_id] = record
@@ -239,9 +442,270 @@ class InMemoryOrganizationRepository(OrganizationRepository):
         matching = [record for record in self.spillovers if record.sponsor_user_id == sponsor_user_id]
         return matching[:limit]
 
+    def find_open_binary_slot(self, sponsor_node_id: str) -> Optional[BinarySlotRecord]:
+        sponsor = self.nodes.get(sponsor_node_id)
+        if sponsor is None:
+            return None
+        path_ids = [segment for segment in sponsor.path.split("/") if segment]
+        prefix = "".join(self.nodes[node_id].position or "" for node_id in path_ids[1:] if node_id in self.nodes)
+        queue = deque([(sponsor_node_id, prefix)])
+        while queue:
+            node_id, placement_key = queue.popleft()
+            children = {child.position: child for child in self.children.get(node_id, [])}
+            for slot in ("L", "R"):
+                if slot not in children:
+                    return BinarySlotRecord(
+                        node_id=node_id,
+                        slot=slot,
+                        status="OPEN",
+                        placement_key=f"{placement_key}{slot}",
+                    )
+            queue.append((children["L"].node_id, f"{placement_key}L"))
+            queue.append((children["R"].node_id, f"{placement_key}R"))
+        return None
+
+    def claim_binary_slot(self, sponsor_node_id: str) -> BinarySlotClaim:
+        slot = self.find_open_binary_slot(sponsor_node_id)
+        if slot is not None:
+            slot.status = "RESERVED"
+        return BinarySlotClaim(slot=slot)
+
+    def enqueue_binary_placement(self, record: BinaryPlacementQueueRecord) -> None:
+        self.waiting_queue[record.queue_id] = record
+
+    def list_pending_binary_placements(self, *, limit: int = 100) -> Sequence[BinaryPlacementQueueRecord]:
+        pending = [record for record in self.waiting_queue.values() if record.status == "PENDING"]
+        pending.sort(key=lambda record: (record.enqueued_at, record.queue_id))
+        return pending[:limit]
+
+    def mark_binary_placement(
+        self,
+        queue_id: str,
+        *,
+        status: str,
+        attempted_at: datetime,
+        retry_count: int,
+    ) -> None:
+        record = self.waiting_queue.get(queue_id)
+        if record is None:
+            return
+        record.status = status
+        record.last_attempt_at = attempted_at
+        record.retry_count = retry_count
+
+    def bulk_insert_nodes(
+        self,
+        tree_type: str,
+        rows: Iterable[tuple[str, str, Optional[str], Optional[str], Optional[str], int, str]],
+        *,
+        created_at: datetime,
+    ) -> int:
+        count = 0
+        for node_id, user_id, parent_node_id, sponsor_user_id, position, depth, path in rows:
+            self.create_node(
+                OrganizationNodeRecord(
+                    node_id=node_id,
+                    user_id=user_id,
+                    tree_type=tree_type,
+                    parent_node_id=parent_node_id,
+                    sponsor_user_id=sponsor_user_id,
+                    position=position,
+                    depth=depth,
+                    path=path,
+                    created_at=created_at,
+                    updated_at=created_at,
+                ),
+            )
+            count += 1
+        return count
+
+    def bulk_insert_closure(self, tree_type: str, rows: Iterable[tuple[str, str, int]]) -> int:
+        # Ancestry is derived from node paths in memory; only the row count is reported.
+        return sum(1 for _ in rows)
+
+    def bulk_insert_binary_slots(
+        self,
+        rows: Iterable[tuple[str, str, str, Optional[str], str]],
+        *,
+        assigned_at: datetime,
+    ) -> int:
+        return sum(1 for _ in rows)
+
     def get_nodes_by_ids(self, node_ids: Sequence[str]) -> Sequence[OrganizationNodeRecord]:
         return [self.nodes[node_id] for node_id in node_ids if node_id in self.nodes]
 
+    def get_ancestor_chains(
+        self,
+        user_id: str,
+        *,
+        tree_types: Sequence[str],
+        max_depth: int,
+    ) -> Mapping[str, Sequence[OrganizationNodeRecord]]:
+        chains: dict[str, list[OrganizationNodeRecord]] = {}
+        for tree_type in tree_types:
+            node = self.get_node_by_user(tree_type, user_id)
+            if node is None:
+                continue
+            path_ids = [segment for segment in node.path.split("/") if segment]
+            chain_ids = list(reversed(path_ids))[: max_depth + 1]
+            chains[tree_type] = [self.nodes[node_id] for node_id in chain_ids if node_id in self.nodes]
+        return chains
+
+    def is_descendant(self, *, ancestor_node_id: str, descendant_node_id: str, tree_type: str) -> bool:
+        return any(
+            node.node_id == ancestor_node_id
+            for node in self.list_ancestors(descendant_node_id, tree_type=tree_type)
+        )
+
+    def list_ancestors(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+    ) -> Sequence[OrganizationNodeRecord]:
+        node = self.nodes.get(node_id)
+        if node is None or node.tree_type != tree_type:
+            return []
+        path_ids = [segment for segment in node.path.split("/") if segment]
+        ancestor_ids = list(reversed(path_ids[:-1]))
+        if max_depth is not None:
+            ancestor_ids = ancestor_ids[:max_depth]
+        return [self.nodes[ancestor_id] for ancestor_id in ancestor_ids if ancestor_id in self.nodes]
+
+    def list_uplines(self, user_ids: Sequence[str], *, tree_type: str) -> Sequence[UplineEntry]:
+        entries: list[UplineEntry] = []
+        for user_id in dict.fromkeys(user_ids):
+            node = self.get_node_by_user(tree_type, user_id)
+            if node is None:
+                continue
+            path_ids = [segment for segment in node.path.split("/") if segment]
+            chain = list(reversed(path_ids))
+            for distance, node_id in enumerate(chain):
+                leg = None
+                if tree_type == "binary" and distance > 0:
+                    leg = self.nodes[chain[distance - 1]].position
+                entries.append(UplineEntry(user_id=user_id, node_id=node_id, distance=distance, leg=leg))
+        return entries
+
+    def list_descendants(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        max_depth: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> OrganizationNodePage:
+        anchor = self.nodes.get(node_id)
+        if anchor is None or anchor.tree_type != tree_type:
+            return OrganizationNodePage(items=[])
+        found: list[tuple[int, str, OrganizationNodeRecord]] = []
+        frontier = [anchor]
+        while frontier:
+            next_frontier: list[OrganizationNodeRecord] = []
+            for parent in frontier:
+                for child in self.children.get(parent.node_id, []):
+                    relative = child.depth - anchor.depth
+                    if max_depth is not None and relative > max_depth:
+                        continue
+                    found.append((relative, child.node_id, child))
+                    next_frontier.append(child)
+            frontier = next_frontier
+        found.sort(key=lambda item: (item[0], item[1]))
+        if cursor:
+            after = decode_node_cursor(cursor)
+            found = [item for item in found if (item[0], item[1]) > after]
+        page = found[:limit]
+        next_cursor = encode_node_cursor(page[-1][0], page[-1][1]) if len(found) > limit and page else None
+        return OrganizationNodePage(items=[item[2] for item in page], next_cursor=next_cursor)
+
+
+class InMemoryOrganizationMetricsRepository(OrganizationMetricsRepository):
+    def __init__(self) -> None:
+        self.metrics: dict[tuple[str, str, date], OrganizationKpiRecord] = {}
+        self.watermarks: dict[str, RollupWatermark] = {}
+        self.rolled_up_orders: set[str] = set()
+
+    def list_metrics(
+        self,
+        node_id: str,
+        *,
+        tree_type: str,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[OrganizationKpiRecord]:
+        matching = [
+            record
+            for (record_node, record_tree, metric_date), record in self.metrics.items()
+            if record_node == node_id and record_tree == tree_type and start_date <= metric_date <= end_date
+        ]
+        return sorted(matching, key=lambda record: record.metric_date)
+
+    def summarize_metrics(
+        self,
+        node_ids: Sequence[str],
+        *,
+        tree_type: str,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[OrganizationKpiTotals]:
+        totals: list[OrganizationKpiTotals] = []
+        for node_id in dict.fromkeys(node_ids):
+            records = self.list_metrics(node_id, tree_type=tree_type, start_date=start_date, end_date=end_date)
+            if not records:
+                continue
+            latest = next((record for record in records if record.metric_date == end_date), None)
+            totals.append(
+                OrganizationKpiTotals(
+                    node_id=node_id,
+                    tree_type=tree_type,
+                    personal_volume=sum((record.personal_volume for record in records), Decimal("0")),
+                    group_volume=sum((record.group_volume for record in records), Decimal("0")),
+                    orders_count=sum(record.orders_count for record in records),
+                    latest_personal_volume=latest.personal_volume if latest else Decimal("0"),
+                    latest_group_volume=latest.group_volume if latest else Decimal("0"),
+                    latest_volume_left=latest.volume_left if latest else None,
+                    latest_volume_right=latest.volume_right if latest else None,
+                ),
+            )
+        return totals
+
+    def apply_metric_deltas(self, deltas: Sequence[OrganizationMetricDelta]) -> None:
+        for delta in deltas:
+            key = (delta.node_id, delta.tree_type, delta.metric_date)
+            record = self.metrics.get(key)
+            if record is None:
+                self.metrics[key] = OrganizationKpiRecord(
+                    node_id=delta.node_id,
+                    tree_type=delta.tree_type,
+                    metric_date=delta.metric_date,
+                    personal_volume=delta.personal_volume,
+                    group_volume=delta.group_volume,
+                    volume_left=delta.volume_left,
+                    volume_right=delta.volume_right,
+                    orders_count=delta.orders_count,
+                )
+                continue
+            record.personal_volume += delta.personal_volume
+            record.group_volume += delta.group_volume
+            if delta.volume_left is not None:
+                record.volume_left = (record.volume_left or Decimal("0")) + delta.volume_left
+            if delta.volume_right is not None:
+                record.volume_right = (record.volume_right or Decimal("0")) + delta.volume_right
+            record.orders_count += delta.orders_count
+
+    def get_rollup_watermark(self, name: str) -> Optional[RollupWatermark]:
+        return self.watermarks.get(name)
+
+    def save_rollup_watermark(self, watermark: RollupWatermark) -> None:
+        self.watermarks[watermark.name] = watermark
+
+    def claim_rollup_orders(self, order_ids: Sequence[str]) -> set[str]:
+        fresh = set(order_ids) - self.rolled_up_orders
+        self.rolled_up_orders |= fresh
+        return fresh
+
 
 class InMemoryBonusRepository(BonusRepository):
     def __init__(self) -> None:
@@ -251,6 +715,10 @@ class InMemoryBonusRepository(BonusRepository):
     def record_bonus(self, record: BonusEntryRecord) -> None:
         self.records[record.bonus_id] = record
 
+    def record_bonuses(self, records: Sequence[BonusEntryRecord]) -> None:
+        for record in records:
+            self.records[record.bonus_id] = record
+
     def list_pending(self, *, limit: int = 100) -> Sequence[BonusEntryRecord]:
         pending = [
             record for record in self.records.values() if record.status.upper() == "PENDING"
@@ -283,6 +751,14 @@ class InMemoryBonusRepository(BonusRepository):
                 updated_at=datetime.now(UTC),
             )
 
+    def mark_confirmed_many(self, bonus_ids: Sequence[str]) -> None:
+        for bonus_id in bonus_ids:
+            self.mark_confirmed(bonus_id)
+
+    def schedule_retries(self, retries: Sequence[BonusRetrySchedule]) -> None:
+        for retry in retries:
+            self.schedule_retry(retry.bonus_id, retry.retry_after, retry.metadata)
+
     def schedule_retry(self, bonus_id: str, retry_after: datetime, metadata: Mapping[str, Any]) -> None:
         record = self.records.get(bonus_id)
         if not record:
@@ -400,3 +876,15 @@ class InMemoryBonusRepository(BonusRepository):
             created_at=record.created_at,
             updated_at=failed_at,
         )
+
+
+def _guard_allows(record: PointWalletRecord, guard: BalanceGuard) -> bool:
+    if guard.require_status is not None and record.status != guard.require_status:
+        return False
+    if guard.min_available is not None and record.balance - record.pending_withdrawal < guard.min_available:
+        return False
+    if guard.min_balance is not None and record.balance < guard.min_balance:
+        return False
+    if guard.min_pending is not None and record.pending_withdrawal < guard.min_pending:
+        return False
+    return True
@@ -21,26 +21,55 @@ def _time_counter(timestamp: float | None = None, step: int = 30) -> int:
     return current_time // step
 
 
-def totp(secret: str, *, timestamp: float | None = None, digits: int = 6, step: int = 30) -> str:
-    """Generate a TOTP code for the given secret."""
+def decode_secret(secret: str) -> bytes:
+    """Decode a base32 secret (padding optional) into raw HMAC key bytes."""
     padding = (-len(secret)) % 8
-    key = base64.b32decode(secret.upper() + "=" * padding)
-    counter = _time_counter(timestamp, step)
-    counter_bytes = struct.pack(">Q", counter)
-    digest = hmac.new(key, counter_bytes, hashlib.sha1).digest()
+    return base64.b32decode(secret.upper() + "=" * padding)
+
+
+def _code_for(mac: "hmac.HMAC", counter: int, digits: int) -> str:
+    # Copying a keyed HMAC reuses its inner/outer pad state instead of re-keying per counter.
+    digest_mac = mac.copy()
+    digest_mac.update(struct.pack(">Q", counter))
+    digest = digest_mac.digest()
     offset = digest[-1] & 0x0F
     code = (struct.unpack(">I", digest[offset : offset + 4])[0] & 0x7FFFFFFF) % (10**digits)
     return str(code).zfill(digits)
 
 
-def verify_totp(secret: str, code: str, *, window: int = 1, digits: int = 6, step: int = 30) -> bool:
-    """Verify a TOTP code within the specified window."""
+def totp(secret: str, *, timestamp: float | None = None, digits: int = 6, step: int = 30) -> str:
+    """Generate a TOTP code for the given secret."""
+    mac = hmac.new(decode_secret(secret), digestmod=hashlib.sha1)
+    return _code_for(mac, _time_counter(timestamp, step), digits)
+
+
+def verify_totp_key(
+    key: bytes,
+    code: str,
+    *,
+    window: int = 1,
+    digits: int = 6,
+    step: int = 30,
+    timestamp: float | None = None,
+) -> bool:
+    """Verify a TOTP code against an already decoded key.
+
+    The HMAC key schedule is computed once and every offset in the window is checked,
+    so the time taken does not reveal which offset matched.
+    """
     if not code or not code.isdigit():
         return False
 
-    current_counter = _time_counter(step=step)
+    mac = hmac.new(key, digestmod=hashlib.sha1)
+    current_counter = _time_counter(timestamp, step)
+    matched = False
     for offset in range(-window, window + 1):
-        candidate = totp(secret, timestamp=(current_counter + offset) * step, digits=digits, step=step)
-        if hmac.compare_digest(candidate, code):
-            return True
-    return False
+        matched |= hmac.compare_digest(_code_for(mac, current_counter + offset, digits), code)
+    return matched
+
+
+def verify_totp(secret: str, code: str, *, window: int = 1, digits: int = 6, step: int = 30) -> bool:
+    """Verify a TOTP code within the specified window."""
+    if not code or not code.isdigit():
+        return False
+    return verify_totp_key(decode_secret(secret), code, window=window, digits=digits, step=step)
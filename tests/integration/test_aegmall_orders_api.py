@@ -51,3 +51,22 @@ def test_aegmall_order_conflict_returns_409(test_app: TestClient) -> None:
     conflict_payload = _order_payload("idem-2", total_amount=Decimal("250"))
     response_conflict = test_app.post("/aegmall/orders", json=conflict_payload)
     assert response_conflict.status_code == 409
+
+
+def test_aegmall_order_batch_ingestion(test_app: TestClient) -> None:
+    first = _order_payload("idem-b1")
+    second = dict(_order_payload("idem-b2"), order_id="order-2")
+    conflicting = dict(_order_payload("idem-b1"), total_amount="999")
+
+    response = test_app.post("/aegmall/orders:batch", json={"orders": [first, second, conflicting]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["created", "created", "conflict"]
+    assert results[2]["error"]
+
+    replay = test_app.post("/aegmall/orders:batch", json={"orders": [first, second]})
+    assert [result["status"] for result in replay.json()["results"]] == ["duplicate", "duplicate"]
+
+    single = test_app.post("/aegmall/orders", json=_order_payload("idem-b1"))
+    assert single.status_code == 200
+    assert single.json()["status"] == "duplicate"
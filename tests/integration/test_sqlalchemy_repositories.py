@@ -1,4 +1,5 @@
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 import pytest
@@ -6,6 +7,9 @@ from sqlalchemy.orm import Session
 
 from aeghash.adapters.hashdam import HashBalance
 from aeghash.core.repositories import (
+    BalanceGuard,
+    OrganizationMetricDelta,
+    BinaryPlacementQueueRecord,
     MiningBalanceRecord,
     PointLedgerRecord,
     PointWalletRecord,
@@ -19,12 +23,15 @@ from aeghash.core.repositories import (
     OrganizationNodeRecord,
     SpilloverLogRecord,
     BonusEntryRecord,
+    BonusRetrySchedule,
     OrderRecord,
     IdempotencyKeyRecord,
+    SessionRecord,
 )
 from aeghash.infrastructure import (
     Base,
     SqlAlchemyMiningRepository,
+    SqlAlchemyPointLedgerRepository,
     SqlAlchemyPointWalletRepository,
     SqlAlchemyWithdrawalAuditRepository,
     SqlAlchemyRiskRepository,
@@ -36,12 +43,17 @@ from aeghash.infrastructure import (
     create_engine_and_session,
 )
 from aeghash.infrastructure.repositories import (
+    BULK_INSERT_CHUNK,
+    SqlAlchemyOrganizationMetricsRepository,
+    SqlAlchemySessionRepository,
+    SqlAlchemyTransactionScope,
     MiningBalanceModel,
     PointLedgerModel,
     PointWalletModel,
     PointWithdrawalModel,
     RiskEventModel,
     RiskKnownDeviceModel,
+    OrganizationMetricsDailyModel,
     OrganizationNodeModel,
     SpilloverLogModel,
     BonusEntryModel,
@@ -52,7 +64,14 @@ from aeghash.infrastructure.repositories import (
     OrderModel,
     IdempotencyKeyModel,
 )
-from aeghash.core.point_wallet import WITHDRAWAL_STATUS_PENDING
+from aeghash.core.bonus_closing import BonusClosingService
+from aeghash.core.commerce_service import AegmallOrderPayload, AegmallOrderService
+from aeghash.core.organization import PLACEMENT_CLAIM, TREE_BINARY, OrganizationService
+from aeghash.core.organization_rollup import ROLLUP_NAME, OrganizationRollupService
+from aeghash.core.point_ledger import PointLedgerService
+from aeghash.core.point_wallet import WITHDRAWAL_STATUS_PENDING, CreditInstruction, PointWalletService
+from aeghash.utils import RetryConfig
+from aeghash.utils.memory_repositories import InMemoryOrganizationRepository
 
 
 @pytest.fixture()
@@ -213,6 +232,216 @@ def test_sqlalchemy_point_wallet_repository(session: Session) -> None:
     assert session.query(PointLedgerModel).count() == 1
     assert session.query(PointWithdrawalModel).count() == 1
 
+    approved = replace(withdrawal, status="approved", approved_by="admin-1", approved_at=now)
+    claimed = repo.transition_withdrawal_request(approved, expected_statuses=[WITHDRAWAL_STATUS_PENDING])
+    assert claimed is not None and claimed.approved_by == "admin-1"
+    racing = replace(withdrawal, status="approved", approved_by="admin-2", approved_at=now)
+    assert repo.transition_withdrawal_request(racing, expected_statuses=[WITHDRAWAL_STATUS_PENDING]) is None
+    assert repo.get_withdrawal_request("wd-pt-1").approved_by == "admin-1"
+
+
+def test_sqlalchemy_point_wallet_apply_balance_delta_is_guarded(session: Session) -> None:
+    repo = SqlAlchemyPointWalletRepository(session)
+    now = datetime.now(UTC)
+    repo.create_wallet(
+        PointWalletRecord(
+            wallet_id="wallet-atomic",
+            user_id="user-atomic",
+            balance=Decimal("100"),
+            pending_withdrawal=Decimal("30"),
+            status="active",
+            created_at=now,
+            updated_at=now,
+        ),
+    )
+
+    held = repo.apply_balance_delta(
+        "wallet-atomic",
+        pending_delta=Decimal("70"),
+        guard=BalanceGuard(min_available=Decimal("70"), require_status="active"),
+        updated_at=now,
+    )
+    assert held is not None
+    assert (held.balance, held.pending_withdrawal) == (Decimal("100"), Decimal("100"))
+
+    refused = repo.apply_balance_delta(
+        "wallet-atomic",
+        balance_delta=Decimal("-1"),
+        guard=BalanceGuard(min_available=Decimal("1")),
+        updated_at=now,
+    )
+    assert refused is None
+    assert repo.apply_balance_delta("missing", balance_delta=Decimal("1"), updated_at=now) is None
+
+    released = repo.apply_balance_delta(
+        "wallet-atomic",
+        balance_delta=Decimal("-100"),
+        pending_delta=Decimal("-100"),
+        guard=BalanceGuard(min_balance=Decimal("100"), min_pending=Decimal("100")),
+        updated_at=now,
+    )
+    assert released is not None
+    stored = repo.get_wallet("wallet-atomic")
+    assert stored is not None
+    assert (stored.balance, stored.pending_withdrawal) == (Decimal("0"), Decimal("0"))
+
+
+def test_sqlalchemy_point_wallet_credit_many(session: Session) -> None:
+    repo = SqlAlchemyPointWalletRepository(session)
+    service = PointWalletService(repo)
+    service.credit(user_id="user-bulk-1", amount=Decimal("10"))
+
+    outcomes = service.credit_many(
+        [
+            CreditInstruction(user_id="user-bulk-1", amount=Decimal("5"), reference_id="bonus-a", metadata={"k": 1}),
+            CreditInstruction(user_id="user-bulk-2", amount=Decimal("2.5"), reference_id="bonus-b"),
+            CreditInstruction(user_id="user-bulk-2", amount=Decimal("1.5"), reference_id="bonus-c"),
+        ],
+    )
+    session.flush()
+
+    assert all(outcome.succeeded for outcome in outcomes)
+    wallets = repo.get_wallets_by_users(["user-bulk-1", "user-bulk-2", "user-missing"])
+    assert set(wallets) == {"user-bulk-1", "user-bulk-2"}
+    assert wallets["user-bulk-1"].balance == Decimal("15")
+    assert wallets["user-bulk-2"].balance == Decimal("4")
+    rows = {
+        row.reference_id: row
+        for row in session.query(PointLedgerModel).filter(PointLedgerModel.reference_id.isnot(None))
+    }
+    assert Decimal(rows["bonus-b"].balance_after) == Decimal("2.5")
+    assert Decimal(rows["bonus-c"].balance_after) == Decimal("4")
+    assert rows["bonus-a"].metadata_json == {"k": 1}
+
+
+def test_sqlalchemy_bonus_closing_rolls_back_a_failed_credit_batch(session: Session) -> None:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    bonus_repo = SqlAlchemyBonusRepository(session)
+    for index, user_id in enumerate(["user-a", "user-b"]):
+        bonus_repo.record_bonus(
+            BonusEntryRecord(
+                bonus_id=f"bonus-{index}",
+                user_id=user_id,
+                source_user_id="buyer",
+                bonus_type="recommend",
+                order_id="order-1",
+                level=1,
+                pv_amount=Decimal("100"),
+                bonus_amount=Decimal("10"),
+                status="PENDING",
+                metadata={},
+                created_at=now,
+            ),
+        )
+    session.commit()
+
+    class LedgerFailingRepository(SqlAlchemyPointWalletRepository):
+        def add_ledger_entries(self, records):
+            raise RuntimeError("ledger insert failed")
+
+    wallets = PointWalletService(LedgerFailingRepository(session))
+    closing = BonusClosingService(
+        bonus_repo,
+        wallet_creditor=None,
+        batch_creditor=wallets.credit_many,
+        now_factory=lambda: now,
+    )
+
+    # Balance updates were already applied when the ledger insert failed; the error must
+    # escape rather than be turned into retries that credit the wallets a second time.
+    with pytest.raises(RuntimeError, match="ledger insert failed"):
+        closing.run_closing()
+    session.rollback()
+
+    assert session.query(PointWalletModel).count() == 0
+    assert {model.status for model in session.query(BonusEntryModel)} == {"PENDING"}
+
+
+def test_sqlalchemy_point_ledger_checkpoints_and_reconciliation(session: Session) -> None:
+    now = datetime(2025, 5, 1, 12, 0, tzinfo=UTC)
+    clock = [now]
+    wallets = PointWalletService(SqlAlchemyPointWalletRepository(session), clock=lambda: clock[0])
+    ledger = PointLedgerService(SqlAlchemyPointLedgerRepository(session), clock=lambda: clock[0])
+
+    wallet = wallets.credit(user_id="user-ledger", amount=Decimal("50"))
+    clock[0] = now + timedelta(minutes=1)
+    wallets.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("20"), requested_by="user-ledger")
+    clock[0] = now + timedelta(minutes=2)
+    result = ledger.checkpoint()
+    clock[0] = now + timedelta(minutes=3)
+    wallets.credit(user_id="user-ledger", amount=Decimal("5"))
+    session.flush()
+
+    assert result.checkpoints == 1
+    at_start = ledger.balance_as_of(wallet.wallet_id, now)
+    assert (at_start.balance, at_start.pending_withdrawal) == (Decimal("50"), Decimal("0"))
+    latest = ledger.balance_as_of(wallet.wallet_id, clock[0])
+    assert (latest.balance, latest.pending_withdrawal) == (Decimal("55"), Decimal("20"))
+
+    report = ledger.reconcile()
+    assert report.balanced
+    assert (report.wallets, report.entries_scanned) == (1, 1)
+
+    session.query(PointWalletModel).filter_by(wallet_id=wallet.wallet_id).update({"balance": Decimal("56")})
+    assert [item.ledger_balance for item in ledger.reconcile(use_checkpoints=False).mismatches] == [Decimal("55")]
+
+    first = ledger.history(wallet.wallet_id, limit=2)
+    second = ledger.history(wallet.wallet_id, limit=2, cursor=first.next_cursor)
+    assert [entry.entry_type for entry in first.items + list(second.items)] == ["credit", "hold", "credit"]
+    assert second.next_cursor is None
+
+
+def test_sqlalchemy_point_ledger_checkpoint_picks_up_late_rows(session: Session) -> None:
+    now = datetime(2025, 5, 1, 12, 0, tzinfo=UTC)
+    clock = [now]
+    wallets = PointWalletService(SqlAlchemyPointWalletRepository(session), clock=lambda: clock[0])
+    ledger = PointLedgerService(SqlAlchemyPointLedgerRepository(session), clock=lambda: clock[0])
+    wallet = wallets.credit(user_id="user-late", amount=Decimal("10"))
+    clock[0] = now + timedelta(minutes=10)
+    ledger.checkpoint()
+
+    clock[0] = now + timedelta(minutes=1)
+    wallets.credit(user_id="user-late", amount=Decimal("7"))
+    clock[0] = now + timedelta(minutes=11)
+    session.flush()
+
+    assert ledger.reconcile().balanced
+    assert ledger.balance_as_of(wallet.wallet_id, clock[0]).balance == Decimal("17")
+    assert (ledger.checkpoint().entries, ledger.reconcile().entries_scanned) == (1, 0)
+    assert ledger.balance_as_of(wallet.wallet_id, clock[0]).balance == Decimal("17")
+    assert session.query(PointLedgerModel).filter(PointLedgerModel.checkpointed_at.is_(None)).count() == 0
+
+
+def test_sqlalchemy_withdrawal_requests_keyset_pagination(session: Session) -> None:
+    repo = SqlAlchemyPointWalletRepository(session)
+    base = datetime(2025, 3, 1, tzinfo=UTC)
+    for index, (wallet_id, status) in enumerate(
+        [("wallet-a", "pending"), ("wallet-b", "pending"), ("wallet-a", "approved"), ("wallet-b", "pending")],
+    ):
+        repo.create_withdrawal_request(
+            WithdrawalRequestRecord(
+                request_id=f"req-{index}",
+                wallet_id=wallet_id,
+                amount=Decimal("1"),
+                status=status,
+                requested_by="user",
+                reference_id=None,
+                metadata=None,
+                created_at=base + timedelta(minutes=index),
+            ),
+        )
+
+    first = repo.list_withdrawal_requests(statuses=["pending"], limit=2)
+    second = repo.list_withdrawal_requests(statuses=["pending"], limit=2, cursor=first.next_cursor)
+    assert [item.request_id for item in first.items] == ["req-0", "req-1"]
+    assert [item.request_id for item in second.items] == ["req-3"]
+    assert second.next_cursor is None
+
+    scoped = repo.list_withdrawal_requests(wallet_id="wallet-a")
+    assert [item.request_id for item in scoped.items] == ["req-0", "req-2"]
+    older = repo.list_withdrawal_requests(created_before=base + timedelta(minutes=2))
+    assert [item.request_id for item in older.items] == ["req-0", "req-1"]
+
 
 def test_sqlalchemy_withdrawal_audit_repository(session: Session) -> None:
     repo = SqlAlchemyWithdrawalAuditRepository(session)
@@ -338,3 +567,416 @@ def test_sqlalchemy_bonus_repository(session: Session) -> None:
     pending = repo.list_pending()
     assert pending[0].bonus_type == "recommend"
     assert session.query(BonusEntryModel).count() == 1
+
+
+def test_sqlalchemy_order_batch_rolls_back_failed_pipelines(session: Session) -> None:
+    bonus_repo = SqlAlchemyBonusRepository(session)
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+
+    class HalfWritingPipeline:
+        def process_order(self, event):
+            entry = BonusEntryRecord(
+                bonus_id=f"bonus-{event.order_id}",
+                user_id="root",
+                source_user_id=event.user_id,
+                bonus_type="recommend",
+                order_id=event.order_id,
+                level=1,
+                pv_amount=event.pv_amount,
+                bonus_amount=Decimal("1"),
+                status="PENDING",
+                metadata={"order_id": event.order_id},
+                created_at=now,
+            )
+            bonus_repo.record_bonuses([entry])
+            if event.order_id == "order-2":
+                raise RuntimeError("pipeline failed after writing")
+            return [entry]
+
+    service = AegmallOrderService(
+        order_repository=SqlAlchemyOrderRepository(session),
+        idempotency_repository=SqlAlchemyIdempotencyRepository(session),
+        bonus_pipeline=HalfWritingPipeline(),
+        retry_config=RetryConfig(attempts=2, initial_delay=0),
+        clock=lambda: now,
+        transaction=SqlAlchemyTransactionScope(session),
+    )
+    payloads = [
+        AegmallOrderPayload(
+            order_id=order_id,
+            user_id="member",
+            total_amount=Decimal("10"),
+            pv_amount=Decimal("5"),
+            channel="ONLINE",
+            metadata={},
+            idempotency_key=f"idem-{order_id}",
+        )
+        for order_id in ("order-1", "order-2", "order-3")
+    ]
+
+    outcomes = service.process_orders(payloads)
+    session.commit()
+
+    assert [outcome.status for outcome in outcomes] == ["created", "failed", "created"]
+    assert sorted(model.order_id for model in session.query(OrderModel)) == ["order-1", "order-3"]
+    assert sorted(model.bonus_id for model in session.query(BonusEntryModel)) == ["bonus-order-1", "bonus-order-3"]
+
+
+def test_sqlalchemy_bonus_repository_records_bulk_entries(session: Session) -> None:
+    repo = SqlAlchemyBonusRepository(session)
+    now = datetime.now(UTC)
+    records = [
+        BonusEntryRecord(
+            bonus_id=f"bonus-{index}",
+            user_id=f"user-{index}",
+            source_user_id="member",
+            bonus_type="sponsor",
+            order_id="order-1",
+            level=index,
+            pv_amount=Decimal("100"),
+            bonus_amount=Decimal("1"),
+            status="PENDING",
+            metadata={"order_id": "order-1", "tree_type": "binary"},
+            created_at=now,
+        )
+        for index in range(1, BULK_INSERT_CHUNK + 3)
+    ]
+    repo.record_bonuses(records)
+    session.commit()
+
+    assert session.query(BonusEntryModel).count() == len(records)
+    stored = repo.get_entry("bonus-2")
+    assert stored is not None
+    assert stored.metadata["tree_type"] == "binary"
+    assert stored.level == 2
+
+
+def test_sqlalchemy_bonus_repository_confirms_and_schedules_in_bulk(session: Session) -> None:
+    repo = SqlAlchemyBonusRepository(session)
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    repo.record_bonuses(
+        [
+            BonusEntryRecord(
+                bonus_id=f"bonus-{index}",
+                user_id=f"user-{index}",
+                source_user_id="member",
+                bonus_type="recommend",
+                order_id="order-1",
+                level=1,
+                pv_amount=Decimal("100"),
+                bonus_amount=Decimal("1"),
+                status="PENDING",
+                metadata={},
+                created_at=now,
+            )
+            for index in range(3)
+        ],
+    )
+    retry_after = now + timedelta(minutes=10)
+    repo.schedule_retries(
+        [
+            BonusRetrySchedule(bonus_id=f"bonus-{index}", retry_after=retry_after, metadata={"retry_count": 1})
+            for index in (0, 1)
+        ],
+    )
+    repo.mark_confirmed_many(["bonus-1", "bonus-2"])
+    session.commit()
+
+    assert [repo.get_entry(f"bonus-{index}").status for index in range(3)] == ["RETRY", "CONFIRMED", "CONFIRMED"]
+    candidates = repo.list_retry_candidates(now=retry_after)
+    assert [(candidate.bonus_id, candidate.retry_count) for candidate in candidates] == [("bonus-0", 1)]
+
+
+def test_sqlalchemy_organization_repository_ancestor_chains(session: Session) -> None:
+    repo = SqlAlchemyOrganizationRepository(session)
+    now = datetime.now(UTC)
+    for tree_type in ("unilevel", "binary"):
+        parent = None
+        for depth, user_id in enumerate(("root", "sponsor", "member")):
+            node_id = f"{tree_type}-{user_id}"
+            repo.create_node(
+                OrganizationNodeRecord(
+                    node_id=node_id,
+                    user_id=user_id,
+                    tree_type=tree_type,
+                    parent_node_id=parent.node_id if parent else None,
+                    sponsor_user_id=parent.user_id if parent else None,
+                    position="L" if parent and tree_type == "binary" else None,
+                    depth=depth,
+                    path=f"{parent.path if parent else ''}/{node_id}",
+                    created_at=now,
+                    updated_at=now,
+                ),
+            )
+            parent = repo.get_node(node_id)
+    session.commit()
+
+    chains = repo.get_ancestor_chains("member", tree_types=["unilevel", "binary"], max_depth=1)
+
+    assert [node.node_id for node in chains["unilevel"]] == ["unilevel-member", "unilevel-sponsor"]
+    assert [node.node_id for node in chains["binary"]] == ["binary-member", "binary-sponsor"]
+    assert repo.get_ancestor_chains("ghost", tree_types=["binary"], max_depth=5) == {}
+
+
+def test_sqlalchemy_organization_repository_lists_ancestors_and_descendants(session: Session) -> None:
+    repo = SqlAlchemyOrganizationRepository(session)
+    now = datetime.now(UTC)
+    layout = [
+        ("root", None, 0),
+        ("a", "root", 1),
+        ("b", "root", 1),
+        ("a1", "a", 2),
+        ("a2", "a", 2),
+        ("b1", "b", 2),
+    ]
+    paths: dict[str, str] = {}
+    for node_id, parent_id, depth in layout:
+        paths[node_id] = f"{paths[parent_id] if parent_id else ''}/{node_id}"
+        repo.create_node(
+            OrganizationNodeRecord(
+                node_id=node_id,
+                user_id=f"user-{node_id}",
+                tree_type="unilevel",
+                parent_node_id=parent_id,
+                sponsor_user_id=f"user-{parent_id}" if parent_id else None,
+                position=None,
+                depth=depth,
+                path=paths[node_id],
+                created_at=now,
+                updated_at=now,
+            ),
+        )
+    session.commit()
+
+    assert [node.node_id for node in repo.list_ancestors("a1", tree_type="unilevel")] == ["a", "root"]
+    assert [node.node_id for node in repo.list_ancestors("a1", tree_type="unilevel", max_depth=1)] == ["a"]
+    assert repo.list_ancestors("root", tree_type="unilevel") == []
+
+    first = repo.list_descendants("root", tree_type="unilevel", limit=3)
+    assert [node.node_id for node in first.items] == ["a", "b", "a1"]
+    assert first.next_cursor is not None
+
+    second = repo.list_descendants("root", tree_type="unilevel", limit=3, cursor=first.next_cursor)
+    assert [node.node_id for node in second.items] == ["a2", "b1"]
+    assert second.next_cursor is None
+
+    shallow = repo.list_descendants("root", tree_type="unilevel", max_depth=1)
+    assert [node.node_id for node in shallow.items] == ["a", "b"]
+
+
+def test_sqlalchemy_binary_slot_allocation_matches_breadth_first_order(session: Session) -> None:
+    def placements(repository) -> list[tuple[str, str, str | None, int]]:
+        counter = {"value": 0}
+
+        def id_factory() -> str:
+            counter["value"] += 1
+            return f"node-{counter['value']:03d}"
+
+        service = OrganizationService(repository, id_factory=id_factory, clock=lambda: datetime(2025, 1, 1, tzinfo=UTC))
+        service.create_root(tree_type=TREE_BINARY, user_id="root")
+        service.add_member(tree_type=TREE_BINARY, user_id="sponsor", sponsor_user_id="root")
+        # Fill the root's right leg first so the sponsor's downline is not the only subtree.
+        service.add_member(tree_type=TREE_BINARY, user_id="other", sponsor_user_id="root")
+        result = []
+        for index in range(20):
+            sponsor = "sponsor" if index % 3 else "root"
+            node = service.add_member(tree_type=TREE_BINARY, user_id=f"member-{index}", sponsor_user_id=sponsor)
+            result.append((node.user_id, node.parent_node_id, node.position, node.depth))
+        return result
+
+    expected = placements(InMemoryOrganizationRepository())
+    actual = placements(SqlAlchemyOrganizationRepository(session))
+
+    assert actual == expected
+
+
+def test_sqlalchemy_claim_binary_slot_reserves_and_queue_round_trip(session: Session) -> None:
+    repo = SqlAlchemyOrganizationRepository(session)
+    service = OrganizationService(
+        repo,
+        clock=lambda: datetime(2025, 1, 1, tzinfo=UTC),
+        placement_mode=PLACEMENT_CLAIM,
+    )
+    root = service.create_root(tree_type=TREE_BINARY, user_id="root")
+    session.commit()
+
+    first = repo.claim_binary_slot(root.node_id).slot
+    second = repo.claim_binary_slot(root.node_id).slot
+    assert (first.node_id, first.slot, first.status) == (root.node_id, "L", "RESERVED")
+    assert (second.node_id, second.slot) == (root.node_id, "R")
+    exhausted = repo.claim_binary_slot(root.node_id)
+    assert (exhausted.slot, exhausted.contended) == (None, False)
+    session.rollback()
+
+    placed = service.request_binary_placement(user_id="member", sponsor_user_id="root")
+    assert placed.node is not None and placed.node.position == "L"
+    assert repo.find_open_binary_slot(root.node_id).slot == "R"
+
+    repo.enqueue_binary_placement(
+        BinaryPlacementQueueRecord(
+            queue_id="queue-1",
+            sponsor_node_id=root.node_id,
+            candidate_user_id="queued",
+            status="PENDING",
+            enqueued_at=datetime(2025, 1, 1, tzinfo=UTC),
+        ),
+    )
+    session.commit()
+
+    drained = service.process_waiting_queue()
+    session.commit()
+
+    assert drained.placed == 1
+    assert repo.get_node_by_user(TREE_BINARY, "queued").position == "R"
+    assert repo.list_pending_binary_placements() == []
+
+
+def test_sqlalchemy_rollup_updates_metrics_with_binary_legs(session: Session) -> None:
+    now = datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+    organizations = SqlAlchemyOrganizationRepository(session)
+    service = OrganizationService(organizations, clock=lambda: now)
+    service.create_root(tree_type=TREE_BINARY, user_id="root")
+    service.add_member(tree_type=TREE_BINARY, user_id="left", sponsor_user_id="root")
+    service.add_member(tree_type=TREE_BINARY, user_id="right", sponsor_user_id="root")
+    service.add_member(tree_type=TREE_BINARY, user_id="right-left", sponsor_user_id="right")
+    session.commit()
+
+    entries = organizations.list_uplines(["right-left"], tree_type=TREE_BINARY)
+    legs = {(entry.distance, entry.leg) for entry in entries}
+    assert legs == {(0, None), (1, "L"), (2, "R")}
+
+    orders = SqlAlchemyOrderRepository(session)
+    orders.upsert_order(
+        OrderRecord(
+            order_id="order-1",
+            user_id="right-left",
+            total_amount=Decimal("30"),
+            pv_amount=Decimal("30"),
+            status="PAID",
+            channel="AEGMALL",
+            metadata={},
+            created_at=now,
+        ),
+    )
+    session.commit()
+    metrics = SqlAlchemyOrganizationMetricsRepository(session)
+    rollup = OrganizationRollupService(
+        orders,
+        organizations,
+        metrics,
+        clock=lambda: now + timedelta(minutes=1),
+        tree_types=(TREE_BINARY,),
+    )
+
+    assert rollup.run().orders == 1
+    assert rollup.run().orders == 0
+    session.commit()
+
+    root = organizations.get_node_by_user(TREE_BINARY, "root")
+    [record] = metrics.list_metrics(root.node_id, tree_type=TREE_BINARY, start_date=now.date(), end_date=now.date())
+    assert (record.group_volume, record.volume_left, record.volume_right) == (Decimal("30"), Decimal("0"), Decimal("30"))
+    assert metrics.get_rollup_watermark(ROLLUP_NAME).last_order_id == "order-1"
+
+
+def test_sqlalchemy_metrics_repository_summarizes_many_nodes(session: Session) -> None:
+    metrics = SqlAlchemyOrganizationMetricsRepository(session)
+    day = datetime(2025, 1, 5, tzinfo=UTC).date()
+
+    def delta(node_id: str, tree_type: str, offset: int, group: str, **volumes: str) -> OrganizationMetricDelta:
+        return OrganizationMetricDelta(
+            node_id=node_id,
+            tree_type=tree_type,
+            metric_date=day - timedelta(days=offset),
+            personal_volume=Decimal(volumes.get("personal", "0")),
+            group_volume=Decimal(group),
+            volume_left=Decimal(volumes["left"]) if "left" in volumes else None,
+            volume_right=Decimal(volumes["right"]) if "right" in volumes else None,
+            orders_count=1 if "personal" in volumes else 0,
+        )
+
+    metrics.apply_metric_deltas(
+        [
+            delta("a", "binary", 1, "8", personal="5", left="3", right="0"),
+            delta("a", "binary", 0, "6", personal="2", left="1", right="3"),
+            delta("b", "binary", 2, "4", left="4", right="0"),
+            delta("a", "unilevel", 0, "100"),
+        ],
+    )
+    session.commit()
+
+    totals = {
+        item.node_id: item
+        for item in metrics.summarize_metrics(
+            ["a", "b", "missing"],
+            tree_type="binary",
+            start_date=day - timedelta(days=6),
+            end_date=day,
+        )
+    }
+
+    assert set(totals) == {"a", "b"}
+    assert (totals["a"].personal_volume, totals["a"].group_volume, totals["a"].orders_count) == (
+        Decimal("7"),
+        Decimal("14"),
+        2,
+    )
+    assert (totals["a"].latest_group_volume, totals["a"].latest_volume_left, totals["a"].latest_volume_right) == (
+        Decimal("6"),
+        Decimal("1"),
+        Decimal("3"),
+    )
+    assert totals["b"].latest_group_volume == Decimal("0")
+    assert totals["b"].latest_volume_left is None
+
+
+def test_sqlalchemy_metric_deltas_increment_rows_another_session_changed(tmp_path) -> None:
+    engine, SessionLocal = create_engine_and_session(f"sqlite+pysqlite:///{tmp_path / 'metrics.db'}")
+    Base.metadata.create_all(engine)
+    day = datetime(2025, 1, 5, tzinfo=UTC).date()
+
+    def delta(group: str, *, left: str | None = None) -> OrganizationMetricDelta:
+        return OrganizationMetricDelta(
+            node_id="a",
+            tree_type="binary",
+            metric_date=day,
+            group_volume=Decimal(group),
+            volume_left=Decimal(left) if left is not None else None,
+            orders_count=1,
+        )
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        SqlAlchemyOrganizationMetricsRepository(first).apply_metric_deltas([delta("1", left="1")])
+        first.commit()
+        # The first session keeps the row loaded while another runner adds to it.
+        loaded = first.get(OrganizationMetricsDailyModel, (day, "a", "binary"))
+        assert loaded is not None
+        SqlAlchemyOrganizationMetricsRepository(second).apply_metric_deltas([delta("2")])
+        second.commit()
+
+        SqlAlchemyOrganizationMetricsRepository(first).apply_metric_deltas([delta("4"), delta("8", left="2")])
+        first.commit()
+
+        row = second.get(OrganizationMetricsDailyModel, (day, "a", "binary"), populate_existing=True)
+        assert (row.group_volume, row.volume_left, row.orders_count) == (Decimal("15"), Decimal("3"), 4)
+    finally:
+        first.close()
+        second.close()
+        engine.dispose()
+
+
+def test_sqlalchemy_session_repository_revocation(session: Session) -> None:
+    repo = SqlAlchemySessionRepository(session)
+    now = 1_000.0
+    for token, expires_at in (("live", now + 60), ("stale", now - 60), ("kept", now + 60)):
+        repo.create_session(SessionRecord(token=token, user_id="user-1", roles=("member",), expires_at=expires_at))
+    session.flush()
+
+    assert repo.revoke_session("live") is True
+    assert repo.revoke_session("live") is False
+    assert repo.revoke_session("missing") is False
+    repo.revoke_session("stale")
+
+    assert repo.get_session("live") is None
+    assert repo.get_session("kept") is not None
+    assert repo.list_revoked_tokens(now=now) == ["live"]
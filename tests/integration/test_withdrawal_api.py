@@ -164,3 +164,124 @@ def test_approve_withdrawal_failure_returns_502(test_client):
     assert notifier.messages
     stored = _get_withdrawal(container, request_id)
     assert stored.status == "failed"
+
+
+def test_list_withdrawals_pages_pending_queue(test_client):
+    client, container, _, _ = test_client
+    seeded = sorted(
+        _seed_withdrawal(container, amount=Decimal("10"), metadata={"coin": "PEP"})[0] for _ in range(3)
+    )
+    _seed_session(container, "admin-token", ("admin",))
+    _seed_session(container, "member-token", ("member",))
+    headers = {"Authorization": "Bearer admin-token"}
+
+    first = client.get("/admin/withdrawals", params={"limit": 2}, headers=headers)
+    assert first.status_code == 200
+    first_page = first.json()
+    assert [item["request_id"] for item in first_page["items"]] == seeded[:2]
+    assert first_page["items"][0]["created_at"].startswith("2025-01-01")
+
+    second = client.get(
+        "/admin/withdrawals",
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+        headers=headers,
+    ).json()
+    assert [item["request_id"] for item in second["items"]] == seeded[2:]
+    assert second["next_cursor"] is None
+
+    approved = client.get("/admin/withdrawals", params={"status": "approved"}, headers=headers).json()
+    assert approved["items"] == []
+    older = client.get(
+        "/admin/withdrawals",
+        params={"created_before": "2024-12-31T00:00:00+00:00"},
+        headers=headers,
+    ).json()
+    assert older["items"] == []
+
+    assert client.get("/admin/withdrawals", params={"cursor": "bogus"}, headers=headers).status_code == 400
+    assert client.get("/admin/withdrawals", params={"limit": 0}, headers=headers).status_code == 400
+    assert client.get("/admin/withdrawals", headers={"Authorization": "Bearer member-token"}).status_code == 403
+
+
+def test_batch_approve_shares_one_client(test_client):
+    client, container, notifier, clients = test_client
+    request_ids = [
+        _seed_withdrawal(container, amount=Decimal(amount), metadata={"provider": "hashdam", "coin": "PEP"})[0]
+        for amount in ("10", "20")
+    ]
+    _seed_session(container, "admin-token", ("admin",))
+    headers = {"Authorization": "Bearer admin-token"}
+
+    stage1 = client.post(
+        "/admin/withdrawals/approve",
+        headers=headers,
+        json={"request_ids": request_ids, "approved_by": "admin-1", "finalize": False},
+    )
+    assert stage1.status_code == 200
+    assert [item["withdrawal"]["status"] for item in stage1.json()["results"]] == ["approved_pending"] * 2
+
+    response = client.post(
+        "/admin/withdrawals/approve",
+        headers=headers,
+        json={"request_ids": [*request_ids, "missing"], "approved_by": "admin-2"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["request_id"] for item in results] == [*request_ids, "missing"]
+    assert [item["withdrawal"]["status"] for item in results[:2]] == ["approved", "approved"]
+    assert results[2]["withdrawal"] is None and results[2]["error"]
+    assert sorted(clients[-1].calls) == [("PEP", Decimal("10")), ("PEP", Decimal("20"))]
+    assert len(clients) == 2  # one client per batch, not per request
+    assert all(_get_withdrawal(container, request_id).status == "approved" for request_id in request_ids)
+    assert not notifier.messages
+
+    too_many = {"request_ids": ["x"] * 101, "approved_by": "admin-2"}
+    assert client.post("/admin/withdrawals/approve", headers=headers, json=too_many).status_code == 400
+
+
+def test_batch_approve_keeps_submitted_withdrawals_when_recording_fails(test_client, monkeypatch):
+    client, container, _, clients = test_client
+    request_ids = [
+        _seed_withdrawal(container, amount=Decimal(amount), metadata={"provider": "hashdam", "coin": "PEP"})[0]
+        for amount in ("10", "20")
+    ]
+    _seed_session(container, "admin-token", ("admin",))
+    headers = {"Authorization": "Bearer admin-token"}
+    client.post(
+        "/admin/withdrawals/approve",
+        headers=headers,
+        json={"request_ids": request_ids, "approved_by": "admin-1", "finalize": False},
+    )
+    annotate = PointWalletService.annotate_withdrawal
+
+    def flaky_annotate(self, request_id, metadata):
+        if request_id == request_ids[0]:
+            raise RuntimeError("database went away")
+        return annotate(self, request_id, metadata)
+
+    monkeypatch.setattr(PointWalletService, "annotate_withdrawal", flaky_annotate)
+
+    response = client.post(
+        "/admin/withdrawals/approve",
+        headers=headers,
+        json={"request_ids": request_ids, "approved_by": "admin-2"},
+    )
+
+    assert response.status_code == 200
+    first, second = response.json()["results"]
+    assert first["error"] and first["withdrawal"]["status"] == "approved"
+    assert second["error"] is None
+    assert len(clients[-1].calls) == 2
+    stored = [_get_withdrawal(container, request_id) for request_id in request_ids]
+    assert [snapshot.status for snapshot in stored] == ["approved", "approved"]
+    assert "hashdam_withdraw_id" not in (stored[0].metadata or {})
+    assert stored[1].metadata["hashdam_withdraw_id"] == "hashdam-1"
+
+    retry = client.post(
+        "/admin/withdrawals/approve",
+        headers=headers,
+        json={"request_ids": request_ids[:1], "approved_by": "admin-3"},
+    )
+    assert retry.json()["results"][0]["error"]
+    assert len(clients[-1].calls) == 0
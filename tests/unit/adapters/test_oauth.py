@@ -1,12 +1,19 @@
 import base64
 import json
+import time
 from typing import Any, Dict
 
+import anyio
+import httpx
 import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from aeghash.adapters.oauth import (
     AppleOAuthClient,
+    AsyncOAuthHTTPTransport,
     GoogleOAuthClient,
+    JwksCache,
     KakaoOAuthClient,
     OAuthError,
     OAuthResult,
@@ -160,3 +167,174 @@ def test_missing_profile_endpoint_raises_error() -> None:
 
     with pytest.raises(OAuthError):
         client.authenticate(code="auth-code")
+
+
+class AsyncStubTransport:
+    def __init__(self, *, post_responses: Dict[str, Dict[str, Any]], get_responses: Dict[str, Dict[str, Any]]) -> None:
+        self._post = post_responses
+        self._get = get_responses
+        self.calls: list[tuple[str, str]] = []
+
+    async def post(self, url: str, data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        self.calls.append(("post", url))
+        return dict(self._post[url])
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        self.calls.append(("get", url))
+        return dict(self._get[url])
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _make_signed_jwt(key: rsa.RSAPrivateKey, kid: str, claims: Dict[str, Any]) -> str:
+    header = _b64(json.dumps({"alg": "RS256", "kid": kid}).encode("utf-8"))
+    body = _b64(json.dumps(claims).encode("utf-8"))
+    signature = key.sign(f"{header}.{body}".encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+    return f"{header}.{body}.{_b64(signature)}"
+
+
+def _jwk(key: rsa.RSAPrivateKey, kid: str) -> Dict[str, Any]:
+    numbers = key.public_key().public_numbers()
+    return {
+        "kty": "RSA",
+        "kid": kid,
+        "alg": "RS256",
+        "n": _b64(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")),
+        "e": _b64(numbers.e.to_bytes(3, "big")),
+    }
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _google_claims(**overrides: Any) -> Dict[str, Any]:
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": "client-id",
+        "sub": "user-1",
+        "email": "user@example.com",
+        "name": "User Example",
+        "exp": time.time() + 300,
+    }
+    claims.update(overrides)
+    return claims
+
+
+def _google_async_client(id_token: str, jwks_keys: list[Dict[str, Any]]) -> tuple[GoogleOAuthClient, AsyncStubTransport]:
+    transport = AsyncStubTransport(
+        post_responses={GoogleOAuthClient.token_endpoint: {"access_token": "token123", "id_token": id_token}},
+        get_responses={GoogleOAuthClient.jwks_url: {"keys": jwks_keys}},
+    )
+    client = GoogleOAuthClient(
+        transport=StubTransport(post_responses={}),
+        settings=make_settings(),
+        async_transport=transport,
+        jwks=JwksCache(transport, GoogleOAuthClient.jwks_url),
+    )
+    return client, transport
+
+
+def test_async_google_oauth_verifies_id_token_without_userinfo_call(signing_key) -> None:
+    id_token = _make_signed_jwt(signing_key, "kid-1", _google_claims())
+    client, transport = _google_async_client(id_token, [_jwk(signing_key, "kid-1")])
+
+    async def run() -> list[OAuthResult]:
+        return [await client.authenticate_async(code="auth-code") for _ in range(2)]
+
+    results = anyio.run(run)
+
+    assert [result.profile.subject for result in results] == ["user-1", "user-1"]
+    assert results[0].profile.email == "user@example.com"
+    # One JWKS fetch serves both logins; the userinfo endpoint is never called.
+    assert transport.calls.count(("get", GoogleOAuthClient.jwks_url)) == 1
+    assert ("get", GoogleOAuthClient.profile_endpoint) not in transport.calls
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        _google_claims(aud="other-client"),
+        _google_claims(iss="https://evil.example.com"),
+        _google_claims(exp=time.time() - 3600),
+    ],
+)
+def test_async_google_oauth_rejects_untrusted_claims(signing_key, claims) -> None:
+    id_token = _make_signed_jwt(signing_key, "kid-1", claims)
+    client, _ = _google_async_client(id_token, [_jwk(signing_key, "kid-1")])
+
+    with pytest.raises(OAuthError):
+        anyio.run(lambda: client.authenticate_async(code="auth-code"))
+
+
+def test_async_google_oauth_rejects_tampered_signature(signing_key) -> None:
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    id_token = _make_signed_jwt(other_key, "kid-1", _google_claims())
+    client, _ = _google_async_client(id_token, [_jwk(signing_key, "kid-1")])
+
+    with pytest.raises(OAuthError):
+        anyio.run(lambda: client.authenticate_async(code="auth-code"))
+
+
+def test_jwks_cache_refreshes_for_unknown_kid_and_ahead_of_expiry(signing_key) -> None:
+    now = [1000.0]
+    transport = AsyncStubTransport(post_responses={}, get_responses={"https://jwks": {"keys": []}})
+    cache = JwksCache(
+        transport,
+        "https://jwks",
+        ttl_seconds=100,
+        refresh_ahead_seconds=20,
+        min_refresh_interval_seconds=10,
+        clock=lambda: now[0],
+    )
+
+    async def run() -> None:
+        with pytest.raises(OAuthError):
+            await cache.get_key("kid-1")
+        transport._get["https://jwks"] = {"keys": [_jwk(signing_key, "kid-1")]}
+        # Still within the refresh interval, so the unknown kid is not refetched yet.
+        with pytest.raises(OAuthError):
+            await cache.get_key("kid-1")
+        now[0] += 10
+        assert await cache.get_key("kid-1") is not None
+        now[0] += 85
+        assert await cache.get_key("kid-1") is not None
+        await anyio.sleep(0.01)
+
+    anyio.run(run)
+
+    assert len(transport.calls) == 3
+
+
+def test_async_http_transport_caps_concurrency_per_host() -> None:
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await anyio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    async def run() -> None:
+        transport = AsyncOAuthHTTPTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            per_host_limit=2,
+        )
+        async with anyio.create_task_group() as group:
+            for _ in range(5):
+                group.start_soon(transport.get, "https://a.example/keys", {})
+                group.start_soon(transport.post, "https://b.example/token", {}, {})
+        await transport.aclose()
+
+    anyio.run(run)
+
+    assert peak == {"a.example": 2, "b.example": 2}
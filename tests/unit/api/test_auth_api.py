@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional
 
+import anyio
 import pytest
 from sqlalchemy import text
 
@@ -273,3 +274,57 @@ def test_authentication_api_from_container_enforces_two_factor() -> None:
     assert success.requires_two_factor is False
 
     session_manager.dispose()
+
+
+class AsyncStubAuthService(StubAuthService):
+    def __init__(self, profile: OAuthProfile) -> None:
+        super().__init__(profile)
+        self.async_calls: list[tuple[str, str]] = []
+
+    def authenticate(self, *, provider: str, code: str) -> OAuthResult:  # pragma: no cover - must not be used
+        raise AssertionError("sync exchange used with an async transport")
+
+    async def authenticate_async(self, *, provider: str, code: str) -> OAuthResult:
+        self.async_calls.append((provider, code))
+        return self._result
+
+
+def test_authentication_api_awaits_provider_exchange_with_async_transport() -> None:
+    verifier = StubTurnstileVerifier()
+    profile = OAuthProfile(provider="google", subject="subject-1", email=None, name=None, raw={})
+    auth_service = AsyncStubAuthService(profile)
+    container = ServiceContainer(
+        settings=StubSettings(),  # type: ignore[arg-type]
+        session_manager=StubSessionManager(),
+        auth_service=auth_service,  # type: ignore[arg-type]
+        turnstile_verifier=verifier,
+        oauth_transport=object(),  # type: ignore[arg-type]
+    )
+    session_repo = StubSessionRepository()
+    api = AuthenticationAPI(
+        container,
+        user_repository_factory=lambda _session: StubUserRepository(),
+        session_repository_factory=lambda _session: session_repo,
+    )
+    offloaded: list[str] = []
+
+    async def offload(func, *args, **kwargs):
+        offloaded.append(func.__name__)
+        return func(*args, **kwargs)
+
+    payload = OAuthCallbackPayload(
+        provider="google",
+        code="auth-code",
+        state="abc",
+        expected_state="abc",
+        turnstile_token="turn-token",
+    )
+
+    result = anyio.run(lambda: api.authenticate_async(payload, remote_ip="1.1.1.1", offload=offload))
+
+    assert result.success is True
+    assert auth_service.async_calls == [("google", "auth-code")]
+    assert offloaded == ["_validate", "_complete"]
+    assert verifier.calls == [("turn-token", "1.1.1.1")]
+    assert len(session_repo.records) == 1
+
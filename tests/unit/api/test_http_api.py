@@ -1,20 +1,26 @@
 from datetime import UTC, datetime
+import threading
 import time
 
+import anyio
+import httpx
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import text
 
 from aeghash.adapters.oauth import OAuthProfile, OAuthResult, OAuthToken
+from aeghash.adapters.turnstile import AsyncTurnstileClient, TurnstileClient
 from aeghash.api.auth import OAuthCallbackPayload
 from aeghash.api.http import create_http_app
 from aeghash.application import Application, shutdown_application
 from aeghash.core.auth_flow import AuthenticationResult
 from aeghash.core.auth_service import AuthService
 from aeghash.core.repositories import SessionRecord, UserAccountRecord, UserRecord
+from aeghash.core.turnstile import TurnstileVerifier
 from aeghash.core.two_factor import TwoFactorService
 from aeghash.infrastructure.audit import LoginAuditLogger
-from aeghash.infrastructure.bootstrap import ServiceContainer
+from aeghash.infrastructure.bootstrap import ServiceContainer, load_revoked_session_tokens
 from aeghash.infrastructure.database import Base
 from aeghash.infrastructure.repositories import (
     SqlAlchemyLoginAuditRepository,
@@ -25,8 +31,11 @@ from aeghash.infrastructure.repositories import (
     UserIdentityModel,
 )
 from aeghash.infrastructure.session import SessionManager
-from aeghash.security.passwords import hash_password
-from aeghash.utils import totp
+from aeghash.security.access import AccessContextCache
+from aeghash.security.session_tokens import SessionRevocationList, SessionTokenSigner
+from aeghash.security.passwords import PasswordCostProfile, PasswordHash, PasswordHasher, hash_password
+from aeghash.security.rate_limit import LOGIN_EMAIL, RateLimiter, RateLimitRule
+from aeghash.utils import TTLCache, totp
 from aeghash.utils.observability import AuthMetricCollector
 from aeghash.config import (
     AppSettings,
@@ -54,6 +63,9 @@ class StubAuthenticationAPI:
             raise self._result
         return self._result
 
+    async def authenticate_async(self, payload: OAuthCallbackPayload, *, remote_ip: str | None = None, offload):
+        return await offload(self.authenticate, payload, remote_ip=remote_ip)
+
 
 def make_success_result() -> AuthenticationResult:
     return AuthenticationResult(
@@ -93,6 +105,49 @@ def test_oauth_callback_returns_result_and_invokes_api() -> None:
     assert stub.calls[0][1] == "testclient"
 
 
+class BarrierAuthenticationAPI:
+    """Blocks each call until ``parties`` calls are in flight at the same time."""
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = threading.Barrier(parties, timeout=5)
+
+    def authenticate(self, payload: OAuthCallbackPayload, *, remote_ip: str | None = None) -> AuthenticationResult:
+        self._barrier.wait()
+        return make_success_result()
+
+    async def authenticate_async(self, payload: OAuthCallbackPayload, *, remote_ip: str | None = None, offload):
+        return await offload(self.authenticate, payload, remote_ip=remote_ip)
+
+
+def test_handlers_offload_blocking_calls_off_the_event_loop() -> None:
+    app = create_http_app(shutdown_on_exit=False, blocking_workers=4)
+    app.state.auth_api = BarrierAuthenticationAPI(parties=3)
+    body = {"provider": "google", "code": "auth-code", "state": "s", "expected_state": "s"}
+    statuses: list[int] = []
+
+    async def call(client: httpx.AsyncClient) -> None:
+        response = await client.post("/oauth/callback", json=body)
+        statuses.append(response.status_code)
+
+    async def run() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            async with anyio.create_task_group() as group:
+                for _ in range(3):
+                    group.start_soon(call, client)
+
+    # A handler blocking the loop would leave the barrier short of parties and time out.
+    anyio.run(run)
+    shutdown_application(app.state.application)
+
+    assert statuses == [200, 200, 200]
+
+
+def test_create_http_app_rejects_non_positive_blocking_workers() -> None:
+    with pytest.raises(ValueError):
+        create_http_app(shutdown_on_exit=False, blocking_workers=0)
+
+
 def test_oauth_callback_propagates_value_error_as_400() -> None:
     app = create_http_app(shutdown_on_exit=False)
     stub = StubAuthenticationAPI(ValueError("invalid turnstile token"))
@@ -401,6 +456,36 @@ def test_signup_requires_turnstile_token(tmp_path) -> None:
     assert verifier.calls == []
 
 
+def test_password_login_maps_turnstile_transport_errors_without_retrying(tmp_path) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'login_turn_down.db'}"
+    application, _ = _build_application_for_signup(db_url)
+    calls: list[str] = []
+
+    def unreachable(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ConnectError("cloudflare unreachable", request=request)
+
+    transport = httpx.MockTransport(unreachable)
+    application.container.turnstile_verifier = TurnstileVerifier(
+        TurnstileClient(secret_key="secret", transport=httpx.Client(transport=transport)),
+        async_client=AsyncTurnstileClient(secret_key="secret", client=httpx.AsyncClient(transport=transport)),
+        cache=TTLCache(),
+    )
+    app = create_http_app(application=application, shutdown_on_exit=False)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/login/password",
+            json={"email": "user@example.com", "password": "strong-password", "turnstile_token": "turn-login"},
+        )
+
+    shutdown_application(app.state.application)
+
+    assert response.status_code == 503
+    assert response.json()["detail"] == "turnstile_unavailable"
+    assert len(calls) == 1
+
+
 def test_password_login_endpoint(tmp_path) -> None:
     db_path = tmp_path / "login.db"
     db_url = f"sqlite+pysqlite:///{db_path}"
@@ -451,6 +536,31 @@ def test_password_login_endpoint(tmp_path) -> None:
     assert verifier.calls == [("turn-login", "testclient")]
 
 
+def test_password_login_upgrades_hash_on_the_container_hasher(tmp_path) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'login_rehash.db'}"
+    application, _ = _build_application_for_signup(db_url)
+    _seed_local_account(application, email="user@example.com", password="strong-password")
+    application.container.password_hasher = PasswordHasher(
+        max_workers=1,
+        profile=PasswordCostProfile(iterations=1_000),
+    )
+    app = create_http_app(application=application, shutdown_on_exit=False)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/login/password",
+            json={"email": "user@example.com", "password": "strong-password", "turnstile_token": "turn-login"},
+        )
+
+    with application.container.session_manager.session_scope() as session:
+        stored = SqlAlchemyUserAccountRepository(session).find_by_email("user@example.com").password_hash
+    shutdown_application(app.state.application)
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert PasswordHash.deserialize(stored).iterations == 1_000
+
+
 def test_password_login_requires_turnstile_token(tmp_path) -> None:
     db_path = tmp_path / "login_turn_missing.db"
     db_url = f"sqlite+pysqlite:///{db_path}"
@@ -472,6 +582,29 @@ def test_password_login_requires_turnstile_token(tmp_path) -> None:
     assert verifier.calls == []
 
 
+def test_password_login_is_rate_limited_per_email_before_any_work(tmp_path) -> None:
+    db_path = tmp_path / "login_rate_limit.db"
+    db_url = f"sqlite+pysqlite:///{db_path}"
+    application, verifier = _build_application_for_signup(db_url)
+    _seed_local_account(application, email="user@example.com", password="strong-password")
+    application.container.rate_limiter = RateLimiter(rules={LOGIN_EMAIL: RateLimitRule(limit=2, window_seconds=60)})
+
+    app = create_http_app(application=application, shutdown_on_exit=False)
+    body = {"email": "User@Example.com", "password": "wrong-password", "turnstile_token": "turn-login"}
+
+    with TestClient(app) as client:
+        statuses = [client.post("/login/password", json=body).status_code for _ in range(3)]
+        limited = client.post("/login/password", json=body)
+
+    shutdown_application(app.state.application)
+
+    assert statuses == [400, 400, 429]
+    assert limited.status_code == 429
+    assert int(limited.headers["Retry-After"]) >= 1
+    # Rejected attempts never reach Turnstile or the password check.
+    assert len(verifier.calls) == 2
+
+
 def test_audit_endpoint_requires_permission(tmp_path) -> None:
     db_path = tmp_path / "audit_auth.db"
     db_url = f"sqlite+pysqlite:///{db_path}"
@@ -500,6 +633,70 @@ def test_audit_endpoint_requires_permission(tmp_path) -> None:
     assert forbidden.json()["detail"] == "forbidden"
 
 
+def test_require_access_serves_repeat_requests_from_access_cache(tmp_path) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'access_cache.db'}"
+    application, _ = _build_application_for_signup(db_url)
+    application.container.access_cache = AccessContextCache()
+
+    manager = application.container.session_manager
+    with manager.session_scope() as session:
+        SqlAlchemySessionRepository(session).create_session(
+            SessionRecord(token="admin-token", user_id="admin-1", roles=("admin",), expires_at=time.time() + 3600),
+        )
+
+    app = create_http_app(application=application, shutdown_on_exit=False)
+    headers = {"Authorization": "Bearer admin-token"}
+
+    with TestClient(app) as client:
+        first = client.get("/admin/users/user-123/two_factor", headers=headers)
+        with manager.session_scope() as session:
+            session.execute(text("DELETE FROM auth_sessions"))
+        cached = client.get("/admin/users/user-123/two_factor", headers=headers)
+        application.container.access_cache.revoke("admin-token")
+        revoked = client.get("/admin/users/user-123/two_factor", headers=headers)
+
+    shutdown_application(app.state.application)
+
+    assert first.status_code == 200
+    assert cached.status_code == 200
+    assert revoked.status_code == 401
+
+
+def test_signed_session_tokens_skip_session_reads_and_honour_logout(tmp_path) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'signed_sessions.db'}"
+    application, _ = _build_application_for_signup(db_url)
+    _seed_local_account(application, email="admin@example.com", password="strong-password", roles=("admin",))
+    container = application.container
+    container.session_signer = SessionTokenSigner("dev-secret")
+    container.session_revocations = SessionRevocationList(
+        lambda: load_revoked_session_tokens(container.session_manager),
+    )
+
+    app = create_http_app(application=application, shutdown_on_exit=False)
+
+    with TestClient(app) as client:
+        login = client.post(
+            "/login/password",
+            json={"email": "admin@example.com", "password": "strong-password", "turnstile_token": "turn"},
+        )
+        token = login.json()["session_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        allowed = client.get("/admin/users/user-123/two_factor", headers=headers)
+        logout = client.post("/logout", headers=headers)
+        revoked = client.get("/admin/users/user-123/two_factor", headers=headers)
+        tampered = client.get("/admin/users/user-123/two_factor", headers={"Authorization": f"Bearer {token}x"})
+
+    shutdown_application(app.state.application)
+
+    assert SessionTokenSigner.is_signed(token)
+    assert allowed.status_code == 200
+    assert logout.status_code == 204
+    assert revoked.status_code == 401
+    assert tampered.status_code == 401
+    with container.session_manager.session_scope() as session:
+        assert len(SqlAlchemySessionRepository(session).list_revoked_tokens(now=time.time())) == 1
+
+
 def test_password_login_two_factor_flow(tmp_path) -> None:
     db_path = tmp_path / "login_2fa.db"
     db_url = f"sqlite+pysqlite:///{db_path}"
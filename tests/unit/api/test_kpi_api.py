@@ -8,8 +8,8 @@ from typing import Sequence
 import pytest
 from fastapi import HTTPException
 
-from aeghash.api.kpi import OrganizationKpiAPI, serialize_summary
-from aeghash.core.organization_kpi import DailyKpiSnapshot, KpiSummary
+from aeghash.api.kpi import OrganizationKpiAPI, serialize_compact_summary, serialize_summary
+from aeghash.core.organization_kpi import DailyKpiSnapshot, KpiSummary, KpiSummaryCache
 from aeghash.core.repositories import (
     OrganizationKpiRecord,
     OrganizationMetricsRepository,
@@ -18,6 +18,7 @@ from aeghash.core.repositories import (
 )
 from aeghash.security.access import AccessContext
 from aeghash.utils import NotificationMessage
+from aeghash.utils.memory_repositories import InMemoryOrganizationMetricsRepository, InMemoryOrganizationRepository
 
 
 class StubSessionManager:
@@ -84,6 +85,13 @@ class StubOrganizationRepo:
     def is_descendant(self, *, ancestor_node_id: str, descendant_node_id: str, tree_type: str) -> bool:
         return (ancestor_node_id, descendant_node_id, tree_type) in self._relations
 
+    def list_ancestors(self, node_id: str, *, tree_type: str, max_depth: int | None = None) -> list[OrganizationNodeRecord]:
+        return [
+            self._nodes[ancestor]
+            for ancestor, descendant, relation_tree in sorted(self._relations)
+            if descendant == node_id and relation_tree == tree_type and ancestor in self._nodes
+        ]
+
 
 def make_record(
     metric_date: date,
@@ -312,3 +320,91 @@ def test_kpi_api_emits_monitoring_alerts_when_below_threshold() -> None:
 
     assert notifier.messages
     assert "personal_volume" in notifier.messages[0].body
+
+
+def _batch_api(records: Sequence[OrganizationKpiRecord], nodes: Sequence[OrganizationNodeRecord]) -> OrganizationKpiAPI:
+    metrics_repo = InMemoryOrganizationMetricsRepository()
+    for record in records:
+        metrics_repo.metrics[(record.node_id, record.tree_type, record.metric_date)] = record
+    org_repo = InMemoryOrganizationRepository()
+    for node in nodes:
+        org_repo.create_node(node)
+    return OrganizationKpiAPI(
+        StubContainer(),
+        repository_factory=lambda _session: metrics_repo,
+        organization_repo_factory=lambda _session: org_repo,
+    )
+
+
+def test_kpi_api_returns_compact_summaries_for_many_nodes() -> None:
+    today = date.today()
+    api = _batch_api(
+        [
+            make_record(today - timedelta(days=1), "5", "15", 2, node_id="node-1"),
+            make_record(today, "10", "20", 3, node_id="node-1"),
+            make_record(today - timedelta(days=30), "99", "99", 9, node_id="node-2"),
+        ],
+        [],
+    )
+
+    summaries = api.get_summaries(["node-2", "node-1", "node-2"], "binary", days=7)
+
+    assert [summary.node_id for summary in summaries] == ["node-2", "node-1"]
+    assert summaries[0].total_orders == 0
+    assert summaries[1].total_personal_volume == Decimal("15")
+    assert summaries[1].latest_group_volume == Decimal("20")
+    payload = serialize_compact_summary(summaries[1])
+    assert payload["totals"] == {"personal_volume": "15", "group_volume": "35", "orders": 5}
+    assert "daily" not in payload
+
+
+def test_kpi_api_batch_enforces_downline_access() -> None:
+    owner = make_node("node-1", user_id="user-1")
+    owner.path = "/node-1"
+    child = make_node("node-2", user_id="user-2")
+    child.path = "/node-1/node-2"
+    outsider = make_node("node-3", user_id="user-3")
+    outsider.path = "/node-3"
+    api = _batch_api([], [owner, child, outsider])
+    access = AccessContext.from_session(
+        SessionRecord(token="tok", user_id="user-1", roles=("support",), expires_at=0.0),
+    )
+
+    assert len(api.get_summaries(["node-1", "node-2"], "binary", access=access)) == 2
+    with pytest.raises(HTTPException) as excinfo:
+        api.get_summaries(["node-2", "node-3"], "binary", access=access)
+    assert excinfo.value.status_code == 403
+    with pytest.raises(HTTPException) as excinfo:
+        api.get_summaries([], "binary")
+    assert excinfo.value.status_code == 400
+
+
+class CountingMetricsRepo(StubMetricsRepo):
+    def __init__(self, records: Sequence[OrganizationKpiRecord]) -> None:
+        super().__init__(records)
+        self.calls = 0
+
+    def list_metrics(self, node_id: str, *, tree_type: str, start_date: date, end_date: date):
+        self.calls += 1
+        return super().list_metrics(node_id, tree_type=tree_type, start_date=start_date, end_date=end_date)
+
+
+def test_kpi_api_caches_serialized_summary_until_invalidated() -> None:
+    today = date.today()
+    repo = CountingMetricsRepo([make_record(today, "10", "20", 3)])
+    cache = KpiSummaryCache()
+    api = OrganizationKpiAPI(StubContainer(), repository_factory=lambda _session: repo, cache=cache)
+
+    first = api.get_summary_payload("node-1", "binary")
+    second = api.get_summary_payload("node-1", "binary")
+
+    assert first is second
+    assert repo.calls == 1
+    assert api.get_summary_payload("node-1", "binary", days=3) is not first
+    assert repo.calls == 2
+
+    cache.invalidate("node-1", "binary")
+    refreshed = api.get_summary_payload("node-1", "binary")
+
+    assert refreshed == first and refreshed is not first
+    assert repo.calls == 3
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import HTTPException
+
+from aeghash.api.organization import OrganizationTreeAPI
+from aeghash.core.organization import TREE_UNILEVEL, OrganizationService
+from aeghash.core.repositories import SessionRecord
+from aeghash.security.access import AccessContext
+from aeghash.utils.memory_repositories import InMemoryOrganizationRepository
+
+
+class StubSessionManager:
+    @contextmanager
+    def session_scope(self):
+        yield object()
+
+
+class StubContainer:
+    def __init__(self) -> None:
+        self.session_manager = StubSessionManager()
+
+
+@pytest.fixture()
+def repository() -> InMemoryOrganizationRepository:
+    repository = InMemoryOrganizationRepository()
+    counter = {"value": 0}
+
+    def id_factory() -> str:
+        counter["value"] += 1
+        return f"node-{counter['value']}"
+
+    service = OrganizationService(repository, id_factory=id_factory, clock=lambda: datetime(2025, 1, 1, tzinfo=UTC))
+    service.create_root(tree_type=TREE_UNILEVEL, user_id="root")
+    service.add_member(tree_type=TREE_UNILEVEL, user_id="leader", sponsor_user_id="root")
+    service.add_member(tree_type=TREE_UNILEVEL, user_id="member", sponsor_user_id="leader")
+    service.add_member(tree_type=TREE_UNILEVEL, user_id="buyer", sponsor_user_id="member")
+    return repository
+
+
+def _access(user_id: str, *roles: str) -> AccessContext:
+    return AccessContext.from_session(SessionRecord(token="t", user_id=user_id, roles=roles, expires_at=0))
+
+
+def _api(repository: InMemoryOrganizationRepository) -> OrganizationTreeAPI:
+    return OrganizationTreeAPI(StubContainer(), organization_repo_factory=lambda _session: repository)
+
+
+def _ancestor_users(api: OrganizationTreeAPI, repository, user_id: str, access: AccessContext) -> list[str]:
+    node = repository.get_node_by_user(TREE_UNILEVEL, user_id)
+    return [ancestor.user_id for ancestor in api.list_ancestors(node.node_id, TREE_UNILEVEL, access=access)]
+
+
+def test_scoped_callers_see_the_upline_only_up_to_their_scope_root(repository) -> None:
+    api = _api(repository)
+    leader = repository.get_node_by_user(TREE_UNILEVEL, "leader")
+
+    scoped = _access("support-1", "support", f"scope:kpi:node:{leader.node_id}")
+    owner = _access("member", "support")
+    admin = _access("admin-1", "admin")
+
+    assert _ancestor_users(api, repository, "buyer", scoped) == ["member", "leader"]
+    assert _ancestor_users(api, repository, "buyer", owner) == ["member"]
+    assert _ancestor_users(api, repository, "member", owner) == []
+    assert _ancestor_users(api, repository, "buyer", admin) == ["member", "leader", "root"]
+
+
+def test_list_ancestors_rejects_non_positive_depth(repository) -> None:
+    buyer = repository.get_node_by_user(TREE_UNILEVEL, "buyer")
+
+    with pytest.raises(HTTPException) as excinfo:
+        _api(repository).list_ancestors(buyer.node_id, TREE_UNILEVEL, max_depth=0)
+
+    assert excinfo.value.detail == "invalid_depth"
@@ -222,3 +222,79 @@ def test_pipeline_failure_marks_idempotency_failed(clock_now: datetime) -> None:
 
     record = idempotency.get(key="idem-fail", scope="aegmall:user-1")
     assert record is not None and record.status == "FAILED"
+
+
+class SelectiveFailingPipeline(StubBonusPipeline):
+    def __init__(self, responses: list[BonusEntryRecord], failing_order_ids: set[str]) -> None:
+        super().__init__(responses)
+        self.failing_order_ids = failing_order_ids
+
+    def process_order(self, event: OrderEvent):
+        if event.order_id in self.failing_order_ids:
+            raise RuntimeError("pipeline unavailable")
+        return super().process_order(event)
+
+
+def _payload(order_id: str, key: str, *, total: str = "200") -> AegmallOrderPayload:
+    return AegmallOrderPayload(
+        order_id=order_id,
+        user_id="user-1",
+        total_amount=Decimal(total),
+        pv_amount=Decimal("100"),
+        channel="ONLINE",
+        metadata={"source": "test"},
+        idempotency_key=key,
+    )
+
+
+def test_process_orders_reports_outcome_per_order(clock_now: datetime) -> None:
+    orders = InMemoryOrderRepository()
+    idempotency = InMemoryIdempotencyRepository()
+    pipeline = SelectiveFailingPipeline([sample_bonus("order-1", clock_now)], failing_order_ids={"order-4"})
+    service = AegmallOrderService(
+        order_repository=orders,
+        idempotency_repository=idempotency,
+        bonus_pipeline=pipeline,
+        retry_config=RetryConfig(attempts=1),
+        clock=lambda: clock_now,
+    )
+    service.process_order(_payload("order-0", "idem-0"))
+
+    outcomes = service.process_orders(
+        [
+            _payload("order-0", "idem-0"),
+            _payload("order-1", "idem-1"),
+            _payload("order-1", "idem-1"),
+            _payload("order-1", "idem-1", total="999"),
+            _payload("order-4", "idem-4"),
+        ],
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["duplicate", "created", "duplicate", "conflict", "failed"]
+    assert outcomes[1].bonuses and outcomes[1].bonuses[0].bonus_id == "bonus-1"
+    assert outcomes[4].error == "pipeline unavailable"
+    assert set(orders.orders) == {"order-0", "order-1"}
+    assert idempotency.get(key="idem-1", scope="aegmall:user-1").status == "SUCCEEDED"
+    assert idempotency.get(key="idem-4", scope="aegmall:user-1").status == "FAILED"
+    assert [event.order_id for event in pipeline.calls] == ["order-0", "order-1"]
+
+
+def test_process_orders_retries_previously_failed_keys(clock_now: datetime) -> None:
+    orders = InMemoryOrderRepository()
+    idempotency = InMemoryIdempotencyRepository()
+    pipeline = SelectiveFailingPipeline([], failing_order_ids={"order-1"})
+    service = AegmallOrderService(
+        order_repository=orders,
+        idempotency_repository=idempotency,
+        bonus_pipeline=pipeline,
+        retry_config=RetryConfig(attempts=1),
+        clock=lambda: clock_now,
+    )
+    assert service.process_orders([_payload("order-1", "idem-1")])[0].status == "failed"
+
+    pipeline.failing_order_ids.clear()
+    outcome = service.process_orders([_payload("order-1", "idem-1")])[0]
+
+    assert outcome.status == "created"
+    record = idempotency.get(key="idem-1", scope="aegmall:user-1")
+    assert record is not None and record.status == "SUCCEEDED" and record.resource_id == "order-1"
@@ -2,6 +2,7 @@ from datetime import UTC, datetime
 from decimal import Decimal
 
 from aeghash.core.bonus_closing import BonusClosingService
+from aeghash.core.point_wallet import CreditOutcome
 from aeghash.core.repositories import BonusEntryRecord
 from aeghash.utils import InMemoryBonusRepository
 
@@ -63,3 +64,66 @@ def test_bonus_closing_confirms_and_schedules_retry():
     retry_entry = repo.records["bonus-fail"]
     assert retry_entry.status == "RETRY"
     assert retry_entry.metadata["retry_after"].startswith("2025-01-01T13:15")
+
+
+class BatchRecordingBonusRepository(InMemoryBonusRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    def mark_confirmed_many(self, bonus_ids) -> None:
+        self.calls.append("mark_confirmed_many")
+        super().mark_confirmed_many(bonus_ids)
+
+    def schedule_retries(self, retries) -> None:
+        self.calls.append("schedule_retries")
+        super().schedule_retries(retries)
+
+
+def test_bonus_closing_credits_in_one_batch():
+    repo = BatchRecordingBonusRepository()
+    created = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    for index, user_id in enumerate(["user-1", "user-2", "user-1"]):
+        repo.record_bonus(
+            BonusEntryRecord(
+                bonus_id=f"bonus-{index}",
+                user_id=user_id,
+                source_user_id="order-user",
+                bonus_type="recommend",
+                order_id="order-1",
+                level=1,
+                pv_amount=Decimal("100"),
+                bonus_amount=Decimal("10"),
+                status="PENDING",
+                metadata={},
+                created_at=created,
+            ),
+        )
+    batches = []
+
+    def batch_creditor(instructions):
+        batches.append(list(instructions))
+        return [
+            CreditOutcome(instruction=item, error="wallet blocked" if item.user_id == "user-2" else None)
+            for item in instructions
+        ]
+
+    def wallet_creditor(payload):  # pragma: no cover - batch path is used instead
+        raise AssertionError("per-entry creditor should not be called")
+
+    service = BonusClosingService(
+        repo,
+        wallet_creditor=wallet_creditor,
+        batch_creditor=batch_creditor,
+        now_factory=lambda: datetime(2025, 1, 1, 13, 0, tzinfo=UTC),
+    )
+
+    job = service.run_closing()
+
+    assert len(batches) == 1
+    assert [item.reference_id for item in batches[0]] == ["bonus-0", "bonus-1", "bonus-2"]
+    assert (job.confirmed_entries, job.retry_entries) == (2, 1)
+    assert repo.calls == ["mark_confirmed_many", "schedule_retries"]
+    assert repo.records["bonus-0"].status == "CONFIRMED"
+    assert repo.records["bonus-1"].status == "RETRY"
+    assert repo.records["bonus-1"].metadata["last_error"] == "wallet blocked"
@@ -1,6 +1,8 @@
 from datetime import UTC, datetime
 from decimal import Decimal
 
+import pytest
+
 from aeghash.core.bonus_pipeline import BonusPipeline, OrderEvent
 from aeghash.core.organization import OrganizationService, TREE_BINARY, TREE_UNILEVEL
 from aeghash.utils import InMemoryBonusRepository, InMemoryOrganizationRepository
@@ -71,3 +73,63 @@ def test_bonus_pipeline_distributes_and_logs_all_bonuses():
     stored = sorted(bonus_repo.records.values(), key=lambda entry: (entry.bonus_type, entry.level))
     expected = sorted(records, key=lambda entry: (entry.bonus_type, entry.level))
     assert stored == expected
+
+
+class CountingBonusRepository(InMemoryBonusRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls = 0
+        self.single_calls = 0
+
+    def record_bonus(self, record) -> None:
+        self.single_calls += 1
+        super().record_bonus(record)
+
+    def record_bonuses(self, records) -> None:
+        self.bulk_calls += 1
+        super().record_bonuses(records)
+
+
+def test_bonus_pipeline_writes_all_entries_in_one_bulk_call():
+    org_repo = InMemoryOrganizationRepository()
+    bonus_repo = CountingBonusRepository()
+    clock = lambda: datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    node_counter = {"value": 0}
+
+    def node_id_factory() -> str:
+        node_counter["value"] += 1
+        return f"node-{node_counter['value']}"
+
+    build_trees(OrganizationService(org_repo, id_factory=node_id_factory, clock=clock))
+    pipeline = BonusPipeline(org_repo, bonus_repo, clock=clock)
+
+    records = pipeline.process_order(
+        OrderEvent(
+            order_id="order-1",
+            user_id="member",
+            pv_amount=Decimal("100"),
+            total_amount=Decimal("200"),
+            metadata={"center_user_id": "center"},
+        ),
+    )
+
+    assert bonus_repo.bulk_calls == 1
+    assert bonus_repo.single_calls == 0
+    assert [record.bonus_id for record in records] == [f"bonus-{index}" for index in range(1, len(records) + 1)]
+    assert [record.bonus_type for record in records] == ["recommend", "recommend", "sponsor", "sponsor", "share", "center"]
+
+
+def test_bonus_pipeline_skips_writes_when_user_missing_from_binary_tree():
+    org_repo = InMemoryOrganizationRepository()
+    bonus_repo = CountingBonusRepository()
+    service = OrganizationService(org_repo)
+    service.create_root(tree_type=TREE_UNILEVEL, user_id="root")
+    service.add_member(tree_type=TREE_UNILEVEL, user_id="member", sponsor_user_id="root")
+    pipeline = BonusPipeline(org_repo, bonus_repo)
+
+    with pytest.raises(ValueError):
+        pipeline.process_order(
+            OrderEvent(order_id="order-1", user_id="member", pv_amount=Decimal("10"), total_amount=Decimal("10")),
+        )
+
+    assert bonus_repo.records == {}
@@ -18,7 +18,7 @@ from aeghash.core.repositories import (
     UserRepository,
 )
 from aeghash.core.two_factor import TwoFactorService
-from aeghash.security.passwords import hash_password
+from aeghash.security.passwords import PasswordCostProfile, PasswordHash, PasswordHasher, hash_password
 from aeghash.utils import totp
 
 
@@ -87,7 +87,7 @@ class StubTurnstileVerifier:
         self.calls.append((token, remote_ip))
 
 
-def make_service(*, turnstile=None, two_factor=None):
+def make_service(*, turnstile=None, two_factor=None, password_hasher=None):
     accounts = InMemoryAccountRepository()
     identities = InMemoryIdentityRepository()
     sessions = InMemorySessionRepository()
@@ -100,6 +100,7 @@ def make_service(*, turnstile=None, two_factor=None):
         audits,
         two_factor_service=two_factor,
         turnstile_verifier=turnstile,
+        password_hasher=password_hasher,
     )
     return service, accounts, identities, sessions, audits
 
@@ -273,3 +274,32 @@ def test_login_service_two_factor_challenge_flow() -> None:
     )
     assert success.success is True
     assert success.session_token
+
+
+def test_login_service_rehashes_password_with_outdated_profile() -> None:
+    hasher = PasswordHasher(max_workers=1, profile=PasswordCostProfile(iterations=2_000))
+    service, accounts, identities, _sessions, _audits = make_service(password_hasher=hasher)
+    accounts.save(
+        UserAccountRecord(
+            user_id="user-1",
+            email="user@example.com",
+            password_hash=hash_password("strong-password", iterations=1_000),
+            is_active=True,
+            created_at=datetime.now(UTC),
+        ),
+    )
+    identities.create_identity(
+        UserRecord(user_id="user-1", provider="local", subject="user@example.com", roles=("member",)),
+    )
+
+    try:
+        result = service.login(LoginRequest(email="user@example.com", password="strong-password"))
+        upgraded = accounts.records["user-1"].password_hash
+        # A second login with the current profile leaves the hash untouched.
+        service.login(LoginRequest(email="user@example.com", password="strong-password"))
+    finally:
+        hasher.shutdown()
+
+    assert result.success is True
+    assert PasswordHash.deserialize(upgraded).iterations == 2_000
+    assert accounts.records["user-1"].password_hash == upgraded
@@ -68,7 +68,7 @@ def test_orchestrator_marks_failure_on_exception(wallet_service: PointWalletServ
 
 def test_orchestrator_requires_coin_metadata(wallet_service: PointWalletService) -> None:
     repo = wallet_service._repository  # type: ignore[attr-defined]
-    withdraw = repo.list_withdrawal_requests(wallet_id=wallet_service.get_wallet_by_user("user-1").wallet_id)[0]
+    withdraw = repo.list_withdrawal_requests(wallet_id=wallet_service.get_wallet_by_user("user-1").wallet_id).items[0]
     withdraw.metadata = {}
     repo.update_withdrawal_request(withdraw)
     mining = StubMiningService()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+
+from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL
+from aeghash.core.organization_import import (
+    OrganizationImportError,
+    OrganizationImportService,
+    build_import_plan,
+    read_edges,
+)
+from aeghash.utils.memory_repositories import InMemoryOrganizationRepository
+
+
+def _ids():
+    counter = {"value": 0}
+
+    def factory() -> str:
+        counter["value"] += 1
+        return f"n{counter['value']}"
+
+    return factory
+
+
+def test_plan_orders_parents_first_and_builds_closure():
+    edges = [("c", "b", None, None), ("b", "a", None, None), ("a", None, None, None)]
+
+    plan = build_import_plan(edges, tree_type=TREE_UNILEVEL, id_factory=_ids())
+
+    nodes = list(plan.iter_nodes())
+    assert [node[1] for node in nodes] == ["a", "b", "c"]
+    assert nodes[2] == ("n1", "c", "n2", None, None, 2, "/n3/n2/n1")
+    assert sorted(plan.iter_closure()) == sorted(
+        [("n3", "n3", 0), ("n2", "n2", 0), ("n3", "n2", 1), ("n1", "n1", 0), ("n2", "n1", 1), ("n3", "n1", 2)],
+    )
+
+
+def test_binary_slots_carry_placement_keys():
+    edges = [("root", None, None, None), ("r", "root", "root", "R"), ("rl", "r", "root", "L")]
+
+    plan = build_import_plan(edges, tree_type=TREE_BINARY, id_factory=_ids())
+
+    slots = {(row[0], row[1]): row for row in plan.iter_binary_slots()}
+    assert slots[("n1", "R")] == ("n1", "R", "FILLED", "n2", "R")
+    assert slots[("n2", "L")] == ("n2", "L", "FILLED", "n3", "RL")
+    assert slots[("n3", "R")][2:] == ("OPEN", None, "RLR")
+
+
+@pytest.mark.parametrize(
+    ("edges", "message"),
+    [
+        ([("a", None, None, None), ("a", None, None, None)], "Duplicate"),
+        ([("a", "ghost", None, None)], "not in the edge list"),
+        ([("a", "b", None, None), ("b", "a", None, None)], "cycle"),
+    ],
+)
+def test_plan_rejects_invalid_edges(edges, message):
+    with pytest.raises(OrganizationImportError, match=message):
+        build_import_plan(edges, tree_type=TREE_UNILEVEL, id_factory=_ids())
+
+
+def test_binary_plan_rejects_double_assigned_slot():
+    edges = [("root", None, None, None), ("a", "root", None, "L"), ("b", "root", None, "L")]
+    with pytest.raises(OrganizationImportError, match="assigned twice"):
+        build_import_plan(edges, tree_type=TREE_BINARY, id_factory=_ids())
+
+
+def test_service_imports_csv_into_repository():
+    stream = StringIO("user_id,parent_user_id\nroot,\nchild,root\n")
+    repository = InMemoryOrganizationRepository()
+    service = OrganizationImportService(repository, id_factory=_ids(), clock=lambda: datetime(2025, 1, 1, tzinfo=UTC))
+
+    result = service.import_edges(read_edges(stream, fmt="csv"), tree_type=TREE_UNILEVEL)
+
+    assert (result.nodes, result.closure_rows) == (2, 3)
+    child = repository.get_node_by_user(TREE_UNILEVEL, "child")
+    assert child is not None and child.sponsor_user_id == "root"
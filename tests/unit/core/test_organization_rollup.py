@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL, OrganizationService
+from aeghash.core.organization_kpi import CachedKpiSummary, KpiSummaryCache, OrganizationKpiService
+from aeghash.core.organization_rollup import ROLLUP_NAME, OrganizationRollupService
+from aeghash.core.repositories import OrderRecord
+from aeghash.utils.memory_repositories import (
+    InMemoryOrderRepository,
+    InMemoryOrganizationMetricsRepository,
+    InMemoryOrganizationRepository,
+)
+
+
+NOW = datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture()
+def organizations() -> InMemoryOrganizationRepository:
+    repository = InMemoryOrganizationRepository()
+    counter = {"value": 0}
+
+    def id_factory() -> str:
+        counter["value"] += 1
+        return f"node-{counter['value']}"
+
+    service = OrganizationService(repository, id_factory=id_factory, clock=lambda: NOW)
+    for tree_type in (TREE_UNILEVEL, TREE_BINARY):
+        service.create_root(tree_type=tree_type, user_id="root")
+        service.add_member(tree_type=tree_type, user_id="left", sponsor_user_id="root")
+        service.add_member(tree_type=tree_type, user_id="right", sponsor_user_id="root")
+        service.add_member(tree_type=tree_type, user_id="left-child", sponsor_user_id="left")
+    return repository
+
+
+def _order(order_id: str, user_id: str, pv: str, created_at: datetime) -> OrderRecord:
+    return OrderRecord(
+        order_id=order_id,
+        user_id=user_id,
+        total_amount=Decimal(pv),
+        pv_amount=Decimal(pv),
+        status="PAID",
+        channel="AEGMALL",
+        metadata={},
+        created_at=created_at,
+    )
+
+
+def _metric(metrics, organizations, tree_type: str, user_id: str, metric_date: date):
+    node = organizations.get_node_by_user(tree_type, user_id)
+    return metrics.metrics[(node.node_id, tree_type, metric_date)]
+
+
+def test_rollup_propagates_pv_and_binary_legs(organizations):
+    orders = InMemoryOrderRepository()
+    metrics = InMemoryOrganizationMetricsRepository()
+    orders.upsert_orders(
+        [
+            _order("o-1", "left-child", "100", NOW - timedelta(hours=2)),
+            _order("o-2", "right", "40", NOW - timedelta(hours=1)),
+        ],
+    )
+    service = OrganizationRollupService(orders, organizations, metrics, clock=lambda: NOW)
+
+    result = service.run()
+
+    assert result.orders == 2
+    today = NOW.date()
+    root = _metric(metrics, organizations, TREE_BINARY, "root", today)
+    assert (root.group_volume, root.volume_left, root.volume_right) == (Decimal("140"), Decimal("100"), Decimal("40"))
+    assert root.personal_volume == Decimal("0")
+    left = _metric(metrics, organizations, TREE_BINARY, "left", today)
+    assert (left.group_volume, left.volume_left, left.volume_right) == (Decimal("100"), Decimal("100"), Decimal("0"))
+    buyer = _metric(metrics, organizations, TREE_UNILEVEL, "left-child", today)
+    assert (buyer.personal_volume, buyer.orders_count, buyer.volume_left) == (Decimal("100"), 1, None)
+    assert _metric(metrics, organizations, TREE_UNILEVEL, "root", today).group_volume == Decimal("140")
+
+
+def test_rollup_is_incremental_and_skips_reupserted_orders(organizations):
+    orders = InMemoryOrderRepository()
+    metrics = InMemoryOrganizationMetricsRepository()
+    clock = {"now": NOW}
+    service = OrganizationRollupService(orders, organizations, metrics, clock=lambda: clock["now"], batch_size=1)
+    orders.upsert_order(_order("o-1", "left", "10", NOW - timedelta(minutes=5)))
+
+    first = service.run()
+    assert (first.orders, first.batches) == (1, 1)
+    assert metrics.watermarks[ROLLUP_NAME].last_order_id == "o-1"
+
+    # A retried ingest re-upserts o-1 with a newer timestamp; only o-2 is new volume.
+    orders.upsert_order(_order("o-1", "left", "10", NOW + timedelta(minutes=1)))
+    orders.upsert_order(_order("o-2", "left", "5", NOW + timedelta(minutes=2)))
+    clock["now"] = NOW + timedelta(minutes=10)
+
+    second = service.run()
+
+    assert (second.orders, second.skipped) == (1, 0)
+    assert _metric(metrics, organizations, TREE_UNILEVEL, "left", NOW.date()).personal_volume == Decimal("15")
+    assert service.run().batches == 0
+
+
+def test_rollup_picks_up_orders_that_commit_late(organizations):
+    orders = InMemoryOrderRepository()
+    metrics = InMemoryOrganizationMetricsRepository()
+    service = OrganizationRollupService(orders, organizations, metrics, clock=lambda: NOW)
+    orders.upsert_order(_order("o-2", "left", "5", NOW - timedelta(minutes=1)))
+    assert service.run().orders == 1
+
+    # o-1 was created earlier but its transaction only became visible after the first run.
+    orders.upsert_order(_order("o-1", "left", "10", NOW - timedelta(minutes=5)))
+    late = service.run()
+
+    assert (late.orders, late.skipped) == (1, 0)
+    assert _metric(metrics, organizations, TREE_UNILEVEL, "left", NOW.date()).personal_volume == Decimal("15")
+
+
+def test_rollup_marks_orders_already_claimed_without_recounting(organizations):
+    orders = InMemoryOrderRepository()
+    metrics = InMemoryOrganizationMetricsRepository()
+    metrics.claim_rollup_orders(["o-1"])
+    orders.upsert_order(_order("o-1", "left", "10", NOW - timedelta(minutes=5)))
+    service = OrganizationRollupService(orders, organizations, metrics, clock=lambda: NOW)
+
+    result = service.run()
+
+    assert (result.orders, result.skipped) == (0, 1)
+    assert metrics.metrics == {}
+    assert service.run().batches == 0
+
+
+def test_rollup_reports_touched_nodes_for_cache_invalidation(organizations):
+    orders = InMemoryOrderRepository()
+    metrics = InMemoryOrganizationMetricsRepository()
+    orders.upsert_order(_order("o-1", "left", "10", NOW - timedelta(minutes=5)))
+
+    result = OrganizationRollupService(orders, organizations, metrics, clock=lambda: NOW).run()
+
+    root = organizations.get_node_by_user(TREE_UNILEVEL, "root")
+    left = organizations.get_node_by_user(TREE_BINARY, "left")
+    assert (root.node_id, TREE_UNILEVEL) in result.touched_nodes
+    assert (left.node_id, TREE_BINARY) in result.touched_nodes
+    assert len(result.touched_nodes) == 4
+
+
+def test_kpi_cache_orphans_entries_loaded_before_an_invalidation(organizations):
+    metrics = InMemoryOrganizationMetricsRepository()
+    cache = KpiSummaryCache()
+    summaries = OrganizationKpiService(metrics, today_factory=lambda: NOW.date())
+    root = organizations.get_node_by_user(TREE_UNILEVEL, "root")
+
+    generation = cache.generation(root.node_id, TREE_UNILEVEL)
+    stale = CachedKpiSummary(summary=summaries.get_summary(root.node_id, TREE_UNILEVEL))
+    cache.invalidate(root.node_id, TREE_UNILEVEL)
+    cache.put(root.node_id, TREE_UNILEVEL, days=7, today=NOW.date(), generation=generation, entry=stale)
+
+    assert cache.get(root.node_id, TREE_UNILEVEL, days=7, today=NOW.date()) is None
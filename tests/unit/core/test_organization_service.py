@@ -4,7 +4,14 @@ from datetime import UTC, datetime
 
 import pytest
 
-from aeghash.core.organization import TREE_BINARY, TREE_UNILEVEL, OrganizationService
+from aeghash.core.organization import (
+    PLACEMENT_CLAIM,
+    TREE_BINARY,
+    TREE_UNILEVEL,
+    OrganizationError,
+    OrganizationService,
+)
+from aeghash.core.repositories import BinaryPlacementQueueRecord, BinarySlotClaim
 from aeghash.utils.memory_repositories import InMemoryOrganizationRepository
 
 
@@ -54,3 +61,140 @@ def test_binary_spillover_depth_order(service: OrganizationService, repository:
     nodes = [repository.get_node_by_user(TREE_BINARY, user_id) for user_id in names]
     depths = [node.depth for node in nodes if node is not None]
     assert max(depths) >= 2
+
+
+def test_repository_lists_ancestors_and_paginates_descendants(
+    service: OrganizationService,
+    repository: InMemoryOrganizationRepository,
+):
+    root = service.create_root(tree_type=TREE_UNILEVEL, user_id="root")
+    child = service.add_member(tree_type=TREE_UNILEVEL, user_id="child", sponsor_user_id="root")
+    grandchild = service.add_member(tree_type=TREE_UNILEVEL, user_id="grandchild", sponsor_user_id="child")
+    service.add_member(tree_type=TREE_UNILEVEL, user_id="sibling", sponsor_user_id="root")
+
+    ancestors = repository.list_ancestors(grandchild.node_id, tree_type=TREE_UNILEVEL)
+    assert [node.node_id for node in ancestors] == [child.node_id, root.node_id]
+
+    first = repository.list_descendants(root.node_id, tree_type=TREE_UNILEVEL, limit=2)
+    assert [node.user_id for node in first.items] == ["child", "sibling"]
+    assert first.next_cursor is not None
+
+    second = repository.list_descendants(root.node_id, tree_type=TREE_UNILEVEL, limit=2, cursor=first.next_cursor)
+    assert [node.user_id for node in second.items] == ["grandchild"]
+    assert second.next_cursor is None
+
+
+class ContendedOrganizationRepository(InMemoryOrganizationRepository):
+    """Loses every slot claim for the first ``contended_claims`` attempts."""
+
+    def __init__(self, contended_claims: int) -> None:
+        super().__init__()
+        self.contended_claims = contended_claims
+        self.claim_calls = 0
+
+    def claim_binary_slot(self, sponsor_node_id: str) -> BinarySlotClaim:
+        self.claim_calls += 1
+        if self.contended_claims > 0:
+            self.contended_claims -= 1
+            return BinarySlotClaim(contended=True)
+        return super().claim_binary_slot(sponsor_node_id)
+
+
+class FullOrganizationRepository(InMemoryOrganizationRepository):
+    """Reports that the sponsor's subtree has no open slot, without contention."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.claim_calls = 0
+
+    def claim_binary_slot(self, sponsor_node_id: str) -> BinarySlotClaim:
+        self.claim_calls += 1
+        return BinarySlotClaim()
+
+
+def _claim_service(repository: InMemoryOrganizationRepository) -> OrganizationService:
+    counter = {"value": 0}
+
+    def id_factory() -> str:
+        counter["value"] += 1
+        return f"id-{counter['value']}"
+
+    return OrganizationService(
+        repository,
+        id_factory=id_factory,
+        clock=lambda: datetime(2025, 1, 1, tzinfo=UTC),
+        placement_mode=PLACEMENT_CLAIM,
+        max_claim_attempts=2,
+        max_queue_retries=2,
+    )
+
+
+def test_claim_mode_retries_lost_claims_before_placing():
+    repository = ContendedOrganizationRepository(contended_claims=1)
+    service = _claim_service(repository)
+    service.create_root(tree_type=TREE_BINARY, user_id="root")
+
+    result = service.request_binary_placement(user_id="member", sponsor_user_id="root")
+
+    assert not result.queued
+    assert result.node is not None and result.node.position == "L"
+    assert repository.claim_calls == 2
+
+
+def test_claim_mode_queues_on_contention_and_worker_drains():
+    repository = ContendedOrganizationRepository(contended_claims=2)
+    service = _claim_service(repository)
+    root = service.create_root(tree_type=TREE_BINARY, user_id="root")
+
+    result = service.request_binary_placement(user_id="member", sponsor_user_id="root")
+
+    assert result.queued
+    assert repository.get_node_by_user(TREE_BINARY, "member") is None
+    assert repository.waiting_queue[result.queue_id].status == "PENDING"
+
+    drained = service.process_waiting_queue()
+
+    assert drained.placed == 1
+    placed = repository.get_node_by_user(TREE_BINARY, "member")
+    assert placed is not None and placed.parent_node_id == root.node_id
+    assert repository.waiting_queue[result.queue_id].status == "COMPLETED"
+
+
+def test_waiting_queue_marks_failed_after_retry_budget():
+    repository = ContendedOrganizationRepository(contended_claims=100)
+    service = _claim_service(repository)
+    service.create_root(tree_type=TREE_BINARY, user_id="root")
+    result = service.request_binary_placement(user_id="member", sponsor_user_id="root")
+
+    first = service.process_waiting_queue()
+    second = service.process_waiting_queue()
+
+    assert (first.deferred, first.failed) == (1, 0)
+    assert (second.deferred, second.failed) == (0, 1)
+    assert repository.waiting_queue[result.queue_id].status == "FAILED"
+    assert service.process_waiting_queue().processed == 0
+
+
+def test_claim_mode_fails_fast_when_no_slot_exists():
+    repository = FullOrganizationRepository()
+    service = _claim_service(repository)
+    root = service.create_root(tree_type=TREE_BINARY, user_id="root")
+
+    with pytest.raises(OrganizationError, match="Unable to find spillover slot"):
+        service.request_binary_placement(user_id="member", sponsor_user_id="root")
+    assert repository.claim_calls == 1
+    assert repository.waiting_queue == {}
+
+    repository.enqueue_binary_placement(
+        BinaryPlacementQueueRecord(
+            queue_id="queue-1",
+            sponsor_node_id=root.node_id,
+            candidate_user_id="member",
+            status="PENDING",
+            enqueued_at=datetime(2025, 1, 1, tzinfo=UTC),
+        ),
+    )
+    drained = service.process_waiting_queue()
+
+    assert (drained.deferred, drained.failed) == (0, 1)
+    assert repository.waiting_queue["queue-1"].status == "FAILED"
@@ -0,0 +1,167 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from aeghash.core.point_ledger import PointLedgerError, PointLedgerService
+from aeghash.core.point_wallet import PointWalletService
+from aeghash.utils import InMemoryPointLedgerRepository, InMemoryPointWalletRepository
+
+
+class SteppingClock:
+    def __init__(self) -> None:
+        self.now = datetime(2025, 5, 1, 12, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, minutes: int = 1) -> datetime:
+        self.now += timedelta(minutes=minutes)
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> SteppingClock:
+    return SteppingClock()
+
+
+@pytest.fixture()
+def wallets() -> InMemoryPointWalletRepository:
+    return InMemoryPointWalletRepository()
+
+
+@pytest.fixture()
+def ledger_repository(wallets: InMemoryPointWalletRepository) -> InMemoryPointLedgerRepository:
+    return InMemoryPointLedgerRepository(wallets)
+
+
+@pytest.fixture()
+def ledger(ledger_repository: InMemoryPointLedgerRepository, clock: SteppingClock) -> PointLedgerService:
+    return PointLedgerService(ledger_repository, clock=clock, batch_size=2)
+
+
+def _wallet_service(wallets: InMemoryPointWalletRepository, clock: SteppingClock) -> PointWalletService:
+    counter = iter(range(1, 10_000))
+    return PointWalletService(wallets, clock=clock, id_factory=lambda: f"id-{next(counter):04d}")
+
+
+def test_balance_as_of_uses_checkpoint_and_tail(
+    wallets: InMemoryPointWalletRepository,
+    ledger_repository: InMemoryPointLedgerRepository,
+    ledger: PointLedgerService,
+    clock: SteppingClock,
+) -> None:
+    service = _wallet_service(wallets, clock)
+    wallet = service.credit(user_id="user-1", amount=Decimal("100"))
+    after_credit = clock.now
+    clock.advance()
+    withdrawal = service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    clock.advance()
+    checkpointed = ledger.checkpoint()
+    clock.advance()
+    service.approve_withdrawal(withdrawal.request_id, approved_by="admin")
+    clock.advance()
+
+    assert checkpointed.checkpoints == 1
+    early = ledger.balance_as_of(wallet.wallet_id, after_credit)
+    assert (early.balance, early.pending_withdrawal) == (Decimal("100"), Decimal("0"))
+    current = ledger.balance_as_of(wallet.wallet_id, clock.now)
+    assert (current.balance, current.pending_withdrawal) == (Decimal("70"), Decimal("0"))
+
+    # A checkpoint with a wrong total shows that queries start from it instead of re-summing history.
+    ledger_repository.checkpoints[0].balance += Decimal("1")
+    assert ledger.balance_as_of(wallet.wallet_id, clock.now).balance == Decimal("71")
+    assert ledger.balance_as_of(wallet.wallet_id, after_credit).balance == Decimal("100")
+
+
+def test_checkpoint_skips_wallets_without_enough_new_entries(
+    wallets: InMemoryPointWalletRepository,
+    ledger: PointLedgerService,
+    clock: SteppingClock,
+) -> None:
+    service = _wallet_service(wallets, clock)
+    service.credit(user_id="user-1", amount=Decimal("5"))
+    service.credit(user_id="user-1", amount=Decimal("5"))
+    service.credit(user_id="user-2", amount=Decimal("5"))
+    service.ensure_wallet(user_id="user-3")
+    clock.advance()
+
+    result = ledger.checkpoint(min_entries=2)
+
+    assert (result.wallets, result.checkpoints, result.entries) == (3, 1, 2)
+    clock.advance()
+    assert ledger.checkpoint(min_entries=2).checkpoints == 0
+
+
+def test_reconcile_reports_wallets_that_drift_from_ledger(
+    wallets: InMemoryPointWalletRepository,
+    ledger: PointLedgerService,
+    clock: SteppingClock,
+) -> None:
+    service = _wallet_service(wallets, clock)
+    first = service.credit(user_id="user-1", amount=Decimal("10"))
+    service.debit(wallet_id=first.wallet_id, amount=Decimal("4"))
+    second = service.credit(user_id="user-2", amount=Decimal("8"))
+    clock.advance()
+    ledger.checkpoint()
+    clock.advance()
+    service.credit(user_id="user-2", amount=Decimal("1"))
+
+    assert ledger.reconcile().balanced
+
+    record = wallets.wallets[second.wallet_id]
+    record.balance += Decimal("5")
+    report = ledger.reconcile()
+
+    assert report.wallets == 2
+    assert report.entries_scanned == 1
+    assert [(item.wallet_id, item.wallet_balance, item.ledger_balance) for item in report.mismatches] == [
+        (second.wallet_id, Decimal("14"), Decimal("9")),
+    ]
+    assert ledger.reconcile(use_checkpoints=False).entries_scanned == 4
+
+
+def test_history_pages_newest_first(
+    wallets: InMemoryPointWalletRepository,
+    ledger: PointLedgerService,
+    clock: SteppingClock,
+) -> None:
+    service = _wallet_service(wallets, clock)
+    wallet = service.ensure_wallet(user_id="user-1")
+    for amount in ("1", "2", "3"):
+        clock.advance()
+        service.credit(user_id="user-1", amount=Decimal(amount))
+
+    first = ledger.history(wallet.wallet_id, limit=2)
+    second = ledger.history(wallet.wallet_id, limit=2, cursor=first.next_cursor)
+
+    assert [entry.amount for entry in first.items] == [Decimal("3"), Decimal("2")]
+    assert [entry.amount for entry in second.items] == [Decimal("1")]
+    assert second.next_cursor is None
+    with pytest.raises(PointLedgerError):
+        ledger.history(wallet.wallet_id, cursor="garbage")
+
+
+def test_rows_committed_after_a_checkpoint_are_never_lost(
+    wallets: InMemoryPointWalletRepository,
+    ledger: PointLedgerService,
+    clock: SteppingClock,
+) -> None:
+    service = _wallet_service(wallets, clock)
+    wallet = service.credit(user_id="user-1", amount=Decimal("10"))
+    started = clock.now
+    clock.advance(10)
+    assert ledger.checkpoint().checkpoints == 1
+
+    # A long transaction stamped its row at ``started`` but only commits now, behind the checkpoint.
+    clock.now, resumed = started, clock.now
+    service.credit(user_id="user-1", amount=Decimal("7"))
+    clock.now = resumed
+
+    assert ledger.balance_as_of(wallet.wallet_id, clock.now).balance == Decimal("17")
+    assert ledger.reconcile().balanced
+    clock.advance()
+    result = ledger.checkpoint()
+    assert (result.checkpoints, result.entries) == (1, 1)
+    assert ledger.reconcile().entries_scanned == 0
+    assert ledger.balance_as_of(wallet.wallet_id, clock.now).balance == Decimal("17")
@@ -7,8 +7,10 @@ from typing import Iterable, Optional, Sequence
 import pytest
 
 from aeghash.core.point_wallet import (
+    CreditInstruction,
     InsufficientBalance,
     InvalidWithdrawalState,
+    PointWalletError,
     PointWalletService,
     WALLET_STATUS_SUSPENDED,
     WithdrawalNotFound,
@@ -21,9 +23,11 @@ from aeghash.core.point_wallet import (
     WalletNotFound,
 )
 from aeghash.core.repositories import (
+    BalanceGuard,
     PointLedgerRecord,
     PointWalletRecord,
     PointWalletRepository,
+    WithdrawalRequestPage,
     WithdrawalRequestRecord,
 )
 
@@ -34,6 +38,9 @@ class InMemoryPointWalletRepository(PointWalletRepository):
         self.wallets_by_user: dict[str, str] = {}
         self.ledger: list[PointLedgerRecord] = []
         self.withdrawals: dict[str, WithdrawalRequestRecord] = {}
+        self.create_wallets_calls = 0
+        self.balance_updates = 0
+        self.ledger_inserts = 0
 
     def get_wallet(self, wallet_id: str) -> Optional[PointWalletRecord]:
         return self.wallets.get(wallet_id)
@@ -44,6 +51,14 @@ class InMemoryPointWalletRepository(PointWalletRepository):
             return None
         return self.wallets.get(wallet_id)
 
+    def get_wallets_by_users(self, user_ids: Sequence[str]) -> dict[str, PointWalletRecord]:
+        return {user_id: self.get_wallet_by_user(user_id) for user_id in user_ids if user_id in self.wallets_by_user}
+
+    def create_wallets(self, records: Sequence[PointWalletRecord]) -> None:
+        self.create_wallets_calls += 1
+        for record in records:
+            self.create_wallet(record)
+
     def create_wallet(self, record: PointWalletRecord) -> PointWalletRecord:
         self.wallets[record.wallet_id] = record
         self.wallets_by_user[record.user_id] = record.wallet_id
@@ -53,9 +68,40 @@ class InMemoryPointWalletRepository(PointWalletRepository):
         self.wallets[record.wallet_id] = record
         return record
 
+    def apply_balance_delta(
+        self,
+        wallet_id: str,
+        *,
+        balance_delta: Decimal = Decimal("0"),
+        pending_delta: Decimal = Decimal("0"),
+        guard: Optional[BalanceGuard] = None,
+        updated_at: datetime,
+    ) -> Optional[PointWalletRecord]:
+        self.balance_updates += 1
+        record = self.wallets.get(wallet_id)
+        if record is None:
+            return None
+        if guard is not None:
+            available = record.balance - record.pending_withdrawal
+            if (
+                (guard.require_status is not None and record.status != guard.require_status)
+                or (guard.min_available is not None and available < guard.min_available)
+                or (guard.min_balance is not None and record.balance < guard.min_balance)
+                or (guard.min_pending is not None and record.pending_withdrawal < guard.min_pending)
+            ):
+                return None
+        record.balance += balance_delta
+        record.pending_withdrawal += pending_delta
+        record.updated_at = updated_at
+        return record
+
     def add_ledger_entry(self, entry: PointLedgerRecord) -> None:
         self.ledger.append(entry)
 
+    def add_ledger_entries(self, entries: Sequence[PointLedgerRecord]) -> None:
+        self.ledger_inserts += 1
+        self.ledger.extend(entries)
+
     def get_withdrawal_request(self, request_id: str) -> Optional[WithdrawalRequestRecord]:
         return self.withdrawals.get(request_id)
 
@@ -67,20 +113,36 @@ class InMemoryPointWalletRepository(PointWalletRepository):
         self.withdrawals[record.request_id] = record
         return record
 
+    def transition_withdrawal_request(
+        self,
+        record: WithdrawalRequestRecord,
+        *,
+        expected_statuses: Sequence[str],
+    ) -> Optional[WithdrawalRequestRecord]:
+        current = self.withdrawals.get(record.request_id)
+        if current is None or current.status not in expected_statuses:
+            return None
+        self.withdrawals[record.request_id] = record
+        return record
+
     def list_withdrawal_requests(
         self,
         *,
-        wallet_id: str,
+        wallet_id: Optional[str] = None,
         statuses: Sequence[str] | None = None,
-    ) -> Sequence[WithdrawalRequestRecord]:
+        created_before: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> WithdrawalRequestPage:
         records: list[WithdrawalRequestRecord] = []
         for request in self.withdrawals.values():
-            if request.wallet_id != wallet_id:
+            if wallet_id is not None and request.wallet_id != wallet_id:
                 continue
             if statuses and request.status not in statuses:
                 continue
             records.append(request)
-        return sorted(records, key=lambda item: item.created_at)
+        records.sort(key=lambda item: (item.created_at, item.request_id))
+        return WithdrawalRequestPage(items=records[:limit])
 
 
 def fixed_clock():
@@ -122,6 +184,50 @@ def test_credit_increments_balance_and_creates_ledger(service: PointWalletServic
     assert repository.ledger[-1].balance_after == Decimal("100")
 
 
+def test_credit_many_aggregates_per_wallet(service: PointWalletService, repository: InMemoryPointWalletRepository):
+    existing = service.credit(user_id="user-1", amount=Decimal("10"))
+    repository.balance_updates = 0
+
+    outcomes = service.credit_many(
+        [
+            CreditInstruction(user_id="user-1", amount=Decimal("5"), reference_id="bonus-1"),
+            CreditInstruction(user_id="user-2", amount=Decimal("7"), reference_id="bonus-2"),
+            CreditInstruction(user_id="user-1", amount=Decimal("3"), reference_id="bonus-3"),
+            CreditInstruction(user_id="user-3", amount=Decimal("0"), reference_id="bonus-4"),
+        ],
+    )
+
+    assert [outcome.succeeded for outcome in outcomes] == [True, True, True, False]
+    assert outcomes[0].wallet_id == existing.wallet_id
+    assert [outcome.balance_after for outcome in outcomes[:3]] == [Decimal("15"), Decimal("7"), Decimal("18")]
+    assert service.get_wallet_by_user("user-1").balance == Decimal("18")
+    assert service.get_wallet_by_user("user-2").balance == Decimal("7")
+    assert repository.get_wallet_by_user("user-3") is None
+    assert repository.create_wallets_calls == 1
+    assert repository.balance_updates == 2
+    assert repository.ledger_inserts == 1
+    assert [entry.reference_id for entry in repository.ledger[1:]] == ["bonus-1", "bonus-3", "bonus-2"]
+
+
+def test_credit_many_fails_only_suspended_wallets(service: PointWalletService, repository: InMemoryPointWalletRepository):
+    wallet = service.ensure_wallet(user_id="user-1")
+    record = repository.get_wallet(wallet.wallet_id)
+    assert record is not None
+    record.status = WALLET_STATUS_SUSPENDED
+
+    outcomes = service.credit_many(
+        [
+            CreditInstruction(user_id="user-1", amount=Decimal("5")),
+            CreditInstruction(user_id="user-2", amount=Decimal("5")),
+        ],
+    )
+
+    assert outcomes[0].error is not None and "suspended" in outcomes[0].error
+    assert outcomes[1].succeeded
+    assert record.balance == Decimal("0")
+    assert len(repository.ledger) == 1
+
+
 def test_debit_requires_sufficient_balance(service: PointWalletService):
     service.credit(user_id="user-1", amount=Decimal("50"))
     with pytest.raises(InsufficientBalance):
@@ -181,6 +287,91 @@ def test_approve_withdrawal_deducts_balance(service: PointWalletService, reposit
     assert repository.ledger[-1].entry_type == "withdrawal"
 
 
+def test_concurrent_approval_loses_the_status_claim(service: PointWalletService, repository: InMemoryPointWalletRepository):
+    wallet = service.credit(user_id="user-1", amount=Decimal("150"))
+    withdrawal = service.request_withdrawal(
+        wallet_id=wallet.wallet_id,
+        amount=Decimal("40"),
+        requested_by="user-1",
+    )
+    stale = repository.withdrawals[withdrawal.request_id]
+    service.approve_withdrawal(withdrawal.request_id, approved_by="admin-1")
+    # The second approver read the request before the first one committed.
+    repository.get_withdrawal_request = lambda request_id: stale  # type: ignore[method-assign]
+
+    with pytest.raises(InvalidWithdrawalState):
+        service.approve_withdrawal(withdrawal.request_id, approved_by="admin-2")
+
+    updated_wallet = service.get_wallet(wallet.wallet_id)
+    assert (updated_wallet.balance, updated_wallet.pending_withdrawal) == (Decimal("110"), Decimal("0"))
+    assert repository.withdrawals[withdrawal.request_id].approved_by == "admin-1"
+
+
+def test_cancel_racing_an_approval_moves_no_balance(service: PointWalletService, repository: InMemoryPointWalletRepository):
+    wallet = service.credit(user_id="user-1", amount=Decimal("100"))
+    first = service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    stale = repository.withdrawals[first.request_id]
+    service.approve_withdrawal(first.request_id, approved_by="admin-1")
+    # The user's cancel read the request while it was still pending.
+    repository.get_withdrawal_request = lambda request_id: stale  # type: ignore[method-assign]
+
+    with pytest.raises(InvalidWithdrawalState):
+        service.cancel_withdrawal(first.request_id, cancelled_by="user-1")
+
+    updated_wallet = service.get_wallet(wallet.wallet_id)
+    assert (updated_wallet.balance, updated_wallet.pending_withdrawal) == (Decimal("70"), Decimal("30"))
+    assert repository.withdrawals[first.request_id].status == WITHDRAWAL_STATUS_APPROVED
+
+
+def test_failing_an_approved_withdrawal_refunds_without_touching_other_holds(
+    service: PointWalletService,
+    repository: InMemoryPointWalletRepository,
+):
+    wallet = service.credit(user_id="user-1", amount=Decimal("100"))
+    first = service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    second = service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    service.approve_withdrawal(first.request_id, approved_by="admin-1")
+
+    failed = service.fail_withdrawal(first.request_id, failed_by="system", reason="hashdam_error")
+
+    assert failed.status == "failed"
+    updated_wallet = service.get_wallet(wallet.wallet_id)
+    assert (updated_wallet.balance, updated_wallet.pending_withdrawal) == (Decimal("100"), Decimal("30"))
+    assert repository.withdrawals[second.request_id].status == WITHDRAWAL_STATUS_PENDING
+
+
+def test_failing_a_stage1_withdrawal_releases_its_hold(service: PointWalletService):
+    wallet = service.credit(user_id="user-1", amount=Decimal("100"))
+    withdrawal = service.request_withdrawal(wallet_id=wallet.wallet_id, amount=Decimal("30"), requested_by="user-1")
+    service.mark_stage1_approval(withdrawal.request_id, approver_id="admin-1")
+
+    service.fail_withdrawal(withdrawal.request_id, failed_by="system")
+
+    updated_wallet = service.get_wallet(wallet.wallet_id)
+    assert (updated_wallet.balance, updated_wallet.pending_withdrawal) == (Decimal("100"), Decimal("0"))
+    with pytest.raises(InvalidWithdrawalState):
+        service.fail_withdrawal(withdrawal.request_id, failed_by="system")
+
+
+def test_approve_withdrawal_requires_the_held_amount(
+    service: PointWalletService,
+    repository: InMemoryPointWalletRepository,
+):
+    wallet = service.credit(user_id="user-1", amount=Decimal("150"))
+    withdrawal = service.request_withdrawal(
+        wallet_id=wallet.wallet_id,
+        amount=Decimal("40"),
+        requested_by="user-1",
+    )
+    repository.wallets[wallet.wallet_id].pending_withdrawal = Decimal("10")
+
+    with pytest.raises(PointWalletError, match="Pending withdrawal amount"):
+        service.approve_withdrawal(withdrawal.request_id, approved_by="admin-1")
+
+    assert repository.wallets[wallet.wallet_id].balance == Decimal("150")
+
+
 def test_reject_withdrawal_releases_pending_amount(service: PointWalletService, repository: InMemoryPointWalletRepository):
     wallet = service.credit(user_id="user-1", amount=Decimal("60"))
     withdrawal = service.request_withdrawal(
@@ -239,6 +430,10 @@ def test_wallet_suspended_operations_blocked(service: PointWalletService, reposi
 
     with pytest.raises(WalletSuspended):
         service.credit(user_id="user-1", amount=Decimal("10"))
+    with pytest.raises(WalletSuspended):
+        service.debit(wallet_id=wallet.wallet_id, amount=Decimal("1"))
+    with pytest.raises(WalletNotFound):
+        service.debit(wallet_id="unknown", amount=Decimal("1"))
 
 
 def test_wallet_not_found(service: PointWalletService):
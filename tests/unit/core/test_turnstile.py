@@ -1,7 +1,9 @@
+import anyio
 import pytest
 
 from aeghash.adapters.turnstile import TurnstileError
 from aeghash.core.turnstile import TurnstileVerifier
+from aeghash.utils.cache import TTLCache
 
 
 class StubTurnstileClient:
@@ -30,3 +32,41 @@ def test_turnstile_verifier_propagates_errors() -> None:
 
     with pytest.raises(TurnstileError):
         verifier.verify("token", None)
+
+
+def test_turnstile_verifier_caches_outcomes_per_token_and_ip() -> None:
+    client = StubTurnstileClient()
+    verifier = TurnstileVerifier(client, cache=TTLCache(maxsize=16))
+
+    verifier.verify("token", "1.1.1.1")
+    verifier.verify("token", "1.1.1.1")
+    verifier.verify("token", "2.2.2.2")
+
+    assert client.calls == [("token", "1.1.1.1"), ("token", "2.2.2.2")]
+
+    client.should_fail = True
+    with pytest.raises(TurnstileError):
+        verifier.verify("bad", None)
+    with pytest.raises(TurnstileError):
+        verifier.verify("bad", None)
+    assert client.calls.count(("bad", None)) == 1
+
+
+def test_turnstile_verifier_async_result_serves_sync_check() -> None:
+    class StubAsyncClient:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        async def verify(self, token: str, *, remote_ip=None) -> bool:
+            self.calls.append(token)
+            return True
+
+    sync_client = StubTurnstileClient()
+    async_client = StubAsyncClient()
+    verifier = TurnstileVerifier(sync_client, async_client=async_client, cache=TTLCache(maxsize=16))
+
+    anyio.run(verifier.verify_async, "token", "1.1.1.1")
+    verifier.verify("token", "1.1.1.1")
+
+    assert async_client.calls == ["token"]
+    assert sync_client.calls == []
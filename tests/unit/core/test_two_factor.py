@@ -6,6 +6,8 @@ from cryptography.fernet import Fernet
 from aeghash.core.repositories import TwoFactorRecord, TwoFactorRepository
 from aeghash.core.two_factor import TwoFactorService
 from aeghash.utils import totp
+from aeghash.security.rate_limit import TWO_FACTOR_USER, RateLimitExceeded, RateLimiter, RateLimitRule
+from aeghash.utils.crypto import EncryptionError, Keyring
 
 
 class InMemoryTwoFactorRepository(TwoFactorRepository):
@@ -121,3 +123,35 @@ def test_verify_without_enabling_raises():
 
     with pytest.raises(ValueError):
         service.verify("user-unknown", "123456")
+
+
+def test_keyring_decrypts_secrets_written_with_retired_key():
+    old_key = Fernet.generate_key().decode("utf-8")
+    new_key = Fernet.generate_key().decode("utf-8")
+    repo = InMemoryTwoFactorRepository()
+    status = TwoFactorService(repo, keyring=Keyring([old_key])).enable("user-1")
+
+    rotated = Keyring.from_value(f"{new_key},{old_key}")
+    service = TwoFactorService(repo, keyring=rotated)
+    code = totp.totp(status.secret)  # type: ignore[arg-type]
+    assert service.verify("user-1", code) is True
+
+    stored = repo.get("user-1")
+    assert stored is not None
+    with pytest.raises(EncryptionError):
+        Keyring([new_key]).decrypt(stored.secret)
+    assert Keyring([new_key]).decrypt(rotated.rotate(stored.secret)) == status.secret
+
+
+def test_verify_is_throttled_per_user_and_reset_on_success() -> None:
+    repo = InMemoryTwoFactorRepository()
+    limiter = RateLimiter(rules={TWO_FACTOR_USER: RateLimitRule(limit=2, window_seconds=300)})
+    service = TwoFactorService(repo, rate_limiter=limiter)
+    status = service.enable("user-1")
+
+    assert service.verify("user-1", "000000") is False
+    assert service.verify("user-1", totp.totp(status.secret)) is True  # type: ignore[arg-type]
+    assert service.verify("user-1", "000000") is False
+    assert service.verify("user-1", "000000") is False
+    with pytest.raises(RateLimitExceeded):
+        service.verify("user-1", totp.totp(status.secret))  # type: ignore[arg-type]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
 
+from aeghash.adapters.hashdam import AssetWithdrawal
 from aeghash.core.mining_service import WithdrawalRequest
 from aeghash.core.mining_workflow import MiningWithdrawalOrchestrator, WithdrawalExecutionError
 from aeghash.core.point_wallet import PointWalletService, WITHDRAWAL_STATUS_APPROVED_STAGE1
@@ -27,7 +29,9 @@ from aeghash.security.risk import (
 class StubMiningService:
     def __init__(self) -> None:
         self.calls: list[tuple[str, str, Decimal]] = []
+        self.failed: list[tuple[str, str, Decimal]] = []
         self.failures = 0
+        self.failing_amounts: set[Decimal] = set()
 
     def request_withdrawal(self, *, user_id: str, coin: str, amount: Decimal) -> WithdrawalRequest:
         if self.failures > 0:
@@ -36,6 +40,18 @@ class StubMiningService:
         self.calls.append((user_id, coin, amount))
         return WithdrawalRequest(withdraw_id="hashdam-1", coin=coin, amount=amount)
 
+    def submit_withdrawal(self, *, coin: str, amount: Decimal) -> AssetWithdrawal:
+        if amount in self.failing_amounts:
+            raise RuntimeError("HashDam unavailable")
+        return AssetWithdrawal(withdraw_id=f"hashdam-{amount}", coin=coin, amount=amount)
+
+    def record_withdrawal(self, *, user_id: str, result: AssetWithdrawal) -> WithdrawalRequest:
+        self.calls.append((user_id, result.coin, result.amount))
+        return WithdrawalRequest(withdraw_id=result.withdraw_id, coin=result.coin, amount=result.amount)
+
+    def record_withdrawal_failure(self, *, user_id: str, coin: str, amount: Decimal) -> None:
+        self.failed.append((user_id, coin, amount))
+
 
 class StubNotifier:
     def __init__(self) -> None:
@@ -45,6 +61,19 @@ class StubNotifier:
         self.messages.append(f"{message.subject}: {message.body}")
 
 
+class RecordingTransaction:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    @contextmanager
+    def savepoint(self):
+        self.events.append("savepoint")
+        yield
+
+    def commit(self) -> None:
+        self.events.append("commit")
+
+
 @pytest.fixture()
 def repository() -> InMemoryPointWalletRepository:
     return InMemoryPointWalletRepository()
@@ -295,6 +324,101 @@ def test_mining_withdrawal_failure_marks_failed(
     assert actions[-1] == "failed"
 
 
+def test_approve_many_isolates_each_request(
+    workflow_with_mining,
+    wallet_service: PointWalletService,
+    audit_repository: InMemoryWithdrawalAuditRepository,
+) -> None:
+    workflow, notifier, mining_service = workflow_with_mining
+    mining_service.failing_amounts = {Decimal("20")}
+    wallet = wallet_service.credit(user_id="user-1", amount=Decimal("100"))
+    request_ids = []
+    for amount in ("10", "20", "30"):
+        request = workflow.request_withdrawal(
+            wallet_id=wallet.wallet_id,
+            amount=Decimal(amount),
+            requested_by="user-1",
+            metadata={"coin": "PEP"},
+        )
+        workflow.approve(request.request_id, approved_by="admin-1", finalize=False)
+        request_ids.append(request.request_id)
+    unstaged = workflow.request_withdrawal(
+        wallet_id=wallet.wallet_id,
+        amount=Decimal("5"),
+        requested_by="user-1",
+        metadata={"coin": "PEP"},
+    )
+
+    results = workflow.approve_many(
+        [*request_ids, unstaged.request_id, "missing", request_ids[0]],
+        approved_by="admin-2",
+        max_workers=2,
+    )
+
+    assert [result.request_id for result in results] == [*request_ids, unstaged.request_id, "missing"]
+    assert [result.succeeded for result in results] == [True, False, True, False, False]
+    assert [result.snapshot.status for result in results[:3]] == ["approved", "failed", "approved"]
+    assert results[2].snapshot.metadata["hashdam_withdraw_id"] == "hashdam-30"
+    assert results[3].snapshot is None and "Second approval required" in results[3].error
+    assert sorted(mining_service.calls) == [("user-1", "PEP", Decimal("10")), ("user-1", "PEP", Decimal("30"))]
+    assert mining_service.failed == [("user-1", "PEP", Decimal("20"))]
+    assert wallet_service.get_withdrawal(unstaged.request_id).status == "pending"
+    assert wallet_service.get_wallet(wallet.wallet_id).balance == Decimal("60")
+    assert len(notifier.messages) == 1
+    actions = {
+        record.request_id: record.action for record in audit_repository.records if record.actor_id == "admin-2"
+    }
+    assert actions == {request_ids[0]: "approved", request_ids[1]: "failed", request_ids[2]: "approved"}
+
+
+def test_approve_many_commits_before_hashdam_and_survives_recording_errors(
+    wallet_service: PointWalletService,
+    audit_repository: InMemoryWithdrawalAuditRepository,
+    mining_service: StubMiningService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    transaction = RecordingTransaction()
+    workflow = WithdrawalWorkflowService(
+        wallet_service,
+        audit_repository,
+        mining_orchestrator=MiningWithdrawalOrchestrator(mining_service, wallet_service),
+        transaction=transaction,
+    )
+    wallet = wallet_service.credit(user_id="user-1", amount=Decimal("100"))
+    request_ids = [
+        workflow.request_withdrawal(
+            wallet_id=wallet.wallet_id,
+            amount=Decimal(amount),
+            requested_by="user-1",
+            metadata={"coin": "PEP"},
+        ).request_id
+        for amount in ("10", "20")
+    ]
+    submit = mining_service.submit_withdrawal
+    monkeypatch.setattr(
+        mining_service,
+        "submit_withdrawal",
+        lambda **kwargs: transaction.events.append("submit") or submit(**kwargs),
+    )
+    annotate = wallet_service.annotate_withdrawal
+
+    def flaky_annotate(request_id, metadata):
+        if request_id == request_ids[0]:
+            raise RuntimeError("database went away")
+        return annotate(request_id, metadata)
+
+    monkeypatch.setattr(wallet_service, "annotate_withdrawal", flaky_annotate)
+
+    results = workflow.approve_many(request_ids, approved_by="admin-1")
+
+    assert transaction.events.index("commit") < transaction.events.index("submit")
+    assert transaction.events.count("savepoint") == 4
+    assert results[0].snapshot.status == "approved"
+    assert "hashdam-10 was submitted but recording it failed" in results[0].error
+    assert results[1].succeeded and results[1].snapshot.metadata["hashdam_withdraw_id"] == "hashdam-20"
+    assert [wallet_service.get_withdrawal(request_id).status for request_id in request_ids] == ["approved"] * 2
+
+
 def test_risk_block_triggers_auto_cancel(
     workflow_with_risk: WithdrawalWorkflowService,
     wallet_service: PointWalletService,
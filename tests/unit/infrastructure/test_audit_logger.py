@@ -1,4 +1,7 @@
-from aeghash.infrastructure.audit import LoginAuditLogger
+import time
+
+from aeghash.core.repositories import LoginAuditRecord
+from aeghash.infrastructure.audit import OVERFLOW_DROP, BufferedLoginAuditWriter, LoginAuditLogger
 from aeghash.infrastructure.database import Base
 from aeghash.infrastructure.repositories import LoginAuditModel, SqlAlchemyLoginAuditRepository
 from aeghash.infrastructure.session import SessionManager
@@ -29,3 +32,60 @@ def test_login_audit_logger_persists_events() -> None:
     statuses = {entry.status for entry in recent}
     assert "SUCCEEDED" in statuses
     manager.dispose()
+
+
+def _count(manager: SessionManager) -> int:
+    with manager.session_scope() as session:
+        return session.query(LoginAuditModel).count()
+
+
+def test_buffered_writer_batches_and_flushes_on_close(tmp_path) -> None:
+    manager = SessionManager(f"sqlite+pysqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(manager.engine)
+    writer = BufferedLoginAuditWriter(manager, batch_size=50, flush_interval_seconds=60)
+    logger = LoginAuditLogger(manager, writer=writer)
+
+    logger.handle_event("auth.start", {"provider": "google"})
+    logger.handle_event("auth.error", {"provider": "google", "reason": "invalid_code"})
+    assert _count(manager) == 0
+
+    writer.close()
+
+    with manager.session_scope() as session:
+        statuses = [row.status for row in session.query(LoginAuditModel).order_by(LoginAuditModel.id)]
+    assert statuses == ["STARTED", "FAILED"]
+    manager.dispose()
+
+
+def test_buffered_writer_flush_and_list_recent(tmp_path) -> None:
+    manager = SessionManager(f"sqlite+pysqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(manager.engine)
+    writer = BufferedLoginAuditWriter(manager, batch_size=2, flush_interval_seconds=60)
+    try:
+        writer.log_many([LoginAuditRecord(provider="local", status="STARTED", subject=f"user-{i}") for i in range(3)])
+        recent = writer.list_recent(limit=10)
+    finally:
+        writer.close()
+
+    assert len(recent) == 3
+    manager.dispose()
+
+
+def test_buffered_writer_drops_on_overflow(tmp_path) -> None:
+    manager = SessionManager(f"sqlite+pysqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(manager.engine)
+    writer = BufferedLoginAuditWriter(manager, max_queue=1, flush_interval_seconds=60, overflow=OVERFLOW_DROP)
+    try:
+        writer.log(LoginAuditRecord(provider="local", status="STARTED", subject="a"))
+        # Wait for the worker to move the first record into its pending batch.
+        deadline = time.monotonic() + 5
+        while writer._queue.qsize() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.log(LoginAuditRecord(provider="local", status="STARTED", subject="b"))
+        writer.log(LoginAuditRecord(provider="local", status="STARTED", subject="c"))
+    finally:
+        writer.close()
+
+    assert writer.dropped == 1
+    assert _count(manager) == 2
+    manager.dispose()
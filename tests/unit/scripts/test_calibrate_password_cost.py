@@ -0,0 +1,28 @@
+import importlib.util
+from pathlib import Path
+
+from aeghash.security.passwords import SCHEME_PBKDF2, SCHEME_SCRYPT
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "calibrate_password_cost.py"
+_SPEC = importlib.util.spec_from_file_location("calibrate_password_cost_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+calibrate = _MODULE.calibrate  # type: ignore[attr-defined]
+main = _MODULE.main  # type: ignore[attr-defined]
+
+
+def test_calibrate_returns_profile_per_scheme() -> None:
+    results = calibrate((SCHEME_PBKDF2, SCHEME_SCRYPT), target_ms=1, samples=1)
+
+    assert [profile.scheme for profile, _elapsed in results] == [SCHEME_PBKDF2, SCHEME_SCRYPT]
+    assert all(elapsed > 0 for _profile, elapsed in results)
+
+
+def test_main_prints_environment_settings(capsys) -> None:
+    assert main(["--target-ms", "1", "--samples", "1"]) == 0
+
+    output = capsys.readouterr().out
+    assert "PASSWORD_HASH_SCHEME=pbkdf2_sha256" in output
+    assert "PASSWORD_HASH_COST=" in output
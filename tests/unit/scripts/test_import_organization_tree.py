@@ -0,0 +1,68 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from aeghash.core.organization import TREE_BINARY, OrganizationService
+from aeghash.infrastructure.repositories import SqlAlchemyOrganizationRepository
+from aeghash.infrastructure.session import SessionManager
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "import_organization_tree.py"
+_SPEC = importlib.util.spec_from_file_location("import_organization_tree_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+import_organization_tree = _MODULE.import_organization_tree  # type: ignore[attr-defined]
+main = _MODULE.main  # type: ignore[attr-defined]
+
+
+@pytest.fixture()
+def database_url(tmp_path: Path) -> str:
+    return f"sqlite+pysqlite:///{tmp_path / 'test.db'}"
+
+
+def test_import_binary_tree_from_csv(tmp_path: Path, database_url: str) -> None:
+    source = tmp_path / "edges.csv"
+    # Children listed before their parents to exercise the topological sort.
+    source.write_text(
+        "user_id,parent_user_id,sponsor_user_id,position\n"
+        "grandchild,right,root,L\n"
+        "right,root,root,R\n"
+        "left,root,root,L\n"
+        "root,,,\n",
+        encoding="utf-8",
+    )
+
+    result = import_organization_tree(database_url=database_url, source=source, tree_type=TREE_BINARY)
+
+    assert (result.nodes, result.closure_rows, result.binary_slots) == (4, 8, 8)
+    manager = SessionManager(database_url)
+    with manager.session_scope() as session:
+        repo = SqlAlchemyOrganizationRepository(session)
+        root = repo.get_node_by_user(TREE_BINARY, "root")
+        grandchild = repo.get_node_by_user(TREE_BINARY, "grandchild")
+        assert grandchild.depth == 2
+        assert [node.user_id for node in repo.list_ancestors(grandchild.node_id, tree_type=TREE_BINARY)] == [
+            "right",
+            "root",
+        ]
+        # Imported slots feed the spillover allocator: left's L slot is the first open one.
+        member = OrganizationService(repo).add_member(tree_type=TREE_BINARY, user_id="new", sponsor_user_id="root")
+        assert repo.get_node(member.parent_node_id).user_id == "left"
+        assert member.position == "L"
+        assert root.path == f"/{root.node_id}"
+    manager.dispose()
+
+
+def test_main_imports_jsonl(tmp_path: Path, database_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "edges.jsonl"
+    source.write_text(
+        '{"user_id": "root"}\n{"user_id": "a", "parent_user_id": "root"}\n{"user_id": "b", "parent_user_id": "a"}\n',
+        encoding="utf-8",
+    )
+
+    exit_code = main([str(source), "--tree-type", "unilevel", "--database-url", database_url])
+
+    assert exit_code == 0
+    assert "Imported 3 nodes, 6 closure rows and 0 binary slots." in capsys.readouterr().out
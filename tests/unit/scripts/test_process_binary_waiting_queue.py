@@ -0,0 +1,56 @@
+import importlib.util
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from aeghash.core.organization import TREE_BINARY, OrganizationService
+from aeghash.core.repositories import BinaryPlacementQueueRecord
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import SqlAlchemyOrganizationRepository
+from aeghash.infrastructure.session import SessionManager
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "process_binary_waiting_queue.py"
+_SPEC = importlib.util.spec_from_file_location("process_binary_waiting_queue_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+main = _MODULE.main  # type: ignore[attr-defined]
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture()
+def database_url(tmp_path: Path) -> str:
+    url = f"sqlite+pysqlite:///{tmp_path / 'test.db'}"
+    manager = SessionManager(url)
+    Base.metadata.create_all(manager.engine)
+    with manager.session_scope() as session:
+        repository = SqlAlchemyOrganizationRepository(session)
+        root = OrganizationService(repository, clock=lambda: NOW).create_root(tree_type=TREE_BINARY, user_id="root")
+        for index, user_id in enumerate(["queued-1", "queued-2"]):
+            repository.enqueue_binary_placement(
+                BinaryPlacementQueueRecord(
+                    queue_id=f"queue-{index}",
+                    sponsor_node_id=root.node_id,
+                    candidate_user_id=user_id,
+                    status="PENDING",
+                    enqueued_at=NOW,
+                ),
+            )
+    manager.dispose()
+    return url
+
+
+def test_main_places_queued_members(database_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--database-url", database_url, "--batch-size", "1"]) == 0
+
+    assert "2 placed, 0 deferred, 0 failed" in capsys.readouterr().out
+    manager = SessionManager(database_url)
+    with manager.session_scope() as session:
+        repository = SqlAlchemyOrganizationRepository(session)
+        positions = {repository.get_node_by_user(TREE_BINARY, user).position for user in ("queued-1", "queued-2")}
+        assert positions == {"L", "R"}
+        assert repository.list_pending_binary_placements() == []
+    manager.dispose()
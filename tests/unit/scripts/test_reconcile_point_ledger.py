@@ -0,0 +1,49 @@
+import importlib.util
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from aeghash.core.point_wallet import PointWalletService
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import PointWalletModel, SqlAlchemyPointWalletRepository
+from aeghash.infrastructure.session import SessionManager
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "reconcile_point_ledger.py"
+_SPEC = importlib.util.spec_from_file_location("reconcile_point_ledger_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+main = _MODULE.main  # type: ignore[attr-defined]
+
+
+@pytest.fixture()
+def database_url(tmp_path: Path) -> str:
+    url = f"sqlite+pysqlite:///{tmp_path / 'test.db'}"
+    manager = SessionManager(url)
+    Base.metadata.create_all(manager.engine)
+    with manager.session_scope() as session:
+        service = PointWalletService(SqlAlchemyPointWalletRepository(session))
+        service.credit(user_id="user-1", amount=Decimal("10"))
+        service.credit(user_id="user-2", amount=Decimal("3"))
+    manager.dispose()
+    return url
+
+
+def test_main_checkpoints_and_reconciles(database_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--database-url", database_url, "--checkpoint", "--batch-size", "1"]) == 0
+
+    output = capsys.readouterr().out
+    assert "Reconciled 2 wallets" in output
+
+
+def test_main_reports_mismatches(database_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    manager = SessionManager(database_url)
+    with manager.session_scope() as session:
+        session.query(PointWalletModel).filter_by(user_id="user-2").update({"balance": Decimal("4")})
+    manager.dispose()
+
+    assert main(["--database-url", database_url, "--full"]) == 1
+
+    assert "MISMATCH" in capsys.readouterr().out
@@ -0,0 +1,86 @@
+import importlib.util
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from aeghash.core.organization import TREE_UNILEVEL, OrganizationService
+from aeghash.core.organization_kpi import CachedKpiSummary, KpiSummary, KpiSummaryCache
+from aeghash.core.repositories import OrderRecord
+from aeghash.infrastructure.database import Base
+from aeghash.infrastructure.repositories import SqlAlchemyOrderRepository, SqlAlchemyOrganizationRepository
+from aeghash.infrastructure.session import SessionManager
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "rollup_organization_metrics.py"
+_SPEC = importlib.util.spec_from_file_location("rollup_organization_metrics_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+rollup_organization_metrics = _MODULE.rollup_organization_metrics  # type: ignore[attr-defined]
+main = _MODULE.main  # type: ignore[attr-defined]
+
+NOW = datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture()
+def database_url(tmp_path: Path) -> str:
+    url = f"sqlite+pysqlite:///{tmp_path / 'test.db'}"
+    manager = SessionManager(url)
+    Base.metadata.create_all(manager.engine)
+    with manager.session_scope() as session:
+        organizations = OrganizationService(SqlAlchemyOrganizationRepository(session), clock=lambda: NOW)
+        organizations.create_root(tree_type=TREE_UNILEVEL, user_id="root")
+        organizations.add_member(tree_type=TREE_UNILEVEL, user_id="member", sponsor_user_id="root")
+        SqlAlchemyOrderRepository(session).upsert_order(
+            OrderRecord(
+                order_id="order-1",
+                user_id="member",
+                total_amount=Decimal("10"),
+                pv_amount=Decimal("10"),
+                status="PAID",
+                channel="AEGMALL",
+                metadata={},
+                created_at=NOW,
+            ),
+        )
+    manager.dispose()
+    return url
+
+
+def test_rollup_invalidates_cached_summaries_after_commit(database_url: str) -> None:
+    manager = SessionManager(database_url)
+    with manager.session_scope() as session:
+        root = SqlAlchemyOrganizationRepository(session).get_node_by_user(TREE_UNILEVEL, "root")
+        node_id = root.node_id
+    manager.dispose()
+    cache = KpiSummaryCache()
+    summary = KpiSummary(
+        node_id=node_id,
+        tree_type=TREE_UNILEVEL,
+        period_start=NOW.date(),
+        period_end=NOW.date(),
+        total_personal_volume=Decimal("0"),
+        total_group_volume=Decimal("0"),
+        total_orders=0,
+        latest_personal_volume=Decimal("0"),
+        latest_group_volume=Decimal("0"),
+        latest_volume_left=None,
+        latest_volume_right=None,
+        daily=[],
+    )
+    generation = cache.generation(node_id, TREE_UNILEVEL)
+    cache.put(node_id, TREE_UNILEVEL, days=7, today=NOW.date(), generation=generation, entry=CachedKpiSummary(summary=summary))
+
+    result = rollup_organization_metrics(database_url=database_url, cache=cache)
+
+    assert result.orders == 1
+    assert (node_id, TREE_UNILEVEL) in result.touched_nodes
+    assert cache.get(node_id, TREE_UNILEVEL, days=7, today=NOW.date()) is None
+
+
+def test_main_reports_rolled_up_orders(database_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--database-url", database_url]) == 0
+
+    assert "Rolled up 1 orders" in capsys.readouterr().out
@@ -0,0 +1,49 @@
+import importlib.util
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+
+from aeghash.adapters.turnstile import AsyncTurnstileClient, TurnstileError
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "scripts" / "turnstile_stub_server.py"
+_SPEC = importlib.util.spec_from_file_location("turnstile_stub_server_module", _MODULE_PATH)
+assert _SPEC and _SPEC.loader  # pragma: no cover - defensive
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)  # type: ignore[arg-type]
+
+build_app = _MODULE.build_app  # type: ignore[attr-defined]
+VERIFY_PATH = _MODULE.VERIFY_PATH  # type: ignore[attr-defined]
+
+
+def _client() -> AsyncTurnstileClient:
+    transport = httpx.ASGITransport(app=build_app())
+    return AsyncTurnstileClient(
+        secret_key="secret",
+        client=httpx.AsyncClient(transport=transport),
+        verify_url=f"http://stub{VERIFY_PATH}",
+    )
+
+
+def test_stub_server_accepts_tokens() -> None:
+    async def run() -> bool:
+        client = _client()
+        try:
+            return await client.verify("token-1", remote_ip="1.1.1.1")
+        finally:
+            await client.aclose()
+
+    assert anyio.run(run) is True
+
+
+def test_stub_server_rejects_fail_prefixed_tokens() -> None:
+    async def run() -> None:
+        client = _client()
+        try:
+            await client.verify("fail-token")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(TurnstileError, match="invalid-input-response"):
+        anyio.run(run)
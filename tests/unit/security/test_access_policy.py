@@ -1,5 +1,5 @@
 from aeghash.core.repositories import SessionRecord
-from aeghash.security.access import AccessContext, AccessPolicy
+from aeghash.security.access import AccessContext, AccessContextCache, AccessPolicy
 
 
 def test_access_context_parses_scopes_and_roles() -> None:
@@ -46,3 +46,64 @@ def test_access_policy_personal_data_flag() -> None:
     policy = AccessPolicy(AccessContext.from_session(session))
 
     assert policy.can_view_full_personal_data()
+
+
+def test_access_policy_checks_use_precomputed_mask() -> None:
+    context = AccessContext.from_session(
+        SessionRecord(token="token", user_id="finance-1", roles=("finance",), expires_at=0.0),
+    )
+    policy = AccessPolicy(context)
+
+    assert context.permission_mask == context.permission_index.mask_for_roles(("finance",))
+    assert policy.has_all(("kpi:read", "wallets:approve_withdrawal"))
+    assert not policy.has_all(("kpi:read", "users:manage"))
+    assert not policy.has("not:a:permission")
+    assert policy.can_view_full_personal_data()
+    assert not policy.has_global_kpi_access()
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _session(token: str = "token-1", *, user_id: str = "admin-1", expires_at: float = 2_000.0) -> SessionRecord:
+    return SessionRecord(token=token, user_id=user_id, roles=("admin",), expires_at=expires_at)
+
+
+def test_access_cache_ttl_is_capped_by_session_expiry() -> None:
+    clock = FakeClock()
+    cache = AccessContextCache(max_ttl_seconds=60, clock=clock)
+    session = _session(expires_at=1_010.0)
+    cache.put(session, AccessContext.from_session(session))
+
+    assert cache.get("token-1") is not None
+    clock.now = 1_010.0
+    assert cache.get("token-1") is None
+
+
+def test_access_cache_ttl_is_capped_by_max_ttl() -> None:
+    clock = FakeClock()
+    cache = AccessContextCache(max_ttl_seconds=30, clock=clock)
+    session = _session()
+    cache.put(session, AccessContext.from_session(session))
+
+    clock.now = 1_029.0
+    assert cache.get("token-1") is not None
+    clock.now = 1_030.0
+    assert cache.get("token-1") is None
+
+
+def test_access_cache_revoke_drops_only_that_token() -> None:
+    clock = FakeClock()
+    cache = AccessContextCache(clock=clock)
+    for token in ("token-1", "token-2"):
+        session = _session(token)
+        cache.put(session, AccessContext.from_session(session))
+
+    cache.revoke("token-1")
+    assert cache.get("token-1") is None
+    assert cache.get("token-2") is not None
@@ -1,7 +1,20 @@
+import asyncio
+import threading
+
+import pytest
+
 from aeghash.security.passwords import (
+    SCHEME_PBKDF2,
+    SCHEME_SCRYPT,
+    PasswordCostProfile,
     PasswordHash,
+    PasswordHasher,
+    PasswordHasherBusy,
+    calibrate_profile,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -42,3 +55,78 @@ def test_unsupported_hash_scheme_raises() -> None:
         assert False, "verify_password should raise for unsupported scheme"
     except ValueError:
         pass
+
+
+def test_password_hasher_roundtrip_uses_configured_iterations() -> None:
+    hasher = PasswordHasher(max_workers=2, profile=PasswordCostProfile(iterations=1_000))
+    try:
+        stored = hasher.hash("pool-secret")
+        assert PasswordHash.deserialize(stored).iterations == 1_000
+        assert hasher.verify("pool-secret", stored)
+        assert not hasher.verify("other", stored)
+    finally:
+        hasher.shutdown()
+
+
+def test_async_entry_points_roundtrip() -> None:
+    hasher = PasswordHasher(max_workers=1, profile=PasswordCostProfile(iterations=1_000))
+
+    async def run() -> tuple[str, bool, bool]:
+        stored = await hash_password_async("async-secret", hasher=hasher)
+        pooled = await verify_password_async("async-secret", stored, hasher=hasher)
+        threaded = await verify_password_async("async-secret", stored)
+        return stored, pooled, threaded
+
+    try:
+        stored, pooled, threaded = asyncio.run(run())
+    finally:
+        hasher.shutdown()
+    assert PasswordHash.deserialize(stored).iterations == 1_000
+    assert pooled is True
+    assert threaded is True
+
+
+def test_password_hasher_sheds_load_when_queue_is_full() -> None:
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+    release = threading.Event()
+    try:
+        blocked = hasher._submit(release.wait)
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash("shed-me")
+        release.set()
+        assert blocked.result(timeout=5) is True
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+def test_scrypt_profile_roundtrip() -> None:
+    stored = hash_password("scrypt-secret", profile=PasswordCostProfile(SCHEME_SCRYPT, 2**10))
+
+    assert PasswordHash.deserialize(stored).scheme == SCHEME_SCRYPT
+    assert verify_password("scrypt-secret", stored)
+    assert not verify_password("wrong", stored)
+
+
+def test_needs_rehash_compares_scheme_and_cost() -> None:
+    profile = PasswordCostProfile(iterations=2_000)
+
+    assert not profile.needs_rehash(hash_password("pw", iterations=2_000))
+    assert profile.needs_rehash(hash_password("pw", iterations=1_000))
+    assert profile.needs_rehash(hash_password("pw", profile=PasswordCostProfile(SCHEME_SCRYPT, 2**10)))
+
+
+def test_cost_profile_rejects_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        PasswordCostProfile(SCHEME_SCRYPT, 1000)
+    with pytest.raises(ValueError):
+        PasswordCostProfile("md5", 1)
+
+
+def test_calibrate_profile_extrapolates_pbkdf2_rounds() -> None:
+    # A 10k-round probe that takes 10ms scales to 100k rounds for a 100ms target.
+    timer = iter([0.0, 0.01]).__next__
+
+    profile = calibrate_profile(SCHEME_PBKDF2, target_seconds=0.1, samples=1, timer=timer)
+
+    assert profile == PasswordCostProfile(SCHEME_PBKDF2, 100_000)
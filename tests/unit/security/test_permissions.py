@@ -1,4 +1,4 @@
-from aeghash.security.permissions import AuthorizationDecision, PermissionService
+from aeghash.security.permissions import AuthorizationDecision, PermissionIndex, PermissionService
 
 
 def test_permissions_for_roles():
@@ -20,3 +20,29 @@ def test_authorize_failure_lists_missing():
     decision = service.authorize(["member"], ["users:manage"])
     assert decision.allowed is False
     assert decision.missing_permissions == {"users:manage"}
+
+
+def test_permission_index_compiles_role_masks():
+    index = PermissionIndex({"reader": {"a:read"}, "writer": {"a:read", "a:write"}})
+
+    reader = index.mask_for_roles(["reader"])
+    writer = index.mask_for_roles(["writer", "unknown"])
+
+    assert index.names(writer) == {"a:read", "a:write"}
+    assert index.allows(writer, index.required_mask(("a:read", "a:write")))
+    assert not index.allows(reader, index.required_mask(("a:read", "a:write")))
+    assert index.any_mask(("a:write", "b:missing")) & reader == 0
+
+
+def test_unknown_permission_is_never_granted():
+    index = PermissionIndex({"admin": {"a:read"}})
+    everything = index.mask_for_roles(["admin"])
+
+    assert index.bit("b:missing") == 0
+    assert not index.allows(everything, index.required_mask(("a:read", "b:missing")))
+
+
+def test_authorize_reports_unknown_permission_as_missing():
+    decision = PermissionService().authorize(["admin"], ["roles:assign", "nonexistent:perm"])
+    assert decision.allowed is False
+    assert decision.missing_permissions == {"nonexistent:perm"}
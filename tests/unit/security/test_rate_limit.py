@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from aeghash.security.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitExceeded,
+    RateLimiter,
+    RateLimitRule,
+    retry_after_header,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limiter_allows_burst_then_refills_over_window() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(
+        InMemoryRateLimitBackend(clock=clock),
+        rules={"login:ip": RateLimitRule(limit=3, window_seconds=30)},
+    )
+
+    for _ in range(3):
+        limiter.check("login:ip", "1.1.1.1")
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        limiter.check("login:ip", "1.1.1.1")
+    assert excinfo.value.rule == "login:ip"
+    assert excinfo.value.retry_after == pytest.approx(10)
+    assert retry_after_header(excinfo.value) == "10"
+
+    # Other subjects have their own bucket.
+    limiter.check("login:ip", "2.2.2.2")
+
+    clock.now += 10
+    limiter.check("login:ip", "1.1.1.1")
+    with pytest.raises(RateLimitExceeded):
+        limiter.check("login:ip", "1.1.1.1")
+
+
+def test_rate_limiter_ignores_unknown_rules_and_missing_subjects() -> None:
+    limiter = RateLimiter(rules={"login:ip": RateLimitRule(limit=1, window_seconds=60)})
+
+    for _ in range(5):
+        limiter.check("unknown", "subject")
+        limiter.check("login:ip", None)
+
+
+def test_reset_restores_full_bucket() -> None:
+    limiter = RateLimiter(rules={"two_factor:user": RateLimitRule(limit=1, window_seconds=60)})
+    limiter.check("two_factor:user", "user-1")
+    with pytest.raises(RateLimitExceeded):
+        limiter.check("two_factor:user", "user-1")
+
+    limiter.reset("two_factor:user", "user-1")
+    limiter.check("two_factor:user", "user-1")
+
+
+def test_in_memory_backend_counts_concurrent_hits_exactly() -> None:
+    limiter = RateLimiter(
+        InMemoryRateLimitBackend(shards=4),
+        rules={"login:email": RateLimitRule(limit=50, window_seconds=3600)},
+    )
+    allowed: list[int] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(25):
+            try:
+                limiter.check("login:email", "user@example.com")
+            except RateLimitExceeded:
+                continue
+            with lock:
+                allowed.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(allowed) == 50
+
+
+def test_in_memory_backend_evicts_least_recently_used_buckets() -> None:
+    backend = InMemoryRateLimitBackend(shards=1, max_keys_per_shard=2)
+
+    assert backend.consume("a", capacity=1, refill_per_second=0.001) == 0
+    assert backend.consume("a", capacity=1, refill_per_second=0.001) > 0
+    backend.consume("b", capacity=1, refill_per_second=0.001)
+    backend.consume("c", capacity=1, refill_per_second=0.001)
+
+    # "a" was evicted, so it starts with a full bucket again.
+    assert backend.consume("a", capacity=1, refill_per_second=0.001) == 0
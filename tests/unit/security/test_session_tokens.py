@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+from aeghash.core.repositories import SessionRecord
+from aeghash.security.session_tokens import SessionRevocationList, SessionTokenSigner
+
+
+def _record() -> SessionRecord:
+    return SessionRecord(token="sid-1", user_id="admin-1", roles=("admin", "scope:kpi:node:n-1"), expires_at=1_234.5)
+
+
+def test_signed_token_roundtrip() -> None:
+    signer = SessionTokenSigner("secret")
+    token = signer.sign(_record())
+
+    assert SessionTokenSigner.is_signed(token)
+    assert signer.verify(token) == _record()
+
+
+def test_signed_token_rejects_tampering_and_foreign_keys() -> None:
+    signer = SessionTokenSigner("secret")
+    token = signer.sign(_record())
+    body, _, signature = token.rpartition(".")
+    forged = SessionTokenSigner("secret").sign(
+        SessionRecord(token="sid-1", user_id="admin-1", roles=("admin", "finance"), expires_at=1_234.5),
+    )
+
+    assert SessionTokenSigner("other-secret").verify(token) is None
+    assert signer.verify(f"{forged.rpartition('.')[0]}.{signature}") is None
+    assert signer.verify(f"{body}.not-base64!") is None
+    assert signer.verify("opaque-token") is None
+
+
+def test_signer_requires_secret() -> None:
+    with pytest.raises(ValueError):
+        SessionTokenSigner("")
+
+
+def test_revocation_list_refreshes_periodically() -> None:
+    now = [0.0]
+    revoked = {"sid-1"}
+    calls: list[int] = []
+
+    def loader() -> set[str]:
+        calls.append(1)
+        return set(revoked)
+
+    revocations = SessionRevocationList(loader, refresh_seconds=5, clock=lambda: now[0])
+    assert revocations.is_stale()
+    revocations.refresh_if_stale()
+    assert "sid-1" in revocations
+
+    revoked.add("sid-2")
+    revocations.refresh_if_stale()
+    assert "sid-2" not in revocations
+    revocations.add("sid-3")
+    assert "sid-3" in revocations
+
+    now[0] = 5.0
+    revocations.refresh_if_stale()
+    assert "sid-2" in revocations
+    assert len(calls) == 2
+
+
+def test_revocation_added_during_a_load_survives_it() -> None:
+    revocations: SessionRevocationList
+
+    def loader() -> set[str]:
+        # Another request revokes a session after the database snapshot was read.
+        revocations.add("sid-late")
+        return {"sid-1"}
+
+    revocations = SessionRevocationList(loader)
+    revocations.refresh()
+
+    assert "sid-1" in revocations
+    assert "sid-late" in revocations
+
+
+def test_only_one_caller_reloads_at_a_time() -> None:
+    now = [0.0]
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def loader() -> set[str]:
+        calls.append(1)
+        if len(calls) == 2:
+            started.set()
+            release.wait(timeout=5)
+        return {"sid-1"}
+
+    revocations = SessionRevocationList(loader, refresh_seconds=5, clock=lambda: now[0])
+    revocations.refresh()
+    now[0] = 10.0
+    worker = threading.Thread(target=revocations.refresh)
+    worker.start()
+    assert started.wait(timeout=5)
+
+    revocations.refresh()
+    release.set()
+    worker.join(timeout=5)
+
+    assert len(calls) == 2
+    assert "sid-1" in revocations
+    assert not revocations.is_stale()
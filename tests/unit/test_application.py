@@ -88,7 +88,7 @@ def test_create_application_wires_container(monkeypatch):
     monkeypatch.setattr("aeghash.application.shutdown_services", stub_shutdown)
 
     class StubAuditLogger:
-        def __init__(self, session_manager):
+        def __init__(self, session_manager, *, writer=None):
             self.session_manager = session_manager
             self.events = []
 
@@ -137,7 +137,7 @@ def test_create_application_loads_settings(monkeypatch):
 
     monkeypatch.setattr(
         "aeghash.application.LoginAuditLogger",
-        lambda session_manager: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
+        lambda session_manager, **_: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
     )
 
     app = create_application(enable_logging_exporter=False)
@@ -161,7 +161,7 @@ def test_create_application_registers_logging_exporter(monkeypatch):
 
     monkeypatch.setattr(
         "aeghash.application.LoginAuditLogger",
-        lambda session_manager: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
+        lambda session_manager, **_: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
     )
 
     app = create_application(settings=settings)
@@ -192,7 +192,7 @@ def test_create_application_uses_dev_transport(monkeypatch):
     monkeypatch.setattr("aeghash.application.shutdown_services", lambda container: None)
     monkeypatch.setattr(
         "aeghash.application.LoginAuditLogger",
-        lambda session_manager: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
+        lambda session_manager, **_: type("StubAudit", (), {"handle_event": lambda self, name, payload: None})(),
     )
 
     try:
@@ -0,0 +1,28 @@
+from aeghash.utils.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries() -> None:
+    now = {"value": 0.0}
+    cache = TTLCache(maxsize=4, default_ttl_seconds=10, clock=lambda: now["value"])
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=30)
+
+    now["value"] = 15.0
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refresh "a"
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.delete("a")
+    assert len(cache) == 1
@@ -20,3 +20,13 @@ def test_totp_generation_and_verification():
 def test_totp_verification_rejects_invalid_code():
     secret = totp.generate_secret()
     assert not totp.verify_totp(secret, "abcdef")
+
+
+def test_verify_totp_key_matches_window_offsets():
+    secret = totp.generate_secret()
+    key = totp.decode_secret(secret)
+    timestamp = 1_700_000_000
+    previous = totp.totp(secret, timestamp=timestamp - 30)
+
+    assert totp.verify_totp_key(key, previous, timestamp=timestamp, window=1)
+    assert not totp.verify_totp_key(key, previous, timestamp=timestamp, window=0)